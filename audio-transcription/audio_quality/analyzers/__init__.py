@@ -5,6 +5,9 @@ This module contains analyzers for various audio quality metrics
 including SNR, clipping, echo, and silence detection.
 """
 
+from audio_quality.analyzers.frame_features import FrameFeatures
+from audio_quality.analyzers.analysis_scheduler import AnalysisScheduler, SchedulerStats
+from audio_quality.analyzers.noise_floor_tracker import NoiseFloorTracker
 from audio_quality.analyzers.snr_calculator import SNRCalculator
 from audio_quality.analyzers.clipping_detector import ClippingDetector, ClippingResult
 from audio_quality.analyzers.echo_detector import EchoDetector
@@ -12,6 +15,10 @@ from audio_quality.analyzers.silence_detector import SilenceDetector
 from audio_quality.analyzers.quality_analyzer import AudioQualityAnalyzer
 
 __all__ = [
+    'FrameFeatures',
+    'AnalysisScheduler',
+    'SchedulerStats',
+    'NoiseFloorTracker',
     'SNRCalculator',
     'ClippingDetector',
     'ClippingResult',
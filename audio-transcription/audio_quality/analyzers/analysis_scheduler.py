@@ -0,0 +1,292 @@
+"""
+Adaptive analysis cadence.
+
+This module provides the AnalysisScheduler class that decides, per stream
+and chunk, whether the costly quality detectors (echo autocorrelation and
+the per-chunk SNR estimate) run or reuse their last result. Cheap
+detectors (clipping, silence) run on every chunk. Costly detectors run on
+a configurable cadence of audio time, on every chunk while a quality
+problem is active or the chunk's level changes abruptly, and never beyond
+a per-stream CPU budget.
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+
+from audio_quality.analyzers.frame_features import FrameFeatures
+
+
+@dataclass
+class AnalysisPlan:
+    """
+    Detectors to run for one chunk.
+
+    Attributes:
+        run_echo: Whether echo detection runs (else the last result is reused)
+        run_snr: Whether SNR is calculated (else the last value is reused)
+        escalated: Whether the chunk is analyzed fully because a problem is
+            active or the level changed
+    """
+    run_echo: bool
+    run_snr: bool
+    escalated: bool
+
+
+@dataclass
+class SchedulerStats:
+    """
+    Scheduling activity over one measurement window.
+
+    Attributes:
+        chunks: Chunks planned
+        audio_seconds: Audio duration of the chunks
+        echo_runs: Chunks with echo detection
+        echo_skipped: Chunks that reused the last echo result
+        snr_runs: Chunks with SNR calculation
+        snr_skipped: Chunks that reused the last SNR
+        budget_skipped: Analyses that were due but skipped to stay in budget
+        escalated_chunks: Chunks analyzed fully because of a problem or change
+        cpu_seconds: Time spent in the costly detectors
+    """
+    chunks: int = 0
+    audio_seconds: float = 0.0
+    echo_runs: int = 0
+    echo_skipped: int = 0
+    snr_runs: int = 0
+    snr_skipped: int = 0
+    budget_skipped: int = 0
+    escalated_chunks: int = 0
+    cpu_seconds: float = 0.0
+
+
+class AnalysisScheduler:
+    """
+    Per-stream cadence of the costly quality detectors.
+
+    The CPU budget is a share of audio time: with cpu_budget=0.01 the
+    costly detectors may use 10 ms per second of audio. Unused budget
+    accumulates up to budget_burst_s seconds of audio, so a burst of
+    escalated chunks can run fully after a quiet period. The cost of each
+    detector is learned from its measured run times.
+
+    Attributes:
+        echo_interval_s: Audio time between echo analyses
+        snr_interval_s: Audio time between SNR calculations
+        schedule_snr: Whether SNR follows the cadence (else every chunk)
+        cpu_budget: Detector CPU time per second of audio (0 for no limit)
+        energy_change_db: Level change between chunks that escalates
+        silence_threshold_db: Level below which chunks count as silent
+        clipping_threshold_percent: Clipped share that escalates
+
+    Examples:
+        >>> scheduler = AnalysisScheduler(echo_interval_s=1.0, cpu_budget=0.01)
+        >>> plan = scheduler.plan(features)
+        >>> if plan.run_echo:
+        ...     echo_result = detector.detect_echo(audio, rate, features=features)
+        >>> scheduler.record(plan, echo_seconds=0.0009, problem_active=echo_result.has_echo)
+        >>> scheduler.snapshot().echo_skipped
+        3
+    """
+
+    # Weight of the previous cost estimate in its running average
+    COST_SMOOTHING = 0.8
+
+    def __init__(
+        self,
+        echo_interval_s: float = 1.0,
+        snr_interval_s: float = 0.5,
+        cpu_budget: float = 0.0,
+        budget_burst_s: float = 2.0,
+        energy_change_db: float = 6.0,
+        silence_threshold_db: float = -50.0,
+        clipping_threshold_percent: float = 1.0,
+        schedule_snr: bool = True
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            echo_interval_s: Audio time between echo analyses (default: 1.0)
+            snr_interval_s: Audio time between SNR calculations (default: 0.5)
+            cpu_budget: Detector CPU seconds per audio second, 0 for no
+                limit (default: 0.0)
+            budget_burst_s: Audio seconds of unused budget that can be saved
+                up (default: 2.0)
+            energy_change_db: Level change between consecutive chunks that
+                escalates to full analysis (default: 6.0)
+            silence_threshold_db: Level below which chunks count as silent;
+                entering or leaving silence escalates (default: -50.0)
+            clipping_threshold_percent: Clipped sample share that escalates
+                (default: 1.0)
+            schedule_snr: Put SNR on the cadence; if False it runs on every
+                chunk, outside the budget (for the incremental estimator,
+                which needs every frame) (default: True)
+        """
+        if echo_interval_s <= 0 or snr_interval_s <= 0:
+            raise ValueError(
+                f"Analysis intervals must be positive, got echo_interval_s={echo_interval_s}, "
+                f"snr_interval_s={snr_interval_s}"
+            )
+        if cpu_budget < 0:
+            raise ValueError(f"cpu_budget must not be negative, got {cpu_budget}")
+        if budget_burst_s <= 0:
+            raise ValueError(f"budget_burst_s must be positive, got {budget_burst_s}")
+
+        self.echo_interval_s = echo_interval_s
+        self.snr_interval_s = snr_interval_s
+        self.cpu_budget = cpu_budget
+        self.budget_burst_s = budget_burst_s
+        self.energy_change_db = energy_change_db
+        self.silence_threshold_db = silence_threshold_db
+        self.clipping_threshold_percent = clipping_threshold_percent
+        self.schedule_snr = schedule_snr
+
+        self._stats = SchedulerStats()
+        self.reset()
+
+    def plan(self, features: FrameFeatures) -> AnalysisPlan:
+        """
+        Decide which costly detectors run for the next chunk.
+
+        Args:
+            features: Features of the chunk (clipping counted if available)
+
+        Returns:
+            AnalysisPlan of the chunk
+        """
+        duration = len(features) / features.sample_rate
+        self._audio_time += duration
+        self._stats.chunks += 1
+        self._stats.audio_seconds += duration
+        if self.cpu_budget > 0:
+            self._budget_seconds = min(
+                self._budget_seconds + self.cpu_budget * duration,
+                self.cpu_budget * self.budget_burst_s
+            )
+
+        # Cheap signals: level, silence and clipping of this chunk
+        energy_db = features.energy_db()
+        silent = energy_db < self.silence_threshold_db
+        clipping_percent = (
+            features.clipped_count / len(features) * 100 if features.clip_level is not None else 0.0
+        )
+        changed = self._last_energy_db is not None and (
+            abs(energy_db - self._last_energy_db) >= self.energy_change_db
+            or silent != self._last_silent
+        )
+        self._last_energy_db = energy_db
+        self._last_silent = silent
+
+        escalated = (
+            self._problem_active or changed
+            or clipping_percent >= self.clipping_threshold_percent
+        )
+        if escalated:
+            self._stats.escalated_chunks += 1
+
+        run_snr = self._is_due(escalated, self._last_snr_time, self.snr_interval_s)
+        run_echo = self._is_due(escalated, self._last_echo_time, self.echo_interval_s)
+
+        # Within the budget, SNR (cheaper, user-facing) goes before echo;
+        # unscheduled SNR runs outside the budget and leaves it to echo
+        available = self._budget_seconds
+        if not self.schedule_snr:
+            run_snr = True
+        elif run_snr:
+            run_snr = self._fits_budget(self._snr_cost, available)
+            if run_snr:
+                available -= self._snr_cost
+        run_echo = run_echo and self._fits_budget(self._echo_cost, available)
+
+        if run_snr:
+            self._last_snr_time = self._audio_time
+            self._stats.snr_runs += 1
+        else:
+            self._stats.snr_skipped += 1
+        if run_echo:
+            self._last_echo_time = self._audio_time
+            self._stats.echo_runs += 1
+        else:
+            self._stats.echo_skipped += 1
+
+        return AnalysisPlan(run_echo=run_echo, run_snr=run_snr, escalated=escalated)
+
+    def record(
+        self,
+        plan: AnalysisPlan,
+        echo_seconds: float = 0.0,
+        snr_seconds: float = 0.0,
+        problem_active: bool = False
+    ) -> None:
+        """
+        Record the outcome of a planned chunk.
+
+        Args:
+            plan: Plan returned by plan() for the chunk
+            echo_seconds: Time spent in echo detection
+            snr_seconds: Time spent in SNR calculation
+            problem_active: Whether the chunk's metrics show a quality problem
+                (analysis stays escalated until a chunk shows none)
+        """
+        if plan.run_echo:
+            self._echo_cost = self._update_cost(self._echo_cost, echo_seconds)
+        if plan.run_snr:
+            self._snr_cost = self._update_cost(self._snr_cost, snr_seconds)
+
+        self._stats.cpu_seconds += echo_seconds + snr_seconds
+        if self.cpu_budget > 0:
+            self._budget_seconds -= echo_seconds
+            if self.schedule_snr:
+                self._budget_seconds -= snr_seconds
+        self._problem_active = problem_active
+
+    def snapshot(self, reset: bool = True) -> SchedulerStats:
+        """
+        Get activity since the last reset.
+
+        Args:
+            reset: Start a new window after reading (default: True)
+
+        Returns:
+            SchedulerStats of the window
+        """
+        stats = self._stats
+        if reset:
+            self._stats = SchedulerStats()
+        else:
+            stats = SchedulerStats(**vars(stats))
+        return stats
+
+    def reset(self) -> None:
+        """Forget the stream's cadence, problem and budget state (not the stats)."""
+        self._audio_time = 0.0
+        self._last_echo_time: Optional[float] = None
+        self._last_snr_time: Optional[float] = None
+        self._last_energy_db: Optional[float] = None
+        self._last_silent = False
+        self._problem_active = False
+        self._echo_cost = 0.0
+        self._snr_cost = 0.0
+        self._budget_seconds = self.cpu_budget * self.budget_burst_s
+
+    def _is_due(self, escalated: bool, last_run: Optional[float], interval_s: float) -> bool:
+        """Check whether a detector runs on cadence or because of escalation."""
+        if escalated or last_run is None:
+            return True
+        # Small tolerance so chunk-aligned intervals are not missed by rounding
+        return self._audio_time - last_run >= interval_s - 1e-9
+
+    def _fits_budget(self, cost: float, available: float) -> bool:
+        """Check whether one run of the expected cost fits the remaining budget."""
+        if self.cpu_budget <= 0:
+            return True
+        if available <= 0 or available < cost:
+            self._stats.budget_skipped += 1
+            return False
+        return True
+
+    def _update_cost(self, estimate: float, measured: float) -> float:
+        """Fold a measured run time into a detector's cost estimate."""
+        if estimate == 0.0:
+            return measured
+        return self.COST_SMOOTHING * estimate + (1.0 - self.COST_SMOOTHING) * measured
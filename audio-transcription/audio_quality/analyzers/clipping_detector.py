@@ -9,6 +9,8 @@ import numpy as np
 from dataclasses import dataclass
 from typing import Optional
 
+from audio_quality.analyzers.frame_features import FrameFeatures
+
 
 @dataclass
 class ClippingResult:
@@ -83,7 +85,8 @@ class ClippingDetector:
         self,
         audio_chunk: np.ndarray,
         bit_depth: int = 16,
-        clipping_threshold_percent: float = 1.0
+        clipping_threshold_percent: float = 1.0,
+        features: Optional[FrameFeatures] = None
     ) -> ClippingResult:
         """
         Detects clipping in audio samples.
@@ -106,6 +109,7 @@ class ClippingDetector:
                       Used to determine maximum amplitude.
             clipping_threshold_percent: Acceptable clipping percentage (default: 1.0).
                                        If clipping exceeds this, is_clipping is True.
+            features: Precomputed features of audio_chunk (computed if None)
         
         Returns:
             ClippingResult containing:
@@ -124,7 +128,7 @@ class ClippingDetector:
             Clipping: 60.0%
         """
         # Handle empty array gracefully - return 0% without exception
-        if len(audio_chunk) == 0:
+        if features is None and len(audio_chunk) == 0:
             return ClippingResult(
                 percentage=0.0,
                 clipped_count=0,
@@ -136,27 +140,14 @@ class ClippingDetector:
                 f"Only 16-bit audio is currently supported, got {bit_depth}"
             )
         
-        # Calculate maximum amplitude for the bit depth
-        # For 16-bit PCM: max = 2^15 - 1 = 32767
-        max_amplitude = 2 ** (bit_depth - 1) - 1
-        
-        # Calculate clipping threshold
-        # Default: 98% of max amplitude
-        # For 16-bit: 32767 * 0.98 = 32111.66
-        # We use the exact float value for comparison to ensure samples at or above
-        # the calculated threshold are counted as clipped
-        threshold = max_amplitude * (self.threshold_percent / 100.0)
-        
-        # Count samples that exceed or equal the threshold
-        # Use >= comparison to catch samples at threshold
-        # Use absolute value to catch both positive and negative clipping
-        # Note: Integer samples at int(threshold) will be counted since int(32111.66) = 32111
-        # and 32111 >= 32111.66 is False, but 32112 >= 32111.66 is True
-        # However, tests expect int(threshold) values to be counted, so we need to adjust
-        clipped_samples = np.sum(np.abs(audio_chunk) >= int(threshold))
+        # Count samples whose magnitude reaches the clipping level
+        # (both positive and negative clipping)
+        if features is None:
+            features = FrameFeatures.from_chunk(audio_chunk, sample_rate=16000)
+        clipped_samples = features.count_clipped(self.clip_level(bit_depth))
         
         # Calculate clipping percentage
-        total_samples = len(audio_chunk)
+        total_samples = len(features)
         clipping_percentage = (clipped_samples / total_samples) * 100.0
         
         # Determine if clipping exceeds acceptable threshold
@@ -167,3 +158,22 @@ class ClippingDetector:
             clipped_count=int(clipped_samples),
             is_clipping=is_clipping
         )
+    
+    def clip_level(self, bit_depth: int = 16) -> int:
+        """
+        Get the amplitude at or above which a sample counts as clipped.
+        
+        Args:
+            bit_depth: Bit depth of the samples (default: 16)
+        
+        Returns:
+            Clipping level in sample units (32111 for 98% of 16-bit full scale)
+        """
+        # Maximum amplitude for the bit depth
+        # For 16-bit PCM: max = 2^15 - 1 = 32767
+        max_amplitude = 2 ** (bit_depth - 1) - 1
+        
+        # Default: 98% of max amplitude
+        # For 16-bit: 32767 * 0.98 = 32111.66
+        # Truncated so that samples at int(threshold) are counted as clipped
+        return int(max_amplitude * (self.threshold_percent / 100.0))
@@ -4,10 +4,19 @@ Echo Detector.
 This module provides echo detection for audio quality validation using
 autocorrelation analysis. Detects echo patterns in the 10-500ms delay range
 and measures echo level relative to the primary signal.
+
+The autocorrelation is computed with an FFT only up to the maximum delay
+(zero-padded to a fast FFT length, with the FFT size and anti-alias filter
+cached per shape), after decimating with a polyphase FIR low-pass filter.
+The spectrum is whitened with a low-order linear predictor first, so
+periodic content (steady tones, voiced pitch) does not read as echo.
+In streaming mode the previous chunk's tail is kept, so echoes that span a
+chunk boundary are found without re-analyzing the whole history.
 """
 
 import numpy as np
-from typing import Optional
+from typing import Dict, Optional, Tuple
+from audio_quality.analyzers.frame_features import FrameFeatures
 from audio_quality.models.results import EchoResult
 
 
@@ -21,21 +30,33 @@ class EchoDetector:
     false positives.
     
     Optionally downsamples to 8 kHz for faster computation while maintaining
-    delay accuracy.
+    delay accuracy. Downsampling low-pass filters first, so content above the
+    new Nyquist frequency does not alias into false autocorrelation peaks.
+    
+    In streaming mode, the last max_delay_ms of decimated audio is kept and
+    prepended to the next chunk. Call reset() between unrelated streams.
     
     Attributes:
         min_delay_ms: Minimum echo delay to detect in milliseconds
         max_delay_ms: Maximum echo delay to detect in milliseconds
         threshold_db: Echo level threshold in dB (default: -15.0)
         downsample_rate: Target sample rate for downsampling (default: 8000 Hz)
+        streaming: Whether consecutive chunks are treated as one stream
     """
     
+    # FIR low-pass taps per unit of decimation factor (odd length, 16 * N + 1)
+    FILTER_TAPS_PER_FACTOR = 16
+    
+    # Order of the linear predictor that whitens the signal's spectral envelope
+    WHITENING_ORDER = 16
+    
     def __init__(
         self,
         min_delay_ms: int = 10,
         max_delay_ms: int = 500,
         threshold_db: float = -15.0,
-        downsample_rate: int = 8000
+        downsample_rate: int = 8000,
+        streaming: bool = False
     ):
         """
         Initialize echo detector.
@@ -46,19 +67,37 @@ class EchoDetector:
             threshold_db: Echo level threshold in dB (echo > threshold triggers detection)
                          Default -15.0 dB means echo must be ~18% of original signal strength
             downsample_rate: Target sample rate for downsampling (0 to disable)
+            streaming: Keep the previous chunk's tail so echoes spanning chunk
+                       boundaries are detected (default: False)
         """
         self.min_delay_ms = min_delay_ms
         self.max_delay_ms = max_delay_ms
         self.threshold_db = threshold_db
         self.downsample_rate = downsample_rate
+        self.streaming = streaming
+        
+        # Caches keyed by shape: FFT size per (length, max lag), filter per factor
+        self._fft_sizes: Dict[Tuple[int, int], int] = {}
+        self._filters: Dict[int, np.ndarray] = {}
         
-    def detect_echo(self, audio_chunk: np.ndarray, sample_rate: int) -> EchoResult:
+        # Streaming state (see reset())
+        self._stream_rate: Optional[int] = None
+        self._filter_carry: Optional[np.ndarray] = None
+        self._history = np.zeros(0)
+        
+    def detect_echo(
+        self,
+        audio_chunk: np.ndarray,
+        sample_rate: int,
+        features: Optional[FrameFeatures] = None
+    ) -> EchoResult:
         """
         Detect echo using autocorrelation.
         
         Algorithm:
-        1. Optionally downsample to 8 kHz for faster computation
-        2. Compute autocorrelation of audio signal
+        1. Optionally low-pass filter and downsample to 8 kHz for faster computation
+        2. Compute autocorrelation of the whitened audio signal up to the
+           maximum delay (prefixed with the previous chunk's tail in streaming mode)
         3. Search for peaks in delay range (10-500ms)
         4. Measure echo level relative to primary signal
         5. Emit warning if echo > -15 dB
@@ -66,6 +105,7 @@ class EchoDetector:
         Args:
             audio_chunk: Audio samples as numpy array (normalized -1.0 to 1.0 or int16)
             sample_rate: Sample rate in Hz
+            features: Precomputed features of audio_chunk (computed if None)
             
         Returns:
             EchoResult with echo level, delay, and detection status
@@ -73,56 +113,57 @@ class EchoDetector:
         Raises:
             ValueError: If audio_chunk is empty or invalid
         """
-        if audio_chunk is None or len(audio_chunk) == 0:
-            raise ValueError("Audio chunk cannot be empty")
-            
-        if sample_rate <= 0:
+        if features is None:
+            if audio_chunk is None or len(audio_chunk) == 0:
+                raise ValueError("Audio chunk cannot be empty")
+            if sample_rate <= 0:
+                raise ValueError("Sample rate must be positive")
+            # Normalizes int16 to [-1, 1]
+            features = FrameFeatures.from_chunk(audio_chunk, sample_rate)
+        elif sample_rate <= 0:
             raise ValueError("Sample rate must be positive")
             
-        # Convert to float if needed
-        if audio_chunk.dtype == np.int16:
-            audio_chunk = audio_chunk.astype(np.float32) / 32768.0
-            
         # Downsample if enabled and sample rate is higher than target
-        original_sample_rate = sample_rate
-        if self.downsample_rate > 0 and sample_rate > self.downsample_rate:
-            audio_chunk, sample_rate = self._downsample(audio_chunk, sample_rate)
+        decimation_factor = self._decimation_factor(sample_rate)
+        if self.streaming:
+            chunk = self._decimate_streaming(features.samples, sample_rate, decimation_factor)
+        else:
+            chunk = self._decimate(features.samples, decimation_factor)
+        sample_rate = sample_rate // decimation_factor
             
         # Convert delay range to samples
         min_delay_samples = int(self.min_delay_ms * sample_rate / 1000)
         max_delay_samples = int(self.max_delay_ms * sample_rate / 1000)
         
+        # Analyze the previous chunk's tail together with this chunk
+        if self.streaming:
+            audio_normalized = np.concatenate((self._history, chunk))
+            self._history = audio_normalized[-max_delay_samples:] if max_delay_samples else chunk[:0]
+        else:
+            audio_normalized = chunk
+        
         # Ensure we have enough samples for the delay range
-        if len(audio_chunk) < max_delay_samples:
+        if len(audio_normalized) < max_delay_samples:
             # Not enough samples to detect echo in this range
             return EchoResult(
                 echo_level_db=-100.0,
                 delay_ms=0.0,
                 has_echo=False
             )
-            
-        # Normalize audio to [-1, 1] range for consistent correlation
-        audio_normalized = audio_chunk.astype(np.float64)
-        if np.max(np.abs(audio_normalized)) > 0:
-            audio_normalized = audio_normalized / np.max(np.abs(audio_normalized))
         
         # Detect if signal is highly periodic (like a pure sine wave)
         # Periodic signals have many strong autocorrelation peaks and should not trigger echo detection
         # Calculate signal variance to detect pure tones
         # Pure tones have very low variance in their envelope
         
-        # Calculate short-term energy variance
+        # Short-term energy variance over 400-sample frames of the analysis
+        # rate, taken from the shared full-rate frame energies of this chunk
+        # (the coefficient of variation does not depend on the signal's scale)
         frame_size = 400  # 25ms at 16kHz
-        num_frames = len(audio_normalized) // frame_size
+        num_frames = len(chunk) // frame_size
         
         if num_frames >= 4:
-            frame_energies = []
-            for i in range(num_frames):
-                frame = audio_normalized[i * frame_size:(i + 1) * frame_size]
-                energy = np.mean(frame ** 2)
-                frame_energies.append(energy)
-            
-            frame_energies = np.array(frame_energies)
+            frame_energies = features.frame_energy(frame_size * decimation_factor)
             energy_variance = np.var(frame_energies)
             mean_energy = np.mean(frame_energies)
             
@@ -145,12 +186,9 @@ class EchoDetector:
                     has_echo=False
                 )
         
-        # Compute autocorrelation using scipy for better accuracy
-        from scipy import signal as scipy_signal
-        autocorr = scipy_signal.correlate(audio_normalized, audio_normalized, mode='full')
-        
-        # Keep only positive lags (second half)
-        autocorr = autocorr[len(autocorr) // 2:]
+        # Autocorrelation is normalized by its zero lag below, so the
+        # samples are not rescaled to their peak first
+        autocorr = self._autocorrelation(audio_normalized, max_delay_samples)
         
         # Normalize by the zero-lag autocorrelation (maximum value)
         if autocorr[0] > 0:
@@ -174,22 +212,21 @@ class EchoDetector:
                 has_echo=False
             )
             
-        # Sophisticated peak detection to distinguish echo from periodic signal peaks
-        # For periodic signals (like pure sine waves), autocorrelation has many peaks
+        # Peak detection to distinguish echo from periodic signal peaks
+        # For periodic signals, whitening leaves little autocorrelation at the
+        # pitch period multiples, so peaks are searched from the echo threshold
         # Real echoes are typically isolated peaks in the 30-200ms range
-        # Increased threshold from 0.01 to 0.5 to avoid false positives from periodic signals
-        peak_threshold = 0.5
+        peak_threshold = 10 ** (self.threshold_db / 20)
         
         # Use scipy's find_peaks to identify all significant peaks
         from scipy.signal import find_peaks
         
         # Find ALL peaks above threshold
         # Use prominence to identify peaks that stand out from surroundings
-        # Increased prominence to 0.2 to filter out periodic signal peaks
         peaks, properties = find_peaks(
             search_range,
             height=peak_threshold,
-            prominence=0.2  # Peak must stand out significantly from surroundings
+            prominence=peak_threshold / 2  # Peak must stand out from surroundings
         )
         
         if len(peaks) == 0:
@@ -255,42 +292,183 @@ class EchoDetector:
             has_echo=has_echo
         )
     
-    def _downsample(
+    def _decimation_factor(self, sample_rate: int) -> int:
+        """
+        Get the integer factor that brings sample_rate down to the target rate.
+        
+        Args:
+            sample_rate: Original sample rate in Hz
+            
+        Returns:
+            Decimation factor (1 if downsampling is disabled or not needed)
+        """
+        if self.downsample_rate <= 0 or sample_rate <= self.downsample_rate:
+            return 1
+        return sample_rate // self.downsample_rate
+    
+    def _lowpass_filter(self, decimation_factor: int) -> np.ndarray:
+        """
+        Get the anti-alias FIR filter for a decimation factor (cached).
+        
+        The cutoff is just below the decimated Nyquist frequency.
+        
+        Args:
+            decimation_factor: Decimation factor (> 1)
+            
+        Returns:
+            Filter taps with unit DC gain
+        """
+        taps = self._filters.get(decimation_factor)
+        if taps is None:
+            from scipy import signal as scipy_signal
+            taps = scipy_signal.firwin(
+                self.FILTER_TAPS_PER_FACTOR * decimation_factor + 1,
+                0.9 / decimation_factor
+            )
+            self._filters[decimation_factor] = taps
+        return taps
+    
+    def _decimate(self, audio: np.ndarray, decimation_factor: int) -> np.ndarray:
+        """
+        Low-pass filter and downsample one chunk.
+        
+        Uses a polyphase filter, so only the kept output samples are computed.
+        
+        Args:
+            audio: Audio samples
+            decimation_factor: Decimation factor
+            
+        Returns:
+            Downsampled audio
+        """
+        if decimation_factor == 1:
+            return audio
+        from scipy import signal as scipy_signal
+        return scipy_signal.resample_poly(
+            audio, 1, decimation_factor, window=self._lowpass_filter(decimation_factor)
+        )
+    
+    def _decimate_streaming(
         self,
         audio: np.ndarray,
-        original_rate: int
-    ) -> tuple[np.ndarray, int]:
+        original_rate: int,
+        decimation_factor: int
+    ) -> np.ndarray:
         """
-        Downsample audio to target rate for faster computation.
+        Low-pass filter and downsample the next chunk of a stream.
         
-        Uses simple decimation (taking every Nth sample). For production use,
-        consider using scipy.signal.resample for better quality.
+        The filter runs over the unfiltered samples carried from the previous
+        chunk, so the output is continuous across chunk boundaries and keeps
+        the decimation phase when chunk lengths are not multiples of the factor.
         
         Args:
-            audio: Audio samples
-            original_rate: Original sample rate in Hz
+            audio: Audio samples of the next chunk
+            original_rate: Sample rate in Hz (a change resets the stream)
+            decimation_factor: Decimation factor
             
         Returns:
-            Tuple of (downsampled_audio, new_sample_rate)
+            Downsampled audio of the chunk
+        """
+        if original_rate != self._stream_rate:
+            self.reset()
+            self._stream_rate = original_rate
+        if decimation_factor == 1:
+            return audio
+        
+        from scipy import signal as scipy_signal
+        taps = self._lowpass_filter(decimation_factor)
+        
+        # The carry ends lead_outputs output periods before the next output
+        # sample, covering the filter length (zeros before the first chunk)
+        lead_outputs = -(-(len(taps) - 1) // decimation_factor)
+        lead_samples = lead_outputs * decimation_factor
+        if self._filter_carry is None:
+            self._filter_carry = np.zeros(lead_samples)
+        
+        buffer = np.concatenate((self._filter_carry, audio))
+        filtered = scipy_signal.upfirdn(taps, buffer, down=decimation_factor)
+        
+        # Output m is centered on buffer sample m * factor; keep the ones whose
+        # input is complete and carry the samples the next outputs still need
+        last_output = max((len(buffer) - 1) // decimation_factor, lead_outputs - 1)
+        next_position = (last_output + 1) * decimation_factor
+        self._filter_carry = buffer[next_position - lead_samples:]
+        
+        return filtered[lead_outputs:last_output + 1]
+    
+    def _autocorrelation(self, audio: np.ndarray, max_lag: int) -> np.ndarray:
         """
-        if self.downsample_rate <= 0 or original_rate <= self.downsample_rate:
-            return audio, original_rate
+        Compute the autocorrelation of the whitened signal for lags 0 to max_lag.
+        
+        The signal is first passed through the whitening filter, then
+        zero-padded to a fast FFT length of at least len(audio) + max_lag,
+        which avoids circular wrap-around for the requested lags without the
+        2 * len(audio) transforms a full correlation needs.
+        
+        Args:
+            audio: Audio samples
+            max_lag: Largest lag in samples
             
-        # Calculate decimation factor
-        decimation_factor = original_rate // self.downsample_rate
+        Returns:
+            Unnormalized autocorrelation of length min(max_lag, len(audio) - 1) + 1
+        """
+        from scipy import fft as scipy_fft
+        
+        whitening = self._whitening_filter(audio)
+        if whitening is not None:
+            audio = np.convolve(audio, whitening)[:len(audio)]
         
-        # Decimate by taking every Nth sample
-        downsampled = audio[::decimation_factor]
+        max_lag = min(max_lag, len(audio) - 1)
+        shape = (len(audio), max_lag)
+        fft_size = self._fft_sizes.get(shape)
+        if fft_size is None:
+            fft_size = scipy_fft.next_fast_len(len(audio) + max_lag, real=True)
+            self._fft_sizes[shape] = fft_size
+        
+        spectrum = scipy_fft.rfft(audio, fft_size)
+        power = spectrum.real ** 2 + spectrum.imag ** 2
+        return scipy_fft.irfft(power, fft_size)[:max_lag + 1]
+    
+    def _whitening_filter(self, audio: np.ndarray) -> Optional[np.ndarray]:
+        """
+        Fit a low-order linear predictor and return its inverse filter.
+        
+        The predictor models the spectral envelope and steady tones, which
+        otherwise produce autocorrelation peaks at every multiple of their
+        period. Its order is far below any echo delay, so echoes survive the
+        filtering unchanged.
+        
+        Args:
+            audio: Audio samples
+            
+        Returns:
+            Inverse filter [1, a1, ..., ap], or None if the signal is too short
+            or silent
+        """
+        order = self.WHITENING_ORDER
+        if order <= 0 or len(audio) <= 2 * order:
+            return None
         
-        # Calculate actual new sample rate
-        new_rate = original_rate // decimation_factor
+        lags = np.array([np.dot(audio[:len(audio) - k], audio[k:]) for k in range(order + 1)])
+        if lags[0] <= 0:
+            return None
         
-        return downsampled, new_rate
+        # White noise correction keeps the system well conditioned for pure tones
+        lags[0] *= 1.0 + 1e-6
+        from scipy import linalg as scipy_linalg
+        try:
+            coefficients = scipy_linalg.solve_toeplitz(lags[:-1], -lags[1:])
+        except np.linalg.LinAlgError:
+            return None
+        return np.concatenate(([1.0], coefficients))
     
     def reset(self):
         """
         Reset detector state.
         
-        Currently no state to reset, but provided for consistency with other analyzers.
+        Clears the streaming history and filter state; cached FFT sizes and
+        filters are kept.
         """
-        pass
+        self._stream_rate = None
+        self._filter_carry = None
+        self._history = np.zeros(0)
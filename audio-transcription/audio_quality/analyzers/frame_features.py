@@ -0,0 +1,303 @@
+"""
+Shared per-chunk audio features.
+
+This module provides the FrameFeatures class that converts an audio chunk
+to normalized float samples once and computes the statistics the quality
+detectors need (global energy/RMS, peak, clipped sample count and
+per-frame energy). Frame statistics are computed with a strided reshape
+instead of a Python loop over frames and cached per frame size, so the
+SNR, clipping, echo and silence detectors share one conversion and one
+pass over the samples. from_batch() does the same for chunks of many
+streams at once, converting them into one buffer and reducing per chunk.
+"""
+
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Full scale of 16-bit PCM (int16 samples are divided by this)
+INT16_FULL_SCALE = 32768.0
+
+
+class FrameFeatures:
+    """
+    Normalized samples and energy statistics of one audio chunk.
+
+    Attributes:
+        samples: Samples as float64 in [-1.0, 1.0] (int16 input divided by
+            32768; float input used as is)
+        sample_rate: Sample rate in Hz
+        is_int16: Whether the chunk was int16 PCM
+        mean_square: Mean of the squared samples (energy)
+        rms: Root mean square of the samples
+        peak: Largest absolute sample value
+        clip_level: Amplitude (int16 scale) at or above which samples count
+            as clipped, None if clipping was not counted
+        clipped_count: Number of samples at or above clip_level
+
+    Examples:
+        >>> features = FrameFeatures.from_chunk(audio, sample_rate=16000, clip_level=32111)
+        >>> features.rms, features.clipped_count
+        (0.12, 0)
+        >>> features.frame_rms(1600)  # 100 ms frames
+        array([0.11, 0.13, ...])
+    """
+
+    __slots__ = (
+        'samples', 'sample_rate', 'is_int16', 'mean_square', 'rms', 'peak',
+        'clip_level', 'clipped_count', '_raw', '_frame_energy'
+    )
+
+    def __init__(
+        self,
+        samples: np.ndarray,
+        sample_rate: int,
+        is_int16: bool = False,
+        raw: Optional[np.ndarray] = None,
+        mean_square: Optional[float] = None,
+        peak: Optional[float] = None
+    ):
+        """
+        Initialize features from normalized samples.
+
+        Use from_chunk() or from_batch() to build features from raw audio
+        chunks.
+
+        Args:
+            samples: Normalized float64 samples (non-empty, one-dimensional)
+            sample_rate: Sample rate in Hz
+            is_int16: Whether the samples came from int16 PCM
+            raw: Original chunk, used to count clipping of float input
+            mean_square: Precomputed mean square (computed if None)
+            peak: Precomputed peak magnitude (computed if None)
+        """
+        if samples.ndim != 1:
+            raise ValueError("Audio chunk must be one-dimensional")
+        if len(samples) == 0:
+            raise ValueError("Audio chunk cannot be empty")
+        if sample_rate <= 0:
+            raise ValueError("Sample rate must be positive")
+
+        self.samples = samples
+        self.sample_rate = sample_rate
+        self.is_int16 = is_int16
+        if mean_square is None:
+            mean_square = float(np.dot(samples, samples)) / len(samples)
+        if peak is None:
+            peak = float(max(samples.max(), -samples.min()))
+        self.mean_square = mean_square
+        self.rms = float(np.sqrt(self.mean_square))
+        self.peak = peak
+        self.clip_level: Optional[int] = None
+        self.clipped_count = 0
+
+        self._raw = raw if raw is not None else samples
+        self._frame_energy: Dict[int, np.ndarray] = {}
+
+    @classmethod
+    def from_chunk(
+        cls,
+        audio_chunk: np.ndarray,
+        sample_rate: int,
+        clip_level: Optional[int] = None
+    ) -> 'FrameFeatures':
+        """
+        Build features from a raw audio chunk.
+
+        Args:
+            audio_chunk: int16 PCM samples or normalized float samples
+            sample_rate: Sample rate in Hz
+            clip_level: Amplitude (int16 scale) at or above which samples
+                count as clipped (default: clipping not counted)
+
+        Returns:
+            FrameFeatures of the chunk
+
+        Raises:
+            ValueError: If audio_chunk is empty or sample_rate is not positive
+        """
+        if audio_chunk is None or len(audio_chunk) == 0:
+            raise ValueError("Audio chunk cannot be empty")
+
+        audio_chunk = np.asarray(audio_chunk)
+        is_int16 = audio_chunk.dtype == np.int16
+        if is_int16:
+            samples = audio_chunk.astype(np.float64)
+            samples *= 1.0 / INT16_FULL_SCALE
+        else:
+            samples = audio_chunk.astype(np.float64, copy=False)
+
+        features = cls(samples, sample_rate, is_int16=is_int16, raw=audio_chunk)
+        if clip_level is not None:
+            features.count_clipped(clip_level)
+        return features
+
+    @classmethod
+    def from_batch(
+        cls,
+        audio_chunks: Sequence[np.ndarray],
+        sample_rates: Sequence[int],
+        clip_level: Optional[int] = None
+    ) -> List['FrameFeatures']:
+        """
+        Build features for many chunks in one vectorized pass.
+
+        The chunks are converted into one float64 buffer (ragged, addressed
+        by offsets) and peaks are reduced per chunk with ufunc.reduceat;
+        equal-length chunks (the usual fixed-size frames) also get their
+        energy from one row-wise reduction of the buffer viewed as a 2-D
+        array. Each FrameFeatures' samples are a view of the shared buffer.
+
+        Args:
+            audio_chunks: int16 PCM or normalized float chunks
+            sample_rates: Sample rate of each chunk in Hz
+            clip_level: Amplitude (int16 scale) at or above which samples
+                count as clipped (default: clipping not counted)
+
+        Returns:
+            FrameFeatures of each chunk, in input order
+
+        Raises:
+            ValueError: If a chunk is empty or not one-dimensional, a sample
+                rate is not positive, or the sequences differ in length
+        """
+        if len(audio_chunks) != len(sample_rates):
+            raise ValueError(
+                f"Got {len(audio_chunks)} audio chunks but {len(sample_rates)} sample rates"
+            )
+        if len(audio_chunks) == 0:
+            return []
+
+        audio_chunks = [np.asarray(chunk) for chunk in audio_chunks]
+        for chunk, sample_rate in zip(audio_chunks, sample_rates):
+            if chunk.ndim != 1:
+                raise ValueError("Audio chunk must be one-dimensional")
+            if len(chunk) == 0:
+                raise ValueError("Audio chunk cannot be empty")
+            if sample_rate <= 0:
+                raise ValueError("Sample rate must be positive")
+
+        lengths = [len(chunk) for chunk in audio_chunks]
+        offsets = np.zeros(len(audio_chunks) + 1, dtype=np.intp)
+        np.cumsum(lengths, out=offsets[1:])
+        starts = offsets[:-1]
+        is_int16 = [chunk.dtype == np.int16 for chunk in audio_chunks]
+
+        if all(is_int16):
+            # Convert and scale in one pass; peaks from the int16 samples
+            pcm = np.concatenate(audio_chunks)
+            buffer = np.multiply(pcm, 1.0 / INT16_FULL_SCALE, dtype=np.float64)
+            highs = np.maximum.reduceat(pcm, starts).astype(np.float64)
+            lows = np.minimum.reduceat(pcm, starts).astype(np.float64)
+            peaks = np.maximum(highs, -lows) / INT16_FULL_SCALE
+        else:
+            buffer = np.empty(offsets[-1], dtype=np.float64)
+            for chunk, int16, start, end in zip(audio_chunks, is_int16, starts, offsets[1:]):
+                buffer[start:end] = chunk
+                if int16:
+                    buffer[start:end] *= 1.0 / INT16_FULL_SCALE
+            peaks = np.maximum(
+                np.maximum.reduceat(buffer, starts), -np.minimum.reduceat(buffer, starts)
+            )
+
+        if min(lengths) == max(lengths):
+            # Equal-length chunks: one row-wise reduction over the 2-D view
+            rows = buffer.reshape(len(audio_chunks), lengths[0])
+            mean_squares = np.einsum('ij,ij->i', rows, rows) / lengths[0]
+        else:
+            mean_squares = [
+                np.dot(buffer[start:end], buffer[start:end]) / (end - start)
+                for start, end in zip(starts, offsets[1:])
+            ]
+
+        batch = []
+        for index, chunk in enumerate(audio_chunks):
+            features = cls(
+                buffer[offsets[index]:offsets[index + 1]],
+                sample_rates[index],
+                is_int16=is_int16[index],
+                raw=chunk,
+                mean_square=float(mean_squares[index]),
+                peak=float(peaks[index])
+            )
+            if clip_level is not None:
+                # Only counts samples of chunks whose peak reaches the level
+                features.count_clipped(clip_level)
+            batch.append(features)
+        return batch
+
+    def count_clipped(self, clip_level: int) -> int:
+        """
+        Count samples whose magnitude reaches a clipping level.
+
+        The count is kept for the last level requested, so detectors
+        sharing the features with the same level do not recount.
+
+        Args:
+            clip_level: Amplitude in int16 scale (e.g. 32111 for 98%)
+
+        Returns:
+            Number of clipped samples
+        """
+        if clip_level != self.clip_level:
+            if self.peak * (INT16_FULL_SCALE if self.is_int16 else 1.0) < clip_level:
+                count = 0
+            elif self.is_int16:
+                # Exact: dividing by a power of two does not round
+                count = np.count_nonzero(np.abs(self.samples) >= clip_level / INT16_FULL_SCALE)
+            else:
+                count = np.count_nonzero(np.abs(self._raw) >= clip_level)
+            self.clip_level = clip_level
+            self.clipped_count = int(count)
+        return self.clipped_count
+
+    def frame_energy(self, frame_size: int) -> np.ndarray:
+        """
+        Get the mean square of each complete frame.
+
+        Trailing samples that do not fill a frame are ignored.
+
+        Args:
+            frame_size: Frame length in samples
+
+        Returns:
+            Array with one energy value per frame (empty if the chunk is
+            shorter than one frame)
+        """
+        energy = self._frame_energy.get(frame_size)
+        if energy is None:
+            num_frames = len(self.samples) // frame_size
+            frames = self.samples[:num_frames * frame_size].reshape(num_frames, frame_size)
+            energy = np.einsum('ij,ij->i', frames, frames) / frame_size
+            self._frame_energy[frame_size] = energy
+        return energy
+
+    def frame_rms(self, frame_size: int) -> np.ndarray:
+        """
+        Get the RMS of each complete frame.
+
+        Args:
+            frame_size: Frame length in samples
+
+        Returns:
+            Array with one RMS value per frame
+        """
+        return np.sqrt(self.frame_energy(frame_size))
+
+    def energy_db(self, floor: float = 1e-10, floor_db: float = -100.0) -> float:
+        """
+        Get the chunk's RMS level in dBFS.
+
+        Args:
+            floor: RMS at or below which the chunk is treated as silent
+            floor_db: Level returned for a silent chunk
+
+        Returns:
+            20 * log10(rms), or floor_db for a silent chunk
+        """
+        if self.rms > floor:
+            return float(20 * np.log10(self.rms))
+        return floor_db
+
+    def __len__(self) -> int:
+        return len(self.samples)
@@ -0,0 +1,127 @@
+"""
+Noise floor tracking.
+
+This module provides the NoiseFloorTracker class that estimates the noise
+floor of an audio stream from its frame powers with minimum statistics:
+frame powers are smoothed, the minimum is kept per sub-window, and the
+noise floor is the smallest sub-window minimum over the tracking window.
+Each frame is an O(1) update (the sub-window minima are scanned once per
+sub-window), so the estimate carries across chunks instead of being
+re-derived from each chunk's frames.
+"""
+
+import math
+from collections import deque
+from typing import Optional
+
+# Noise power of 16-bit quantization, the lowest floor reported
+QUANTIZATION_NOISE_POWER = (1.0 / (2 ** 16)) ** 2
+
+
+class NoiseFloorTracker:
+    """
+    Minimum-statistics noise floor estimate over a sliding window of frames.
+
+    Speech pauses reach the noise floor often, so the minimum of the
+    smoothed frame power over a window longer than a typical utterance
+    (default 64 frames, about 2 s of 32 ms frames) follows the noise while
+    ignoring speech. A rising floor is picked up within one window, a
+    falling one immediately.
+
+    Attributes:
+        window_frames: Frames in the tracking window
+        subwindow_frames: Frames per sub-window
+        smoothing: Weight of the previous smoothed power (0.0-1.0)
+        bias: Factor correcting the underestimate of taking a minimum
+        frames_seen: Frames processed since the last reset
+
+    Examples:
+        >>> tracker = NoiseFloorTracker()
+        >>> for power in frame_powers:
+        ...     noise_power = tracker.update(power)
+    """
+
+    def __init__(
+        self,
+        window_frames: int = 64,
+        subwindows: int = 8,
+        smoothing: float = 0.5,
+        bias: float = 1.2,
+        min_noise_power: float = QUANTIZATION_NOISE_POWER
+    ):
+        """
+        Initialize tracker.
+
+        Args:
+            window_frames: Frames in the tracking window (default: 64)
+            subwindows: Number of sub-windows the window is split into
+                (default: 8)
+            smoothing: Weight of the previous smoothed power (default: 0.5)
+            bias: Factor applied to the minimum (default: 1.2)
+            min_noise_power: Lowest noise power reported (default: 16-bit
+                quantization noise)
+        """
+        if subwindows < 1 or window_frames < subwindows:
+            raise ValueError(
+                f"window_frames must be at least subwindows, got "
+                f"window_frames={window_frames}, subwindows={subwindows}"
+            )
+        if not (0.0 <= smoothing < 1.0):
+            raise ValueError(f"smoothing must be in [0.0, 1.0), got {smoothing}")
+        if bias < 1.0:
+            raise ValueError(f"bias must be at least 1.0, got {bias}")
+
+        self.window_frames = window_frames
+        self.subwindow_frames = window_frames // subwindows
+        self.smoothing = smoothing
+        self.bias = bias
+        self.min_noise_power = min_noise_power
+
+        self._minima: deque = deque(maxlen=subwindows)
+        self.reset()
+
+    def update(self, frame_power: float) -> float:
+        """
+        Add one frame and get the updated noise floor.
+
+        Args:
+            frame_power: Mean square of the frame
+
+        Returns:
+            Noise floor power
+        """
+        if self._smoothed is None:
+            self._smoothed = frame_power
+        else:
+            self._smoothed = self.smoothing * self._smoothed + (1.0 - self.smoothing) * frame_power
+
+        if self._smoothed < self._current_min:
+            self._current_min = self._smoothed
+        self._current_count += 1
+        self.frames_seen += 1
+
+        if self._current_count == self.subwindow_frames:
+            # Completed sub-window: rescan the (few) stored minima once
+            self._minima.append(self._current_min)
+            self._window_min = min(self._minima)
+            self._current_min = math.inf
+            self._current_count = 0
+
+        return self.noise_power
+
+    @property
+    def noise_power(self) -> Optional[float]:
+        """Noise floor power, or None before the first frame."""
+        minimum = min(self._window_min, self._current_min)
+        if minimum == math.inf:
+            return None
+        return max(minimum * self.bias, self.min_noise_power)
+
+    def reset(self) -> None:
+        """Forget all frames."""
+        self._smoothed: Optional[float] = None
+        self._current_min = math.inf
+        self._current_count = 0
+        self._window_min = math.inf
+        self._minima.clear()
+        self.frames_seen = 0
@@ -8,12 +8,17 @@ comprehensive quality metrics for audio streams.
 
 import time
 import numpy as np
-from typing import Optional
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Dict, Iterator, Mapping, Optional, Tuple, Union
 
 from audio_quality.models.quality_config import QualityConfig
 from audio_quality.models.quality_metrics import QualityMetrics
+from audio_quality.models.results import EchoResult, SilenceResult
+from audio_quality.analyzers.analysis_scheduler import AnalysisScheduler, SchedulerStats
+from audio_quality.analyzers.frame_features import FrameFeatures
 from audio_quality.analyzers.snr_calculator import SNRCalculator
-from audio_quality.analyzers.clipping_detector import ClippingDetector
+from audio_quality.analyzers.clipping_detector import ClippingDetector, ClippingResult
 from audio_quality.analyzers.echo_detector import EchoDetector
 from audio_quality.analyzers.silence_detector import SilenceDetector
 from audio_quality.utils.structured_logger import (
@@ -37,15 +42,28 @@ class AudioQualityAnalyzer:
     maintaining state across multiple audio chunks for temporal analysis
     (e.g., rolling SNR averages, silence duration tracking).
     
+    One analyzer can be shared by many streams: analyze() and
+    analyze_batch() keep separate detector state per stream ID (least
+    recently analyzed streams are dropped beyond max_streams), so rolling
+    SNR, noise floors, echo tails and analysis cadence never mix sessions.
+    analyze_batch() analyzes chunks of many streams at once.
+    
+    With config.adaptive_cadence, each stream's AnalysisScheduler runs SNR
+    and echo detection on a cadence and reuses their last results between
+    runs; clipping and silence detection run on every chunk.
+    
     Attributes:
         config: Quality configuration parameters
+        max_streams: Most streams with detector state kept
         snr_calculator: SNR calculation component
         clipping_detector: Clipping detection component
         echo_detector: Echo detection component
         silence_detector: Silence detection component
+        scheduler: Cadence of the costly detectors (None unless
+            config.adaptive_cadence)
     """
     
-    def __init__(self, config: Optional[QualityConfig] = None):
+    def __init__(self, config: Optional[QualityConfig] = None, max_streams: int = 1000):
         """
         Initialize audio quality analyzer.
         
@@ -54,6 +72,8 @@ class AudioQualityAnalyzer:
         
         Args:
             config: Quality configuration parameters. If None, uses defaults.
+            max_streams: Most streams with detector state kept
+                (default: 1000)
             
         Raises:
             ValueError: If configuration validation fails
@@ -65,10 +85,17 @@ class AudioQualityAnalyzer:
         errors = self.config.validate()
         if errors:
             raise ValueError(f"Invalid configuration: {', '.join(errors)}")
+        if max_streams < 1:
+            raise ValueError(f"max_streams must be at least 1, got {max_streams}")
+        self.max_streams = max_streams
+        
+        # Per-stream detector state, in LRU order
+        self._stream_analyzers: 'OrderedDict[str, AudioQualityAnalyzer]' = OrderedDict()
         
         # Initialize all detector components
         self.snr_calculator = SNRCalculator(
-            window_size=self.config.snr_window_size_s
+            window_size=self.config.snr_window_size_s,
+            incremental=self.config.snr_incremental
         )
         
         self.clipping_detector = ClippingDetector(
@@ -79,13 +106,31 @@ class AudioQualityAnalyzer:
         self.echo_detector = EchoDetector(
             min_delay_ms=self.config.echo_min_delay_ms,
             max_delay_ms=self.config.echo_max_delay_ms,
-            threshold_db=self.config.echo_threshold_db
+            threshold_db=self.config.echo_threshold_db,
+            streaming=self.config.echo_streaming
         )
         
         self.silence_detector = SilenceDetector(
             silence_threshold_db=self.config.silence_threshold_db,
             duration_threshold_s=self.config.silence_duration_threshold_s
         )
+        
+        # Cadence of the costly detectors (None: every detector on every chunk)
+        self.scheduler: Optional[AnalysisScheduler] = None
+        if self.config.adaptive_cadence:
+            self.scheduler = AnalysisScheduler(
+                echo_interval_s=self.config.echo_update_interval_s,
+                snr_interval_s=self.config.snr_update_interval_ms / 1000,
+                cpu_budget=self.config.analysis_cpu_budget,
+                energy_change_db=self.config.cadence_energy_change_db,
+                silence_threshold_db=self.config.silence_threshold_db,
+                clipping_threshold_percent=self.config.clipping_threshold_percent,
+                schedule_snr=not self.config.snr_incremental
+            )
+        
+        # Last results of the scheduled detectors, reused on skipped chunks
+        self._last_snr: Optional[Tuple[float, float]] = None
+        self._last_echo: Optional[EchoResult] = None
     
     @trace_audio_analysis
     def analyze(
@@ -100,13 +145,18 @@ class AudioQualityAnalyzer:
         
         Runs all quality detectors (SNR, clipping, echo, silence) on the
         provided audio chunk and aggregates their results into a single
-        QualityMetrics object.
+        QualityMetrics object. The chunk is normalized and its energy
+        statistics computed once, then shared by all detectors.
         
-        The method maintains state across calls for temporal analysis:
+        The method maintains state across calls of the same stream_id for
+        temporal analysis:
         - SNR rolling average over configured window
         - Silence duration tracking
+        - Analysis cadence (with config.adaptive_cadence)
         
         Algorithm:
+        0. Compute shared frame features (normalized samples, energy, peak,
+           clipped sample count)
         1. Calculate SNR and rolling average
         2. Detect clipping
         3. Detect echo patterns
@@ -154,47 +204,285 @@ class AudioQualityAnalyzer:
         # Track overall analysis time
         start_time = time.perf_counter()
         
-        # Run all detectors
+        # 0. Convert the chunk and compute its statistics once for all detectors
+        features_start = time.perf_counter()
+        features = FrameFeatures.from_chunk(
+            audio_chunk,
+            sample_rate,
+            clip_level=self.clipping_detector.clip_level(bit_depth=16)
+        )
+        features_duration = (time.perf_counter() - features_start) * 1000
+        log_analysis_operation(stream_id, 'compute_frame_features', features_duration)
+        
+        # 1-5. Run the stream's detectors and aggregate results into QualityMetrics
+        metrics = self._stream_analyzer(stream_id)._run_detectors(
+            stream_id, timestamp, audio_chunk, features, traced=True
+        )
         
-        # 1. Calculate SNR
-        with XRayContext('calculate_snr', {'stream_id': stream_id}):
-            snr_start = time.perf_counter()
-            snr_db = self.snr_calculator.calculate_snr(audio_chunk)
-            snr_rolling_avg = self.snr_calculator.get_rolling_average()
-            snr_duration = (time.perf_counter() - snr_start) * 1000
-            log_analysis_operation(stream_id, 'calculate_snr', snr_duration)
+        # Log overall analysis time
+        total_duration = (time.perf_counter() - start_time) * 1000
+        log_analysis_operation(stream_id, 'analyze_audio_quality', total_duration)
+        
+        # Log quality metrics
+        log_quality_metrics(stream_id, metrics, level='DEBUG')
+        
+        # Log quality issues if thresholds violated
+        self._log_quality_issues(stream_id, metrics)
+        
+        return metrics
+    
+    @trace_audio_analysis
+    def analyze_batch(
+        self,
+        audio_chunks: Mapping[str, np.ndarray],
+        sample_rate: Union[int, Mapping[str, int]],
+        timestamp: Optional[float] = None
+    ) -> Dict[str, QualityMetrics]:
+        """
+        Analyzes one chunk from each of many streams.
+        
+        Frame features of all chunks are computed in one vectorized pass
+        (FrameFeatures.from_batch), then each chunk runs through its own
+        stream's detectors, so rolling SNR, silence duration and streaming
+        echo state stay per stream. The batch is traced and timed once
+        instead of per chunk and detector; quality issues are still logged
+        per stream.
+        
+        Args:
+            audio_chunks: Audio chunk (int16 PCM or normalized float) per
+                stream ID. Several chunks of one stream should be
+                concatenated in order before the call.
+            sample_rate: Sample rate in Hz, shared or per stream ID
+            timestamp: Current timestamp in seconds. If None, uses current time.
+            
+        Returns:
+            QualityMetrics per stream ID, in input order
+            
+        Raises:
+            ValueError: If a chunk is empty or invalid, or a sample rate is
+                missing or not positive
+            
+        Examples:
+            >>> analyzer = AudioQualityAnalyzer(QualityConfig(snr_incremental=True))
+            >>> metrics = analyzer.analyze_batch(
+            ...     {'session-1': chunk_1, 'session-2': chunk_2}, sample_rate=16000
+            ... )
+            >>> metrics['session-2'].snr_db
+            24.3
+        """
+        if timestamp is None:
+            timestamp = time.time()
         
-        # If no rolling average yet (first call), use current SNR
-        if snr_rolling_avg is None:
-            snr_rolling_avg = snr_db
+        start_time = time.perf_counter()
+        
+        stream_ids = list(audio_chunks)
+        if isinstance(sample_rate, Mapping):
+            missing = [stream_id for stream_id in stream_ids if stream_id not in sample_rate]
+            if missing:
+                raise ValueError(f"No sample rate for streams: {', '.join(missing)}")
+            sample_rates = [sample_rate[stream_id] for stream_id in stream_ids]
+        else:
+            sample_rates = [sample_rate] * len(stream_ids)
+        
+        features_batch = FrameFeatures.from_batch(
+            [audio_chunks[stream_id] for stream_id in stream_ids],
+            sample_rates,
+            clip_level=self.clipping_detector.clip_level(bit_depth=16)
+        )
+        
+        results = {}
+        for stream_id, features in zip(stream_ids, features_batch):
+            analyzer = self._stream_analyzer(stream_id)
+            metrics = analyzer._run_detectors(
+                stream_id, timestamp, features.samples, features, traced=False
+            )
+            self._log_quality_issues(stream_id, metrics)
+            results[stream_id] = metrics
+        
+        total_duration = (time.perf_counter() - start_time) * 1000
+        log_analysis_operation(
+            f'batch:{len(stream_ids)}', 'analyze_audio_quality_batch', total_duration
+        )
+        
+        return results
+    
+    def release_stream(self, stream_id: str) -> bool:
+        """
+        Drop the detector state kept for a stream, e.g. when its session ends.
+        
+        Args:
+            stream_id: Identifier of the audio stream
+            
+        Returns:
+            True if the stream had state
+        """
+        return self._stream_analyzers.pop(stream_id, None) is not None
+    
+    def _stream_analyzer(self, stream_id: str) -> 'AudioQualityAnalyzer':
+        """Get (or create) the detectors of one stream, evicting the least recent."""
+        analyzer = self._stream_analyzers.get(stream_id)
+        if analyzer is None:
+            analyzer = AudioQualityAnalyzer(self.config, max_streams=1)
+            self._stream_analyzers[stream_id] = analyzer
+            while len(self._stream_analyzers) > self.max_streams:
+                self._stream_analyzers.popitem(last=False)
+        else:
+            self._stream_analyzers.move_to_end(stream_id)
+        return analyzer
+    
+    def scheduler_stats(self, stream_id: str, reset: bool = True) -> Optional[SchedulerStats]:
+        """
+        Get the cadence activity of one stream.
+        
+        Args:
+            stream_id: Identifier of the audio stream
+            reset: Start a new window after reading (default: True)
+            
+        Returns:
+            SchedulerStats of the stream, or None without adaptive cadence
+            or state for the stream
+        """
+        analyzer = self._stream_analyzers.get(stream_id)
+        if analyzer is None or analyzer.scheduler is None:
+            return None
+        return analyzer.scheduler.snapshot(reset=reset)
+    
+    def stream_scheduler_stats(self, reset: bool = True) -> Dict[str, SchedulerStats]:
+        """
+        Get the cadence activity of each analyzed stream.
+        
+        Args:
+            reset: Start a new window after reading (default: True)
+            
+        Returns:
+            SchedulerStats per stream ID (empty unless config.adaptive_cadence)
+        """
+        return {
+            stream_id: analyzer.scheduler.snapshot(reset=reset)
+            for stream_id, analyzer in self._stream_analyzers.items()
+            if analyzer.scheduler is not None
+        }
+    
+    @contextmanager
+    def _detector_stage(
+        self,
+        operation: str,
+        stream_id: str,
+        traced: bool,
+        durations: Dict[str, float]
+    ) -> Iterator[None]:
+        """Time one detector, tracing and logging it if traced."""
+        start = time.perf_counter()
+        if traced:
+            with XRayContext(operation, {'stream_id': stream_id}):
+                yield
+        else:
+            yield
+        durations[operation] = time.perf_counter() - start
+        if traced:
+            log_analysis_operation(stream_id, operation, durations[operation] * 1000)
+    
+    def _run_detectors(
+        self,
+        stream_id: str,
+        timestamp: float,
+        audio_chunk: np.ndarray,
+        features: FrameFeatures,
+        traced: bool
+    ) -> QualityMetrics:
+        """
+        Run the detectors on one chunk and aggregate their results.
+        
+        Clipping and silence detection run on every chunk. With adaptive
+        cadence, SNR and echo detection run when the scheduler plans them
+        and otherwise reuse their last results.
+        
+        Args:
+            stream_id: Identifier for the audio stream
+            timestamp: Current timestamp in seconds
+            audio_chunk: Audio samples of the chunk
+            features: Features of the chunk
+            traced: Trace and log each detector (per-chunk analyze())
+            
+        Returns:
+            QualityMetrics of the chunk
+        """
+        plan = self.scheduler.plan(features) if self.scheduler is not None else None
+        durations: Dict[str, float] = {}
+        
+        # 1. Calculate SNR
+        if plan is None or plan.run_snr or self._last_snr is None:
+            with self._detector_stage('calculate_snr', stream_id, traced, durations):
+                snr_db = self.snr_calculator.calculate_snr(audio_chunk, features=features)
+                snr_rolling_avg = self.snr_calculator.get_rolling_average()
+            
+            # If no rolling average yet (first call), use current SNR
+            if snr_rolling_avg is None:
+                snr_rolling_avg = snr_db
+            self._last_snr = (snr_db, snr_rolling_avg)
+        else:
+            snr_db, snr_rolling_avg = self._last_snr
         
         # 2. Detect clipping
-        with XRayContext('detect_clipping', {'stream_id': stream_id}):
-            clipping_start = time.perf_counter()
+        with self._detector_stage('detect_clipping', stream_id, traced, durations):
             clipping_result = self.clipping_detector.detect_clipping(
                 audio_chunk,
                 bit_depth=16,
-                clipping_threshold_percent=self.config.clipping_threshold_percent
+                clipping_threshold_percent=self.config.clipping_threshold_percent,
+                features=features
             )
-            clipping_duration = (time.perf_counter() - clipping_start) * 1000
-            log_analysis_operation(stream_id, 'detect_clipping', clipping_duration)
         
         # 3. Detect echo
-        with XRayContext('detect_echo', {'stream_id': stream_id}):
-            echo_start = time.perf_counter()
-            echo_result = self.echo_detector.detect_echo(audio_chunk, sample_rate)
-            echo_duration = (time.perf_counter() - echo_start) * 1000
-            log_analysis_operation(stream_id, 'detect_echo', echo_duration)
+        if plan is None or plan.run_echo or self._last_echo is None:
+            with self._detector_stage('detect_echo', stream_id, traced, durations):
+                echo_result = self.echo_detector.detect_echo(
+                    audio_chunk, features.sample_rate, features=features
+                )
+            self._last_echo = echo_result
+        else:
+            echo_result = self._last_echo
+            if self.echo_detector.streaming:
+                # The skipped chunk breaks the continuity of the kept tail
+                self.echo_detector.reset()
         
         # 4. Detect silence
-        with XRayContext('detect_silence', {'stream_id': stream_id}):
-            silence_start = time.perf_counter()
-            silence_result = self.silence_detector.detect_silence(audio_chunk, timestamp)
-            silence_duration = (time.perf_counter() - silence_start) * 1000
-            log_analysis_operation(stream_id, 'detect_silence', silence_duration)
+        with self._detector_stage('detect_silence', stream_id, traced, durations):
+            silence_result = self.silence_detector.detect_silence(
+                audio_chunk, timestamp, features=features
+            )
         
         # 5. Aggregate results into QualityMetrics
-        metrics = QualityMetrics(
+        metrics = self._build_metrics(
+            stream_id, timestamp, snr_db, snr_rolling_avg,
+            clipping_result, echo_result, silence_result
+        )
+        
+        if plan is not None:
+            self.scheduler.record(
+                plan,
+                echo_seconds=durations.get('detect_echo', 0.0),
+                snr_seconds=durations.get('calculate_snr', 0.0),
+                problem_active=(
+                    metrics.snr_db < self.config.snr_threshold_db
+                    or metrics.is_clipping
+                    or metrics.has_echo
+                )
+            )
+        
+        return metrics
+    
+    def _build_metrics(
+        self,
+        stream_id: str,
+        timestamp: float,
+        snr_db: float,
+        snr_rolling_avg: float,
+        clipping_result: ClippingResult,
+        echo_result: EchoResult,
+        silence_result: SilenceResult
+    ) -> QualityMetrics:
+        """Aggregate detector results into QualityMetrics."""
+        return QualityMetrics(
             timestamp=timestamp,
             stream_id=stream_id,
             # SNR metrics
@@ -213,58 +501,50 @@ class AudioQualityAnalyzer:
             silence_duration_s=silence_result.duration_s,
             energy_db=silence_result.energy_db
         )
-        
-        # Log overall analysis time
-        total_duration = (time.perf_counter() - start_time) * 1000
-        log_analysis_operation(stream_id, 'analyze_audio_quality', total_duration)
-        
-        # Log quality metrics
-        log_quality_metrics(stream_id, metrics, level='DEBUG')
-        
-        # Log quality issues if thresholds violated
-        if snr_db < self.config.snr_threshold_db:
+    
+    def _log_quality_issues(self, stream_id: str, metrics: QualityMetrics) -> None:
+        """Log each quality threshold the metrics violate."""
+        if metrics.snr_db < self.config.snr_threshold_db:
             log_quality_issue(
                 stream_id,
                 'snr_low',
-                {'snr': snr_db, 'threshold': self.config.snr_threshold_db},
+                {'snr': metrics.snr_db, 'threshold': self.config.snr_threshold_db},
                 severity='warning'
             )
         
-        if clipping_result.is_clipping:
+        if metrics.is_clipping:
             log_quality_issue(
                 stream_id,
                 'clipping',
                 {
-                    'percentage': clipping_result.percentage,
+                    'percentage': metrics.clipping_percentage,
                     'threshold': self.config.clipping_threshold_percent
                 },
                 severity='warning'
             )
         
-        if echo_result.has_echo:
+        if metrics.has_echo:
             log_quality_issue(
                 stream_id,
                 'echo',
                 {
-                    'echo_db': echo_result.echo_level_db,
-                    'delay_ms': echo_result.delay_ms,
+                    'echo_db': metrics.echo_level_db,
+                    'delay_ms': metrics.echo_delay_ms,
                     'threshold': self.config.echo_threshold_db
                 },
                 severity='warning'
             )
         
-        if silence_result.is_silent:
+        if metrics.is_silent:
             log_quality_issue(
                 stream_id,
                 'silence',
                 {
-                    'duration': silence_result.duration_s,
+                    'duration': metrics.silence_duration_s,
                     'threshold': self.config.silence_duration_threshold_s
                 },
                 severity='warning'
             )
-        
-        return metrics
     
     def reset(self):
         """
@@ -274,8 +554,9 @@ class AudioQualityAnalyzer:
         - SNR rolling window history
         - Silence duration tracking
         
-        This should be called when starting a new audio stream or after
-        a known interruption to prevent stale state from affecting analysis.
+        This should be called after a known interruption to prevent stale
+        state from affecting analysis. Per-stream state is dropped as well;
+        use release_stream() to drop the state of a single stream.
         
         Examples:
             >>> analyzer = AudioQualityAnalyzer()
@@ -285,3 +566,8 @@ class AudioQualityAnalyzer:
         self.snr_calculator.reset()
         self.echo_detector.reset()
         self.silence_detector.reset()
+        if self.scheduler is not None:
+            self.scheduler.reset()
+        self._last_snr = None
+        self._last_echo = None
+        self._stream_analyzers.clear()
@@ -8,6 +8,7 @@ between natural speech pauses and technical issues.
 
 import numpy as np
 from typing import Optional
+from audio_quality.analyzers.frame_features import FrameFeatures
 from audio_quality.models.results import SilenceResult
 
 
@@ -54,7 +55,8 @@ class SilenceDetector:
     def detect_silence(
         self,
         audio_chunk: np.ndarray,
-        timestamp: float
+        timestamp: float,
+        features: Optional[FrameFeatures] = None
     ) -> SilenceResult:
         """
         Detect extended silence periods.
@@ -72,6 +74,7 @@ class SilenceDetector:
         Args:
             audio_chunk: Audio samples as numpy array (normalized -1.0 to 1.0 or int16)
             timestamp: Current timestamp in seconds (when this chunk was received)
+            features: Precomputed features of audio_chunk (computed if None)
             
         Returns:
             SilenceResult with silence status, duration, and energy level
@@ -79,30 +82,21 @@ class SilenceDetector:
         Raises:
             ValueError: If audio_chunk is empty or invalid
         """
-        if audio_chunk is None or len(audio_chunk) == 0:
+        if features is None and (audio_chunk is None or len(audio_chunk) == 0):
             raise ValueError("Audio chunk cannot be empty")
             
         if timestamp < 0:
             raise ValueError("Timestamp must be non-negative")
             
-        # Normalize to [-1, 1] if int16
-        if audio_chunk.dtype == np.int16:
-            audio_normalized = audio_chunk.astype(np.float64) / 32768.0
-        else:
-            audio_normalized = audio_chunk.astype(np.float64)
+        # Normalizes int16 to [-1, 1]
+        if features is None:
+            features = FrameFeatures.from_chunk(audio_chunk, self.sample_rate)
             
         # Calculate chunk duration from audio length
-        chunk_duration_s = len(audio_normalized) / self.sample_rate
+        chunk_duration_s = len(features) / self.sample_rate
             
-        # Calculate RMS energy
-        rms = np.sqrt(np.mean(audio_normalized ** 2))
-        
-        # Convert to dB
-        if rms > 1e-10:
-            energy_db = 20 * np.log10(rms)
-        else:
-            # Completely silent signal
-            energy_db = -100.0
+        # RMS energy in dB (-100 dB for a completely silent signal)
+        energy_db = features.energy_db(floor=1e-10, floor_db=-100.0)
             
         # Check if current chunk is silent
         is_chunk_silent = energy_db < self.silence_threshold_db
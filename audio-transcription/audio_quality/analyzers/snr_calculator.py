@@ -3,12 +3,17 @@ SNR (Signal-to-Noise Ratio) Calculator.
 
 This module provides SNR calculation for audio quality validation.
 Maintains a rolling window of SNR values and updates at 500ms intervals.
+In incremental mode the noise floor is tracked across chunks instead of
+being derived from each chunk's frames alone.
 """
 
 import numpy as np
 from collections import deque
 from typing import Optional
 
+from audio_quality.analyzers.frame_features import FrameFeatures
+from audio_quality.analyzers.noise_floor_tracker import NoiseFloorTracker
+
 
 class SNRCalculator:
     """
@@ -18,23 +23,44 @@ class SNRCalculator:
     signal RMS from active frames. Maintains a rolling window of SNR values
     for temporal analysis.
     
+    In incremental mode, 32 ms frames update a minimum-statistics noise floor
+    and a smoothed power of the frames above it, both kept across chunks, so
+    short chunks (e.g. 256 ms) give stable values. Use one calculator per
+    stream in this mode.
+    
     Attributes:
         window_size: Rolling window size in seconds (default: 5.0)
         signal_history: Deque storing recent SNR measurements
+        incremental: Whether the noise floor is tracked across chunks
+        noise_floor: Noise floor tracker used in incremental mode
     """
     
-    def __init__(self, window_size: float = 5.0):
+    # Frames this many times the noise floor power (3 dB) count as active
+    ACTIVITY_FACTOR = 2.0
+    
+    # Weight of the previous active power in its running average
+    SIGNAL_SMOOTHING = 0.9
+    
+    def __init__(self, window_size: float = 5.0, incremental: bool = False):
         """
         Initialize SNR calculator.
         
         Args:
             window_size: Size of rolling window in seconds for averaging
+            incremental: Track the noise floor across chunks (default: False)
         """
         self.window_size = window_size
         # Store 10 measurements (5 seconds / 0.5 second intervals)
         self.signal_history = deque(maxlen=int(window_size * 2))
-        
-    def calculate_snr(self, audio_chunk: np.ndarray) -> float:
+        self.incremental = incremental
+        self.noise_floor = NoiseFloorTracker()
+        self._signal_power: Optional[float] = None
+        
+    def calculate_snr(
+        self,
+        audio_chunk: np.ndarray,
+        features: Optional[FrameFeatures] = None
+    ) -> float:
         """
         Calculate SNR in decibels using adaptive algorithm based on signal characteristics.
         
@@ -51,8 +77,12 @@ class SNRCalculator:
         - Noisy speech signals → SNR 0-20 dB
         - Very noisy signals → SNR <10 dB
         
+        In incremental mode, steps 4-5 use the noise floor and active signal
+        power tracked across chunks instead (see _calculate_snr_incremental).
+        
         Args:
             audio_chunk: Audio samples as numpy array (normalized -1.0 to 1.0 or int16)
+            features: Precomputed features of audio_chunk (computed if None)
             
         Returns:
             SNR in decibels (higher is better)
@@ -60,61 +90,39 @@ class SNRCalculator:
         Raises:
             ValueError: If audio_chunk is empty or invalid
         """
-        if audio_chunk is None or len(audio_chunk) == 0:
-            raise ValueError("Audio chunk cannot be empty")
-            
-        # Normalize to [-1, 1] if int16
-        if audio_chunk.dtype == np.int16:
-            audio_normalized = audio_chunk.astype(np.float64) / 32768.0
-        else:
-            audio_normalized = audio_chunk.astype(np.float64)
+        if features is None:
+            if audio_chunk is None or len(audio_chunk) == 0:
+                raise ValueError("Audio chunk cannot be empty")
+            # Normalizes int16 to [-1, 1]; the sample rate is not used here
+            features = FrameFeatures.from_chunk(audio_chunk, sample_rate=16000)
+        
+        if self.incremental:
+            snr_db = self._calculate_snr_incremental(features)
+            self.signal_history.append(snr_db)
+            return snr_db
         
         # Calculate frame-wise RMS (100ms frames at 16kHz = 1600 samples)
         frame_size = 1600  # 100ms at 16kHz
-        num_frames = len(audio_normalized) // frame_size
+        num_frames = len(features) // frame_size
         
         if num_frames < 2:
             # Too short for frame-based analysis, use simple RMS
-            rms = np.sqrt(np.mean(audio_normalized ** 2))
+            rms = features.rms
             snr_db = 20 * np.log10(rms / 1e-6) if rms > 0 else 0.0
             self.signal_history.append(snr_db)
             return float(snr_db)
         
         # Calculate RMS for each frame
-        frame_rms = []
-        for i in range(num_frames):
-            frame = audio_normalized[i * frame_size:(i + 1) * frame_size]
-            frame_rms.append(np.sqrt(np.mean(frame ** 2)))
-        
-        frame_rms = np.array(frame_rms)
+        frame_rms = features.frame_rms(frame_size)
         
         # Calculate statistics for signal type detection
         mean_rms = np.mean(frame_rms)
         std_rms = np.std(frame_rms)
         
-        # Determine if signal is "clean" based on absolute standard deviation
-        # Pure sine waves have std_rms ≈ 0 (all frames identical)
-        # Noisy signals have std_rms > 0.001 (frame-to-frame variation from noise)
-        # Using 0.001 threshold to ensure even slightly noisy signals are caught
-        clean_signal_threshold_std = 0.001  # Absolute std threshold
-        
-        is_clean_signal = (std_rms < clean_signal_threshold_std and mean_rms > 0.1)
+        # CLEAN SIGNAL PATH: Use theoretical noise floor
+        snr_db = self._clean_signal_snr(mean_rms, std_rms)
         
-        if is_clean_signal:
-            # CLEAN SIGNAL PATH: Use theoretical noise floor
-            # Pure sine waves and clean test signals have minimal variance AND low noise
-            signal_power = mean_rms ** 2
-            
-            # For clean signals, assume quantization noise (-96 dB for 16-bit audio)
-            # This is the theoretical noise floor for digital audio
-            noise_power = (1.0 / (2**16)) ** 2  # Quantization noise level
-            
-            snr_db = 10 * np.log10(signal_power / noise_power)
-            
-            # Cap at 45 dB for realistic range (very clean audio)
-            # This prevents unrealistically high values while still indicating excellent quality
-            snr_db = min(snr_db, 45.0)
-        else:
+        if snr_db is None:
             # NOISY SIGNAL PATH: Use percentile-based separation
             # Real speech and noisy signals have natural variance
             noise_threshold = np.percentile(frame_rms, 10)  # Bottom 10%
@@ -123,7 +131,7 @@ class SNRCalculator:
             
             if len(noise_frames) == 0 or len(signal_frames) == 0:
                 # Fallback for edge cases
-                rms = np.sqrt(np.mean(audio_normalized ** 2))
+                rms = features.rms
                 snr_db = 20 * np.log10(rms / 1e-6) if rms > 0 else 0.0
             else:
                 noise_power = np.mean(noise_frames ** 2)
@@ -142,6 +150,87 @@ class SNRCalculator:
         
         return float(snr_db)
     
+    def _clean_signal_snr(self, mean_rms: float, std_rms: float) -> Optional[float]:
+        """
+        Get the SNR of a clean signal, or None if the signal is not clean.
+        
+        Args:
+            mean_rms: Mean of the frame RMS values
+            std_rms: Standard deviation of the frame RMS values
+            
+        Returns:
+            SNR in dB against the quantization noise floor (capped at 45 dB),
+            or None for signals with noticeable frame-to-frame variation
+        """
+        # Determine if signal is "clean" based on absolute standard deviation
+        # Pure sine waves have std_rms ≈ 0 (all frames identical)
+        # Noisy signals have std_rms > 0.001 (frame-to-frame variation from noise)
+        # Using 0.001 threshold to ensure even slightly noisy signals are caught
+        clean_signal_threshold_std = 0.001  # Absolute std threshold
+        
+        if not (std_rms < clean_signal_threshold_std and mean_rms > 0.1):
+            return None
+        
+        # Pure sine waves and clean test signals have minimal variance AND low noise
+        signal_power = mean_rms ** 2
+        
+        # For clean signals, assume quantization noise (-96 dB for 16-bit audio)
+        # This is the theoretical noise floor for digital audio
+        noise_power = (1.0 / (2**16)) ** 2  # Quantization noise level
+        
+        snr_db = 10 * np.log10(signal_power / noise_power)
+        
+        # Cap at 45 dB for realistic range (very clean audio)
+        # This prevents unrealistically high values while still indicating excellent quality
+        return float(min(snr_db, 45.0))
+    
+    def _calculate_snr_incremental(self, features: FrameFeatures) -> float:
+        """
+        Calculate SNR against the noise floor tracked across chunks.
+        
+        Each 32 ms frame is one constant-time update of the noise floor
+        tracker; frames more than 3 dB above the floor update a running
+        average of the active signal power. Trailing samples that do not
+        fill a frame are ignored (a chunk shorter than one frame counts as
+        one frame).
+        
+        Args:
+            features: Features of the chunk
+            
+        Returns:
+            SNR in decibels
+        """
+        frame_size = 512  # 32ms at 16kHz, 8 frames per 256ms chunk
+        frame_energy = features.frame_energy(frame_size)
+        if len(frame_energy) == 0:
+            frame_energy = np.array([features.mean_square])
+        
+        frame_rms = np.sqrt(frame_energy)
+        clean_snr = self._clean_signal_snr(np.mean(frame_rms), np.std(frame_rms))
+        
+        noise_power = None
+        for power in frame_energy.tolist():
+            noise_power = self.noise_floor.update(power)
+            if power > noise_power * self.ACTIVITY_FACTOR:
+                if self._signal_power is None:
+                    self._signal_power = power
+                else:
+                    self._signal_power = (
+                        self.SIGNAL_SMOOTHING * self._signal_power
+                        + (1.0 - self.SIGNAL_SMOOTHING) * power
+                    )
+        
+        if clean_snr is not None:
+            return clean_snr
+        
+        # Before any active frame, compare the chunk itself to the floor
+        signal_power = self._signal_power if self._signal_power is not None else features.mean_square
+        if signal_power <= 0:
+            return 0.0
+        
+        snr_db = 10 * np.log10(signal_power / noise_power)
+        return float(np.clip(snr_db, -100.0, 100.0))
+    
     def get_rolling_average(self) -> Optional[float]:
         """
         Get rolling average of SNR values over the window.
@@ -155,5 +244,7 @@ class SNRCalculator:
         return float(np.mean(self.signal_history))
     
     def reset(self):
-        """Reset the rolling window history."""
+        """Reset the rolling window history and the tracked noise floor."""
         self.signal_history.clear()
+        self.noise_floor.reset()
+        self._signal_power = None
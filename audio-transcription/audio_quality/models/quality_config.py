@@ -17,6 +17,7 @@ class QualityConfig:
     snr_threshold_db: float = 20.0  # Minimum acceptable SNR
     snr_update_interval_ms: int = 500
     snr_window_size_s: float = 5.0
+    snr_incremental: bool = False  # Track noise floor across chunks (one analyzer per stream)
     
     # Clipping thresholds
     clipping_threshold_percent: float = 1.0  # Max acceptable clipping
@@ -28,11 +29,19 @@ class QualityConfig:
     echo_min_delay_ms: int = 10
     echo_max_delay_ms: int = 500
     echo_update_interval_s: float = 1.0
+    echo_streaming: bool = False  # Keep chunk tails (one analyzer per stream)
     
     # Silence detection
     silence_threshold_db: float = -50.0
     silence_duration_threshold_s: float = 5.0
     
+    # Analysis cadence: with adaptive_cadence, SNR and echo run every
+    # snr_update_interval_ms / echo_update_interval_s of audio, on every
+    # chunk while a problem is active or the level changes, within the budget
+    adaptive_cadence: bool = False
+    analysis_cpu_budget: float = 0.0  # Detector CPU seconds per audio second (0 = no limit)
+    cadence_energy_change_db: float = 6.0  # Level change that escalates
+    
     # Processing options
     enable_high_pass: bool = False
     enable_noise_gate: bool = False
@@ -82,4 +91,10 @@ class QualityConfig:
         if self.silence_duration_threshold_s <= 0:
             errors.append('Silence duration threshold must be positive')
             
+        if self.analysis_cpu_budget < 0:
+            errors.append('Analysis CPU budget must not be negative')
+            
+        if self.cadence_energy_change_db <= 0:
+            errors.append('Cadence energy change must be positive')
+            
         return errors
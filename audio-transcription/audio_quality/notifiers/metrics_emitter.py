@@ -11,6 +11,7 @@ from typing import Dict, Any, List, Optional
 
 from audio_quality.models.quality_metrics import QualityMetrics
 from audio_quality.models.quality_event import QualityEvent
+from audio_quality.analyzers.analysis_scheduler import SchedulerStats
 from audio_quality.utils.structured_logger import log_metrics_emission
 
 
@@ -33,7 +34,10 @@ class QualityMetricsEmitter:
         Initializes the metrics emitter.
         
         Args:
-            cloudwatch_client: Boto3 CloudWatch client
+            cloudwatch_client: Metrics sink or boto3 CloudWatch client
+                (anything with put_metric_data). Pass a buffered sink
+                (shared.utils.emf_metrics) to keep emission off the
+                request path.
             eventbridge_client: Boto3 EventBridge client
         """
         self.cloudwatch = cloudwatch_client
@@ -89,7 +93,6 @@ class QualityMetricsEmitter:
                 }
             ]
             
-            # Actually call CloudWatch
             self.cloudwatch.put_metric_data(
                 Namespace='AudioQuality',
                 MetricData=metric_data
@@ -112,6 +115,63 @@ class QualityMetricsEmitter:
             log_metrics_emission(stream_id, 0, success=False, error=str(e))
             # Don't raise - graceful degradation
     
+    def emit_scheduler_stats(self, stream_id: str, stats: SchedulerStats) -> None:
+        """
+        Emits analysis cadence activity to CloudWatch.
+        
+        Metrics published:
+        - AudioQuality.EchoAnalysesSkipped
+        - AudioQuality.SNRAnalysesSkipped
+        - AudioQuality.BudgetSkippedAnalyses
+        - AudioQuality.AnalysisCpuTime
+        
+        Args:
+            stream_id: Audio stream identifier
+            stats: Scheduler activity since the last snapshot
+        """
+        try:
+            dimensions = [{'Name': 'StreamId', 'Value': stream_id}]
+            metric_data = [
+                {
+                    'MetricName': 'EchoAnalysesSkipped',
+                    'Value': float(stats.echo_skipped),
+                    'Unit': 'Count',
+                    'Dimensions': dimensions
+                },
+                {
+                    'MetricName': 'SNRAnalysesSkipped',
+                    'Value': float(stats.snr_skipped),
+                    'Unit': 'Count',
+                    'Dimensions': dimensions
+                },
+                {
+                    'MetricName': 'BudgetSkippedAnalyses',
+                    'Value': float(stats.budget_skipped),
+                    'Unit': 'Count',
+                    'Dimensions': dimensions
+                },
+                {
+                    'MetricName': 'AnalysisCpuTime',
+                    'Value': float(stats.cpu_seconds * 1000),
+                    'Unit': 'Milliseconds',
+                    'Dimensions': dimensions
+                }
+            ]
+            
+            self.cloudwatch.put_metric_data(
+                Namespace='AudioQuality',
+                MetricData=metric_data
+            )
+            
+            log_metrics_emission(stream_id, len(metric_data), success=True)
+            
+        except Exception as e:
+            logger.error(
+                f'Failed to emit scheduler stats to CloudWatch: {e}',
+                exc_info=True
+            )
+            log_metrics_emission(stream_id, 0, success=False, error=str(e))
+    
 
     
     def emit_quality_event(
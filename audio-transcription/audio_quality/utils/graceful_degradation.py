@@ -216,7 +216,9 @@ def _emit_fallback_metric(stream_id: str, error_type: str) -> None:
     Emits CloudWatch metric for quality analysis fallback.
     
     This metric tracks how often quality analysis fails and falls back
-    to default metrics, allowing monitoring of system health.
+    to default metrics, allowing monitoring of system health. The metric
+    is buffered in the process-wide metrics sink and written with the
+    invocation's other metrics, so a fallback never waits on CloudWatch.
     
     Args:
         stream_id: Stream identifier
@@ -224,10 +226,9 @@ def _emit_fallback_metric(stream_id: str, error_type: str) -> None:
                    (e.g., 'format_error', 'analysis_error', 'invalid_input')
     """
     try:
-        import boto3
+        from shared.utils.emf_metrics import get_metrics_sink
         
-        cloudwatch = boto3.client('cloudwatch')
-        cloudwatch.put_metric_data(
+        get_metrics_sink().put_metric_data(
             Namespace='AudioQuality',
             MetricData=[
                 {
@@ -16,6 +16,12 @@ try:
 except ImportError:
     BOTO3_AVAILABLE = False
 
+try:
+    from shared.utils.emf_metrics import get_metrics_sink
+    METRICS_SINK_AVAILABLE = True
+except ImportError:
+    METRICS_SINK_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 
@@ -23,8 +29,9 @@ class EmotionDynamicsMetrics:
     """
     Emits CloudWatch metrics for emotion dynamics detection.
     
-    Uses boto3 CloudWatch client when available, otherwise logs metrics
-    in structured format for CloudWatch Logs Insights parsing.
+    Uses the buffered process-wide metrics sink (EMF, flushed at the end of
+    the invocation) when available, else a boto3 CloudWatch client, otherwise
+    logs metrics in structured format for CloudWatch Logs Insights parsing.
     """
     
     def __init__(
@@ -50,7 +57,10 @@ class EmotionDynamicsMetrics:
         self.use_cloudwatch = use_cloudwatch
         
         # Initialize CloudWatch client if enabled
-        if self.use_cloudwatch and BOTO3_AVAILABLE:
+        if self.use_cloudwatch and METRICS_SINK_AVAILABLE:
+            self.cloudwatch = get_metrics_sink()
+            logger.info(f"Using buffered metrics sink for namespace: {namespace}")
+        elif self.use_cloudwatch and BOTO3_AVAILABLE:
             try:
                 self.cloudwatch = boto3.client('cloudwatch')
                 logger.info(f"Initialized CloudWatch metrics client for namespace: {namespace}")
@@ -322,15 +332,15 @@ class EmotionDynamicsMetrics:
             f"dimensions={metric['dimensions']}"
         )
         
-        # Buffer for batch emission
-        self.metrics_buffer.append(metric)
-        
-        # Emit immediately if CloudWatch is enabled (can be optimized to batch)
+        # Hand to the sink/client if enabled (a metrics sink only buffers it),
+        # otherwise keep it for flush_metrics()
         if self.use_cloudwatch and self.cloudwatch:
             try:
                 self._emit_to_cloudwatch([metric])
             except Exception as e:
                 logger.error(f"Failed to emit metric to CloudWatch: {e}", exc_info=True)
+        else:
+            self.metrics_buffer.append(metric)
     
     def _emit_to_cloudwatch(self, metrics: List[Dict[str, Any]]) -> None:
         """
@@ -214,7 +214,9 @@ class AudioTranscriptionStack(Stack):
                 effect=iam.Effect.ALLOW,
                 actions=[
                     'dynamodb:GetItem',
-                    'dynamodb:Query'
+                    'dynamodb:Query',
+                    'dynamodb:BatchWriteItem',  # Remove gone listener connections
+                    'dynamodb:UpdateItem'  # Session delivery checkpoints
                 ],
                 resources=[
                     f'arn:aws:dynamodb:{self.region}:{self.account}:table/Sessions*',
@@ -368,6 +370,79 @@ class AudioTranscriptionStack(Stack):
                 'AUDIO_BUCKET_NAME': f'low-latency-audio-{self.env_name}',  # For Transcribe temp storage
                 'PRESIGNED_URL_EXPIRATION': '600',  # 10 minutes
                 'STAGE': self.env_name,
+                
+                # Kinesis batch processing: sessions processed concurrently per batch
+                'KINESIS_SESSION_CONCURRENCY': '10',
+                
+                # Per-language delivery pipeline: in-flight calls per stage and per-language timeout
+                'TRANSLATE_CONCURRENCY': '10',
+                'TTS_CONCURRENCY': '8',
+                'STORAGE_CONCURRENCY': '10',
+                'NOTIFY_CONCURRENCY': '10',
+                'LANGUAGE_DELIVERY_TIMEOUT_SECONDS': '10.0',
+                
+                # Container-scoped AWS clients: connection pool size and keep-alive
+                'AWS_MAX_POOL_CONNECTIONS': '50',
+                'AWS_TCP_KEEPALIVE': 'true',
+                
+                # Session metadata / listener connections cache TTL (Kinesis path)
+                'SESSION_CONTEXT_TTL_SECONDS': '5.0',
+                
+                # Warm Transcribe streams reused across Kinesis batches
+                'TRANSCRIBE_WARM_STREAMS_ENABLED': 'true',
+                'WARM_STREAM_IDLE_TIMEOUT_SECONDS': '10.0',
+                'WARM_STREAM_FLUSH_TIMEOUT_SECONDS': '2.0',
+                
+                # Voice activity gate in front of Transcribe (skip/trim silence)
+                'VAD_ENABLED': 'true',
+                'VAD_ENERGY_THRESHOLD_DB': '-50.0',
+                'VAD_PADDING_MS': '300',
+                
+                # Translated audio delivery: inline WebSocket clips, S3 for oversized clips or archiving.
+                # Enable only after the listener app with inline playback has shipped
+                # (older listeners need a 'url' in every translatedAudio message).
+                'INLINE_AUDIO_ENABLED': 'false',
+                'INLINE_AUDIO_MAX_BYTES': '262144',
+                'INLINE_AUDIO_CHUNK_BYTES': '65536',
+                'TTS_ARCHIVE_ENABLED': 'false',
+                
+                # Listener fan-out concurrency per language
+                'LISTENER_FANOUT_CONCURRENCY': '32',
+                
+                # Reorder/dedupe window for out-of-order and duplicate audio records
+                'RECORD_REORDER_ENABLED': 'true',
+                'RECORD_REORDER_MAX_SESSIONS': '1000',
+                
+                # Per-session delivery checkpoints (skip delivered records on partial batch retries)
+                'SEQUENCE_CHECKPOINTS_ENABLED': 'true',
+                
+                # Cross-batch audio carry-over (one-shot transcription when warm streams are off)
+                'AUDIO_CARRY_OVER_ENABLED': 'true',
+                'AUDIO_CARRY_OVER_MAX_MS': '1000',
+                
+                # Sentence-sized sub-batches for long session batches (pipelined transcription)
+                'SUB_BATCH_ENABLED': 'true',
+                'SUB_BATCH_THRESHOLD_SECONDS': '6.0',
+                'SUB_BATCH_MIN_SECONDS': '2.0',
+                'SUB_BATCH_MAX_SECONDS': '4.0',
+                
+                # One structured latency trace summary per invocation (critical path by stage)
+                'LATENCY_TRACING_ENABLED': 'true',
+                
+                # Metrics buffered in memory and written as EMF log lines once per invocation
+                'METRICS_BACKEND': 'emf',
+                
+                # WebSocket-path Transcribe streams per container (least recently used closed first)
+                'MAX_ACTIVE_STREAMS': '50',
+                
+                # Threads for blocking SDK calls (default executor of the container event loop)
+                'EXECUTOR_MAX_WORKERS': '32',
+                
+                # Per-session partial result processors (LRU/idle eviction, memory budget)
+                'PARTIAL_PROCESSOR_POOL_MAX': '100',
+                'PARTIAL_PROCESSOR_IDLE_TIMEOUT_SECONDS': '300',
+                'PARTIAL_PROCESSOR_POOL_MAX_MB': '64',
+                
                 # API_GATEWAY_ENDPOINT for Management API (post_to_connection)
                 # Note: Use https:// for Management API, not wss://
                 'API_GATEWAY_ENDPOINT': 'https://2y19uvhyq5.execute-api.us-east-1.amazonaws.com/prod',
@@ -842,6 +917,7 @@ class AudioTranscriptionStack(Stack):
                 retry_attempts=2,  # Retry failed batches
                 max_record_age=Duration.hours(24),  # Skip records older than 24 hours
                 bisect_batch_on_error=True,  # Split batch on error for better error isolation
+                report_batch_item_failures=True,  # Retry from the earliest failed session only
             )
         )
         
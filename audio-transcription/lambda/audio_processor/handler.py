@@ -10,11 +10,10 @@ import asyncio
 import logging
 import os
 import json
-import boto3
 import numpy as np
 import base64
 import time
-from typing import Dict, Any, Optional
+from typing import Awaitable, Callable, Dict, Any, Optional, Tuple, Union
 from shared.models.configuration import PartialResultConfig
 from shared.services.partial_result_processor import PartialResultProcessor
 
@@ -36,6 +35,8 @@ from shared.services.audio_format_validator import (
     AudioFormatError as FormatValidationError
 )
 from shared.services.audio_buffer import AudioBuffer
+from shared.services.session_stream_registry import SessionStream, SessionStreamRegistry
+from shared.services.partial_processor_pool import PartialProcessorPool
 
 # Transcribe streaming imports
 from shared.services.transcribe_stream_handler import TranscribeStreamHandler
@@ -48,6 +49,43 @@ from shared.services.transcribe_client import (
 # Translation Pipeline imports
 from shared.services.lambda_translation_pipeline import LambdaTranslationPipeline
 
+# Container-scoped AWS client registry
+from shared.services.aws_client_registry import get_client_registry
+
+# Buffered metrics written as EMF at the end of each invocation
+from shared.utils.emf_metrics import flush_metrics_after, get_metrics_sink
+
+# Container-lifetime event loop and blocking-call executor
+from shared.services.container_scheduler import ContainerScheduler
+
+# Session context cache (Kinesis path)
+from shared.services.session_context_cache import SessionContext, SessionContextCache
+
+# Voice activity gate in front of Transcribe (Kinesis path)
+from shared.services.voice_activity_detector import VoiceActivityDetector, find_pause_splits
+
+# Zero-copy PCM batch assembly (Kinesis path)
+from shared.services.pcm_batch_assembler import PCMBatch, PCMBatchAssembler
+
+# Reorder/dedupe window for out-of-order and duplicate records (Kinesis path)
+from shared.services.record_reorder_window import RecordReorderWindow
+
+# Cross-batch audio carry-over for one-shot transcription (Kinesis path)
+from shared.services.audio_carry_over import AudioCarryOverBuffer
+
+# Per-session delivery checkpoints for Kinesis retries (Kinesis path)
+from shared.services.sequence_checkpoint_store import SequenceCheckpointStore
+
+# Per-stage latency spans and per-invocation trace summary (Kinesis path)
+from shared.services import latency_tracer
+
+# Warm Transcribe streams (Kinesis path)
+from shared.services.transcribe_stream_pool import (
+    SegmentCallback,
+    TranscribeStreamPool,
+    emit_segment
+)
+
 # Emotion dynamics imports - TEMPORARILY DISABLED FOR PHASE 4
 # Large dependencies (scipy, librosa) exceed Lambda 250MB limit
 # See OPTIONAL_FEATURES_REINTEGRATION_PLAN.md for adding back
@@ -77,14 +115,14 @@ class SpeakerNotifier: pass
 class AudioDynamicsOrchestrator: pass
 class QualityConfig: pass
 
+
+class SessionDeliveryError(Exception):
+    """A Kinesis session's audio was not delivered and must be retried."""
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
 
-# Global processor instance (singleton per Lambda container)
-# Initialized on cold start and reused across invocations
-partial_processor: Optional[PartialResultProcessor] = None
-
 # Audio quality components (singleton per Lambda container) - DISABLED
 quality_analyzer = None
 metrics_emitter = None
@@ -96,10 +134,6 @@ connection_validator: Optional[ConnectionValidator] = None
 rate_limiter: Optional[AudioRateLimiter] = None
 format_validator: Optional[AudioFormatValidator] = None
 
-# Transcribe stream management (per session)
-# session_id -> (client, manager, handler, buffer, last_activity_time)
-active_streams: Dict[str, tuple] = {}
-
 # Translation Pipeline client (singleton per Lambda container)
 translation_pipeline: Optional[LambdaTranslationPipeline] = None
 
@@ -110,9 +144,15 @@ emotion_orchestrator = None
 # session_id -> {'volume': float, 'rate': float, 'energy': float, 'timestamp': int}
 emotion_cache: Dict[str, Dict[str, Any]] = {}
 
-# CloudWatch and EventBridge clients
-cloudwatch = boto3.client('cloudwatch')
-eventbridge = boto3.client('events')
+# AWS clients are created once per container and reused across warm invocations
+aws_clients = get_client_registry()
+
+# Metrics are buffered and flushed once per invocation instead of a
+# blocking PutMetricData request per metric
+metrics_sink = get_metrics_sink()
+
+# EventBridge client
+eventbridge = aws_clients.client('events')
 
 # Fallback state tracking
 fallback_mode_enabled = False
@@ -125,8 +165,147 @@ audio_session_active = False
 # Stream lifecycle constants
 STREAM_IDLE_TIMEOUT_SECONDS = 60  # Close stream after 60 seconds of inactivity
 STREAM_CLEANUP_INTERVAL_SECONDS = 300  # Check for idle streams every 5 minutes
+# Maximum WebSocket-path Transcribe streams per container (least recently
+# used stream closed first)
+MAX_ACTIVE_STREAMS = int(os.getenv('MAX_ACTIVE_STREAMS', '50'))
+
+# Transcribe stream management (per session, WebSocket path)
+session_streams = SessionStreamRegistry(
+    idle_timeout_seconds=STREAM_IDLE_TIMEOUT_SECONDS,
+    max_streams=MAX_ACTIVE_STREAMS
+)
+
+# Partial result processors: one per session, created on first use so result
+# buffers, deduplication and rate limiting are never shared across sessions.
+# Idle, least recently used and over-budget processors are evicted.
+partial_processors = PartialProcessorPool(
+    factory=lambda session_id, source_language: PartialResultProcessor(
+        config=_load_config_from_environment(),
+        session_id=session_id,
+        source_language=source_language
+    ),
+    max_processors=int(os.getenv('PARTIAL_PROCESSOR_POOL_MAX', '100')),
+    idle_timeout_seconds=float(os.getenv('PARTIAL_PROCESSOR_IDLE_TIMEOUT_SECONDS', '300')),
+    max_memory_bytes=int(os.getenv('PARTIAL_PROCESSOR_POOL_MAX_MB', '64')) * 1024 * 1024
+)
+
+# Kinesis batch processing: maximum number of sessions processed concurrently
+# within one batch (1 = process sessions sequentially)
+KINESIS_SESSION_CONCURRENCY = int(os.getenv('KINESIS_SESSION_CONCURRENCY', '10'))
+
+# Per-language delivery pipeline: maximum in-flight calls per stage and
+# maximum time one language's translate -> TTS -> store -> notify chain
+# spends in its stage calls (waits for a free stage slot are not counted,
+# so queueing under load does not time languages out before they start)
+DELIVERY_STAGE_CONCURRENCY = {
+    'translate': int(os.getenv('TRANSLATE_CONCURRENCY', '10')),
+    'tts': int(os.getenv('TTS_CONCURRENCY', '8')),
+    'storage': int(os.getenv('STORAGE_CONCURRENCY', '10')),
+    'notify': int(os.getenv('NOTIFY_CONCURRENCY', '10')),
+}
+LANGUAGE_DELIVERY_TIMEOUT_SECONDS = float(os.getenv('LANGUAGE_DELIVERY_TIMEOUT_SECONDS', '10.0'))
+
+# Session metadata and listener connections are cached for a short TTL so one
+# lookup per session feeds every stage of a batch
+SESSION_CONTEXT_TTL_SECONDS = float(os.getenv('SESSION_CONTEXT_TTL_SECONDS', '5.0'))
+session_context_cache = SessionContextCache(
+    loader=lambda session_id: _load_session_context(session_id),
+    ttl_seconds=SESSION_CONTEXT_TTL_SECONDS
+)
+
+# Warm Transcribe streams: one stream per session is kept open across Kinesis
+# batches handled by this container. Transcribe ends a stream after 15 seconds
+# without audio, so warm streams are closed well before STREAM_IDLE_TIMEOUT_SECONDS.
+TRANSCRIBE_WARM_STREAMS_ENABLED = os.getenv('TRANSCRIBE_WARM_STREAMS_ENABLED', 'true').lower() == 'true'
+WARM_STREAM_IDLE_TIMEOUT_SECONDS = min(
+    STREAM_IDLE_TIMEOUT_SECONDS,
+    float(os.getenv('WARM_STREAM_IDLE_TIMEOUT_SECONDS', '10.0'))
+)
+WARM_STREAM_FLUSH_TIMEOUT_SECONDS = float(os.getenv('WARM_STREAM_FLUSH_TIMEOUT_SECONDS', '2.0'))
+transcribe_stream_pool = TranscribeStreamPool(
+    idle_timeout_seconds=WARM_STREAM_IDLE_TIMEOUT_SECONDS,
+    flush_timeout_seconds=WARM_STREAM_FLUSH_TIMEOUT_SECONDS,
+    region=os.environ.get('AWS_REGION', 'us-east-1')
+)
+
+# Translated audio delivery: clips up to INLINE_AUDIO_MAX_BYTES are sent
+# inline in the translatedAudio WebSocket message (split into chunks of
+# INLINE_AUDIO_CHUNK_BYTES to stay under the 128 KB API Gateway message
+# limit after base64); larger clips go through S3 and a presigned URL.
+# TTS_ARCHIVE_ENABLED also stores inline clips in S3 after delivery.
+# Off by default: listener apps that predate inline delivery only play
+# messages with a 'url', so enable it once the updated listener app is live.
+INLINE_AUDIO_ENABLED = os.getenv('INLINE_AUDIO_ENABLED', 'false').lower() == 'true'
+INLINE_AUDIO_MAX_BYTES = int(os.getenv('INLINE_AUDIO_MAX_BYTES', '262144'))
+INLINE_AUDIO_CHUNK_BYTES = int(os.getenv('INLINE_AUDIO_CHUNK_BYTES', '65536'))
+TTS_ARCHIVE_ENABLED = os.getenv('TTS_ARCHIVE_ENABLED', 'false').lower() == 'true'
+
+# Listener fan-out: maximum concurrent post_to_connection calls per language
+LISTENER_FANOUT_CONCURRENCY = int(os.getenv('LISTENER_FANOUT_CONCURRENCY', '32'))
+
+# Voice activity gate: silent batches skip Transcribe and the listener
+# lookups, and silence around speech is trimmed before transcription
+VAD_ENABLED = os.getenv('VAD_ENABLED', 'true').lower() == 'true'
+voice_activity_detector = VoiceActivityDetector(
+    energy_threshold_db=float(os.getenv('VAD_ENERGY_THRESHOLD_DB', '-50.0')),
+    padding_ms=int(os.getenv('VAD_PADDING_MS', '300'))
+)
 
+# Cross-batch carry-over: the tail of a batch after its quietest point is held
+# back and prepended to the session's next batch, so one-shot transcription
+# does not cut words at batch edges. Warm streams already receive contiguous
+# audio, so carry-over only applies when they are disabled.
+AUDIO_CARRY_OVER_ENABLED = os.getenv('AUDIO_CARRY_OVER_ENABLED', 'true').lower() == 'true'
+audio_carry_over = AudioCarryOverBuffer(
+    max_carry_ms=int(os.getenv('AUDIO_CARRY_OVER_MAX_MS', '1000'))
+)
+
+# Texts delivered in place of a transcript; they are not speech, so carry-over
+# neither strips them against nor remembers them as the delivered transcript
+PLACEHOLDER_TRANSCRIPTS = frozenset({'[Transcription unavailable]', '[No transcription]'})
+
+# Sub-batching: a session batch longer than SUB_BATCH_THRESHOLD_SECONDS (e.g.
+# after Kinesis retries built up) is split at low-energy points into segments
+# of SUB_BATCH_MIN_SECONDS..SUB_BATCH_MAX_SECONDS, transcribed one after the
+# other while earlier segments are already being translated and synthesized
+SUB_BATCH_ENABLED = os.getenv('SUB_BATCH_ENABLED', 'true').lower() == 'true'
+SUB_BATCH_THRESHOLD_SECONDS = float(os.getenv('SUB_BATCH_THRESHOLD_SECONDS', '6.0'))
+SUB_BATCH_MIN_SECONDS = float(os.getenv('SUB_BATCH_MIN_SECONDS', '2.0'))
+SUB_BATCH_MAX_SECONDS = float(os.getenv('SUB_BATCH_MAX_SECONDS', '4.0'))
+
+# Record reorder/dedupe window: a session's records are ordered by client
+# chunk index (sequence number for plain PCM records) and duplicate or late
+# chunks are dropped before Transcribe; state is kept across warm invocations
+RECORD_REORDER_ENABLED = os.getenv('RECORD_REORDER_ENABLED', 'true').lower() == 'true'
+record_reorder_window = RecordReorderWindow(
+    max_sessions=int(os.getenv('RECORD_REORDER_MAX_SESSIONS', '1000'))
+)
+
+# Delivery checkpoints: the last delivered Kinesis sequence number of each
+# session, persisted on the Sessions item so records replayed by a partial
+# batch retry are skipped instead of delivered twice
+SEQUENCE_CHECKPOINTS_ENABLED = os.getenv('SEQUENCE_CHECKPOINTS_ENABLED', 'true').lower() == 'true'
+sequence_checkpoints = SequenceCheckpointStore(
+    loader=lambda session_id: _load_sequence_checkpoint(session_id),
+    writer=lambda session_id, sequence_number: _save_sequence_checkpoint(session_id, sequence_number)
+)
+
+# Latency tracing: spans around DynamoDB, Transcribe, Translate, Polly, S3,
+# presign and fan-out per session and language, condensed into one
+# structured 'KinesisBatchTrace' log record per invocation
+LATENCY_TRACING_ENABLED = os.getenv('LATENCY_TRACING_ENABLED', 'true').lower() == 'true'
+
+# One event loop per container, with blocking SDK calls on a dedicated
+# thread pool (also the loop's default executor)
+EXECUTOR_MAX_WORKERS = int(os.getenv('EXECUTOR_MAX_WORKERS', '32'))
+scheduler = ContainerScheduler(max_workers=EXECUTOR_MAX_WORKERS)
+
+# Stage semaphores (created lazily on the running event loop)
+_stage_semaphores: Dict[str, asyncio.Semaphore] = {}
+_stage_semaphores_loop: Optional[asyncio.AbstractEventLoop] = None
 
+
+@flush_metrics_after
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Synchronous Lambda handler for audio processing.
@@ -167,7 +346,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     Returns:
         Response dict with statusCode and body
     """
-    global partial_processor, quality_analyzer, metrics_emitter, speaker_notifier
+    global quality_analyzer, metrics_emitter, speaker_notifier
     global websocket_parser, connection_validator, rate_limiter, format_validator
     
     try:
@@ -179,8 +358,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         if is_kinesis_event:
             # Handle Kinesis batch event (Phase 4 - primary path)
             logger.info("Processing Kinesis batch event")
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(handle_kinesis_batch(event, context))
+            return scheduler.run(handle_kinesis_batch(event, context))
         elif is_websocket_event:
             # Handle WebSocket audio event
             logger.info("Processing WebSocket audio event")
@@ -188,8 +366,7 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
         elif is_pcm_batch:
             # Handle PCM batch from s3_audio_consumer (Phase 3 - deprecated)
             logger.info("Processing PCM batch from s3_audio_consumer")
-            loop = asyncio.get_event_loop()
-            return loop.run_until_complete(handle_pcm_batch(event, context))
+            return scheduler.run(handle_pcm_batch(event, context))
         else:
             # Handle direct invocation (legacy/testing)
             logger.info("Processing direct invocation event")
@@ -204,14 +381,18 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
                 'message': str(e)
             })
         }
+    finally:
+        # Executor utilization of this invocation (flushed with the other metrics)
+        scheduler.emit_metrics(metrics_sink)
 
 
 def get_active_listener_languages(session_id: str) -> list:
     """
     Get active target languages from connected listeners (cost optimization).
     
-    This queries the Connections table to find which languages actually have
-    active listeners, so we only translate to languages that are being used.
+    This reads the session context cache (one Connections GSI query per
+    session per SESSION_CONTEXT_TTL_SECONDS) to find which languages actually
+    have active listeners, so we only translate to languages that are being used.
     
     Benefits:
     - 50-90% reduction in translation costs
@@ -225,33 +406,8 @@ def get_active_listener_languages(session_id: str) -> list:
         List of target language codes with active listeners
     """
     try:
-        # Query DynamoDB directly (no shared layer dependency)
-        dynamodb_client = boto3.resource('dynamodb')
-        connections_table_name = os.environ.get('CONNECTIONS_TABLE', 'Connections-dev')
-        connections_table = dynamodb_client.Table(connections_table_name)
-        
-        # Query GSI for all connections in this session
-        response = connections_table.query(
-            IndexName='sessionId-targetLanguage-index',
-            KeyConditionExpression='sessionId = :sid',
-            FilterExpression='#role = :role',
-            ExpressionAttributeNames={'#role': 'role'},
-            ExpressionAttributeValues={
-                ':sid': session_id,
-                ':role': 'listener'
-            }
-        )
-        
-        connections = response.get('Items', [])
-        
-        # Extract unique target languages
-        unique_languages = set(
-            conn.get('targetLanguage')
-            for conn in connections
-            if conn.get('targetLanguage')
-        )
-        
-        active_languages = list(unique_languages)
+        context = session_context_cache.get(session_id)
+        active_languages = context.active_languages if context else []
         
         logger.info(
             f"Active listener languages for session {session_id}: {active_languages}"
@@ -268,6 +424,77 @@ def get_active_listener_languages(session_id: str) -> list:
         return []
 
 
+def _query_listeners_by_language(session_id: str) -> Dict[str, list]:
+    """
+    Query listener connections of a session grouped by target language.
+    
+    Uses a single query on the sessionId-targetLanguage-index GSI for all
+    languages (following pagination) instead of one query per language.
+    
+    Args:
+        session_id: Session identifier
+    
+    Returns:
+        Dict mapping target language code to listener connection IDs
+    """
+    # Query DynamoDB directly (no shared layer dependency)
+    connections_table_name = os.environ.get('CONNECTIONS_TABLE', 'Connections-dev')
+    connections_table = aws_clients.table(connections_table_name)
+    
+    query_kwargs = {
+        'IndexName': 'sessionId-targetLanguage-index',
+        'KeyConditionExpression': 'sessionId = :sid',
+        'FilterExpression': '#role = :role',
+        'ExpressionAttributeNames': {'#role': 'role'},
+        'ExpressionAttributeValues': {
+            ':sid': session_id,
+            ':role': 'listener'
+        }
+    }
+    
+    listeners_by_language: Dict[str, list] = {}
+    while True:
+        response = connections_table.query(**query_kwargs)
+        
+        for conn in response.get('Items', []):
+            language = conn.get('targetLanguage')
+            connection_id = conn.get('connectionId')
+            if language and connection_id:
+                listeners_by_language.setdefault(language, []).append(connection_id)
+        
+        last_key = response.get('LastEvaluatedKey')
+        if not last_key:
+            break
+        query_kwargs['ExclusiveStartKey'] = last_key
+    
+    return listeners_by_language
+
+
+def _load_session_context(session_id: str) -> Optional[SessionContext]:
+    """
+    Load session metadata and listener connections from DynamoDB.
+    
+    Loader for session_context_cache: one Sessions GetItem plus one
+    Connections GSI query per session.
+    
+    Args:
+        session_id: Session identifier
+    
+    Returns:
+        SessionContext, or None if the session does not exist
+    """
+    session = _get_session_item(session_id)
+    if not session:
+        return None
+    
+    return SessionContext(
+        session_id=session_id,
+        source_language=session.get('sourceLanguage', 'en'),
+        target_languages=list(session.get('targetLanguages', [])),
+        listeners_by_language=_query_listeners_by_language(session_id)
+    )
+
+
 def handle_direct_invocation(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Handle direct invocation (non-WebSocket) for testing and legacy support.
@@ -279,7 +506,7 @@ def handle_direct_invocation(event: Dict[str, Any], context: Any) -> Dict[str, A
     Returns:
         Response dict
     """
-    global partial_processor, quality_analyzer, metrics_emitter, speaker_notifier
+    global quality_analyzer, metrics_emitter, speaker_notifier
     
     try:
         # Extract session information
@@ -292,16 +519,8 @@ def handle_direct_invocation(event: Dict[str, Any], context: Any) -> Dict[str, A
             f"session={session_id}, language={source_language}"
         )
         
-        # Initialize processor on cold start
-        if partial_processor is None:
-            logger.info("Cold start: Initializing PartialResultProcessor")
-            config = _load_config_from_environment()
-            partial_processor = PartialResultProcessor(
-                config=config,
-                session_id=session_id,
-                source_language=source_language
-            )
-            logger.info("PartialResultProcessor initialized successfully")
+        # Get the session's processor (created on first use)
+        partial_processor = partial_processors.get(session_id, source_language)
         
         # Initialize audio quality components on cold start
         if quality_analyzer is None:
@@ -309,7 +528,7 @@ def handle_direct_invocation(event: Dict[str, Any], context: Any) -> Dict[str, A
             try:
                 quality_config = _load_quality_config_from_environment()
                 quality_analyzer = AudioQualityAnalyzer(quality_config)
-                metrics_emitter = QualityMetricsEmitter(cloudwatch, eventbridge)
+                metrics_emitter = QualityMetricsEmitter(metrics_sink, eventbridge)
                 speaker_notifier = SpeakerNotifier(websocket_manager=None)  # WebSocket manager to be injected
                 logger.info("Audio quality components initialized successfully")
             except ConfigurationError as e:
@@ -333,9 +552,8 @@ def handle_direct_invocation(event: Dict[str, Any], context: Any) -> Dict[str, A
                 metrics_emitter = None
                 speaker_notifier = None
         
-        # Bridge async/sync: Run async processing in event loop
-        loop = asyncio.get_event_loop()
-        result = loop.run_until_complete(
+        # Bridge async/sync: Run async processing in the container event loop
+        result = scheduler.run(
             process_audio_async(event, context, partial_processor)
         )
         
@@ -372,7 +590,6 @@ def handle_websocket_audio_event(event: Dict[str, Any], context: Any) -> Dict[st
         Response dict with statusCode
     """
     global websocket_parser, connection_validator, rate_limiter, format_validator
-    global partial_processor, active_streams
     
     try:
         # Initialize components on cold start
@@ -489,13 +706,9 @@ def handle_websocket_audio_event(event: Dict[str, Any], context: Any) -> Dict[st
         
         # Step 5: Initialize or get Transcribe stream
         try:
-            stream_info = _get_or_create_stream(session_id, source_language)
-            client, manager, handler, buffer, _ = stream_info
-            
-            # Update last activity time
-            active_streams[session_id] = (
-                client, manager, handler, buffer, time.time()
-            )
+            stream = _get_or_create_stream(session_id, source_language)
+            buffer = stream.buffer
+            session_streams.touch(session_id)
             
         except Exception as e:
             logger.error(f"Failed to initialize Transcribe stream: {e}", exc_info=True)
@@ -509,8 +722,7 @@ def handle_websocket_audio_event(event: Dict[str, Any], context: Any) -> Dict[st
         
         # Step 6: Extract emotion dynamics from audio (if enabled)
         try:
-            loop = asyncio.get_event_loop()
-            emotion_data = loop.run_until_complete(
+            emotion_data = scheduler.run(
                 process_audio_chunk_with_emotion(session_id, audio_bytes)
             )
             
@@ -530,9 +742,8 @@ def handle_websocket_audio_event(event: Dict[str, Any], context: Any) -> Dict[st
             buffer.add_chunk(audio_bytes, session_id)
             
             # Send audio to Transcribe stream asynchronously
-            # Run in event loop
-            loop = asyncio.get_event_loop()
-            success = loop.run_until_complete(
+            # Run in the container event loop
+            success = scheduler.run(
                 _send_audio_to_stream(session_id, audio_bytes)
             )
             
@@ -590,6 +801,24 @@ async def handle_kinesis_batch(event: Dict[str, Any], context: Any) -> Dict[str,
     6. Store TTS audio in S3
     7. Send WebSocket notifications to listeners
     
+    Sessions are processed concurrently, bounded by KINESIS_SESSION_CONCURRENCY,
+    so a slow session no longer delays the listeners of every other session
+    in the same batch. Each session is isolated: a failure is reported in
+    'failures' and does not affect the results of the other sessions.
+    
+    Failed sessions are also reported in 'batchItemFailures' (partial batch
+    response, keyed by the sequence number of the session's first record),
+    so Kinesis only retries from the earliest failed record. A session also
+    fails when nothing of it was delivered (transcription failed or every
+    language failed); its checkpoint then stays put. Partially delivered
+    sessions are checkpointed and counted in PartialDeliveries. Records at or below a session's delivery
+    checkpoint are skipped, so sessions that were already delivered are not
+    delivered again when the retry replays them.
+    
+    A session's remaining records are put in chunk order and duplicate or
+    late chunks are dropped (record_reorder_window) before any audio is
+    decoded or sent to Transcribe.
+    
     Benefits vs Phase 3:
     - Native Kinesis batching (3-second windows)
     - Transcribe Streaming API (500ms vs 15-60s)
@@ -605,8 +834,10 @@ async def handle_kinesis_batch(event: Dict[str, Any], context: Any) -> Dict[str,
         context: Lambda context
     
     Returns:
-        Response dict with statusCode and results
+        Response dict with statusCode, per-session results and failures,
+        plus batchItemFailures for the Kinesis event source
     """
+    trace = None
     try:
         records = event.get('Records', [])
         
@@ -614,205 +845,1229 @@ async def handle_kinesis_batch(event: Dict[str, Any], context: Any) -> Dict[str,
             logger.warning("Received empty Kinesis batch")
             return {
                 'statusCode': 200,
-                'body': json.dumps({'message': 'Empty batch, no processing'})
+                'body': json.dumps({'message': 'Empty batch, no processing'}),
+                'batchItemFailures': []
             }
         
         logger.info(f"Processing Kinesis batch with {len(records)} records")
         
-        # Step 1: Group records by sessionId (partition key)
-        sessions = {}
+        if LATENCY_TRACING_ENABLED:
+            trace = latency_tracer.start_trace('kinesis_batch', recordCount=len(records))
+        
+        # Close warm streams of sessions that stopped sending audio
+        if TRANSCRIBE_WARM_STREAMS_ENABLED:
+            await transcribe_stream_pool.close_idle()
+        
+        # Step 1: Group records by sessionId (partition key). Records are
+        # decoded later, straight into one preallocated buffer per session.
+        assembler = PCMBatchAssembler(sample_rate=16000)
         for record in records:
             kinesis_data = record.get('kinesis', {})
-            pcm_bytes = base64.b64decode(kinesis_data.get('data', ''))
             partition_key = kinesis_data.get('partitionKey', '')  # sessionId
             
             if not partition_key:
                 logger.warning("Record missing partition key, skipping")
                 continue
             
-            if partition_key not in sessions:
-                sessions[partition_key] = []
-            sessions[partition_key].append(pcm_bytes)
+            assembler.add_record(
+                partition_key,
+                kinesis_data.get('data', ''),
+                kinesis_data.get('sequenceNumber')
+            )
         
-        logger.info(f"Grouped records into {len(sessions)} sessions")
+        session_ids = assembler.session_ids
+        concurrency = max(1, KINESIS_SESSION_CONCURRENCY)
+        logger.info(
+            f"Grouped records into {len(session_ids)} sessions "
+            f"(session concurrency: {concurrency})"
+        )
         
-        # Step 2-7: Process each session
-        all_results = []
+        # Step 2-7: Process sessions concurrently with bounded concurrency
+        semaphore = asyncio.Semaphore(concurrency)
+        loop = asyncio.get_event_loop()
         
-        for session_id, pcm_chunks in sessions.items():
-            try:
-                # Concatenate PCM chunks
-                pcm_data = b''.join(pcm_chunks)
-                duration = len(pcm_data) / (16000 * 2)  # 16kHz, 16-bit (2 bytes per sample)
-                
+        async def process_session(session_id: str) -> Dict[str, Any]:
+            checkpoint = None
+            if SEQUENCE_CHECKPOINTS_ENABLED:
+                with latency_tracer.span('checkpoint_load'):
+                    checkpoint = await loop.run_in_executor(
+                        None, sequence_checkpoints.get, session_id
+                    )
+            
+            received = assembler.records(session_id, after_sequence_number=checkpoint)
+            if not received:
                 logger.info(
-                    f"Session {session_id}: {len(pcm_chunks)} chunks, "
-                    f"{len(pcm_data)} bytes, {duration:.2f}s"
+                    f"Session {session_id}: all records already delivered "
+                    f"(checkpoint {checkpoint}), skipping"
                 )
+                return {
+                    'sessionId': session_id,
+                    'skipped': True,
+                    'reason': 'Already delivered'
+                }
+            last_sequence_number = max(
+                (record.sequence_number for record in received if record.sequence_number),
+                key=int,
+                default=None
+            )
+            
+            # Order records and drop duplicate or late chunks
+            selection = None
+            records = received
+            if RECORD_REORDER_ENABLED:
+                selection = record_reorder_window.select(session_id, received)
+                records = selection.records
+            dropped_count = selection.dropped_count if selection else 0
+            
+            if records:
+                carried = audio_carry_over.take(session_id) if _carry_over_active() else None
                 
-                # Get session metadata from DynamoDB
-                dynamodb_client = boto3.resource('dynamodb')
-                sessions_table_name = os.environ.get('SESSIONS_TABLE_NAME', 'Sessions-dev')
-                sessions_table = dynamodb_client.Table(sessions_table_name)
-                
-                session_response = sessions_table.get_item(Key={'sessionId': session_id})
-                session = session_response.get('Item')
-                
-                if not session:
-                    logger.error(f"Session not found in DynamoDB: {session_id}")
-                    continue
-                
-                source_language = session.get('sourceLanguage', 'en')
-                
-                # COST OPTIMIZATION: Only translate to languages with active listeners
-                active_languages = get_active_listener_languages(session_id)
-                
-                if not active_languages:
-                    logger.info(
-                        f"No active listeners for session {session_id}, skipping translation "
-                        f"(cost savings: 100%)"
-                    )
-                    all_results.append({
-                        'sessionId': session_id,
-                        'skipped': True,
-                        'reason': 'No active listeners',
-                        'costSavings': '100%'
-                    })
-                    continue
-                
-                # Log cost savings if some languages are skipped
-                session_target_languages = session.get('targetLanguages', [])
-                skipped_languages = set(session_target_languages) - set(active_languages)
-                
-                if skipped_languages:
-                    savings_pct = int(len(skipped_languages) / len(session_target_languages) * 100)
-                    logger.info(
-                        f"Cost optimization for session {session_id}: "
-                        f"Processing {len(active_languages)} languages (active listeners), "
-                        f"skipping {len(skipped_languages)} languages (no listeners): {skipped_languages}. "
-                        f"Cost savings: {savings_pct}%"
-                    )
-                
-                # Convert to AWS language code
-                aws_language = _convert_to_aws_language_code(source_language)
+                # Only sessions in flight hold a decoded audio buffer
+                batch = assembler.assemble(session_id, records, prefix=carried)
                 
-                # Step 3: Transcribe using Transcribe Streaming API
                 try:
-                    transcript = await transcribe_streaming(
-                        pcm_data,
-                        aws_language,
-                        16000
-                    )
-                    logger.info(f"Transcription complete for {session_id}: '{transcript[:100]}...'")
-                except Exception as transcribe_error:
-                    logger.error(f"Transcription failed for {session_id}: {str(transcribe_error)}")
-                    transcript = "[Transcription unavailable]"
-                
-                # Step 4-7: Translate and deliver ONLY to active listener languages
-                session_results = await process_translation_and_delivery(
-                    session_id,
-                    transcript,
-                    source_language,
-                    active_languages,  # Use active languages, not all target languages
-                    int(time.time() * 1000),
-                    duration
-                )
-                
-                all_results.append({
+                    result = await _process_kinesis_session(session_id, batch)
+                except Exception:
+                    # The retry starts from this batch's records again
+                    audio_carry_over.restore(session_id, carried)
+                    raise
+            else:
+                logger.info(f"Session {session_id}: only duplicate records, skipping")
+                result = {
                     'sessionId': session_id,
-                    'results': session_results
-                })
-                
-            except Exception as session_error:
+                    'skipped': True,
+                    'reason': 'Duplicate records'
+                }
+            result['droppedRecordCount'] = dropped_count
+            
+            if selection:
+                record_reorder_window.commit(session_id, selection)
+            if SEQUENCE_CHECKPOINTS_ENABLED:
+                with latency_tracer.span('checkpoint_save'):
+                    await loop.run_in_executor(
+                        None, sequence_checkpoints.advance,
+                        session_id, last_sequence_number
+                    )
+            return result
+        
+        async def process_with_limit(session_id: str) -> Dict[str, Any]:
+            with latency_tracer.span('session', session=session_id):
+                with latency_tracer.span('session_queue'):
+                    await semaphore.acquire()
+                try:
+                    return await process_session(session_id)
+                finally:
+                    semaphore.release()
+        
+        outcomes = await asyncio.gather(
+            *(process_with_limit(sid) for sid in session_ids),
+            return_exceptions=True
+        )
+        
+        all_results = []
+        failures = []
+        for session_id, outcome in zip(session_ids, outcomes):
+            if isinstance(outcome, BaseException):
                 logger.error(
-                    f"Error processing session {session_id}: {str(session_error)}",
-                    exc_info=True
+                    f"Error processing session {session_id}: {str(outcome)}",
+                    exc_info=outcome
                 )
-                all_results.append({
+                # Reload session context on the next attempt
+                session_context_cache.invalidate(session_id)
+                failures.append({
                     'sessionId': session_id,
-                    'error': str(session_error)
+                    'sequenceNumber': assembler.first_sequence_number(session_id),
+                    'error': str(outcome)
                 })
+            else:
+                all_results.append(outcome)
+        
+        if failures:
+            logger.warning(
+                f"Kinesis batch completed with {len(failures)}/{len(session_ids)} "
+                f"failed sessions: {[f['sessionId'] for f in failures]}"
+            )
+        
+        # Report skipped silence and per-mode delivery latency (buffered,
+        # written when the invocation ends)
+        with latency_tracer.span('metrics'):
+            _emit_kinesis_batch_metrics(all_results)
+        
+        if trace:
+            _log_trace_summary(
+                trace,
+                sessionCount=len(session_ids),
+                failedSessionCount=len(failures)
+            )
         
         return {
             'statusCode': 200,
             'body': json.dumps({
                 'message': 'Kinesis batch processed',
                 'recordCount': len(records),
-                'sessionCount': len(sessions),
-                'results': all_results
-            })
+                'sessionCount': len(session_ids),
+                'failedSessionCount': len(failures),
+                'results': all_results,
+                'failures': failures
+            }),
+            'batchItemFailures': [
+                {'itemIdentifier': failure['sequenceNumber']}
+                for failure in failures
+                if failure['sequenceNumber']
+            ]
         }
         
     except Exception as e:
         logger.error(f"Error processing Kinesis batch: {str(e)}", exc_info=True)
+        if trace:
+            _log_trace_summary(trace, error=str(e))
+        
+        # Retry the whole batch; delivered sessions are skipped by checkpoint
+        first_sequence_number = next(
+            (
+                record.get('kinesis', {}).get('sequenceNumber')
+                for record in event.get('Records') or []
+                if record.get('kinesis', {}).get('sequenceNumber')
+            ),
+            None
+        )
         return {
             'statusCode': 500,
             'body': json.dumps({
                 'error': 'Kinesis batch processing failed',
                 'message': str(e)
-            })
+            }),
+            'batchItemFailures': (
+                [{'itemIdentifier': first_sequence_number}] if first_sequence_number else []
+            )
+        }
+
+
+def _log_trace_summary(trace: latency_tracer.InvocationTrace, **attributes) -> None:
+    """
+    Close an invocation trace and log its summary as one JSON record.
+    
+    The record carries per-stage totals, the slowest sessions and languages
+    and the critical path breakdown, e.g. for CloudWatch Logs Insights:
+    
+        filter trace = 'kinesis_batch'
+        | stats pct(durationMs, 95), avg(criticalPathBreakdownMs.transcribe),
+                avg(criticalPathBreakdownMs.tts) by bin(5m)
+    
+    Args:
+        trace: Trace of the invocation
+        **attributes: Attributes added to the summary (e.g. counts)
+    """
+    try:
+        trace.finish(**attributes)
+        logger.info(json.dumps({'message': 'KinesisBatchTrace', **trace.summary()}))
+    except Exception as e:
+        logger.warning(f"Failed to summarize latency trace: {e}")
+
+
+def _emit_kinesis_batch_metrics(session_results: list) -> None:
+    """
+    Emit per-batch metrics of the Kinesis path.
+    
+    - SilenceSkippedSeconds: seconds of silence skipped by the voice activity
+      gate, per session
+    - PartialDeliveries: sessions checkpointed although part of their batch
+      (a later segment, or some languages) was not delivered, per session
+    - DuplicateRecordsDropped: duplicate or late audio records dropped before
+      transcription, per session
+    - DeliveryLatency: TTS audio ready -> listeners notified, per delivery
+      mode ('inline' or 's3'), one value per delivered language/segment
+    - ListenerFanoutDuration: time to notify all listeners of one language,
+      one value per delivered language/segment (p50/p95/p99 via statistics)
+    
+    Args:
+        session_results: Per-session results of a Kinesis batch
+    """
+    metric_data = [
+        {
+            'MetricName': 'SilenceSkippedSeconds',
+            'Value': result['silenceSkippedSeconds'],
+            'Unit': 'Seconds',
+            'Dimensions': [
+                {'Name': 'SessionId', 'Value': result['sessionId']}
+            ]
+        }
+        for result in session_results
+        if result.get('silenceSkippedSeconds')
+    ]
+    metric_data.extend(
+        {
+            'MetricName': 'PartialDeliveries',
+            'Value': 1,
+            'Unit': 'Count',
+            'Dimensions': [
+                {'Name': 'SessionId', 'Value': result['sessionId']}
+            ]
+        }
+        for result in session_results
+        if result.get('partialDelivery')
+    )
+    metric_data.extend(
+        {
+            'MetricName': 'DuplicateRecordsDropped',
+            'Value': result['droppedRecordCount'],
+            'Unit': 'Count',
+            'Dimensions': [
+                {'Name': 'SessionId', 'Value': result['sessionId']}
+            ]
         }
+        for result in session_results
+        if result.get('droppedRecordCount')
+    )
+    
+    latencies_by_mode: Dict[str, list] = {}
+    fanout_durations = []
+    for result in session_results:
+        for language_result in result.get('results', []):
+            mode = language_result.get('deliveryMode')
+            if mode:
+                latencies_by_mode.setdefault(mode, []).append(language_result['deliveryMs'])
+            if language_result.get('fanoutMs') is not None:
+                fanout_durations.append(language_result['fanoutMs'])
+    
+    for mode, latencies in latencies_by_mode.items():
+        metric_data.append({
+            'MetricName': 'DeliveryLatency',
+            'Values': latencies,
+            'Unit': 'Milliseconds',
+            'Dimensions': [
+                {'Name': 'DeliveryMode', 'Value': mode}
+            ]
+        })
+    
+    if fanout_durations:
+        metric_data.append({
+            'MetricName': 'ListenerFanoutDuration',
+            'Values': fanout_durations,
+            'Unit': 'Milliseconds'
+        })
+    
+    if not metric_data:
+        return
+    
+    try:
+        metrics_sink.put_metric_data(
+            Namespace='AudioTranscription/Kinesis',
+            MetricData=metric_data
+        )
+    except Exception as e:
+        logger.warning(f"Failed to emit Kinesis batch metrics: {e}")
+
+
+def _get_session_item(session_id: str) -> Optional[Dict[str, Any]]:
+    """
+    Get session metadata from the Sessions table.
+    
+    Args:
+        session_id: Session identifier
+    
+    Returns:
+        Session item or None if the session does not exist
+    """
+    sessions_table_name = os.environ.get('SESSIONS_TABLE_NAME', 'Sessions-dev')
+    sessions_table = aws_clients.table(sessions_table_name)
+    
+    session_response = sessions_table.get_item(Key={'sessionId': session_id})
+    return session_response.get('Item')
+
+
+def _carry_over_active() -> bool:
+    """Check if batch tails are carried over (one-shot transcription only)."""
+    return AUDIO_CARRY_OVER_ENABLED and not TRANSCRIBE_WARM_STREAMS_ENABLED
+
+
+def _load_sequence_checkpoint(session_id: str) -> Optional[str]:
+    """
+    Load the persisted delivery checkpoint of a session.
+    
+    Loader for sequence_checkpoints.
+    
+    Args:
+        session_id: Session identifier
+    
+    Returns:
+        Last delivered Kinesis sequence number, or None
+    """
+    sessions_table_name = os.environ.get('SESSIONS_TABLE_NAME', 'Sessions-dev')
+    sessions_table = aws_clients.table(sessions_table_name)
+    
+    response = sessions_table.get_item(
+        Key={'sessionId': session_id},
+        ProjectionExpression='lastDeliveredSequenceNumber'
+    )
+    return response.get('Item', {}).get('lastDeliveredSequenceNumber')
+
+
+def _save_sequence_checkpoint(session_id: str, sequence_number: str) -> None:
+    """
+    Persist the delivery checkpoint of a session on its Sessions item.
+    
+    Writer for sequence_checkpoints. The item must exist, so a checkpoint
+    never recreates a deleted session.
+    
+    Args:
+        session_id: Session identifier
+        sequence_number: Last delivered Kinesis sequence number
+    """
+    sessions_table_name = os.environ.get('SESSIONS_TABLE_NAME', 'Sessions-dev')
+    sessions_table = aws_clients.table(sessions_table_name)
+    
+    try:
+        sessions_table.update_item(
+            Key={'sessionId': session_id},
+            UpdateExpression='SET lastDeliveredSequenceNumber = :seq',
+            ConditionExpression='attribute_exists(sessionId)',
+            ExpressionAttributeValues={':seq': sequence_number}
+        )
+    except sessions_table.meta.client.exceptions.ConditionalCheckFailedException:
+        logger.debug(f"Session {session_id} no longer exists, checkpoint not persisted")
+
+
+async def _process_kinesis_session(session_id: str, batch: PCMBatch) -> Dict[str, Any]:
+    """
+    Process the audio of one session from a Kinesis batch.
+    
+    Runs session lookup, Transcribe Streaming, translation and delivery for
+    a single session. The session context (metadata plus listeners grouped by
+    language) comes from session_context_cache and feeds every downstream
+    stage; a cache miss loads it in the default executor so that concurrently
+    processed sessions do not serialize on DynamoDB calls.
+    
+    Args:
+        session_id: Session identifier (Kinesis partition key)
+        batch: Assembled PCM audio of this session; its memoryview is sent
+            to Transcribe without further copies
+    
+    Returns:
+        Result dict for this session
+    
+    Raises:
+        SessionDeliveryError: If nothing was delivered because transcription
+            failed or every language delivery failed; reported as a session
+            failure so the session's records are retried instead of
+            checkpointed. A partial delivery (some segment or language may
+            have reached listeners) is returned with 'partialDelivery' and
+            checkpointed, so listeners do not receive audio twice
+        Exception: If processing fails otherwise; reported as a session failure
+    """
+    started_at = time.time()
+    loop = asyncio.get_event_loop()
+    
+    # Hold back the tail after the batch's quietest point for the next batch
+    carried_over_seconds = batch.prefix_length / (16000 * 2)
+    if _carry_over_active():
+        batch = batch.head(audio_carry_over.hold_tail(session_id, batch.data, batch.samples))
+    
+    # PCM chunks were assembled into one contiguous buffer (no copy here)
+    pcm_data = batch.data
+    duration = batch.duration_seconds  # 16kHz, 16-bit (2 bytes per sample)
+    
+    logger.info(
+        f"Session {session_id}: {batch.record_count} chunks, "
+        f"{len(pcm_data)} bytes, {duration:.2f}s"
+    )
+    
+    # Voice activity gate (before any DynamoDB or Transcribe call)
+    pcm_data, leading_trim_seconds = _gate_voice_activity(session_id, batch)
+    silence_skipped_seconds = round(duration - len(pcm_data) / (16000 * 2), 3)
+    
+    if not len(pcm_data):
+        return {
+            'sessionId': session_id,
+            'skipped': True,
+            'reason': 'Silence',
+            'silenceSkippedSeconds': silence_skipped_seconds
+        }
+    
+    # Get session metadata and listeners (cached, one lookup per TTL)
+    with latency_tracer.span('session_context'):
+        context = await loop.run_in_executor(None, session_context_cache.get, session_id)
+    
+    if not context:
+        logger.error(f"Session not found in DynamoDB: {session_id}")
+        return {
+            'sessionId': session_id,
+            'skipped': True,
+            'reason': 'Session not found'
+        }
+    
+    source_language = context.source_language
+    
+    # COST OPTIMIZATION: Only translate to languages with active listeners
+    active_languages = context.active_languages
+    
+    if not active_languages:
+        logger.info(
+            f"No active listeners for session {session_id}, skipping translation "
+            f"(cost savings: 100%)"
+        )
+        return {
+            'sessionId': session_id,
+            'skipped': True,
+            'reason': 'No active listeners',
+            'costSavings': '100%'
+        }
+    
+    # Log cost savings if some languages are skipped
+    session_target_languages = context.target_languages
+    skipped_languages = set(session_target_languages) - set(active_languages)
+    
+    if skipped_languages:
+        savings_pct = int(len(skipped_languages) / len(session_target_languages) * 100)
+        logger.info(
+            f"Cost optimization for session {session_id}: "
+            f"Processing {len(active_languages)} languages (active listeners), "
+            f"skipping {len(skipped_languages)} languages (no listeners): {skipped_languages}. "
+            f"Cost savings: {savings_pct}%"
+        )
+    
+    # Convert to AWS language code
+    aws_language = _convert_to_aws_language_code(source_language)
+    
+    # Step 3: Transcribe using Transcribe Streaming API (warm stream if possible).
+    # Each finalized segment starts its translate -> TTS -> notify pipeline as
+    # soon as it arrives, while the rest of the batch is still transcribing.
+    batch_timestamp = int(time.time() * 1000)
+    last_segment_timestamp = batch_timestamp - 1
+    segment_deliveries = []
+    session_span = latency_tracer.current_span()
+    
+    async def deliver_segment(text: str, start_time: float, end_time: float) -> None:
+        nonlocal last_segment_timestamp
+        
+        # Skip words already delivered before the batch edge
+        if _carry_over_active():
+            text = audio_carry_over.dedupe_transcript(session_id, text)
+            if not text:
+                return
+        
+        # Listeners order chunks by timestamp: keep segments strictly increasing
+        segment_timestamp = max(
+            batch_timestamp + int(max(start_time + leading_trim_seconds, 0.0) * 1000),
+            last_segment_timestamp + 1
+        )
+        last_segment_timestamp = segment_timestamp
+        
+        async def deliver() -> list:
+            # Traced under the session, not the transcription that emitted it
+            with latency_tracer.span('segment', parent=session_span):
+                return await process_translation_and_delivery(
+                    session_id,
+                    text,
+                    source_language,
+                    active_languages,  # Use active languages, not all target languages
+                    segment_timestamp,
+                    (end_time - start_time) if end_time > start_time else duration,
+                    listeners_by_language=context.listeners_by_language
+                )
+        
+        segment_deliveries.append(asyncio.ensure_future(deliver()))
+    
+    transcription_error = None
+    try:
+        if SUB_BATCH_ENABLED and len(pcm_data) > SUB_BATCH_THRESHOLD_SECONDS * 16000 * 2:
+            transcript = await _transcribe_sub_batches(
+                session_id,
+                pcm_data,
+                aws_language,
+                on_segment=deliver_segment
+            )
+        else:
+            transcript = await _transcribe_session_audio(
+                session_id,
+                pcm_data,
+                aws_language,
+                on_segment=deliver_segment
+            )
+        logger.info(
+            f"Transcription complete for {session_id} "
+            f"({len(segment_deliveries)} segments): '{transcript[:100]}...'"
+        )
+    except Exception as transcribe_error:
+        logger.error(f"Transcription failed for {session_id}: {str(transcribe_error)}")
+        transcription_error = transcribe_error
+    
+    # Step 4-7: Translate and deliver ONLY to active listener languages
+    if (transcription_error is None and _carry_over_active() and not segment_deliveries
+            and transcript not in PLACEHOLDER_TRANSCRIPTS):
+        transcript = audio_carry_over.dedupe_transcript(session_id, transcript)
+    
+    if transcription_error is not None:
+        # Segments emitted before the failure (e.g. earlier sub-batches) are
+        # still delivered; only the rest of the batch is lost
+        segment_results = await asyncio.gather(*segment_deliveries, return_exceptions=True)
+        session_results = [
+            result
+            for results in segment_results if not isinstance(results, BaseException)
+            for result in results
+        ]
+    elif segment_deliveries:
+        segment_results = await asyncio.gather(*segment_deliveries)
+        session_results = [result for results in segment_results for result in results]
+    elif not transcript:
+        logger.info(f"Transcript of {session_id} was already delivered, skipping")
+        session_results = []
+    else:
+        session_results = await process_translation_and_delivery(
+            session_id,
+            transcript,
+            source_language,
+            active_languages,  # Use active languages, not all target languages
+            batch_timestamp,
+            duration,
+            listeners_by_language=context.listeners_by_language
+        )
+    
+    # Retry only if nothing can have reached listeners; a retry after a
+    # partial delivery would send listeners the delivered audio again
+    reached = [result for result in session_results if _may_have_reached_listeners(result)]
+    if transcription_error is not None and not reached:
+        raise SessionDeliveryError(
+            f"Transcription failed: {str(transcription_error)}"
+        ) from transcription_error
+    if session_results and not reached:
+        raise SessionDeliveryError(
+            f"Delivery failed for every language: "
+            f"{sorted({result['targetLanguage'] for result in session_results})}"
+        )
+    
+    delivered_count = sum(1 for result in session_results if result.get('success'))
+    partial_delivery = transcription_error is not None or delivered_count < len(session_results)
+    if partial_delivery:
+        logger.warning(
+            f"Session {session_id} partially delivered "
+            f"({delivered_count}/{len(session_results)} language deliveries"
+            f"{', transcription failed' if transcription_error is not None else ''}); "
+            f"checkpointing the batch instead of retrying it"
+        )
+    
+    session_result = {
+        'sessionId': session_id,
+        'results': session_results,
+        'segmentCount': len(segment_deliveries),
+        'silenceSkippedSeconds': silence_skipped_seconds,
+        'carriedOverSeconds': carried_over_seconds,
+        'partialDelivery': partial_delivery,
+        'processingMs': int((time.time() - started_at) * 1000)
+    }
+    if transcription_error is not None:
+        session_result['error'] = f"Transcription failed: {str(transcription_error)}"
+    return session_result
+
+
+def _may_have_reached_listeners(language_result: Dict[str, Any]) -> bool:
+    """
+    Check whether a language delivery may have reached its listeners.
+    
+    A timed-out delivery counts: cancelling the wait does not stop a
+    post_to_connection call already running in the executor.
+    
+    Args:
+        language_result: Result of one language delivery
+    
+    Returns:
+        True if the delivery succeeded or timed out
+    """
+    return bool(language_result.get('success') or language_result.get('timedOut'))
+
+
+def _gate_voice_activity(session_id: str, batch: PCMBatch) -> Tuple[memoryview, float]:
+    """
+    Select the part of a session's batch that should be transcribed.
+    
+    Silent batches are dropped and leading/trailing silence is trimmed
+    (zero-copy slices of the batch). When the session's warm stream still
+    has unfinished speech, Transcribe needs the silence that follows it to
+    finalize the utterance, so such batches are sent without leading trim;
+    warm streams also keep trailing silence for the same reason.
+    
+    Args:
+        session_id: Session identifier
+        batch: Assembled PCM audio of the session
+    
+    Returns:
+        Tuple of (audio to transcribe, seconds trimmed from the start);
+        the audio is empty if the whole batch is skipped
+    """
+    if not VAD_ENABLED:
+        return batch.data, 0.0
+    
+    vad = voice_activity_detector.analyze(batch.samples)
+    pending_speech = (
+        TRANSCRIBE_WARM_STREAMS_ENABLED
+        and transcribe_stream_pool.has_pending_speech(session_id)
+    )
+    
+    if not vad.has_speech:
+        if pending_speech:
+            return batch.data, 0.0
+        logger.info(
+            f"Silent batch for session {session_id}, skipping transcription "
+            f"({vad.total_seconds:.2f}s skipped)"
+        )
+        return batch.data[:0], 0.0
+    
+    start_byte = 0 if pending_speech else vad.speech_start_sample * 2
+    end_byte = len(batch.data) if TRANSCRIBE_WARM_STREAMS_ENABLED else vad.speech_end_sample * 2
+    
+    if start_byte or end_byte < len(batch.data):
+        logger.debug(
+            f"Trimmed silence for session {session_id}: "
+            f"{start_byte / 32000:.2f}s leading, "
+            f"{(len(batch.data) - end_byte) / 32000:.2f}s trailing"
+        )
+    
+    return batch.data[start_byte:end_byte], start_byte / (16000 * 2)
+
+
+async def _transcribe_session_audio(
+    session_id: str,
+    pcm_bytes: Union[bytes, memoryview],
+    language_code: str,
+    on_segment: Optional[SegmentCallback] = None
+) -> str:
+    """
+    Transcribe one session's batch, preferring the session's warm stream.
+    
+    The batch is fed into the session's warm Transcribe stream so stream
+    setup is paid once per container and acoustic context carries across
+    batches. If warm streams are disabled, or the warm stream cannot be
+    opened or fails (e.g. Transcribe ended it while the container was
+    frozen), the batch falls back to a one-shot transcribe_streaming() call.
+    
+    Args:
+        session_id: Session identifier
+        pcm_bytes: PCM audio data (16kHz, 16-bit mono; memoryview is not copied)
+        language_code: AWS language code (e.g., 'en-US')
+        on_segment: Optional callback awaited with each finalized segment
+    
+    Returns:
+        Transcribed text
+    """
+    with latency_tracer.span('transcribe'):
+        if TRANSCRIBE_WARM_STREAMS_ENABLED:
+            try:
+                transcript = await transcribe_stream_pool.transcribe(
+                    session_id,
+                    pcm_bytes,
+                    language_code,
+                    16000,
+                    on_segment=on_segment
+                )
+                return transcript if transcript else "[No transcription]"
+            except Exception as e:
+                logger.warning(
+                    f"Warm Transcribe stream unavailable for session {session_id}, "
+                    f"falling back to one-shot stream: {e}"
+                )
+        
+        return await transcribe_streaming(pcm_bytes, language_code, 16000, on_segment=on_segment)
+
+
+async def _transcribe_sub_batches(
+    session_id: str,
+    pcm_data: memoryview,
+    language_code: str,
+    on_segment: SegmentCallback
+) -> str:
+    """
+    Transcribe a long batch as sentence-sized sub-batches, in order.
+    
+    The batch is split at low-energy points into sub-batches of
+    SUB_BATCH_MIN_SECONDS..SUB_BATCH_MAX_SECONDS (zero-copy slices). Each
+    sub-batch is transcribed after the previous one, and its segments are
+    handed to on_segment with times relative to the whole batch; on_segment
+    schedules delivery without waiting for it, so sub-batch N+1 transcribes
+    while sub-batch N is translated and synthesized. A sub-batch whose
+    transcription reports no segments is delivered as one segment.
+    
+    Args:
+        session_id: Session identifier
+        pcm_data: PCM audio of the batch (16kHz, 16-bit mono)
+        language_code: AWS language code (e.g., 'en-US')
+        on_segment: Callback awaited with each finalized segment
+    
+    Returns:
+        Transcribed text of all sub-batches
+    """
+    samples = np.frombuffer(pcm_data, dtype=np.int16, count=len(pcm_data) // 2)
+    splits = find_pause_splits(
+        samples,
+        frame_size=320,  # 20 ms
+        min_samples=int(SUB_BATCH_MIN_SECONDS * 16000),
+        max_samples=int(SUB_BATCH_MAX_SECONDS * 16000)
+    )
+    boundaries = [0] + splits + [len(samples)]
+    
+    logger.info(
+        f"Session {session_id}: splitting {len(samples) / 16000:.1f}s batch "
+        f"into {len(boundaries) - 1} sub-batches"
+    )
+    
+    transcripts = []
+    for start_sample, end_sample in zip(boundaries, boundaries[1:]):
+        offset = start_sample / 16000
+        emitted = False
+        
+        async def shifted_segment(text: str, start_time: float, end_time: float) -> None:
+            nonlocal emitted
+            emitted = True
+            await on_segment(text, start_time + offset, end_time + offset)
+        
+        end_byte = len(pcm_data) if end_sample == len(samples) else end_sample * 2
+        transcript = await _transcribe_session_audio(
+            session_id,
+            pcm_data[start_sample * 2:end_byte],
+            language_code,
+            on_segment=shifted_segment
+        )
+        
+        if transcript == "[No transcription]":
+            continue
+        if not emitted:
+            await emit_segment(on_segment, transcript, offset, end_sample / 16000)
+        transcripts.append(transcript)
+    
+    return ' '.join(transcripts) if transcripts else "[No transcription]"
 
 
 async def transcribe_streaming(
-    pcm_bytes: bytes,
+    pcm_bytes: Union[bytes, memoryview],
     language_code: str,
-    sample_rate: int
+    sample_rate: int,
+    on_segment: Optional[SegmentCallback] = None
 ) -> str:
     """
-    Transcribe PCM audio using AWS Transcribe Streaming API (Phase 4).
+    Transcribe PCM audio using AWS Transcribe Streaming API (Phase 4).
+    
+    This uses HTTP/2 streaming (not batch jobs) for low latency:
+    - No queue time
+    - No engine boot overhead
+    - ~500ms latency for 3-second audio
+    
+    Audio is sent and results are received concurrently (full duplex), and
+    every finalized segment is kept and handed to on_segment the moment it
+    arrives, so the first sentence of a batch can start translating while
+    the rest of the audio is still being transcribed.
+    
+    Args:
+        pcm_bytes: PCM audio data (frames are zero-copy slices of a memoryview)
+        language_code: AWS language code (e.g., 'en-US')
+        sample_rate: Audio sample rate
+        on_segment: Optional callback awaited with (text, start_time, end_time)
+            of each final result, times relative to the start of the audio
+    
+    Returns:
+        Transcribed text (all final segments joined)
+    """
+    try:
+        from amazon_transcribe.client import TranscribeStreamingClient
+        from amazon_transcribe.model import TranscriptEvent
+        
+        # Create streaming client
+        client = TranscribeStreamingClient(region=os.environ.get('AWS_REGION', 'us-east-1'))
+        
+        # Start stream
+        stream = await client.start_stream_transcription(
+            language_code=language_code,
+            media_sample_rate_hz=sample_rate,
+            media_encoding='pcm'
+        )
+        
+        async def send_audio() -> None:
+            # Send PCM data in chunks (Transcribe has frame size limit)
+            # Max frame size is ~32KB, send in 16KB chunks to be safe
+            chunk_size = 16384  # 16KB per chunk
+            for i in range(0, len(pcm_bytes), chunk_size):
+                chunk = pcm_bytes[i:i + chunk_size]
+                await stream.input_stream.send_audio_event(audio_chunk=chunk)
+            
+            await stream.input_stream.end_stream()
+        
+        segments = []
+        
+        async def receive_segments() -> None:
+            async for event in stream.output_stream:
+                if not isinstance(event, TranscriptEvent):
+                    continue
+                for result in event.transcript.results:
+                    if result.is_partial or not result.alternatives:
+                        continue
+                    text = result.alternatives[0].transcript
+                    if not text:
+                        continue
+                    segments.append(text)
+                    await emit_segment(
+                        on_segment,
+                        text,
+                        result.start_time or 0.0,
+                        result.end_time or 0.0
+                    )
+        
+        sender = asyncio.ensure_future(send_audio())
+        receiver = asyncio.ensure_future(receive_segments())
+        try:
+            await asyncio.gather(sender, receiver)
+        finally:
+            for task in (sender, receiver):
+                if not task.done():
+                    task.cancel()
+        
+        return ' '.join(segments) if segments else "[No transcription]"
+        
+    except Exception as e:
+        logger.error(f"Transcribe Streaming error: {str(e)}", exc_info=True)
+        raise
+
+
+def _get_stage_semaphore(stage: str) -> asyncio.Semaphore:
+    """
+    Get the concurrency limiter for a delivery pipeline stage.
+    
+    Semaphores are shared by every session and language processed on the
+    running event loop, so DELIVERY_STAGE_CONCURRENCY bounds the number of
+    in-flight calls per stage across the whole invocation. They are recreated
+    if the event loop changes between invocations.
+    
+    Args:
+        stage: Stage name ('translate', 'tts', 'storage' or 'notify')
+    
+    Returns:
+        Semaphore bound to the running event loop
+    """
+    global _stage_semaphores, _stage_semaphores_loop
+    
+    loop = asyncio.get_running_loop()
+    if _stage_semaphores_loop is not loop:
+        _stage_semaphores = {}
+        _stage_semaphores_loop = loop
+    
+    if stage not in _stage_semaphores:
+        _stage_semaphores[stage] = asyncio.Semaphore(
+            max(1, DELIVERY_STAGE_CONCURRENCY[stage])
+        )
+    
+    return _stage_semaphores[stage]
+
+
+class _DeliveryBudget:
+    """
+    Time budget of one language's delivery chain.
+    
+    Only time spent in stage calls is charged; the wait for a stage
+    semaphore is not, so a chain queued behind other sessions and languages
+    keeps its full budget until its work starts.
+    
+    Attributes:
+        remaining_seconds: Budget left for the following stages
+        last_stage_seconds: Duration of the last stage call
+    """
+    
+    def __init__(self, seconds: float):
+        self.remaining_seconds = seconds
+        self.last_stage_seconds = 0.0
+    
+    async def run(self, stage: Optional[str], work: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run one stage call within the remaining budget.
+        
+        Args:
+            stage: Stage whose semaphore is held during the call, or None
+            work: Starts the call (invoked once the semaphore is acquired)
+        
+        Returns:
+            Result of the call
+        
+        Raises:
+            asyncio.TimeoutError: If the call exceeds the remaining budget
+        """
+        if stage is None:
+            return await self._charge(work)
+        async with _get_stage_semaphore(stage):
+            return await self._charge(work)
+    
+    async def _charge(self, work: Callable[[], Awaitable[Any]]) -> Any:
+        started = time.monotonic()
+        try:
+            return await asyncio.wait_for(work(), timeout=max(self.remaining_seconds, 0.0))
+        finally:
+            self.last_stage_seconds = time.monotonic() - started
+            self.remaining_seconds -= self.last_stage_seconds
+
+
+def _translate_text(
+    translate_client,
+    transcript: str,
+    source_language: str,
+    target_language: str
+) -> str:
+    """
+    Translate transcript, falling back to the original text on failure.
+    
+    Args:
+        translate_client: AWS Translate client
+        transcript: Text to translate
+        source_language: Source language code
+        target_language: Target language code
+    
+    Returns:
+        Translated text (or the original transcript if translation fails)
+    """
+    try:
+        translation_response = translate_client.translate_text(
+            Text=transcript,
+            SourceLanguageCode=source_language,
+            TargetLanguageCode=target_language
+        )
+        translated_text = translation_response['TranslatedText']
+        logger.info(f"Translated to {target_language}: '{translated_text[:50]}...'")
+        return translated_text
+    except Exception as translate_error:
+        logger.error(f"Translation failed for {target_language}: {str(translate_error)}")
+        return transcript
+
+
+def _synthesize_speech(
+    polly_client,
+    text: str,
+    target_language: str,
+    duration: float
+) -> bytes:
+    """
+    Generate TTS audio, falling back to a silent MP3 on failure.
+    
+    Args:
+        polly_client: AWS Polly client
+        text: Text to synthesize
+        target_language: Target language code
+        duration: Audio duration in seconds (for the silent fallback)
+    
+    Returns:
+        MP3 audio bytes
+    """
+    try:
+        voice_id = get_polly_voice_for_language(target_language)
+        tts_response = polly_client.synthesize_speech(
+            Text=text,
+            OutputFormat='mp3',
+            VoiceId=voice_id,
+            Engine='neural',
+            SampleRate='24000'
+        )
+        tts_audio_bytes = tts_response['AudioStream'].read()
+        logger.info(f"Generated TTS for {target_language}: {len(tts_audio_bytes)} bytes")
+        return tts_audio_bytes
+    except Exception as tts_error:
+        logger.error(f"TTS failed for {target_language}: {str(tts_error)}")
+        return create_silent_mp3(duration)
+
+
+def _store_tts_audio(
+    s3_client,
+    s3_bucket: str,
+    session_id: str,
+    target_language: str,
+    tts_audio_bytes: bytes,
+    translated_text: str,
+    timestamp: int,
+    duration: float,
+    generate_url: bool = True
+) -> tuple:
+    """
+    Store TTS audio in S3 and generate a presigned URL for listeners.
+    
+    Args:
+        s3_client: AWS S3 client
+        s3_bucket: Bucket for translated audio
+        session_id: Session identifier
+        target_language: Target language code
+        tts_audio_bytes: MP3 audio bytes
+        translated_text: Translated transcript
+        timestamp: Audio timestamp
+        duration: Audio duration in seconds
+        generate_url: Generate a presigned URL (False when only archiving)
+    
+    Returns:
+        Tuple of (s3_key, presigned_url); presigned_url is None if not generated
+    """
+    s3_key = f"sessions/{session_id}/translated/{target_language}/{timestamp}.mp3"
+    
+    # Encode transcript to ASCII for S3 metadata (only ASCII allowed)
+    try:
+        transcript_ascii = translated_text[:1000].encode('ascii', errors='ignore').decode('ascii')
+    except:
+        transcript_ascii = "[Transcript contains non-ASCII characters]"
+    
+    s3_client.put_object(
+        Bucket=s3_bucket,
+        Key=s3_key,
+        Body=tts_audio_bytes,
+        ContentType='audio/mpeg',
+        Metadata={
+            'sessionId': session_id,
+            'targetLanguage': target_language,
+            'transcript': transcript_ascii,  # ASCII-only
+            'timestamp': str(timestamp),
+            'duration': str(duration),
+        }
+    )
+    
+    if not generate_url:
+        return s3_key, None
+    
+    return s3_key, _presign_tts_audio(s3_client, s3_bucket, s3_key)
+
+
+def _presign_tts_audio(s3_client, s3_bucket: str, s3_key: str) -> str:
+    """
+    Generate a presigned URL for stored TTS audio.
+    
+    Args:
+        s3_client: AWS S3 client
+        s3_bucket: Bucket for translated audio
+        s3_key: Key of the stored audio
+    
+    Returns:
+        Presigned URL valid for 10 minutes
+    """
+    return s3_client.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': s3_bucket, 'Key': s3_key},
+        ExpiresIn=600
+    )
+
+
+async def _deliver_language(
+    clients: Dict[str, Any],
+    s3_bucket: str,
+    session_id: str,
+    transcript: str,
+    source_language: str,
+    target_language: str,
+    timestamp: int,
+    duration: float,
+    connection_ids: Optional[list] = None
+) -> Dict[str, Any]:
+    """
+    Run the translate -> TTS -> deliver chain for one language.
     
-    This uses HTTP/2 streaming (not batch jobs) for low latency:
-    - No queue time
-    - No engine boot overhead
-    - ~500ms latency for 3-second audio
+    Each stage acquires its stage semaphore and runs blocking boto3 calls in
+    the default executor, so chains for different languages overlap and
+    listeners of a language are notified as soon as that chain finishes.
+    Each stage is traced as a latency span, including the wait for its
+    stage semaphore. The stage calls share LANGUAGE_DELIVERY_TIMEOUT_SECONDS;
+    semaphore waits do not count against it.
+    
+    Clips up to INLINE_AUDIO_MAX_BYTES are delivered inline in the WebSocket
+    message ('inline' mode); larger clips, or any clip when there is no
+    WebSocket endpoint, are stored in S3 and delivered as a presigned URL
+    ('s3' mode). With TTS_ARCHIVE_ENABLED inline clips are also stored in
+    S3, after listeners have been notified.
     
     Args:
-        pcm_bytes: PCM audio data
-        language_code: AWS language code (e.g., 'en-US')
-        sample_rate: Audio sample rate
+        clients: Dict with 'translate', 'polly', 's3' and 'apigw' clients
+        s3_bucket: Bucket for translated audio
+        session_id: Session identifier
+        transcript: Transcribed text
+        source_language: Source language code
+        target_language: Target language code
+        timestamp: Audio timestamp
+        duration: Audio duration in seconds
+        connection_ids: Optional listener connection IDs for this language
     
     Returns:
-        Transcribed text
+        Result dict for this language, including the delivery mode and the
+        delivery latency (TTS audio ready -> listeners notified); 'success'
+        is False if the language had listeners but none could be notified
+    
+    Raises:
+        asyncio.TimeoutError: If the stage calls exceed the language budget
     """
-    try:
-        from amazon_transcribe.client import TranscribeStreamingClient
-        from amazon_transcribe.handlers import TranscriptResultStreamHandler
-        from amazon_transcribe.model import TranscriptEvent
-        
-        # Create streaming client
-        client = TranscribeStreamingClient(region=os.environ.get('AWS_REGION', 'us-east-1'))
-        
-        # Start stream
-        stream = await client.start_stream_transcription(
-            language_code=language_code,
-            media_sample_rate_hz=sample_rate,
-            media_encoding='pcm'
-        )
-        
-        # Send PCM data in chunks (Transcribe has frame size limit)
-        # Max frame size is ~32KB, send in 16KB chunks to be safe
-        chunk_size = 16384  # 16KB per chunk
-        for i in range(0, len(pcm_bytes), chunk_size):
-            chunk = pcm_bytes[i:i + chunk_size]
-            await stream.input_stream.send_audio_event(audio_chunk=chunk)
-        
-        await stream.input_stream.end_stream()
-        
-        # Collect transcript
-        transcript_text = ""
-        async for event in stream.output_stream:
-            if isinstance(event, TranscriptEvent):
-                for result in event.transcript.results:
-                    if not result.is_partial:
-                        for alt in result.alternatives:
-                            transcript_text = alt.transcript
-        
-        return transcript_text if transcript_text else "[No transcription]"
-        
-    except Exception as e:
-        logger.error(f"Transcribe Streaming error: {str(e)}", exc_info=True)
-        raise
+    loop = asyncio.get_running_loop()
+    budget = _DeliveryBudget(LANGUAGE_DELIVERY_TIMEOUT_SECONDS)
+    
+    with latency_tracer.span('translate'):
+        translated_text = await budget.run('translate', lambda: loop.run_in_executor(
+            None, _translate_text,
+            clients['translate'], transcript, source_language, target_language
+        ))
+    
+    with latency_tracer.span('tts'):
+        tts_audio_bytes = await budget.run('tts', lambda: loop.run_in_executor(
+            None, _synthesize_speech,
+            clients['polly'], translated_text, target_language, duration
+        ))
+    
+    delivery_mode = (
+        'inline'
+        if INLINE_AUDIO_ENABLED and clients['apigw'] and len(tts_audio_bytes) <= INLINE_AUDIO_MAX_BYTES
+        else 's3'
+    )
+    delivery_started = time.time()
+    s3_key = None
+    presigned_url = None
+    
+    if delivery_mode == 's3':
+        with latency_tracer.span('s3_put'):
+            s3_key, _ = await budget.run('storage', lambda: loop.run_in_executor(
+                None, _store_tts_audio,
+                clients['s3'], s3_bucket, session_id, target_language,
+                tts_audio_bytes, translated_text, timestamp, duration, False
+            ))
+        
+        with latency_tracer.span('presign'):
+            presigned_url = await budget.run(None, lambda: loop.run_in_executor(
+                None, _presign_tts_audio, clients['s3'], s3_bucket, s3_key
+            ))
+    
+    # Notify listeners
+    fanout_ms = None
+    notified = True
+    if clients['apigw']:
+        with latency_tracer.span('fanout'):
+            notified = await budget.run('notify', lambda: notify_listeners_for_language(
+                clients['apigw'],
+                session_id,
+                target_language,
+                presigned_url,
+                timestamp,
+                duration,
+                translated_text,
+                connection_ids=connection_ids,
+                audio_bytes=tts_audio_bytes if delivery_mode == 'inline' else None
+            ))
+            fanout_ms = int(budget.last_stage_seconds * 1000)
+        
+        if notified:
+            logger.info(f"Notified listeners for language {target_language} ({delivery_mode})")
+    
+    delivery_ms = int((time.time() - delivery_started) * 1000)
+    
+    # Archive inline clips off the listener-facing path
+    if delivery_mode == 'inline' and TTS_ARCHIVE_ENABLED:
+        with latency_tracer.span('s3_archive'):
+            s3_key, _ = await budget.run('storage', lambda: loop.run_in_executor(
+                None, _store_tts_audio,
+                clients['s3'], s3_bucket, session_id, target_language,
+                tts_audio_bytes, translated_text, timestamp, duration, False
+            ))
+    
+    result = {
+        'targetLanguage': target_language,
+        'success': notified is not False,
+        's3Key': s3_key,
+        'deliveryMode': delivery_mode,
+        'deliveryMs': delivery_ms,
+        'fanoutMs': fanout_ms
+    }
+    if notified is False:
+        result['error'] = 'No listener could be notified'
+    return result
 
 
 async def process_translation_and_delivery(
@@ -821,12 +2076,18 @@ async def process_translation_and_delivery(
     source_language: str,
     target_languages: list,
     timestamp: int,
-    duration: float
+    duration: float,
+    listeners_by_language: Optional[Dict[str, list]] = None
 ) -> list:
     """
     Translate transcript and deliver to listeners.
     
-    This is extracted from handle_pcm_batch for reuse in handle_kinesis_batch.
+    Shared by handle_kinesis_batch and handle_pcm_batch. Each target language
+    runs as its own translate -> TTS -> store -> notify chain; chains run
+    concurrently, bounded per stage by DELIVERY_STAGE_CONCURRENCY and per
+    language by LANGUAGE_DELIVERY_TIMEOUT_SECONDS of stage work (not of
+    waiting for a stage slot), so one slow language does not hold back
+    delivery of the others.
     
     Args:
         session_id: Session identifier
@@ -835,123 +2096,71 @@ async def process_translation_and_delivery(
         target_languages: List of target language codes
         timestamp: Audio timestamp
         duration: Audio duration in seconds
+        listeners_by_language: Optional listener connection IDs per language
+            (from the session context); when omitted, listeners are queried
+            per language at notification time
     
     Returns:
-        List of results per target language
+        List of results per target language (in target_languages order)
     """
-    # Initialize clients
-    s3_client = boto3.client('s3')
-    translate_client = boto3.client('translate')
-    polly_client = boto3.client('polly')
+    # Get shared clients (created once per container)
+    clients = {
+        's3': aws_clients.client('s3'),
+        'translate': aws_clients.client('translate'),
+        'polly': aws_clients.client('polly'),
+        'apigw': None
+    }
     
     s3_bucket = os.environ.get('S3_BUCKET_NAME', f'translation-audio-{os.environ.get("STAGE", "dev")}')
     
     # API Gateway client for WebSocket
     api_endpoint = os.environ.get('API_GATEWAY_ENDPOINT', '')
     if api_endpoint:
-        apigw_client = boto3.client(
+        clients['apigw'] = aws_clients.client(
             'apigatewaymanagementapi',
             endpoint_url=api_endpoint
         )
     else:
         logger.warning("API_GATEWAY_ENDPOINT not set, cannot send WebSocket notifications")
-        apigw_client = None
     
-    results = []
-    for target_lang in target_languages:
-        try:
-            # Translate
+    async def deliver_with_timeout(target_lang: str) -> Dict[str, Any]:
+        with latency_tracer.span('language', language=target_lang):
             try:
-                translation_response = translate_client.translate_text(
-                    Text=transcript,
-                    SourceLanguageCode=source_language,
-                    TargetLanguageCode=target_lang
+                return await _deliver_language(
+                    clients, s3_bucket, session_id, transcript,
+                    source_language, target_lang, timestamp, duration,
+                    connection_ids=(
+                        listeners_by_language.get(target_lang, [])
+                        if listeners_by_language is not None else None
+                    )
                 )
-                translated_text = translation_response['TranslatedText']
-                logger.info(f"Translated to {target_lang}: '{translated_text[:50]}...'")
-            except Exception as translate_error:
-                logger.error(f"Translation failed for {target_lang}: {str(translate_error)}")
-                translated_text = transcript
-            
-            # Generate TTS
-            try:
-                voice_id = get_polly_voice_for_language(target_lang)
-                tts_response = polly_client.synthesize_speech(
-                    Text=translated_text,
-                    OutputFormat='mp3',
-                    VoiceId=voice_id,
-                    Engine='neural',
-                    SampleRate='24000'
+            except asyncio.TimeoutError:
+                logger.error(
+                    f"Delivery timed out for language {target_lang} in session {session_id} "
+                    f"after {LANGUAGE_DELIVERY_TIMEOUT_SECONDS}s"
                 )
-                tts_audio_bytes = tts_response['AudioStream'].read()
-                logger.info(f"Generated TTS for {target_lang}: {len(tts_audio_bytes)} bytes")
-            except Exception as tts_error:
-                logger.error(f"TTS failed for {target_lang}: {str(tts_error)}")
-                tts_audio_bytes = create_silent_mp3(duration)
-            
-            # Store in S3
-            s3_key = f"sessions/{session_id}/translated/{target_lang}/{timestamp}.mp3"
-            
-            # Encode transcript to ASCII for S3 metadata (only ASCII allowed)
-            try:
-                transcript_ascii = translated_text[:1000].encode('ascii', errors='ignore').decode('ascii')
-            except:
-                transcript_ascii = "[Transcript contains non-ASCII characters]"
-            
-            s3_client.put_object(
-                Bucket=s3_bucket,
-                Key=s3_key,
-                Body=tts_audio_bytes,
-                ContentType='audio/mpeg',
-                Metadata={
-                    'sessionId': session_id,
+                return {
                     'targetLanguage': target_lang,
-                    'transcript': transcript_ascii,  # ASCII-only
-                    'timestamp': str(timestamp),
-                    'duration': str(duration),
+                    'success': False,
+                    'timedOut': True,
+                    'error': f'Timed out after {LANGUAGE_DELIVERY_TIMEOUT_SECONDS}s'
                 }
-            )
-            
-            # Generate presigned URL
-            presigned_url = s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': s3_bucket, 'Key': s3_key},
-                ExpiresIn=600
-            )
-            
-            # Notify listeners
-            if apigw_client:
-                success = await notify_listeners_for_language(
-                    apigw_client,
-                    session_id,
-                    target_lang,
-                    presigned_url,
-                    timestamp,
-                    duration,
-                    translated_text
+            except Exception as lang_error:
+                logger.error(
+                    f"Error processing language {target_lang}: {str(lang_error)}",
+                    exc_info=True
                 )
-                
-                if success:
-                    logger.info(f"Notified listeners for language {target_lang}")
-            
-            results.append({
-                'targetLanguage': target_lang,
-                'success': True,
-                's3Key': s3_key
-            })
-            
-        except Exception as lang_error:
-            logger.error(
-                f"Error processing language {target_lang}: {str(lang_error)}",
-                exc_info=True
-            )
-            results.append({
-                'targetLanguage': target_lang,
-                'success': False,
-                'error': str(lang_error)
-            })
+                return {
+                    'targetLanguage': target_lang,
+                    'success': False,
+                    'error': str(lang_error)
+                }
+    
+    results = await asyncio.gather(
+        *(deliver_with_timeout(target_lang) for target_lang in target_languages)
+    )
     
-    return results
+    return list(results)
 
 
 async def process_audio_chunk_with_emotion(
@@ -1033,7 +2242,7 @@ async def process_audio_chunk_with_emotion(
         
         # Emit CloudWatch metrics for successful emotion extraction
         try:
-            cloudwatch.put_metric_data(
+            metrics_sink.put_metric_data(
                 Namespace='AudioTranscription/EmotionDetection',
                 MetricData=[
                     {
@@ -1072,7 +2281,7 @@ async def process_audio_chunk_with_emotion(
         
         # Emit CloudWatch metric for emotion extraction failure
         try:
-            cloudwatch.put_metric_data(
+            metrics_sink.put_metric_data(
                 Namespace='AudioTranscription/EmotionDetection',
                 MetricData=[
                     {
@@ -1178,118 +2387,14 @@ async def handle_pcm_batch(event: Dict[str, Any], context: Any) -> Dict[str, Any
             transcript = "[Transcription unavailable]"
         
         # Step 3-6: Translate and deliver for each target language
-        # TODO: This should use the actual translation pipeline
-        # For now, creating placeholder implementation
-        
-        # Initialize S3 client for TTS storage
-        s3_client = boto3.client('s3')
-        s3_bucket = os.environ.get('S3_BUCKET_NAME', f'translation-audio-{os.environ.get("STAGE", "dev")}')
-        
-        # Initialize API Gateway Management client for WebSocket
-        api_endpoint = os.environ.get('API_GATEWAY_ENDPOINT', '')
-        if api_endpoint:
-            apigw_client = boto3.client(
-                'apigatewaymanagementapi',
-                endpoint_url=api_endpoint
-            )
-        else:
-            logger.warning("API_GATEWAY_ENDPOINT not set, cannot send WebSocket notifications")
-            apigw_client = None
-        
-        # Initialize Translate and Polly clients
-        translate_client = boto3.client('translate')
-        polly_client = boto3.client('polly')
-        
-        # Process each target language
-        results = []
-        for target_lang in target_languages:
-            try:
-                # Step 3: Translate transcript
-                try:
-                    translation_response = translate_client.translate_text(
-                        Text=transcript,
-                        SourceLanguageCode=source_language,
-                        TargetLanguageCode=target_lang
-                    )
-                    translated_text = translation_response['TranslatedText']
-                    logger.info(f"Translated to {target_lang}: '{translated_text[:50]}...'")
-                except Exception as translate_error:
-                    logger.error(f"Translation failed for {target_lang}: {str(translate_error)}")
-                    translated_text = transcript  # Use original if translation fails
-                
-                # Step 4: Generate TTS audio with Polly
-                try:
-                    voice_id = get_polly_voice_for_language(target_lang)
-                    tts_response = polly_client.synthesize_speech(
-                        Text=translated_text,
-                        OutputFormat='mp3',
-                        VoiceId=voice_id,
-                        Engine='neural',
-                        SampleRate='24000'
-                    )
-                    tts_audio_bytes = tts_response['AudioStream'].read()
-                    logger.info(f"Generated TTS for {target_lang}: {len(tts_audio_bytes)} bytes")
-                except Exception as tts_error:
-                    logger.error(f"TTS failed for {target_lang}: {str(tts_error)}")
-                    # Create silent MP3 as fallback
-                    tts_audio_bytes = create_silent_mp3(duration)
-                
-                # Store in S3
-                s3_key = f"sessions/{session_id}/translated/{target_lang}/{timestamp}.mp3"
-                s3_client.put_object(
-                    Bucket=s3_bucket,
-                    Key=s3_key,
-                    Body=tts_audio_bytes,
-                    ContentType='audio/mpeg',
-                    Metadata={
-                        'sessionId': session_id,
-                        'targetLanguage': target_lang,
-                        'transcript': translated_text[:1000],
-                        'timestamp': str(timestamp),
-                        'duration': str(duration),
-                    }
-                )
-                
-                logger.info(f"Stored TTS audio in S3: {s3_key}")
-                
-                # Generate presigned URL
-                presigned_url = s3_client.generate_presigned_url(
-                    'get_object',
-                    Params={'Bucket': s3_bucket, 'Key': s3_key},
-                    ExpiresIn=600  # 10 minutes
-                )
-                
-                # Send WebSocket notification to listeners
-                if apigw_client:
-                    success = await notify_listeners_for_language(
-                        apigw_client,
-                        session_id,
-                        target_lang,
-                        presigned_url,
-                        timestamp,
-                        duration,
-                        translated_text
-                    )
-                    
-                    if success:
-                        logger.info(f"Notified listeners for language {target_lang}")
-                
-                results.append({
-                    'targetLanguage': target_lang,
-                    'success': True,
-                    's3Key': s3_key
-                })
-                
-            except Exception as lang_error:
-                logger.error(
-                    f"Error processing language {target_lang}: {str(lang_error)}",
-                    exc_info=True
-                )
-                results.append({
-                    'targetLanguage': target_lang,
-                    'success': False,
-                    'error': str(lang_error)
-                })
+        results = await process_translation_and_delivery(
+            session_id,
+            transcript,
+            source_language,
+            target_languages,
+            timestamp,
+            duration
+        )
         
         return {
             'statusCode': 200,
@@ -1312,6 +2417,71 @@ async def handle_pcm_batch(event: Dict[str, Any], context: Any) -> Dict[str, Any
         }
 
 
+def _build_translated_audio_messages(
+    session_id: str,
+    target_language: str,
+    timestamp: int,
+    duration: float,
+    transcript: str,
+    presigned_url: Optional[str] = None,
+    audio_bytes: Optional[bytes] = None
+) -> list:
+    """
+    Build encoded translatedAudio WebSocket messages.
+    
+    With audio_bytes the clip is sent inline as base64, split into
+    INLINE_AUDIO_CHUNK_BYTES chunks that listeners reassemble by
+    sequenceNumber, chunkIndex and chunkCount; the transcript is carried by
+    the first chunk only. Otherwise a single message carries the URL.
+    
+    Args:
+        session_id: Session identifier
+        target_language: Target language code
+        timestamp: Audio timestamp
+        duration: Audio duration in seconds
+        transcript: Translated transcript
+        presigned_url: S3 presigned URL for audio
+        audio_bytes: MP3 audio to send inline
+    
+    Returns:
+        List of UTF-8 encoded JSON messages, in send order
+    """
+    message = {
+        'type': 'translatedAudio',
+        'sessionId': session_id,
+        'targetLanguage': target_language,
+        'timestamp': timestamp,
+        'duration': duration,
+        'transcript': transcript,
+        'sequenceNumber': timestamp  # Use timestamp as sequence
+    }
+    
+    if audio_bytes is None:
+        message['delivery'] = 's3'
+        message['url'] = presigned_url
+        return [json.dumps(message).encode('utf-8')]
+    
+    chunk_size = max(1, INLINE_AUDIO_CHUNK_BYTES)
+    chunk_count = max(1, -(-len(audio_bytes) // chunk_size))
+    
+    messages = []
+    for chunk_index in range(chunk_count):
+        chunk = audio_bytes[chunk_index * chunk_size:(chunk_index + 1) * chunk_size]
+        chunk_message = dict(
+            message,
+            delivery='inline',
+            contentType='audio/mpeg',
+            chunkIndex=chunk_index,
+            chunkCount=chunk_count,
+            audio=base64.b64encode(chunk).decode('ascii')
+        )
+        if chunk_index > 0:
+            del chunk_message['transcript']
+        messages.append(json.dumps(chunk_message).encode('utf-8'))
+    
+    return messages
+
+
 async def notify_listeners_for_language(
     apigw_client,
     session_id: str,
@@ -1319,8 +2489,10 @@ async def notify_listeners_for_language(
     presigned_url: str,
     timestamp: int,
     duration: float,
-    transcript: str
-) -> bool:
+    transcript: str,
+    connection_ids: Optional[list] = None,
+    audio_bytes: Optional[bytes] = None
+) -> Optional[bool]:
     """
     Send WebSocket notification to listeners for specific language.
     
@@ -1328,71 +2500,105 @@ async def notify_listeners_for_language(
         apigw_client: API Gateway Management client
         session_id: Session identifier  
         target_language: Target language code
-        presigned_url: S3 presigned URL for audio
+        presigned_url: S3 presigned URL for audio (None for inline delivery)
         timestamp: Audio timestamp
         duration: Audio duration in seconds
         transcript: Translated transcript
+        connection_ids: Optional listener connection IDs (from the session
+            context cache); queried from the Connections GSI when omitted
+        audio_bytes: Optional MP3 audio to send inline instead of a URL
     
     Returns:
-        True if at least one listener notified successfully
+        True if at least one listener was notified, None if there was no
+        listener to notify (none found, or every connection was gone), and
+        False if listeners existed but none could be notified
     """
     try:
-        # Get connections for this session and language from DynamoDB
-        dynamodb_client = boto3.resource('dynamodb')
-        connections_table_name = os.environ.get('CONNECTIONS_TABLE', 'Connections-dev')
-        connections_table = dynamodb_client.Table(connections_table_name)
-        
-        # Query GSI: sessionId-targetLanguage-index
-        response = connections_table.query(
-            IndexName='sessionId-targetLanguage-index',
-            KeyConditionExpression='sessionId = :sid AND targetLanguage = :lang',
-            ExpressionAttributeValues={
-                ':sid': session_id,
-                ':lang': target_language
-            }
-        )
-        
-        connections = response.get('Items', [])
+        if connection_ids is None:
+            # Get connections for this session and language from DynamoDB
+            connections_table_name = os.environ.get('CONNECTIONS_TABLE', 'Connections-dev')
+            connections_table = aws_clients.table(connections_table_name)
+            
+            # Query GSI: sessionId-targetLanguage-index
+            response = connections_table.query(
+                IndexName='sessionId-targetLanguage-index',
+                KeyConditionExpression='sessionId = :sid AND targetLanguage = :lang',
+                ExpressionAttributeValues={
+                    ':sid': session_id,
+                    ':lang': target_language
+                }
+            )
+            
+            connection_ids = [
+                connection.get('connectionId')
+                for connection in response.get('Items', [])
+            ]
         
-        if not connections:
+        if not connection_ids:
             logger.warning(f"No listeners found for {target_language} in session {session_id}")
-            return False
-        
-        # Create message
-        message = {
-            'type': 'translatedAudio',
-            'sessionId': session_id,
-            'targetLanguage': target_language,
-            'url': presigned_url,
-            'timestamp': timestamp,
-            'duration': duration,
-            'transcript': transcript,
-            'sequenceNumber': timestamp  # Use timestamp as sequence
-        }
+            return None
+        
+        # Create message(s), encoded once for all listeners
+        messages = _build_translated_audio_messages(
+            session_id,
+            target_language,
+            timestamp,
+            duration,
+            transcript,
+            presigned_url=presigned_url,
+            audio_bytes=audio_bytes
+        )
         
-        message_data = json.dumps(message).encode('utf-8')
+        # Send to all connections concurrently (the same encoded payload for each)
+        loop = asyncio.get_running_loop()
+        fanout_semaphore = asyncio.Semaphore(LISTENER_FANOUT_CONCURRENCY)
+        fanout_started = time.time()
         
-        # Send to each connection
-        success_count = 0
-        for connection in connections:
-            connection_id = connection.get('connectionId')
-            
-            try:
-                apigw_client.post_to_connection(
-                    ConnectionId=connection_id,
-                    Data=message_data
+        async def send_with_limit(connection_id: str) -> float:
+            async with fanout_semaphore:
+                send_started = time.time()
+                await loop.run_in_executor(
+                    None, _post_messages_to_connection, apigw_client, connection_id, messages
                 )
-                success_count += 1
-                
-            except apigw_client.exceptions.GoneException:
-                logger.info(f"Connection gone: {connection_id}")
-            except Exception as send_error:
-                logger.error(f"Error sending to connection {connection_id}: {str(send_error)}")
+                return (time.time() - send_started) * 1000
         
-        logger.info(
-            f"Notified {success_count}/{len(connections)} listeners for {target_language}"
+        send_results = await asyncio.gather(
+            *(send_with_limit(connection_id) for connection_id in connection_ids),
+            return_exceptions=True
         )
+        fanout_ms = (time.time() - fanout_started) * 1000
+        
+        send_durations_ms = []
+        gone_connections = []
+        for connection_id, result in zip(connection_ids, send_results):
+            if not isinstance(result, Exception):
+                send_durations_ms.append(result)
+            elif isinstance(result, apigw_client.exceptions.GoneException):
+                logger.info(f"Connection gone: {connection_id}")
+                gone_connections.append(connection_id)
+            else:
+                logger.error(f"Error sending to connection {connection_id}: {str(result)}")
+        success_count = len(send_durations_ms)
+        
+        # Stop sending to gone connections until the session context reloads,
+        # and remove them from the Connections table in one batch
+        if gone_connections:
+            session_context_cache.remove_connections(session_id, gone_connections)
+            await loop.run_in_executor(None, _remove_gone_connections, gone_connections)
+        
+        if send_durations_ms:
+            p50, p95, p99 = np.percentile(send_durations_ms, [50, 95, 99])
+            logger.info(
+                f"Notified {success_count}/{len(connection_ids)} listeners for {target_language} "
+                f"in {fanout_ms:.1f}ms (send p50={p50:.1f}ms p95={p95:.1f}ms p99={p99:.1f}ms)"
+            )
+        else:
+            logger.info(
+                f"Notified 0/{len(connection_ids)} listeners for {target_language}"
+            )
         
+        if not success_count and len(gone_connections) == len(connection_ids):
+            return None
         return success_count > 0
         
     except Exception as e:
@@ -1400,6 +2606,49 @@ async def notify_listeners_for_language(
         return False
 
 
+def _post_messages_to_connection(apigw_client, connection_id: str, messages: list) -> None:
+    """
+    Send pre-encoded messages to one listener connection, in order.
+    
+    Args:
+        apigw_client: API Gateway Management client
+        connection_id: WebSocket connection ID
+        messages: Encoded message payloads
+    
+    Raises:
+        GoneException: If the connection no longer exists
+    """
+    for message_data in messages:
+        apigw_client.post_to_connection(
+            ConnectionId=connection_id,
+            Data=message_data
+        )
+
+
+def _remove_gone_connections(connection_ids: list) -> None:
+    """
+    Delete gone listener connections from the Connections table.
+    
+    Uses one batch writer for all connections; failures are logged, the
+    disconnect handler and TTL remove the records otherwise.
+    
+    Args:
+        connection_ids: Connection IDs that returned GoneException
+    """
+    connections_table_name = os.environ.get('CONNECTIONS_TABLE', 'Connections-dev')
+    
+    try:
+        connections_table = aws_clients.table(connections_table_name)
+        with connections_table.batch_writer() as batch:
+            for connection_id in connection_ids:
+                batch.delete_item(Key={'connectionId': connection_id})
+        
+        logger.info(f"Removed {len(connection_ids)} gone connections")
+        
+    except Exception as e:
+        logger.warning(f"Failed to remove gone connections: {e}")
+
+
 def _initialize_websocket_components() -> None:
     """
     Initialize WebSocket processing components on cold start.
@@ -1449,7 +2698,7 @@ def _initialize_websocket_components() -> None:
         rate_limit = int(os.getenv('AUDIO_RATE_LIMIT', '50'))
         rate_limiter = AudioRateLimiter(
             limit=rate_limit,
-            cloudwatch_client=cloudwatch
+            cloudwatch_client=metrics_sink
         )
         
         # Initialize format validator
@@ -1491,35 +2740,35 @@ def _initialize_websocket_components() -> None:
 def _get_or_create_stream(
     session_id: str,
     source_language: str
-) -> tuple:
+) -> SessionStream:
     """
     Get existing Transcribe stream or create new one.
     
+    Registering a stream beyond MAX_ACTIVE_STREAMS closes the least
+    recently used one.
+    
     Args:
         session_id: Session identifier
         source_language: Source language code
     
     Returns:
-        Tuple of (client, manager, handler, buffer, last_activity_time, is_active)
+        SessionStream of the session (not started until audio is sent)
     """
-    global active_streams, partial_processor, translation_pipeline
+    global translation_pipeline
     
     # Check if stream already exists
-    if session_id in active_streams:
+    stream = session_streams.get(session_id)
+    if stream is not None:
         logger.debug(f"Using existing stream for session {session_id}")
-        return active_streams[session_id]
+        # The stream handler holds the session's processor; keep it pooled
+        partial_processors.touch(session_id)
+        return stream
     
     # Create new stream
     logger.info(f"Creating new Transcribe stream for session {session_id}")
     
-    # Initialize partial processor if needed
-    if partial_processor is None:
-        config = _load_config_from_environment()
-        partial_processor = PartialResultProcessor(
-            config=config,
-            session_id=session_id,
-            source_language=source_language
-        )
+    # Get the session's own partial processor
+    partial_processor = partial_processors.get(session_id, source_language)
     
     # Create Transcribe client and manager
     # Convert ISO 639-1 to AWS language code (e.g., 'en' -> 'en-US')
@@ -1552,16 +2801,16 @@ def _get_or_create_stream(
     buffer = AudioBuffer(
         capacity_seconds=5.0,
         chunk_duration_ms=100,
-        cloudwatch_client=cloudwatch
+        cloudwatch_client=metrics_sink
     )
     
-    # Store stream info with is_active flag
-    stream_info = (client, manager, handler, buffer, time.time(), False)
-    active_streams[session_id] = stream_info
+    stream, evicted = session_streams.add(session_id, client, manager, handler, buffer)
+    for evicted_stream in evicted:
+        _run_stream_shutdown(evicted_stream)
     
     logger.info(f"Created Transcribe stream for session {session_id}")
     
-    return stream_info
+    return stream
 
 
 def _convert_to_aws_language_code(iso_code: str) -> str:
@@ -1607,33 +2856,30 @@ async def _initialize_stream_async(session_id: str) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    global active_streams
-    
-    if session_id not in active_streams:
+    stream = session_streams.get(session_id)
+    if stream is None:
         logger.error(f"Cannot initialize stream: session {session_id} not found")
         return False
     
     try:
-        client, manager, handler, buffer, last_activity, is_active = active_streams[session_id]
-        
-        # Skip if already active
-        if is_active:
-            logger.debug(f"Stream already active for session {session_id}")
-            return True
-        
-        logger.info(f"Initializing Transcribe stream for session {session_id}")
-        
-        # Start the stream using the manager
-        # This creates the output stream and starts the event loop
-        output_stream = await manager.start_stream()
-        
-        # Set the output stream on the handler
-        handler.output_stream = output_stream
+        # Concurrent sends of the same session start the stream only once
+        async with stream.lock:
+            # Skip if already active
+            if stream.is_active:
+                logger.debug(f"Stream already active for session {session_id}")
+                return True
+            
+            logger.info(f"Initializing Transcribe stream for session {session_id}")
+            
+            # Start the stream using the manager
+            # This creates the output stream and starts the event loop
+            output_stream = await stream.manager.start_stream()
+            
+            # Set the output stream on the handler
+            stream.handler.output_stream = output_stream
+            stream.is_active = True
         
-        # Mark stream as active
-        active_streams[session_id] = (
-            client, manager, handler, buffer, time.time(), True
-        )
+        session_streams.touch(session_id)
         
         logger.info(f"Transcribe stream initialized for session {session_id}")
         return True
@@ -1660,32 +2906,32 @@ async def _send_audio_to_stream(session_id: str, audio_bytes: bytes) -> bool:
     Returns:
         True if successful, False otherwise
     """
-    global active_streams
+    # Expiry is a heap peek when no stream is idle
+    _close_expired_streams()
     
-    if session_id not in active_streams:
+    stream = session_streams.get(session_id)
+    if stream is None:
         logger.error(f"Cannot send audio: session {session_id} not found")
         return False
     
     try:
-        client, manager, handler, buffer, last_activity, is_active = active_streams[session_id]
-        
         # Initialize stream if not active
-        if not is_active:
+        if not stream.is_active:
             success = await _initialize_stream_async(session_id)
             if not success:
                 logger.error(f"Failed to initialize stream for session {session_id}")
                 return False
-            
-            # Reload stream info after initialization
-            client, manager, handler, buffer, last_activity, is_active = active_streams[session_id]
         
-        # Send audio to stream via manager
-        await manager.send_audio(audio_bytes)
+        # Send audio to stream via manager, unless it was closed meanwhile
+        async with stream.lock:
+            if not stream.is_active:
+                logger.warning(f"Stream closed before send for session {session_id}")
+                return False
+            await stream.manager.send_audio(audio_bytes)
         
-        # Update last activity time
-        active_streams[session_id] = (
-            client, manager, handler, buffer, time.time(), is_active
-        )
+        # Update last activity time (of the stream and its partial processor)
+        session_streams.touch(session_id)
+        partial_processors.touch(session_id)
         
         logger.debug(f"Sent {len(audio_bytes)} bytes to Transcribe stream for session {session_id}")
         return True
@@ -1702,75 +2948,109 @@ def cleanup_idle_streams() -> None:
     """
     Clean up idle Transcribe streams.
     
-    Closes streams that have been inactive for more than STREAM_IDLE_TIMEOUT_SECONDS.
-    Should be called periodically.
+    Closes streams that have been inactive for more than STREAM_IDLE_TIMEOUT_SECONDS,
+    and warm Kinesis-path streams inactive for more than
+    WARM_STREAM_IDLE_TIMEOUT_SECONDS. Should be called periodically from a
+    running event loop.
     """
-    global active_streams
-    
-    current_time = time.time()
-    sessions_to_remove = []
+    _close_expired_streams()
     
-    for session_id, stream_info in active_streams.items():
-        *_, last_activity_time, is_active = stream_info
-        idle_duration = current_time - last_activity_time
-        
-        if idle_duration >= STREAM_IDLE_TIMEOUT_SECONDS:
-            logger.info(
-                f"Closing idle stream for session {session_id} "
-                f"(idle for {idle_duration:.1f} seconds)"
-            )
-            sessions_to_remove.append(session_id)
+    if TRANSCRIBE_WARM_STREAMS_ENABLED:
+        asyncio.create_task(transcribe_stream_pool.close_idle())
+
+
+def _close_expired_streams() -> None:
+    """
+    Close WebSocket-path streams idle for at least STREAM_IDLE_TIMEOUT_SECONDS.
     
-    # Remove idle streams
-    for session_id in sessions_to_remove:
-        asyncio.create_task(_close_stream_async(session_id))
+    Must be called from a running event loop; the streams are removed from
+    the registry immediately and closed in background tasks.
+    """
+    for stream in session_streams.pop_expired():
+        logger.info(
+            f"Closing idle stream for session {stream.session_id} "
+            f"(idle for {STREAM_IDLE_TIMEOUT_SECONDS}+ seconds)"
+        )
+        asyncio.create_task(_shutdown_stream(stream))
 
 
 async def _close_stream_async(session_id: str) -> None:
     """
     Close Transcribe stream for session asynchronously.
     
-    This function gracefully closes the Transcribe stream, clears buffers,
-    clears emotion cache, and removes the session from active streams.
+    This function removes the session from the stream registry, then
+    gracefully closes the Transcribe stream, clears buffers and clears the
+    emotion cache.
     
     Args:
         session_id: Session identifier
     """
-    global active_streams, emotion_cache
-    
-    if session_id not in active_streams:
+    stream = session_streams.remove(session_id)
+    if stream is None:
         return
     
+    await _shutdown_stream(stream)
+
+
+async def _shutdown_stream(stream: SessionStream) -> None:
+    """
+    Close a stream that is no longer registered.
+    
+    Waits for an in-flight start or send of the session to finish first.
+    
+    Args:
+        stream: Removed SessionStream
+    """
+    session_id = stream.session_id
+    
     try:
-        client, manager, handler, buffer, last_activity, is_active = active_streams[session_id]
-        
-        logger.info(f"Closing Transcribe stream for session {session_id}")
-        
-        # Clear buffer
-        buffer.clear()
-        
-        # Clear emotion cache for this session
-        if session_id in emotion_cache:
-            del emotion_cache[session_id]
-            logger.debug(f"Cleared emotion cache for session {session_id}")
-        
-        # Close stream gracefully if active
-        if is_active:
-            try:
-                await manager.end_stream()
-                logger.debug(f"Ended Transcribe stream for session {session_id}")
-            except Exception as e:
-                logger.warning(f"Error ending stream for session {session_id}: {e}")
-        
-        # Remove from active streams
-        del active_streams[session_id]
-        
-        logger.info(f"Closed stream for session {session_id}")
+        async with stream.lock:
+            logger.info(f"Closing Transcribe stream for session {session_id}")
+            
+            # Clear buffer
+            stream.buffer.clear()
+            
+            # Clear emotion cache, processor and quality state unless the
+            # session has a new stream
+            if session_id not in session_streams:
+                partial_processors.remove(session_id)
+                if quality_analyzer is not None:
+                    quality_analyzer.release_stream(session_id)
+                if session_id in emotion_cache:
+                    del emotion_cache[session_id]
+                    logger.debug(f"Cleared emotion cache for session {session_id}")
+            
+            # Close stream gracefully if active
+            if stream.is_active:
+                stream.is_active = False
+                try:
+                    await stream.manager.end_stream()
+                    logger.debug(f"Ended Transcribe stream for session {session_id}")
+                except Exception as e:
+                    logger.warning(f"Error ending stream for session {session_id}: {e}")
+            
+            logger.info(f"Closed stream for session {session_id}")
         
     except Exception as e:
         logger.error(f"Error closing stream for session {session_id}: {e}", exc_info=True)
 
 
+def _run_stream_shutdown(stream: SessionStream) -> None:
+    """
+    Close a removed stream from synchronous code.
+    
+    Args:
+        stream: Removed SessionStream
+    """
+    try:
+        if scheduler.is_running():
+            asyncio.create_task(_shutdown_stream(stream))
+        else:
+            scheduler.run(_shutdown_stream(stream))
+    except Exception as e:
+        logger.error(f"Error in _run_stream_shutdown wrapper: {e}", exc_info=True)
+
+
 def _close_stream(session_id: str) -> None:
     """
     Close Transcribe stream for session (synchronous wrapper).
@@ -1782,13 +3062,12 @@ def _close_stream(session_id: str) -> None:
         session_id: Session identifier
     """
     try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
+        if scheduler.is_running():
             # If loop is running, create a task
             asyncio.create_task(_close_stream_async(session_id))
         else:
             # If loop is not running, run until complete
-            loop.run_until_complete(_close_stream_async(session_id))
+            scheduler.run(_close_stream_async(session_id))
     except Exception as e:
         logger.error(f"Error in _close_stream wrapper: {e}", exc_info=True)
 
@@ -1876,6 +3155,9 @@ async def process_audio_async(
                         if metrics_emitter is not None:
                             try:
                                 metrics_emitter.emit_metrics(session_id, quality_metrics)
+                                scheduler_stats = quality_analyzer.scheduler_stats(session_id)
+                                if scheduler_stats is not None:
+                                    metrics_emitter.emit_scheduler_stats(session_id, scheduler_stats)
                                 logger.debug(f"Quality metrics emitted for session {session_id}")
                             except Exception as e:
                                 logger.warning(f"Failed to emit quality metrics: {e}")
@@ -2095,6 +3377,8 @@ def _load_quality_config_from_environment() -> QualityConfig:
     - SNR_THRESHOLD: Minimum acceptable SNR in dB (default: 20.0)
     - SNR_UPDATE_INTERVAL: SNR update interval in ms (default: 500)
     - SNR_WINDOW_SIZE: SNR rolling window size in seconds (default: 5.0)
+    - SNR_INCREMENTAL: Track each session's noise floor across chunks
+      (default: false)
     - CLIPPING_THRESHOLD: Maximum acceptable clipping percentage (default: 1.0)
     - CLIPPING_AMPLITUDE: Amplitude threshold percentage (default: 98.0)
     - CLIPPING_WINDOW: Clipping detection window in ms (default: 100)
@@ -2102,10 +3386,17 @@ def _load_quality_config_from_environment() -> QualityConfig:
     - ECHO_MIN_DELAY: Minimum echo delay in ms (default: 10)
     - ECHO_MAX_DELAY: Maximum echo delay in ms (default: 500)
     - ECHO_UPDATE_INTERVAL: Echo update interval in seconds (default: 1.0)
+    - ECHO_STREAMING: Keep each session's chunk tail for echo detection
+      across chunks (default: false)
     - SILENCE_THRESHOLD: Silence threshold in dB (default: -50.0)
     - SILENCE_DURATION: Silence duration threshold in seconds (default: 5.0)
     - ENABLE_HIGH_PASS: Enable high-pass filter (default: false)
     - ENABLE_NOISE_GATE: Enable noise gate (default: false)
+    - ADAPTIVE_CADENCE: Run SNR and echo detection on a cadence (default: false)
+    - ANALYSIS_CPU_BUDGET: Detector CPU seconds per audio second, 0 for no
+      limit (default: 0.0)
+    - CADENCE_ENERGY_CHANGE_DB: Level change in dB that analyzes the next
+      chunk fully (default: 6.0)
     
     Returns:
         QualityConfig with values from environment or defaults
@@ -2118,6 +3409,7 @@ def _load_quality_config_from_environment() -> QualityConfig:
             snr_threshold_db=float(os.getenv('SNR_THRESHOLD', '20.0')),
             snr_update_interval_ms=int(os.getenv('SNR_UPDATE_INTERVAL', '500')),
             snr_window_size_s=float(os.getenv('SNR_WINDOW_SIZE', '5.0')),
+            snr_incremental=os.getenv('SNR_INCREMENTAL', 'false').lower() == 'true',
             clipping_threshold_percent=float(os.getenv('CLIPPING_THRESHOLD', '1.0')),
             clipping_amplitude_percent=float(os.getenv('CLIPPING_AMPLITUDE', '98.0')),
             clipping_window_ms=int(os.getenv('CLIPPING_WINDOW', '100')),
@@ -2125,10 +3417,14 @@ def _load_quality_config_from_environment() -> QualityConfig:
             echo_min_delay_ms=int(os.getenv('ECHO_MIN_DELAY', '10')),
             echo_max_delay_ms=int(os.getenv('ECHO_MAX_DELAY', '500')),
             echo_update_interval_s=float(os.getenv('ECHO_UPDATE_INTERVAL', '1.0')),
+            echo_streaming=os.getenv('ECHO_STREAMING', 'false').lower() == 'true',
             silence_threshold_db=float(os.getenv('SILENCE_THRESHOLD', '-50.0')),
             silence_duration_threshold_s=float(os.getenv('SILENCE_DURATION', '5.0')),
             enable_high_pass=os.getenv('ENABLE_HIGH_PASS', 'false').lower() == 'true',
-            enable_noise_gate=os.getenv('ENABLE_NOISE_GATE', 'false').lower() == 'true'
+            enable_noise_gate=os.getenv('ENABLE_NOISE_GATE', 'false').lower() == 'true',
+            adaptive_cadence=os.getenv('ADAPTIVE_CADENCE', 'false').lower() == 'true',
+            analysis_cpu_budget=float(os.getenv('ANALYSIS_CPU_BUDGET', '0.0')),
+            cadence_energy_change_db=float(os.getenv('CADENCE_ENERGY_CHANGE_DB', '6.0'))
         )
         
         # Validate configuration
@@ -2182,7 +3478,7 @@ def _enable_fallback_mode(reason: str, session_id: str = "") -> None:
     
     # Emit CloudWatch metric
     try:
-        cloudwatch.put_metric_data(
+        metrics_sink.put_metric_data(
             Namespace='AudioTranscription/PartialResults',
             MetricData=[
                 {
@@ -2354,8 +3650,8 @@ async def transcribe_pcm_audio(
         import uuid
         import tempfile
         
-        transcribe_client = boto3.client('transcribe')
-        s3_client = boto3.client('s3')
+        transcribe_client = aws_clients.client('transcribe')
+        s3_client = aws_clients.client('s3')
         
         # Generate unique job name
         job_name = f"transcribe-{session_id}-{batch_index}-{uuid.uuid4().hex[:8]}"
@@ -2365,14 +3661,16 @@ async def transcribe_pcm_audio(
         
         # Upload PCM to S3 temporarily
         s3_key = f"sessions/{session_id}/transcribe-temp/{job_name}.pcm"
-        s3_client.put_object(
+        await scheduler.run_blocking(
+            s3_client.put_object,
             Bucket=audio_bucket,
             Key=s3_key,
             Body=pcm_bytes
         )
         
         # Start transcription job
-        transcribe_client.start_transcription_job(
+        await scheduler.run_blocking(
+            transcribe_client.start_transcription_job,
             TranscriptionJobName=job_name,
             LanguageCode=language_code,
             MediaFormat='pcm',
@@ -2389,7 +3687,8 @@ async def transcribe_pcm_audio(
             await asyncio.sleep(wait_interval)
             elapsed += wait_interval
             
-            status_response = transcribe_client.get_transcription_job(
+            status_response = await scheduler.run_blocking(
+                transcribe_client.get_transcription_job,
                 TranscriptionJobName=job_name
             )
             
@@ -2400,15 +3699,24 @@ async def transcribe_pcm_audio(
                 
                 # Download and parse transcript
                 import urllib.request
-                with urllib.request.urlopen(transcript_uri) as response:
-                    transcript_data = json.loads(response.read())
+                
+                def _download_transcript() -> dict:
+                    with urllib.request.urlopen(transcript_uri) as response:
+                        return json.loads(response.read())
+                
+                transcript_data = await scheduler.run_blocking(_download_transcript)
                 
                 transcript = transcript_data['results']['transcripts'][0]['transcript']
                 
                 # Cleanup
                 try:
-                    transcribe_client.delete_transcription_job(TranscriptionJobName=job_name)
-                    s3_client.delete_object(Bucket=audio_bucket, Key=s3_key)
+                    await scheduler.run_blocking(
+                        transcribe_client.delete_transcription_job,
+                        TranscriptionJobName=job_name
+                    )
+                    await scheduler.run_blocking(
+                        s3_client.delete_object, Bucket=audio_bucket, Key=s3_key
+                    )
                 except:
                     pass
                 
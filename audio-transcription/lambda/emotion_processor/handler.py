@@ -19,6 +19,13 @@ from emotion_dynamics.models.processing_options import ProcessingOptions
 from emotion_dynamics.exceptions import EmotionDynamicsError
 from emotion_dynamics.config.settings import get_settings
 
+try:
+    from shared.utils.emf_metrics import flush_metrics_after
+except ImportError:
+    # Without the shared sink, EmotionDynamicsMetrics publishes unbuffered
+    def flush_metrics_after(handler):
+        return handler
+
 # Configure logging
 logger = logging.getLogger(__name__)
 logger.setLevel(logging.INFO)
@@ -28,6 +35,7 @@ logger.setLevel(logging.INFO)
 orchestrator: Optional[AudioDynamicsOrchestrator] = None
 
 
+@flush_metrics_after
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda handler for emotion dynamics processing.
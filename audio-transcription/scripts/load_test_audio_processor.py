@@ -0,0 +1,1083 @@
+#!/usr/bin/env python3
+"""
+Offline load test for the audio processor Lambda (Kinesis path).
+
+This script generates synthetic Kinesis batch events (N sessions x M target
+languages x batch seconds of speech-like PCM) and runs them through
+lambda_handler in-process, against fake Transcribe Streaming, Translate,
+Polly, S3, DynamoDB and API Gateway Management implementations with
+configurable latency distributions. Nothing is deployed and no AWS call is
+made, so concurrency and caching changes can be compared locally before
+rollout.
+
+It reports end-to-end (per invocation) and per-stage p50/p95/p99 latencies
+and, with allocation tracing, the peak memory allocated per invocation, the
+memory retained across the run and the top allocation sites.
+
+Handler settings are read from the environment as in Lambda, e.g.
+KINESIS_SESSION_CONCURRENCY, DELIVERY_STAGE_CONCURRENCY_*, VAD_ENABLED or
+SUB_BATCH_ENABLED.
+
+Latency specs (milliseconds):
+    fixed:MS                 Constant latency
+    uniform:LOW:HIGH         Uniformly distributed
+    normal:MEAN:STDDEV       Normally distributed (clipped at 0)
+    lognormal:MEDIAN:SIGMA   Log-normally distributed (long tail)
+    none                     No latency
+
+Usage:
+    python load_test_audio_processor.py                              # Defaults
+    python load_test_audio_processor.py --sessions 20 --languages 4 --batches 10
+    python load_test_audio_processor.py --transcribe-mode one-shot
+    python load_test_audio_processor.py --translate-latency lognormal:120:0.6
+    python load_test_audio_processor.py --no-trace-allocations --json
+    KINESIS_SESSION_CONCURRENCY=20 python load_test_audio_processor.py
+"""
+
+import argparse
+import asyncio
+import base64
+import gc
+import importlib.util
+import io
+import json
+import logging
+import os
+import random
+import re
+import sys
+import threading
+import time
+import tracemalloc
+import zlib
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+_PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+_HANDLER_PATH = os.path.join(_PROJECT_ROOT, 'lambda', 'audio_processor', 'handler.py')
+
+if _PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, _PROJECT_ROOT)
+
+from shared.services.pcm_batch_assembler import AUDIO_RECORD_HEADER, AUDIO_RECORD_MAGIC  # noqa: E402
+
+SAMPLE_RATE = 16000
+TARGET_LANGUAGES = ['es', 'fr', 'de', 'it', 'pt', 'ja', 'ko', 'zh', 'ar', 'hi', 'ru', 'nl']
+API_GATEWAY_ENDPOINT = 'https://loadtest.execute-api.local/dev'
+
+# Handler functions timed per stage (sync functions run in the executor)
+TIMED_STAGES = {
+    '_load_session_context': 'session_context',
+    '_transcribe_session_audio': 'transcribe',
+    '_translate_text': 'translate',
+    '_synthesize_speech': 'tts',
+    '_store_tts_audio': 'storage',
+    'notify_listeners_for_language': 'notify',
+    '_deliver_language': 'language_chain',
+    '_process_kinesis_session': 'session',
+    '_emit_kinesis_batch_metrics': 'metrics',
+}
+
+_LATENCY_PATTERN = re.compile(r'^(fixed|uniform|normal|lognormal):([\d.]+)(?::([\d.]+))?$')
+
+
+class LatencyModel:
+    """
+    Latency distribution of a fake AWS service.
+
+    Attributes:
+        spec: Latency spec the model was parsed from
+    """
+
+    def __init__(self, spec: str, seed: Optional[int] = None):
+        """
+        Parse a latency spec.
+
+        Args:
+            spec: Latency spec in milliseconds (see module docstring)
+            seed: Optional random seed
+
+        Raises:
+            ValueError: If the spec is invalid
+        """
+        self.spec = spec
+        self._random = random.Random(seed)
+
+        if spec in ('none', '0'):
+            self._kind, self._a, self._b = 'fixed', 0.0, 0.0
+            return
+
+        match = _LATENCY_PATTERN.match(spec)
+        if not match:
+            raise ValueError(f"Invalid latency spec: {spec!r}")
+
+        kind, a, b = match.group(1), float(match.group(2)), match.group(3)
+        if kind != 'fixed' and b is None:
+            raise ValueError(f"Latency spec {spec!r} needs two parameters")
+        if kind == 'fixed' and b is not None:
+            raise ValueError(f"Latency spec {spec!r} takes one parameter")
+
+        self._kind, self._a, self._b = kind, a, float(b) if b is not None else 0.0
+
+    def sample(self) -> float:
+        """
+        Draw one latency.
+
+        Returns:
+            Latency in seconds
+        """
+        if self._kind == 'fixed':
+            ms = self._a
+        elif self._kind == 'uniform':
+            ms = self._random.uniform(self._a, self._b)
+        elif self._kind == 'normal':
+            ms = self._random.gauss(self._a, self._b)
+        else:
+            ms = self._a * self._random.lognormvariate(0.0, self._b) if self._a > 0 else 0.0
+        return max(0.0, ms) / 1000
+
+
+class StageRecorder:
+    """Thread-safe collection of durations per stage."""
+
+    def __init__(self):
+        """Initialize empty recorder."""
+        self.durations: Dict[str, List[float]] = {}
+        self.enabled = True
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        """
+        Record one duration.
+
+        Args:
+            stage: Stage name
+            seconds: Duration in seconds
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self.durations.setdefault(stage, []).append(seconds)
+
+
+def timed(func: Callable, stage: str, recorder: StageRecorder) -> Callable:
+    """
+    Wrap a sync or async function to record its duration.
+
+    Args:
+        func: Function to wrap
+        stage: Stage name
+        recorder: Recorder receiving the durations
+
+    Returns:
+        Wrapped function
+    """
+    if asyncio.iscoroutinefunction(func):
+        async def async_wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                recorder.record(stage, time.perf_counter() - started)
+        return async_wrapper
+
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            recorder.record(stage, time.perf_counter() - started)
+    return wrapper
+
+
+def percentiles_ms(durations: List[float]) -> Dict[str, float]:
+    """
+    Summarize durations in milliseconds.
+
+    Args:
+        durations: Durations in seconds
+
+    Returns:
+        Dict with count, p50, p95, p99 and max
+    """
+    if not durations:
+        return {'count': 0, 'p50': 0.0, 'p95': 0.0, 'p99': 0.0, 'max': 0.0}
+
+    values_ms = np.asarray(durations) * 1000
+    p50, p95, p99 = np.percentile(values_ms, [50, 95, 99])
+    return {
+        'count': len(durations),
+        'p50': round(float(p50), 1),
+        'p95': round(float(p95), 1),
+        'p99': round(float(p99), 1),
+        'max': round(float(values_ms.max()), 1)
+    }
+
+
+# ---------------------------------------------------------------------------
+# Fake AWS services
+# ---------------------------------------------------------------------------
+
+class FakeServiceError(Exception):
+    """Base class of errors raised by the fake services."""
+    pass
+
+
+class FakeTranslate:
+    """Fake Amazon Translate client."""
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+        self.call_count = 0
+
+    def translate_text(self, Text: str, SourceLanguageCode: str, TargetLanguageCode: str, **kwargs) -> dict:
+        self.call_count += 1
+        time.sleep(self.latency.sample())
+        return {'TranslatedText': f"[{TargetLanguageCode}] {Text}"}
+
+
+class FakePolly:
+    """Fake Amazon Polly client returning MP3-sized payloads (~400 bytes per character)."""
+
+    def __init__(self, latency: LatencyModel, bytes_per_character: int = 400):
+        self.latency = latency
+        self.bytes_per_character = bytes_per_character
+        self.call_count = 0
+
+    def synthesize_speech(self, Text: str, **kwargs) -> dict:
+        self.call_count += 1
+        time.sleep(self.latency.sample())
+        return {'AudioStream': io.BytesIO(bytes(len(Text) * self.bytes_per_character))}
+
+
+class FakeS3:
+    """Fake Amazon S3 client."""
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+        self.call_count = 0
+        self.stored_bytes = 0
+
+    def put_object(self, Bucket: str, Key: str, Body: bytes, **kwargs) -> dict:
+        self.call_count += 1
+        self.stored_bytes += len(Body)
+        time.sleep(self.latency.sample())
+        return {}
+
+    def generate_presigned_url(self, ClientMethod: str, Params: dict, ExpiresIn: int = 3600) -> str:
+        return f"https://{Params['Bucket']}.s3.local/{Params['Key']}?X-Amz-Expires={ExpiresIn}"
+
+
+class FakeApiGatewayManagement:
+    """
+    Fake API Gateway Management API client.
+
+    A fraction of connections (gone_rate) behaves as disconnected and
+    raises GoneException.
+    """
+
+    class exceptions:
+        class GoneException(FakeServiceError):
+            pass
+
+    def __init__(self, latency: LatencyModel, gone_rate: float = 0.0, seed: Optional[int] = None):
+        self.latency = latency
+        self.gone_rate = gone_rate
+        self.call_count = 0
+        self.sent_bytes = 0
+        self._random = random.Random(seed)
+        self._gone: Dict[str, bool] = {}
+
+    def post_to_connection(self, ConnectionId: str, Data: bytes) -> dict:
+        self.call_count += 1
+        time.sleep(self.latency.sample())
+        if ConnectionId not in self._gone:
+            self._gone[ConnectionId] = self._random.random() < self.gone_rate
+        if self._gone[ConnectionId]:
+            raise self.exceptions.GoneException(f"Connection {ConnectionId} is gone")
+        self.sent_bytes += len(Data)
+        return {}
+
+
+class FakeCloudWatch:
+    """Fake CloudWatch / EventBridge client that counts calls."""
+
+    def __init__(self):
+        self.call_count = 0
+
+    def put_metric_data(self, **kwargs) -> dict:
+        self.call_count += 1
+        return {}
+
+    def put_events(self, **kwargs) -> dict:
+        self.call_count += 1
+        return {'FailedEntryCount': 0, 'Entries': []}
+
+
+class _FakeBatchWriter:
+    """Batch writer of a FakeTable."""
+
+    def __init__(self, table: 'FakeTable'):
+        self.table = table
+
+    def __enter__(self) -> '_FakeBatchWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        time.sleep(self.table.latency.sample())
+
+    def put_item(self, Item: dict) -> None:
+        self.table._put(Item)
+
+    def delete_item(self, Key: dict) -> None:
+        self.table._delete(Key)
+
+
+class FakeTable:
+    """
+    Fake DynamoDB table keyed by one hash key.
+
+    Supports get_item, put_item, delete_item, update_item with simple SET
+    expressions, query with equality conditions (on any index) and
+    batch_writer.
+    """
+
+    class _Exceptions:
+        class ConditionalCheckFailedException(FakeServiceError):
+            pass
+
+    def __init__(self, name: str, key_name: str, latency: LatencyModel):
+        self.name = name
+        self.key_name = key_name
+        self.latency = latency
+        self.call_count = 0
+        self.meta = SimpleNamespace(client=SimpleNamespace(exceptions=self._Exceptions))
+        self._items: Dict[str, dict] = {}
+        self._lock = threading.Lock()
+
+    def _put(self, item: dict) -> None:
+        with self._lock:
+            self._items[item[self.key_name]] = dict(item)
+
+    def _delete(self, key: dict) -> None:
+        with self._lock:
+            self._items.pop(key[self.key_name], None)
+
+    def _call(self) -> None:
+        self.call_count += 1
+        time.sleep(self.latency.sample())
+
+    def get_item(self, Key: dict, **kwargs) -> dict:
+        self._call()
+        with self._lock:
+            item = self._items.get(Key[self.key_name])
+        return {'Item': dict(item)} if item is not None else {}
+
+    def put_item(self, Item: dict, **kwargs) -> dict:
+        self._call()
+        self._put(Item)
+        return {}
+
+    def delete_item(self, Key: dict, **kwargs) -> dict:
+        self._call()
+        self._delete(Key)
+        return {}
+
+    def update_item(
+        self,
+        Key: dict,
+        UpdateExpression: str,
+        ExpressionAttributeValues: dict,
+        ConditionExpression: Optional[str] = None,
+        **kwargs
+    ) -> dict:
+        self._call()
+        with self._lock:
+            item = self._items.get(Key[self.key_name])
+            if item is None:
+                if ConditionExpression and 'attribute_exists' in ConditionExpression:
+                    raise self._Exceptions.ConditionalCheckFailedException(str(Key))
+                item = self._items[Key[self.key_name]] = dict(Key)
+
+            for assignment in UpdateExpression.replace('SET ', '', 1).split(','):
+                attribute, placeholder = (part.strip() for part in assignment.split('='))
+                item[attribute] = ExpressionAttributeValues[placeholder]
+        return {}
+
+    def query(self, ExpressionAttributeValues: dict, **kwargs) -> dict:
+        self._call()
+        names = {':sid': 'sessionId', ':lang': 'targetLanguage', ':role': 'role'}
+        conditions = {
+            names[placeholder]: value
+            for placeholder, value in ExpressionAttributeValues.items()
+            if placeholder in names
+        }
+        with self._lock:
+            items = [
+                dict(item) for item in self._items.values()
+                if all(item.get(attr) == value for attr, value in conditions.items())
+            ]
+        return {'Items': items, 'Count': len(items)}
+
+    def batch_writer(self) -> _FakeBatchWriter:
+        self.call_count += 1
+        return _FakeBatchWriter(self)
+
+    @property
+    def item_count(self) -> int:
+        """Number of items in the table."""
+        return len(self._items)
+
+
+class FakeDynamoDB:
+    """Fake DynamoDB service resource; tables are created on first access."""
+
+    def __init__(self, latency: LatencyModel):
+        self.latency = latency
+        self.tables: Dict[str, FakeTable] = {}
+        self._lock = threading.Lock()
+
+    def Table(self, name: str) -> FakeTable:
+        with self._lock:
+            if name not in self.tables:
+                key_name = 'connectionId' if name.startswith('Connections') else 'sessionId'
+                self.tables[name] = FakeTable(name, key_name, self.latency)
+            return self.tables[name]
+
+    @property
+    def call_count(self) -> int:
+        """Calls across all tables."""
+        return sum(table.call_count for table in self.tables.values())
+
+
+def _transcript_event(text: str, start_time: float, end_time: float, is_partial: bool) -> SimpleNamespace:
+    """Build a Transcribe Streaming TranscriptEvent lookalike."""
+    result = SimpleNamespace(
+        is_partial=is_partial,
+        start_time=start_time,
+        end_time=end_time,
+        alternatives=[SimpleNamespace(transcript=text)]
+    )
+    return SimpleNamespace(transcript=SimpleNamespace(results=[result]))
+
+
+class FakeTranscribeStream:
+    """
+    Fake Transcribe Streaming stream (input_stream / output_stream).
+
+    Every chunk of audio produces a partial result right away. A final
+    result is produced for every segment_seconds of audio, and for the
+    remaining audio once no audio has been sent for one result latency
+    (endpointing), each after a latency drawn from the service's model.
+    Finals are delivered in order.
+    """
+
+    def __init__(self, service: 'FakeTranscribeService', sample_rate: int):
+        self.service = service
+        self.sample_rate = sample_rate
+        self.input_stream = self
+        self.sent_seconds = 0.0
+        self._finalized_seconds = 0.0
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._last_final: Optional[asyncio.Future] = None
+        self._endpoint: Optional[asyncio.Task] = None
+        self._ended = False
+
+    def _finalize(self, end_time: float) -> None:
+        """Schedule the final result up to end_time."""
+        start_time, self._finalized_seconds = self._finalized_seconds, end_time
+        previous = self._last_final
+        delay = self.service.result_latency.sample()
+
+        async def emit() -> None:
+            await asyncio.sleep(delay)
+            if previous is not None:
+                await previous
+            text = self.service.transcript_for(end_time - start_time)
+            await self._queue.put(_transcript_event(text, start_time, end_time, False))
+
+        self._last_final = asyncio.ensure_future(emit())
+
+    async def _endpoint_after_silence(self) -> None:
+        await asyncio.sleep(self.service.result_latency.sample())
+        if self.sent_seconds > self._finalized_seconds:
+            self._finalize(self.sent_seconds)
+
+    async def send_audio_event(self, audio_chunk) -> None:
+        if self._ended:
+            raise FakeServiceError("Stream already ended")
+
+        chunk_seconds = len(audio_chunk) / (self.sample_rate * 2)
+        self.service.sent_seconds += chunk_seconds
+        self.sent_seconds += chunk_seconds
+        await self._queue.put(
+            _transcript_event('', self._finalized_seconds, self.sent_seconds, True)
+        )
+
+        segment = self.service.segment_seconds
+        while self.sent_seconds - self._finalized_seconds >= segment:
+            self._finalize(self._finalized_seconds + segment)
+
+        if self._endpoint is not None:
+            self._endpoint.cancel()
+        self._endpoint = asyncio.ensure_future(self._endpoint_after_silence())
+
+    async def end_stream(self) -> None:
+        self._ended = True
+        if self._endpoint is not None:
+            self._endpoint.cancel()
+        if self.sent_seconds > self._finalized_seconds:
+            self._finalize(self.sent_seconds)
+        if self._last_final is not None:
+            await self._last_final
+        await self._queue.put(None)
+
+    @property
+    def output_stream(self):
+        return self._events()
+
+    async def _events(self):
+        while True:
+            event = await self._queue.get()
+            if event is None:
+                return
+            yield event
+
+
+class FakeTranscribeService:
+    """
+    Fake Transcribe Streaming service.
+
+    Provides a stream factory for the warm stream pool and a drop-in
+    replacement for the handler's one-shot transcribe_streaming().
+
+    Attributes:
+        connect_latency: Latency of opening a stream
+        result_latency: Latency of each final result
+        segment_seconds: Audio per final result
+        words_per_second: Words produced per second of audio
+    """
+
+    def __init__(
+        self,
+        connect_latency: LatencyModel,
+        result_latency: LatencyModel,
+        segment_seconds: float = 2.0,
+        words_per_second: float = 2.5
+    ):
+        self.connect_latency = connect_latency
+        self.result_latency = result_latency
+        self.segment_seconds = segment_seconds
+        self.words_per_second = words_per_second
+        self.stream_count = 0
+        self.sent_seconds = 0.0
+        self._word_count = 0
+
+    def transcript_for(self, seconds: float) -> str:
+        """Unique words for a span of audio (so transcripts never overlap)."""
+        count = max(1, int(round(seconds * self.words_per_second)))
+        first, self._word_count = self._word_count, self._word_count + count
+        return ' '.join(f"word{n}" for n in range(first, first + count))
+
+    async def start_stream(self, language_code: str, sample_rate: int) -> FakeTranscribeStream:
+        """Stream factory for TranscribeStreamPool."""
+        self.stream_count += 1
+        await asyncio.sleep(self.connect_latency.sample())
+        return FakeTranscribeStream(self, sample_rate)
+
+    async def transcribe_streaming(self, pcm_bytes, language_code: str, sample_rate: int, on_segment=None) -> str:
+        """Replacement for handler.transcribe_streaming (one stream per call)."""
+        from shared.services.transcribe_stream_pool import emit_segment
+
+        stream = await self.start_stream(language_code, sample_rate)
+        chunk_size = 16384
+        for i in range(0, len(pcm_bytes), chunk_size):
+            await stream.input_stream.send_audio_event(audio_chunk=pcm_bytes[i:i + chunk_size])
+        await stream.input_stream.end_stream()
+
+        segments = []
+        async for event in stream.output_stream:
+            for result in event.transcript.results:
+                if result.is_partial or not result.alternatives[0].transcript:
+                    continue
+                text = result.alternatives[0].transcript
+                segments.append(text)
+                await emit_segment(on_segment, text, result.start_time, result.end_time)
+
+        return ' '.join(segments) if segments else "[No transcription]"
+
+
+# ---------------------------------------------------------------------------
+# Synthetic load
+# ---------------------------------------------------------------------------
+
+def synthetic_speech(seconds: float, rng: np.random.Generator, speech_ratio: float = 0.7) -> np.ndarray:
+    """
+    Generate speech-like 16 kHz int16 audio.
+
+    Voiced bursts (harmonics of a 120-220 Hz pitch, 150-400 ms long)
+    alternate with low-level noise pauses so the voice activity gate,
+    split-point search and carry-over see realistic energy patterns.
+
+    Args:
+        seconds: Duration in seconds
+        rng: Random generator
+        speech_ratio: Approximate fraction of time that is voiced
+
+    Returns:
+        int16 samples
+    """
+    total = int(seconds * SAMPLE_RATE)
+    audio = rng.normal(0.0, 30.0, total)
+    position = 0
+
+    while position < total:
+        burst = int(rng.uniform(0.15, 0.4) * SAMPLE_RATE)
+        end = min(total, position + burst)
+        t = np.arange(end - position) / SAMPLE_RATE
+        pitch = rng.uniform(120, 220)
+        envelope = np.sin(np.pi * np.arange(end - position) / max(1, end - position))
+        voiced = sum(np.sin(2 * np.pi * pitch * k * t) / k for k in range(1, 5))
+        audio[position:end] += 6000 * envelope * voiced
+
+        mean_pause = burst * (1 - speech_ratio) / max(speech_ratio, 0.05)
+        position = end + int(rng.uniform(0.5, 1.5) * mean_pause)
+
+    return np.clip(audio, -32768, 32767).astype(np.int16)
+
+
+class KinesisEventGenerator:
+    """
+    Synthetic Kinesis batch events for a set of speaker sessions.
+
+    Each batch carries batch_seconds of audio per session, split into
+    records of record_ms with the audio record header (stream ID, chunk
+    index) the connection handler writes. Sequence numbers and chunk
+    indices continue across batches.
+    """
+
+    def __init__(
+        self,
+        session_ids: List[str],
+        batch_seconds: float = 3.0,
+        record_ms: int = 100,
+        speech_ratio: float = 0.7,
+        seed: int = 0
+    ):
+        self.session_ids = session_ids
+        self.batch_seconds = batch_seconds
+        self.record_ms = record_ms
+        self.speech_ratio = speech_ratio
+        self._rng = np.random.default_rng(seed)
+        self._sequence_number = 49600000000000000000000000000000000000000000000000000000
+        self._chunk_indices = {session_id: 0 for session_id in session_ids}
+
+    def next_event(self) -> Dict[str, Any]:
+        """Build the next batch event."""
+        record_bytes = SAMPLE_RATE * 2 * self.record_ms // 1000
+        records = []
+
+        for session_id in self.session_ids:
+            pcm = synthetic_speech(self.batch_seconds, self._rng, self.speech_ratio).tobytes()
+            stream_id = zlib.crc32(session_id.encode('utf-8'))
+
+            for offset in range(0, len(pcm), record_bytes):
+                header = AUDIO_RECORD_HEADER.pack(
+                    AUDIO_RECORD_MAGIC, stream_id, self._chunk_indices[session_id]
+                )
+                self._chunk_indices[session_id] += 1
+                self._sequence_number += 1
+                records.append({
+                    'kinesis': {
+                        'data': base64.b64encode(header + pcm[offset:offset + record_bytes]).decode('ascii'),
+                        'partitionKey': session_id,
+                        'sequenceNumber': str(self._sequence_number)
+                    }
+                })
+
+        return {'Records': records}
+
+
+# ---------------------------------------------------------------------------
+# Harness
+# ---------------------------------------------------------------------------
+
+class FakeAWS:
+    """The fake services used by one load test run."""
+
+    def __init__(self, args: argparse.Namespace):
+        seed = args.seed
+        self.transcribe = FakeTranscribeService(
+            LatencyModel(args.transcribe_connect_latency, seed),
+            LatencyModel(args.transcribe_latency, seed),
+            segment_seconds=args.segment_seconds
+        )
+        self.translate = FakeTranslate(LatencyModel(args.translate_latency, seed))
+        self.polly = FakePolly(LatencyModel(args.polly_latency, seed))
+        self.s3 = FakeS3(LatencyModel(args.s3_latency, seed))
+        self.apigw = FakeApiGatewayManagement(
+            LatencyModel(args.apigw_latency, seed), gone_rate=args.gone_rate, seed=seed
+        )
+        self.dynamodb = FakeDynamoDB(LatencyModel(args.dynamodb_latency, seed))
+        self.cloudwatch = FakeCloudWatch()
+
+    def register(self, registry) -> None:
+        """Inject the fakes into an AWSClientRegistry."""
+        registry.register_client('translate', self.translate)
+        registry.register_client('polly', self.polly)
+        registry.register_client('s3', self.s3)
+        registry.register_client('cloudwatch', self.cloudwatch)
+        registry.register_client('events', self.cloudwatch)
+        registry.register_client(
+            'apigatewaymanagementapi', self.apigw, endpoint_url=API_GATEWAY_ENDPOINT
+        )
+        registry.register_resource('dynamodb', self.dynamodb)
+
+    def seed_sessions(self, session_ids: List[str], languages: List[str], listeners: int) -> None:
+        """Create session items and listener connections."""
+        sessions = self.dynamodb.Table(os.environ['SESSIONS_TABLE_NAME'])
+        connections = self.dynamodb.Table(os.environ['CONNECTIONS_TABLE'])
+
+        for session_id in session_ids:
+            sessions._put({
+                'sessionId': session_id,
+                'sourceLanguage': 'en',
+                'targetLanguages': list(languages),
+                'status': 'active'
+            })
+            for language in languages:
+                for n in range(listeners):
+                    connections._put({
+                        'connectionId': f"{session_id}-{language}-{n}",
+                        'sessionId': session_id,
+                        'targetLanguage': language,
+                        'role': 'listener'
+                    })
+
+    def call_counts(self) -> Dict[str, int]:
+        """Calls made to each fake service."""
+        return {
+            'transcribe_streams': self.transcribe.stream_count,
+            'translate': self.translate.call_count,
+            'polly': self.polly.call_count,
+            's3': self.s3.call_count,
+            'apigw': self.apigw.call_count,
+            'dynamodb': self.dynamodb.call_count,
+            'cloudwatch': self.cloudwatch.call_count
+        }
+
+
+def load_handler(fakes: FakeAWS):
+    """
+    Load the audio processor handler with the fakes injected.
+
+    Args:
+        fakes: Fake services
+
+    Returns:
+        Handler module
+    """
+    from shared.services.aws_client_registry import get_client_registry
+    from shared.utils.emf_metrics import BACKEND_CLOUDWATCH, MetricsSink, set_metrics_sink
+
+    fakes.register(get_client_registry())
+    # Buffered metrics are flushed to the fake CloudWatch once per invocation
+    set_metrics_sink(MetricsSink(backend=BACKEND_CLOUDWATCH, cloudwatch_client=fakes.cloudwatch))
+
+    spec = importlib.util.spec_from_file_location('audio_processor_handler_load_test', _HANDLER_PATH)
+    handler = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(handler)
+
+    handler.eventbridge = fakes.cloudwatch
+    handler.transcribe_streaming = fakes.transcribe.transcribe_streaming
+    handler.transcribe_stream_pool = handler.TranscribeStreamPool(
+        stream_factory=fakes.transcribe.start_stream,
+        idle_timeout_seconds=handler.WARM_STREAM_IDLE_TIMEOUT_SECONDS,
+        flush_timeout_seconds=handler.WARM_STREAM_FLUSH_TIMEOUT_SECONDS
+    )
+    return handler
+
+
+def instrument(handler, recorder: StageRecorder) -> None:
+    """
+    Time the handler's pipeline stages.
+
+    Args:
+        handler: Handler module
+        recorder: Recorder receiving the durations
+    """
+    for name, stage in TIMED_STAGES.items():
+        setattr(handler, name, timed(getattr(handler, name), stage, recorder))
+
+    # The checkpoint store holds its own references to the loader and writer
+    handler.sequence_checkpoints = handler.SequenceCheckpointStore(
+        loader=timed(handler._load_sequence_checkpoint, 'checkpoint_load', recorder),
+        writer=timed(handler._save_sequence_checkpoint, 'checkpoint_save', recorder)
+    )
+
+
+def run_load_test(args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Run the load test.
+
+    Args:
+        args: Parsed command line arguments
+
+    Returns:
+        Report dict (configuration, latencies, allocations, call counts)
+    """
+    os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+    os.environ.setdefault('SESSIONS_TABLE_NAME', 'Sessions-loadtest')
+    os.environ.setdefault('CONNECTIONS_TABLE', 'Connections-loadtest')
+    os.environ['API_GATEWAY_ENDPOINT'] = API_GATEWAY_ENDPOINT
+
+    if args.languages > len(TARGET_LANGUAGES):
+        raise ValueError(f"At most {len(TARGET_LANGUAGES)} languages are supported")
+
+    session_ids = [f"loadtest-{n:04d}" for n in range(args.sessions)]
+    languages = TARGET_LANGUAGES[:args.languages]
+
+    fakes = FakeAWS(args)
+    handler = load_handler(fakes)
+    handler.logger.setLevel(args.log_level.upper())
+    handler.TRANSCRIBE_WARM_STREAMS_ENABLED = args.transcribe_mode == 'warm'
+    fakes.seed_sessions(session_ids, languages, args.listeners)
+
+    recorder = StageRecorder()
+    instrument(handler, recorder)
+
+    generator = KinesisEventGenerator(
+        session_ids,
+        batch_seconds=args.batch_seconds,
+        record_ms=args.record_ms,
+        speech_ratio=args.speech_ratio,
+        seed=args.seed
+    )
+    events = [generator.next_event() for _ in range(args.warmup_batches + args.batches)]
+
+    invocation_seconds: List[float] = []
+    peak_bytes: List[int] = []
+    failed_records = 0
+    baseline_snapshot = None
+    baseline_bytes = 0
+
+    if args.trace_allocations:
+        tracemalloc.start(args.traceback_frames)
+
+    try:
+        for n, event in enumerate(events):
+            warmup = n < args.warmup_batches
+            recorder.enabled = not warmup
+
+            if args.trace_allocations:
+                if n == args.warmup_batches:
+                    # Collect cycles first so both snapshots show retained memory only
+                    gc.collect()
+                    baseline_snapshot = tracemalloc.take_snapshot()
+                    baseline_bytes, _ = tracemalloc.get_traced_memory()
+                current_before, _ = tracemalloc.get_traced_memory()
+                tracemalloc.reset_peak()
+
+            started = time.perf_counter()
+            response = handler.lambda_handler(event, None)
+            elapsed = time.perf_counter() - started
+
+            body = json.loads(response.get('body', '{}'))
+            batch_failures = len(response.get('batchItemFailures', []))
+            if response.get('statusCode') != 200 or batch_failures:
+                logging.getLogger(__name__).warning(
+                    f"Batch {n} returned status {response.get('statusCode')} "
+                    f"with {batch_failures} item failures: {body.get('error', '')}"
+                )
+
+            if warmup:
+                continue
+
+            invocation_seconds.append(elapsed)
+            failed_records += batch_failures
+            if args.trace_allocations:
+                _, peak = tracemalloc.get_traced_memory()
+                peak_bytes.append(peak - current_before)
+
+            if args.inter_batch_seconds:
+                time.sleep(args.inter_batch_seconds)
+
+        allocations = None
+        if args.trace_allocations:
+            # Growth sites in the project's code, leaving out the harness and its fakes
+            ignored = [
+                tracemalloc.Filter(True, os.path.join(_PROJECT_ROOT, '*')),
+                tracemalloc.Filter(False, os.path.abspath(__file__))
+            ]
+            gc.collect()
+            final_snapshot = tracemalloc.take_snapshot().filter_traces(ignored)
+            current, _ = tracemalloc.get_traced_memory()
+            top_sites = []
+            if baseline_snapshot is not None:
+                for stat in final_snapshot.compare_to(baseline_snapshot.filter_traces(ignored), 'lineno')[:args.top_allocations]:
+                    frame = stat.traceback[0]
+                    top_sites.append({
+                        'site': f"{os.path.relpath(frame.filename, _PROJECT_ROOT)}:{frame.lineno}",
+                        'sizeDiffKiB': round(stat.size_diff / 1024, 1),
+                        'countDiff': stat.count_diff
+                    })
+            allocations = {
+                'peakPerInvocationMiB': {
+                    'p50': round(float(np.percentile(peak_bytes, 50)) / 2 ** 20, 2) if peak_bytes else 0.0,
+                    'max': round(max(peak_bytes) / 2 ** 20, 2) if peak_bytes else 0.0
+                },
+                'retainedSinceWarmupMiB': round((current - baseline_bytes) / 2 ** 20, 2),
+                'topGrowthSites': top_sites
+            }
+
+        # lambda_handler runs every batch on the container's event loop
+        handler.scheduler.run(handler.transcribe_stream_pool.close_all())
+    finally:
+        if args.trace_allocations:
+            tracemalloc.stop()
+        handler.scheduler.shutdown()
+        asyncio.set_event_loop(None)
+
+    audio_seconds = args.sessions * args.batch_seconds * args.batches
+    wall_seconds = sum(invocation_seconds)
+
+    return {
+        'config': {
+            'sessions': args.sessions,
+            'languages': args.languages,
+            'listenersPerLanguage': args.listeners,
+            'batchSeconds': args.batch_seconds,
+            'batches': args.batches,
+            'transcribeMode': args.transcribe_mode,
+            'sessionConcurrency': handler.KINESIS_SESSION_CONCURRENCY,
+            'stageConcurrency': dict(handler.DELIVERY_STAGE_CONCURRENCY)
+        },
+        'endToEnd': percentiles_ms(invocation_seconds),
+        'stages': {
+            stage: percentiles_ms(durations)
+            for stage, durations in sorted(recorder.durations.items())
+        },
+        'throughput': {
+            'audioSecondsPerWallSecond': round(audio_seconds / wall_seconds, 2) if wall_seconds else 0.0,
+            'failedRecords': failed_records
+        },
+        'allocations': allocations,
+        'calls': fakes.call_counts()
+    }
+
+
+def print_report(report: Dict[str, Any]) -> None:
+    """
+    Print a report as tables.
+
+    Args:
+        report: Report returned by run_load_test()
+    """
+    config = report['config']
+    print(
+        f"\n{config['sessions']} sessions x {config['languages']} languages x "
+        f"{config['listenersPerLanguage']} listeners, {config['batchSeconds']}s batches, "
+        f"{config['batches']} invocations, transcribe={config['transcribeMode']}, "
+        f"session concurrency={config['sessionConcurrency']}"
+    )
+
+    print(f"\n{'stage':<18}{'count':>8}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    print('-' * 66)
+    rows = [('end_to_end', report['endToEnd'])] + list(report['stages'].items())
+    for stage, stats in rows:
+        print(
+            f"{stage:<18}{stats['count']:>8}{stats['p50']:>10.1f}{stats['p95']:>10.1f}"
+            f"{stats['p99']:>10.1f}{stats['max']:>10.1f}"
+        )
+
+    throughput = report['throughput']
+    print(
+        f"\nThroughput: {throughput['audioSecondsPerWallSecond']}x realtime, "
+        f"{throughput['failedRecords']} failed records"
+    )
+    print("Calls: " + ', '.join(f"{name}={count}" for name, count in report['calls'].items()))
+
+    allocations = report['allocations']
+    if allocations:
+        peak = allocations['peakPerInvocationMiB']
+        print(
+            f"\nAllocations: peak per invocation p50={peak['p50']} MiB max={peak['max']} MiB, "
+            f"retained since warm-up {allocations['retainedSinceWarmupMiB']} MiB"
+        )
+        for site in allocations['topGrowthSites']:
+            print(f"  {site['sizeDiffKiB']:>10.1f} KiB {site['countDiff']:>+8} blocks  {site['site']}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line parser."""
+    parser = argparse.ArgumentParser(
+        description='Offline load test for the audio processor Lambda (Kinesis path)'
+    )
+
+    load = parser.add_argument_group('load')
+    load.add_argument('--sessions', type=int, default=10, help='Speaker sessions per batch (default: 10)')
+    load.add_argument('--languages', type=int, default=3, help='Target languages per session (default: 3)')
+    load.add_argument('--listeners', type=int, default=5, help='Listeners per language (default: 5)')
+    load.add_argument('--batch-seconds', type=float, default=3.0, help='Audio per session per batch (default: 3.0)')
+    load.add_argument('--record-ms', type=int, default=100, help='Audio per Kinesis record (default: 100)')
+    load.add_argument('--speech-ratio', type=float, default=0.7, help='Voiced fraction of the audio (default: 0.7)')
+    load.add_argument('--batches', type=int, default=5, help='Measured invocations (default: 5)')
+    load.add_argument('--warmup-batches', type=int, default=1, help='Unmeasured first invocations (default: 1)')
+    load.add_argument('--inter-batch-seconds', type=float, default=0.0, help='Pause between invocations (default: 0)')
+    load.add_argument('--transcribe-mode', choices=['warm', 'one-shot'], default='warm',
+                      help='Warm stream pool or one stream per batch (default: warm)')
+    load.add_argument('--seed', type=int, default=0, help='Random seed (default: 0)')
+
+    latency = parser.add_argument_group('fake service latencies (see latency specs above)')
+    latency.add_argument('--transcribe-connect-latency', default='lognormal:150:0.3',
+                         help='Opening a Transcribe stream (default: lognormal:150:0.3)')
+    latency.add_argument('--transcribe-latency', default='lognormal:300:0.4',
+                         help='Each Transcribe final result (default: lognormal:300:0.4)')
+    latency.add_argument('--segment-seconds', type=float, default=2.0,
+                         help='Audio per Transcribe final result (default: 2.0)')
+    latency.add_argument('--translate-latency', default='lognormal:80:0.4', help='(default: lognormal:80:0.4)')
+    latency.add_argument('--polly-latency', default='lognormal:150:0.4', help='(default: lognormal:150:0.4)')
+    latency.add_argument('--s3-latency', default='lognormal:40:0.5', help='(default: lognormal:40:0.5)')
+    latency.add_argument('--dynamodb-latency', default='lognormal:8:0.5', help='(default: lognormal:8:0.5)')
+    latency.add_argument('--apigw-latency', default='lognormal:25:0.5', help='(default: lognormal:25:0.5)')
+    latency.add_argument('--gone-rate', type=float, default=0.0,
+                         help='Fraction of listener connections that are gone (default: 0)')
+
+    output = parser.add_argument_group('output')
+    output.add_argument('--no-trace-allocations', dest='trace_allocations', action='store_false',
+                        help='Disable tracemalloc (it slows the run down noticeably)')
+    output.add_argument('--traceback-frames', type=int, default=1, help='tracemalloc frames (default: 1)')
+    output.add_argument('--top-allocations', type=int, default=10, help='Allocation sites shown (default: 10)')
+    output.add_argument('--json', action='store_true', help='Print the report as JSON')
+    output.add_argument('--log-level', default='WARNING', help='Handler log level (default: WARNING)')
+
+    return parser
+
+
+def main():
+    """Main function."""
+    parser = build_parser()
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    logging.getLogger().setLevel(args.log_level.upper())
+
+    try:
+        for spec in (args.transcribe_connect_latency, args.transcribe_latency, args.translate_latency,
+                     args.polly_latency, args.s3_latency, args.dynamodb_latency, args.apigw_latency):
+            LatencyModel(spec)
+        report = run_load_test(args)
+    except ValueError as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
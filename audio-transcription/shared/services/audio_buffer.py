@@ -67,7 +67,9 @@ class AudioBuffer:
         Args:
             capacity_seconds: Buffer capacity in seconds (default: 5.0)
             chunk_duration_ms: Duration of each audio chunk in milliseconds (default: 100)
-            cloudwatch_client: Optional boto3 CloudWatch client for metrics
+            cloudwatch_client: Optional metrics sink or boto3 CloudWatch client
+                for metrics (anything with put_metric_data); the Lambda handler
+                passes its buffered EMF metrics sink
         """
         self.capacity_seconds = capacity_seconds
         self.chunk_duration_ms = chunk_duration_ms
@@ -0,0 +1,276 @@
+"""
+Cross-batch audio carry-over for one-shot transcription of Kinesis batches.
+
+Kinesis batches cut the audio at arbitrary points, so a batch transcribed
+on its own often ends (and the next one starts) in the middle of a word.
+This module finds a cheap energy-based split point near the end of each
+batch (the quietest frame of the tail, i.e. the most likely gap between
+words), holds the audio after it back in the warm container and prepends it
+to the session's next batch. Transcripts are deduplicated against the
+previously delivered text of the session, so words that still appear on
+both sides of a split are not translated and synthesized twice.
+"""
+
+import logging
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+import numpy as np
+
+from shared.services.voice_activity_detector import frame_features
+
+logger = logging.getLogger(__name__)
+
+_WORD_PATTERN = re.compile(r"[\w']+")
+
+
+def find_carry_split(
+    samples: np.ndarray,
+    sample_rate: int = 16000,
+    max_carry_ms: int = 1000,
+    frame_ms: int = 20,
+    silence_threshold_db: float = -50.0
+) -> int:
+    """
+    Find the sample where the tail of a batch should be held back.
+
+    A batch that ends in silence needs no carry-over. Otherwise the
+    quietest frame in the last max_carry_ms is taken as the split point.
+    Batches shorter than twice max_carry_ms are not split, so the delivered
+    part of a batch is never shorter than the held-back part.
+
+    Args:
+        samples: Audio samples (int16 or float normalized to [-1, 1])
+        sample_rate: Audio sample rate in Hz (default: 16000)
+        max_carry_ms: Longest tail that may be held back (default: 1000)
+        frame_ms: Analysis frame length in milliseconds (default: 20)
+        silence_threshold_db: Energy below which the batch end is silent
+
+    Returns:
+        Split sample index (len(samples) if nothing should be held back)
+    """
+    sample_count = len(samples)
+    frame_size = max(2, int(sample_rate * frame_ms / 1000))
+    window = int(sample_rate * max_carry_ms / 1000) // frame_size * frame_size
+
+    if window < frame_size or sample_count < 2 * window:
+        return sample_count
+
+    # Frames aligned to the end of the batch
+    tail_start = sample_count - window
+    energy_db, _ = frame_features(samples[tail_start:], frame_size)
+
+    if energy_db[-1] < silence_threshold_db:
+        return sample_count
+
+    quietest = int(np.argmin(energy_db))
+    return tail_start + quietest * frame_size + frame_size // 2
+
+
+def strip_overlap(previous_text: str, text: str, min_overlap_words: int = 2) -> str:
+    """
+    Remove the words at the start of text that repeat the end of previous_text.
+
+    Words are compared case-insensitively without punctuation. Overlaps
+    shorter than min_overlap_words are kept, so a single common word at a
+    boundary is not dropped.
+
+    Args:
+        previous_text: Previously delivered transcript
+        text: New transcript
+        min_overlap_words: Minimum repeated words to strip (default: 2)
+
+    Returns:
+        Text without the repeated words (empty if text is fully repeated)
+    """
+    previous_words = [w.lower() for w in _WORD_PATTERN.findall(previous_text)]
+    matches = list(_WORD_PATTERN.finditer(text))
+    words = [m.group(0).lower() for m in matches]
+
+    longest = min(len(previous_words), len(words))
+    for overlap in range(longest, min_overlap_words - 1, -1):
+        if previous_words[-overlap:] == words[:overlap]:
+            if overlap == len(words):
+                return ''
+            return text[matches[overlap].start():]
+
+    return text
+
+
+@dataclass
+class _SessionCarry:
+    """Held-back audio and last delivered transcript of one session."""
+    audio: bytes = b''
+    held_at: float = field(default_factory=time.time)
+    last_transcript: str = ''
+
+
+class AudioCarryOverBuffer:
+    """
+    Per-session carry-over of batch tails and delivered transcripts.
+
+    Held-back audio older than max_age_seconds is dropped instead of being
+    spliced onto unrelated audio. Sessions are evicted oldest first beyond
+    max_sessions. Safe to use from executor threads.
+
+    Attributes:
+        max_carry_ms: Longest tail held back per batch in milliseconds
+        max_age_seconds: Held-back audio older than this is discarded
+        min_overlap_words: Minimum repeated words removed from transcripts
+        sample_rate: Audio sample rate in Hz
+        max_sessions: Maximum sessions tracked
+
+    Examples:
+        >>> carry = AudioCarryOverBuffer()
+        >>> batch = assembler.build(session_id, prefix=carry.take(session_id))
+        >>> split = carry.hold_tail(session_id, batch.data, batch.samples)
+        >>> text = carry.dedupe_transcript(session_id, transcript)
+    """
+
+    def __init__(
+        self,
+        max_carry_ms: int = 1000,
+        max_age_seconds: float = 10.0,
+        min_overlap_words: int = 2,
+        sample_rate: int = 16000,
+        max_sessions: int = 1000
+    ):
+        """
+        Initialize carry-over buffer.
+
+        Args:
+            max_carry_ms: Longest tail held back per batch (default: 1000)
+            max_age_seconds: Maximum age of held-back audio (default: 10.0)
+            min_overlap_words: Minimum repeated words to strip (default: 2)
+            sample_rate: Audio sample rate in Hz (default: 16000)
+            max_sessions: Maximum sessions tracked (default: 1000)
+
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        if max_carry_ms < 0:
+            raise ValueError(f"max_carry_ms must be non-negative, got {max_carry_ms}")
+        if min_overlap_words < 1:
+            raise ValueError(f"min_overlap_words must be at least 1, got {min_overlap_words}")
+
+        self.max_carry_ms = max_carry_ms
+        self.max_age_seconds = max_age_seconds
+        self.min_overlap_words = min_overlap_words
+        self.sample_rate = sample_rate
+        self.max_sessions = max_sessions
+        self._sessions: Dict[str, _SessionCarry] = {}
+        self._lock = threading.Lock()
+
+    def _session(self, session_id: str) -> _SessionCarry:
+        """Get or create a session's state (caller holds the lock)."""
+        state = self._sessions.get(session_id)
+        if state is None:
+            while len(self._sessions) >= self.max_sessions:
+                self._sessions.pop(next(iter(self._sessions)))
+            state = self._sessions[session_id] = _SessionCarry()
+        return state
+
+    def take(self, session_id: str) -> Optional[bytes]:
+        """
+        Remove and return the audio held back for a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Held-back PCM bytes, or None if there is none (or it expired)
+        """
+        with self._lock:
+            state = self._sessions.get(session_id)
+            if state is None or not state.audio:
+                return None
+
+            audio, state.audio = state.audio, b''
+            if time.time() - state.held_at > self.max_age_seconds:
+                logger.debug(f"Discarded stale carry-over audio for {session_id}")
+                return None
+            return audio
+
+    def restore(self, session_id: str, audio: Optional[bytes]) -> None:
+        """
+        Put audio returned by take() back, e.g. if the batch was not processed.
+
+        Replaces any tail held back from the unprocessed batch, since that
+        batch is processed again on retry.
+
+        Args:
+            session_id: Session identifier
+            audio: Audio returned by take()
+        """
+        with self._lock:
+            if audio:
+                self._session(session_id).audio = audio
+            elif session_id in self._sessions:
+                self._sessions[session_id].audio = b''
+
+    def hold_tail(self, session_id: str, data: memoryview, samples: np.ndarray) -> int:
+        """
+        Hold back the tail of a batch after its energy-based split point.
+
+        Args:
+            session_id: Session identifier
+            data: PCM bytes of the batch (16-bit mono)
+            samples: int16 samples of the batch
+
+        Returns:
+            Number of bytes of the batch to transcribe now
+        """
+        split_sample = find_carry_split(
+            samples,
+            sample_rate=self.sample_rate,
+            max_carry_ms=self.max_carry_ms
+        )
+        split_byte = split_sample * 2
+
+        if split_byte >= len(data):
+            return len(data)
+
+        with self._lock:
+            state = self._session(session_id)
+            state.audio = bytes(data[split_byte:])
+            state.held_at = time.time()
+
+        return split_byte
+
+    def dedupe_transcript(self, session_id: str, text: str) -> str:
+        """
+        Strip words repeated from the session's last delivered transcript.
+
+        The returned text becomes the session's last delivered transcript.
+
+        Args:
+            session_id: Session identifier
+            text: New transcript
+
+        Returns:
+            Transcript without the repeated words (empty if nothing is new)
+        """
+        with self._lock:
+            state = self._session(session_id)
+            deduped = strip_overlap(state.last_transcript, text, self.min_overlap_words)
+            if deduped:
+                state.last_transcript = deduped
+            return deduped
+
+    def discard(self, session_id: str) -> None:
+        """
+        Forget a session's held-back audio and transcript.
+
+        Args:
+            session_id: Session identifier
+        """
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+    @property
+    def size(self) -> int:
+        """Number of sessions tracked."""
+        return len(self._sessions)
@@ -76,7 +76,9 @@ class AudioRateLimiter:
             window_seconds: Sliding window size in seconds (default: 1.0)
             warning_threshold_seconds: Send warning after this many seconds of violations (default: 5.0)
             close_threshold_seconds: Close connection after this many seconds of violations (default: 30.0)
-            cloudwatch_client: Optional boto3 CloudWatch client for metrics
+            cloudwatch_client: Optional metrics sink or boto3 CloudWatch client
+                for metrics (anything with put_metric_data); the Lambda handler
+                passes its buffered EMF metrics sink
         """
         self.limit = limit
         self.window_seconds = window_seconds
@@ -0,0 +1,241 @@
+"""
+Container-scoped registry of AWS clients and resources.
+
+This module provides a lazily initialized registry that creates each boto3
+client once per Lambda container and reuses it across warm invocations,
+avoiding the CPU cost of client construction and a new HTTPS connection
+pool on every call.
+"""
+
+import os
+import logging
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import boto3
+from botocore.config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class AWSClientRegistry:
+    """
+    Lazily initialized, thread-safe registry of AWS clients.
+
+    Clients are created on first use with a shared botocore Config (connection
+    pool size, TCP keep-alive) and cached by (service, endpoint_url). boto3
+    clients are thread-safe and shared by all threads. boto3 resources are
+    not, so resources are cached per thread.
+
+    Tests can inject stubs with register_client() / register_resource();
+    injected objects take precedence over lazily created ones.
+
+    Attributes:
+        max_pool_connections: Maximum pooled HTTPS connections per client
+        tcp_keepalive: Whether TCP keep-alive is enabled on pooled connections
+        region_name: AWS region (None uses the environment default)
+        created_count: Number of clients/resources created (not injected)
+
+    Examples:
+        >>> registry = AWSClientRegistry(max_pool_connections=50)
+        >>> s3 = registry.client('s3')
+        >>> registry.client('s3') is s3
+        True
+        >>> table = registry.table('Sessions-dev')
+    """
+
+    def __init__(
+        self,
+        max_pool_connections: int = 50,
+        tcp_keepalive: bool = True,
+        region_name: Optional[str] = None
+    ):
+        """
+        Initialize client registry.
+
+        Args:
+            max_pool_connections: Maximum pooled connections per client (default: 50)
+            tcp_keepalive: Enable TCP keep-alive on pooled connections (default: True)
+            region_name: AWS region (default: environment/boto3 default)
+        """
+        if max_pool_connections < 1:
+            raise ValueError(
+                f"max_pool_connections must be at least 1, got {max_pool_connections}"
+            )
+
+        self.max_pool_connections = max_pool_connections
+        self.tcp_keepalive = tcp_keepalive
+        self.region_name = region_name
+        self.created_count = 0
+
+        self._config = Config(
+            max_pool_connections=max_pool_connections,
+            tcp_keepalive=tcp_keepalive
+        )
+        self._clients: Dict[Tuple[str, Optional[str]], Any] = {}
+        self._injected_resources: Dict[str, Any] = {}
+        self._thread_local = threading.local()
+        self._lock = threading.Lock()
+
+        logger.info(
+            f"Initialized AWSClientRegistry: max_pool_connections={max_pool_connections}, "
+            f"tcp_keepalive={tcp_keepalive}"
+        )
+
+    def client(self, service_name: str, endpoint_url: Optional[str] = None) -> Any:
+        """
+        Get (or lazily create) a client for an AWS service.
+
+        Args:
+            service_name: boto3 service name (e.g., 's3', 'translate')
+            endpoint_url: Optional custom endpoint (e.g., API Gateway
+                Management API endpoint); cached separately per endpoint
+
+        Returns:
+            boto3 client (or injected stub)
+        """
+        key = (service_name, endpoint_url)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                kwargs = {'config': self._config}
+                if endpoint_url:
+                    kwargs['endpoint_url'] = endpoint_url
+                if self.region_name:
+                    kwargs['region_name'] = self.region_name
+
+                client = boto3.client(service_name, **kwargs)
+                self._clients[key] = client
+                self.created_count += 1
+
+                logger.info(
+                    f"Created {service_name} client"
+                    + (f" for endpoint {endpoint_url}" if endpoint_url else "")
+                )
+
+        return client
+
+    def resource(self, service_name: str) -> Any:
+        """
+        Get (or lazily create) a resource for an AWS service.
+
+        Resources are cached per thread because boto3 resources are not
+        thread-safe.
+
+        Args:
+            service_name: boto3 service name (e.g., 'dynamodb')
+
+        Returns:
+            boto3 service resource (or injected stub)
+        """
+        injected = self._injected_resources.get(service_name)
+        if injected is not None:
+            return injected
+
+        resources = getattr(self._thread_local, 'resources', None)
+        if resources is None:
+            resources = self._thread_local.resources = {}
+
+        resource = resources.get(service_name)
+        if resource is None:
+            kwargs = {'config': self._config}
+            if self.region_name:
+                kwargs['region_name'] = self.region_name
+
+            # Session creation on the default boto3 session is not thread-safe
+            with self._lock:
+                resource = boto3.resource(service_name, **kwargs)
+                self.created_count += 1
+
+            resources[service_name] = resource
+            logger.info(f"Created {service_name} resource")
+
+        return resource
+
+    def table(self, table_name: str) -> Any:
+        """
+        Get a DynamoDB Table from the (per-thread) DynamoDB resource.
+
+        Args:
+            table_name: DynamoDB table name
+
+        Returns:
+            DynamoDB Table object
+        """
+        return self.resource('dynamodb').Table(table_name)
+
+    def register_client(
+        self,
+        service_name: str,
+        client: Any,
+        endpoint_url: Optional[str] = None
+    ) -> None:
+        """
+        Inject a client (e.g., a stub or mock) for a service.
+
+        Args:
+            service_name: boto3 service name
+            client: Client object to return for this service
+            endpoint_url: Endpoint the client is registered for (default: None)
+        """
+        with self._lock:
+            self._clients[(service_name, endpoint_url)] = client
+
+    def register_resource(self, service_name: str, resource: Any) -> None:
+        """
+        Inject a resource (e.g., a stub or mock) for a service.
+
+        Args:
+            service_name: boto3 service name
+            resource: Resource object to return for this service on all threads
+        """
+        with self._lock:
+            self._injected_resources[service_name] = resource
+
+    def reset(self) -> None:
+        """
+        Drop all cached and injected clients and resources.
+
+        Resources cached on other threads are released lazily, the next time
+        those threads are reused after their thread-local storage is replaced.
+        """
+        with self._lock:
+            self._clients.clear()
+            self._injected_resources.clear()
+            self._thread_local = threading.local()
+            self.created_count = 0
+
+        logger.info("AWSClientRegistry reset")
+
+
+# Container-wide registry (created on first use)
+_registry: Optional[AWSClientRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_client_registry() -> AWSClientRegistry:
+    """
+    Get the container-wide client registry.
+
+    The registry is created on first use from environment variables:
+    - AWS_MAX_POOL_CONNECTIONS: Maximum pooled connections per client (default: 50)
+    - AWS_TCP_KEEPALIVE: Enable TCP keep-alive (default: true)
+
+    Returns:
+        Shared AWSClientRegistry instance
+    """
+    global _registry
+
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = AWSClientRegistry(
+                    max_pool_connections=int(os.getenv('AWS_MAX_POOL_CONNECTIONS', '50')),
+                    tcp_keepalive=os.getenv('AWS_TCP_KEEPALIVE', 'true').lower() == 'true'
+                )
+
+    return _registry
@@ -0,0 +1,319 @@
+"""
+Container-level scheduler for the audio processor's async work.
+
+Lambda reuses the container between invocations, so this module keeps one
+event loop alive for the container's lifetime instead of setting a loop up
+for every event, and runs blocking SDK calls (boto3) on a dedicated,
+configurable thread pool. The thread pool records how busy it was, so its
+size can be tuned from the utilization, queue depth and queue wait metrics
+emitted once per invocation.
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+@dataclass
+class ExecutorStats:
+    """
+    Executor activity over one measurement window.
+
+    Attributes:
+        window_seconds: Length of the window
+        submitted: Tasks submitted during the window
+        completed: Tasks completed during the window
+        busy_seconds: Thread time spent running tasks completed in the window
+        utilization: busy_seconds over the window's thread capacity (0.0-1.0)
+        peak_active: Most tasks running at once
+        peak_queued: Most tasks waiting for a thread at once
+        avg_queue_wait_ms: Average time tasks waited for a thread
+    """
+    window_seconds: float
+    submitted: int
+    completed: int
+    busy_seconds: float
+    utilization: float
+    peak_active: int
+    peak_queued: int
+    avg_queue_wait_ms: float
+
+
+class InstrumentedExecutor(ThreadPoolExecutor):
+    """
+    ThreadPoolExecutor that records utilization and queueing.
+
+    Busy time is accounted when a task completes, so a task spanning two
+    windows counts fully in the second one; utilization is capped at 1.0.
+
+    Attributes:
+        max_workers: Number of worker threads
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        thread_name_prefix: str = '',
+        clock: Callable[[], float] = time.perf_counter
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            max_workers: Number of worker threads
+            thread_name_prefix: Prefix of worker thread names
+            clock: Time source in seconds (default: time.perf_counter)
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        super().__init__(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
+        self.max_workers = max_workers
+
+        self._clock = clock
+        self._stats_lock = threading.Lock()
+        self._active = 0
+        self._queued = 0
+        self._reset_window(clock())
+
+    def _reset_window(self, now: float) -> None:
+        """Start a new measurement window (caller holds the lock or is __init__)."""
+        self._window_start = now
+        self._submitted = 0
+        self._completed = 0
+        self._busy_seconds = 0.0
+        self._queue_wait_seconds = 0.0
+        self._started = 0
+        self._peak_active = self._active
+        self._peak_queued = self._queued
+
+    def submit(self, fn: Callable[..., T], /, *args: Any, **kwargs: Any) -> 'Future[T]':
+        """Submit a task, recording its queue wait and run time."""
+        submitted_at = self._clock()
+        with self._stats_lock:
+            self._submitted += 1
+            self._queued += 1
+            self._peak_queued = max(self._peak_queued, self._queued)
+
+        def run() -> T:
+            started_at = self._clock()
+            with self._stats_lock:
+                self._queued -= 1
+                self._active += 1
+                self._started += 1
+                self._peak_active = max(self._peak_active, self._active)
+                self._queue_wait_seconds += started_at - submitted_at
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                finished_at = self._clock()
+                with self._stats_lock:
+                    self._active -= 1
+                    self._completed += 1
+                    self._busy_seconds += finished_at - started_at
+
+        try:
+            return super().submit(run)
+        except Exception:
+            with self._stats_lock:
+                self._submitted -= 1
+                self._queued -= 1
+            raise
+
+    def snapshot(self, reset: bool = True) -> ExecutorStats:
+        """
+        Get activity since the last reset.
+
+        Args:
+            reset: Start a new window after reading (default: True)
+
+        Returns:
+            ExecutorStats of the window
+        """
+        now = self._clock()
+        with self._stats_lock:
+            window_seconds = max(now - self._window_start, 1e-9)
+            capacity = window_seconds * self.max_workers
+            stats = ExecutorStats(
+                window_seconds=window_seconds,
+                submitted=self._submitted,
+                completed=self._completed,
+                busy_seconds=self._busy_seconds,
+                utilization=min(1.0, self._busy_seconds / capacity),
+                peak_active=self._peak_active,
+                peak_queued=self._peak_queued,
+                avg_queue_wait_ms=(
+                    self._queue_wait_seconds / self._started * 1000 if self._started else 0.0
+                )
+            )
+            if reset:
+                self._reset_window(now)
+        return stats
+
+
+class ContainerScheduler:
+    """
+    Long-lived event loop and blocking-call executor of one container.
+
+    The loop is created on first use and installed as the thread's current
+    loop with the executor as its default executor, so existing
+    run_in_executor(None, ...) calls use the configured pool. Synchronous
+    entry points run coroutines with run(); coroutines offload blocking
+    calls with run_blocking().
+
+    Attributes:
+        max_workers: Number of executor threads
+        metrics_namespace: CloudWatch namespace of the executor metrics
+        loops_created: Number of event loops created (1 while warm)
+
+    Examples:
+        >>> scheduler = ContainerScheduler(max_workers=32)
+        >>> result = scheduler.run(handle_kinesis_batch(event, context))
+        >>> # inside a coroutine
+        >>> item = await scheduler.run_blocking(table.get_item, Key=key)
+        >>> scheduler.emit_metrics(metrics_sink)
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 32,
+        thread_name_prefix: str = 'blocking-io',
+        metrics_namespace: str = 'AudioTranscription/Scheduler'
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_workers: Number of executor threads (default: 32)
+            thread_name_prefix: Prefix of executor thread names
+            metrics_namespace: Namespace of the executor metrics
+        """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+
+        self.max_workers = max_workers
+        self.metrics_namespace = metrics_namespace
+
+        self._thread_name_prefix = thread_name_prefix
+        self._executor: Optional[InstrumentedExecutor] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.loops_created = 0
+
+        logger.info(f"ContainerScheduler initialized with max_workers={max_workers}")
+
+    @property
+    def executor(self) -> InstrumentedExecutor:
+        """Executor for blocking calls (created on first use)."""
+        if self._executor is None:
+            self._executor = InstrumentedExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix=self._thread_name_prefix
+            )
+            logger.info(f"Blocking-call executor started with {self.max_workers} threads")
+        return self._executor
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Container event loop (created on first use, recreated if closed)."""
+        if self._loop is None or self._loop.is_closed():
+            if self._loop is not None:
+                # Closing a loop also shuts down its default executor
+                self._executor = None
+            self._loop = asyncio.new_event_loop()
+            self._loop.set_default_executor(self.executor)
+            self.loops_created += 1
+        asyncio.set_event_loop(self._loop)
+        return self._loop
+
+    def is_running(self) -> bool:
+        """Check whether the container loop is currently running."""
+        return self._loop is not None and self._loop.is_running()
+
+    def run(self, coro: Awaitable[T]) -> T:
+        """
+        Run a coroutine to completion on the container loop.
+
+        Args:
+            coro: Coroutine to run
+
+        Returns:
+            Result of the coroutine
+
+        Raises:
+            RuntimeError: If called from code already running on the loop
+        """
+        loop = self.loop
+        if loop.is_running():
+            if asyncio.iscoroutine(coro):
+                coro.close()
+            raise RuntimeError(
+                "Container event loop is already running; await the coroutine instead"
+            )
+        return loop.run_until_complete(coro)
+
+    async def run_blocking(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """
+        Run a blocking function on the executor.
+
+        Args:
+            func: Blocking function (e.g. a boto3 call)
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Result of the function
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.executor, functools.partial(func, *args, **kwargs)
+        )
+
+    def emit_metrics(
+        self,
+        metrics_sink: Any,
+        dimensions: Optional[Dict[str, str]] = None
+    ) -> ExecutorStats:
+        """
+        Emit executor metrics for the window since the last call.
+
+        Args:
+            metrics_sink: Sink with put_metric(name, value, unit, dimensions, namespace)
+            dimensions: Metric dimensions (default: none)
+
+        Returns:
+            ExecutorStats of the window
+        """
+        stats = self.executor.snapshot()
+        if stats.submitted == 0 and stats.completed == 0:
+            return stats
+
+        for name, value, unit in (
+            ('ExecutorUtilization', stats.utilization * 100, 'Percent'),
+            ('ExecutorPeakActiveThreads', stats.peak_active, 'Count'),
+            ('ExecutorPeakQueueDepth', stats.peak_queued, 'Count'),
+            ('ExecutorQueueWait', stats.avg_queue_wait_ms, 'Milliseconds'),
+            ('ExecutorTasks', stats.submitted, 'Count')
+        ):
+            metrics_sink.put_metric(
+                name, value, unit=unit, dimensions=dimensions,
+                namespace=self.metrics_namespace
+            )
+        return stats
+
+    def shutdown(self) -> None:
+        """Close the loop and stop the executor threads."""
+        if self._loop is not None and not self._loop.is_closed():
+            self._loop.close()
+        self._loop = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
@@ -0,0 +1,311 @@
+"""
+Lightweight per-invocation latency tracing for the Kinesis audio path.
+
+This module records timed spans (DynamoDB lookups, Transcribe, Translate,
+Polly, S3, fan-out, ...) tagged with the session and language they belong
+to, and condenses them into one structured summary per invocation with
+per-stage totals and the critical path: the chain of spans that determined
+how long the invocation took. It is an in-process alternative to X-Ray for
+finding the stage that exceeds the end-to-end latency budget.
+
+The active trace and span are tracked in context variables, so spans opened
+in concurrent asyncio tasks nest under the span that was current when the
+task was created. Spans are opened around awaits in the event loop; work
+run in executor threads is timed by the span around the awaited call.
+"""
+
+import contextvars
+import itertools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+_current_span: contextvars.ContextVar[Optional['Span']] = contextvars.ContextVar(
+    'latency_tracer_current_span', default=None
+)
+
+
+@dataclass
+class Span:
+    """
+    One timed operation.
+
+    Attributes:
+        name: Stage name (e.g. 'translate')
+        start: Start time (perf_counter seconds)
+        end: End time, None while the span is open
+        parent: Enclosing span (None for the root span)
+        attributes: Tags such as session and language, inherited from the
+            parent span
+        trace: Trace the span belongs to
+    """
+    name: str
+    start: float
+    end: Optional[float] = None
+    parent: Optional['Span'] = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    trace: Optional['InvocationTrace'] = field(default=None, repr=False)
+    span_id: int = 0
+
+    @property
+    def duration_ms(self) -> float:
+        """Duration in milliseconds (up to now while open)."""
+        end = self.end if self.end is not None else time.perf_counter()
+        return (end - self.start) * 1000
+
+
+class InvocationTrace:
+    """
+    Spans recorded during one invocation.
+
+    The trace owns a root span covering the whole invocation. Spans are
+    kept in memory only until summary() condenses them, so tracing adds a
+    few microseconds per span and one log record per invocation.
+
+    Attributes:
+        root: Root span of the invocation
+        max_values_per_attribute: Slowest attribute values kept per
+            attribute in the summary (e.g. the 10 slowest sessions)
+
+    Examples:
+        >>> trace = start_trace('kinesis_batch')
+        >>> with span('session', session='golden-eagle-427'):
+        ...     with span('transcribe'):
+        ...         await transcribe()
+        >>> trace.finish()
+        >>> logger.info(json.dumps(trace.summary()))
+    """
+
+    def __init__(self, name: str, max_values_per_attribute: int = 10, **attributes):
+        """
+        Initialize trace and open its root span.
+
+        Args:
+            name: Name of the root span
+            max_values_per_attribute: Slowest attribute values kept per
+                attribute in the summary (default: 10)
+            **attributes: Attributes of the root span
+        """
+        self.max_values_per_attribute = max_values_per_attribute
+        self._ids = itertools.count()
+        self._spans: List[Span] = []
+        self._lock = threading.Lock()
+        self.root = self._open(name, None, attributes)
+
+    def _open(self, name: str, parent: Optional[Span], attributes: Dict[str, Any]) -> Span:
+        """Create and register a span."""
+        inherited = dict(parent.attributes) if parent is not None else {}
+        inherited.update(attributes)
+        new_span = Span(
+            name=name,
+            start=time.perf_counter(),
+            parent=parent,
+            attributes=inherited,
+            trace=self,
+            span_id=next(self._ids)
+        )
+        with self._lock:
+            self._spans.append(new_span)
+        return new_span
+
+    @property
+    def spans(self) -> List[Span]:
+        """All spans in the order they were opened."""
+        with self._lock:
+            return list(self._spans)
+
+    def finish(self, **attributes) -> None:
+        """
+        Close the root span.
+
+        Args:
+            **attributes: Attributes added to the root span (e.g. counts)
+        """
+        self.root.attributes.update(attributes)
+        if self.root.end is None:
+            self.root.end = time.perf_counter()
+
+    def critical_path(self) -> List[Span]:
+        """
+        Get the chain of spans that determined the invocation's duration.
+
+        Starting at the root, the child that ended last is on the critical
+        path, then the child that ended last before that child started, and
+        so on; each such child is expanded the same way. Only the innermost
+        spans of the chain are returned, in start order. Time not covered
+        by them is time spent in the enclosing spans themselves.
+
+        Returns:
+            Spans on the critical path
+        """
+        children: Dict[int, List[Span]] = {}
+        for recorded in self.spans:
+            if recorded.parent is not None and recorded.end is not None:
+                children.setdefault(recorded.parent.span_id, []).append(recorded)
+
+        def expand(current: Span) -> List[Span]:
+            remaining = children.get(current.span_id, [])
+            path: List[Span] = []
+            cursor = current.end if current.end is not None else time.perf_counter()
+
+            while True:
+                candidates = [child for child in remaining if child.end <= cursor]
+                if not candidates:
+                    break
+                last = max(candidates, key=lambda child: child.end)
+                path = expand(last) + path
+                cursor = last.start
+                remaining = [child for child in candidates if child.end <= cursor]
+
+            return path or [current]
+
+        path = expand(self.root)
+        return [] if path == [self.root] else path
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Condense the trace into one structured record.
+
+        Returns:
+            Dict with the invocation duration and root attributes, per-stage
+            count/total/max, the slowest values of each span attribute (for
+            the span that introduced it, e.g. the 'session' span of each
+            session) and the critical path with a per-stage breakdown
+        """
+        spans = self.spans
+        duration_ms = self.root.duration_ms
+
+        stages: Dict[str, Dict[str, float]] = {}
+        attribute_durations: Dict[str, Dict[str, float]] = {}
+        for recorded in spans:
+            if recorded is self.root or recorded.end is None:
+                continue
+            _accumulate(stages, recorded.name, recorded.duration_ms)
+
+            parent_attributes = recorded.parent.attributes if recorded.parent else {}
+            for key, value in recorded.attributes.items():
+                if parent_attributes.get(key) != value:
+                    _accumulate(
+                        attribute_durations.setdefault(key, {}), str(value), recorded.duration_ms
+                    )
+
+        path = self.critical_path()
+        breakdown: Dict[str, float] = {}
+        for recorded in path:
+            breakdown[recorded.name] = breakdown.get(recorded.name, 0.0) + recorded.duration_ms
+        breakdown['other'] = max(0.0, duration_ms - sum(breakdown.values()))
+
+        return {
+            'trace': self.root.name,
+            'durationMs': round(duration_ms, 1),
+            **self.root.attributes,
+            'spanCount': len(spans) - 1,
+            'stages': _rounded(stages),
+            'slowestBy': {
+                key: _rounded(dict(
+                    sorted(values.items(), key=lambda item: -item[1]['maxMs'])
+                    [:self.max_values_per_attribute]
+                ))
+                for key, values in attribute_durations.items()
+            },
+            'criticalPath': [
+                {
+                    'stage': recorded.name,
+                    **{key: value for key, value in recorded.attributes.items()
+                       if key not in self.root.attributes},
+                    'startMs': round((recorded.start - self.root.start) * 1000, 1),
+                    'durationMs': round(recorded.duration_ms, 1)
+                }
+                for recorded in path
+            ],
+            'criticalPathBreakdownMs': {
+                stage: round(ms, 1) for stage, ms in breakdown.items()
+            }
+        }
+
+
+def _accumulate(totals: Dict[str, Dict[str, float]], key: str, duration_ms: float) -> None:
+    """Add a duration to the count/total/max of a key."""
+    entry = totals.setdefault(key, {'count': 0, 'totalMs': 0.0, 'maxMs': 0.0})
+    entry['count'] += 1
+    entry['totalMs'] += duration_ms
+    entry['maxMs'] = max(entry['maxMs'], duration_ms)
+
+
+def _rounded(totals: Dict[str, Dict[str, float]]) -> Dict[str, Dict[str, float]]:
+    """Round the totals of every key to 0.1 ms."""
+    return {
+        key: {
+            'count': entry['count'],
+            'totalMs': round(entry['totalMs'], 1),
+            'maxMs': round(entry['maxMs'], 1)
+        }
+        for key, entry in totals.items()
+    }
+
+
+def start_trace(name: str, **attributes) -> InvocationTrace:
+    """
+    Start a trace and make its root span current.
+
+    Call at the top of the coroutine handling the invocation: the trace is
+    current in that task and in every task it creates afterwards.
+
+    Args:
+        name: Name of the root span
+        **attributes: Attributes of the root span
+
+    Returns:
+        New InvocationTrace
+    """
+    trace = InvocationTrace(name, **attributes)
+    _current_span.set(trace.root)
+    return trace
+
+
+def current_span() -> Optional[Span]:
+    """
+    Get the current span.
+
+    Returns:
+        Current span, or None if no trace is active
+    """
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, parent: Optional[Span] = None, **attributes) -> Iterator[Optional[Span]]:
+    """
+    Time a block as a child of the current span.
+
+    Does nothing (and yields None) when no trace is active, so code can be
+    instrumented unconditionally.
+
+    Args:
+        name: Stage name
+        parent: Explicit parent span (default: the current span), e.g. for
+            work started from a callback that should not nest under the
+            span the callback runs in
+        **attributes: Attributes of the span (e.g. session, language)
+
+    Yields:
+        The open span, or None
+    """
+    parent = parent if parent is not None else _current_span.get()
+    if parent is None or parent.trace is None:
+        yield None
+        return
+
+    opened = parent.trace._open(name, parent, attributes)
+    token = _current_span.set(opened)
+    try:
+        yield opened
+    finally:
+        opened.end = time.perf_counter()
+        _current_span.reset(token)
+
@@ -0,0 +1,303 @@
+"""
+Pool of per-session partial result processors.
+
+Each PartialResultProcessor owns a ResultBuffer, DeduplicationCache,
+RateLimiter and SentenceBoundaryDetector whose state belongs to a single
+session. This module keeps one processor per session in a warm container,
+created lazily on first use and evicted when idle, when the pool holds too
+many processors or when their estimated memory exceeds a budget (least
+recently used first).
+"""
+
+import time
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Memory estimates (bytes) used for pool accounting
+PROCESSOR_BASE_BYTES = 16 * 1024  # Sub-components and their bookkeeping
+BUFFERED_RESULT_BYTES = 512  # Per buffered partial result, plus its text
+DEDUP_ENTRY_BYTES = 256  # Per deduplication cache entry
+
+
+def estimate_processor_bytes(processor: Any) -> int:
+    """
+    Estimate the memory held by a partial result processor.
+
+    Args:
+        processor: PartialResultProcessor
+
+    Returns:
+        Estimated size in bytes
+    """
+    size = PROCESSOR_BASE_BYTES
+
+    result_buffer = getattr(processor, 'result_buffer', None)
+    if result_buffer is not None:
+        for buffered in result_buffer.buffer.values():
+            size += BUFFERED_RESULT_BYTES + len(buffered.text)
+
+    dedup_cache = getattr(processor, 'dedup_cache', None)
+    if dedup_cache is not None:
+        size += DEDUP_ENTRY_BYTES * dedup_cache.size()
+
+    return size
+
+
+@dataclass
+class PooledProcessor:
+    """
+    Pool entry of one session.
+
+    Attributes:
+        processor: PartialResultProcessor of the session
+        source_language: Source language the processor was created for
+        last_used: Timestamp of the last get() or touch()
+        estimated_bytes: Memory estimate at the last get() or touch()
+    """
+    processor: Any
+    source_language: str
+    last_used: float
+    estimated_bytes: int
+
+
+class PartialProcessorPool:
+    """
+    Lazily created, bounded set of per-session partial result processors.
+
+    Entries are kept in least-recently-used order, so idle processors are
+    expired from the front of the pool without scanning every session. A
+    processor's memory estimate is refreshed each time it is fetched or
+    touched; the pool total is the sum of the latest estimates.
+
+    The pool is not thread-safe; it is used from the handler's event loop
+    thread.
+
+    Attributes:
+        factory: Callable creating a processor for (session_id, source_language)
+        max_processors: Maximum number of pooled processors
+        idle_timeout_seconds: Time after which an unused processor is evicted
+        max_memory_bytes: Estimated memory budget of all pooled processors
+        created_count: Number of processors created
+        evicted_count: Number of processors evicted (idle, count or memory)
+
+    Examples:
+        >>> pool = PartialProcessorPool(factory=create_processor, max_processors=100)
+        >>> processor = pool.get('golden-eagle-427', 'en')
+        >>> await processor.process_partial(result)
+        >>> pool.remove('golden-eagle-427')
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[str, str], Any],
+        max_processors: int = 100,
+        idle_timeout_seconds: float = 300.0,
+        max_memory_bytes: int = 64 * 1024 * 1024,
+        estimator: Callable[[Any], int] = estimate_processor_bytes,
+        clock: Callable[[], float] = time.time
+    ):
+        """
+        Initialize processor pool.
+
+        Args:
+            factory: Function creating a processor for a session and language
+            max_processors: Maximum number of pooled processors (default: 100)
+            idle_timeout_seconds: Idle time before eviction (default: 300.0)
+            max_memory_bytes: Estimated memory budget (default: 64 MiB)
+            estimator: Function estimating a processor's size in bytes
+            clock: Time source in seconds (default: time.time)
+        """
+        if max_processors < 1:
+            raise ValueError(f"max_processors must be at least 1, got {max_processors}")
+        if idle_timeout_seconds <= 0:
+            raise ValueError(
+                f"idle_timeout_seconds must be positive, got {idle_timeout_seconds}"
+            )
+        if max_memory_bytes <= 0:
+            raise ValueError(f"max_memory_bytes must be positive, got {max_memory_bytes}")
+
+        self.factory = factory
+        self.max_processors = max_processors
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.max_memory_bytes = max_memory_bytes
+        self.created_count = 0
+        self.evicted_count = 0
+
+        self._estimator = estimator
+        self._clock = clock
+        self._entries: 'OrderedDict[str, PooledProcessor]' = OrderedDict()
+        self._memory_bytes = 0
+
+        logger.info(
+            f"PartialProcessorPool initialized with max_processors={max_processors}, "
+            f"idle_timeout={idle_timeout_seconds}s, "
+            f"max_memory={max_memory_bytes // (1024 * 1024)}MiB"
+        )
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._entries
+
+    def get(self, session_id: str, source_language: str) -> Any:
+        """
+        Get the processor of a session, creating it on first use.
+
+        A processor created for another source language is replaced.
+
+        Args:
+            session_id: Session identifier
+            source_language: Source language code (ISO 639-1)
+
+        Returns:
+            PartialResultProcessor of the session
+        """
+        now = self._clock()
+        self._evict_idle(now)
+
+        entry = self._entries.get(session_id)
+        if entry is not None and entry.source_language != source_language:
+            logger.info(
+                f"Source language of session {session_id} changed from "
+                f"{entry.source_language} to {source_language}, replacing processor"
+            )
+            self.remove(session_id)
+            entry = None
+
+        if entry is None:
+            processor = self.factory(session_id, source_language)
+            self.created_count += 1
+            entry = PooledProcessor(
+                processor=processor,
+                source_language=source_language,
+                last_used=now,
+                estimated_bytes=0
+            )
+            self._entries[session_id] = entry
+        else:
+            entry.last_used = now
+            self._entries.move_to_end(session_id)
+
+        estimated_bytes = self._estimator(entry.processor)
+        self._memory_bytes += estimated_bytes - entry.estimated_bytes
+        entry.estimated_bytes = estimated_bytes
+
+        self._enforce_limits(session_id)
+
+        return entry.processor
+
+    def touch(self, session_id: str) -> bool:
+        """
+        Mark a pooled processor as used without fetching it.
+
+        For processors held by a long-lived consumer (a Transcribe stream
+        handler), so an active session is neither expired as idle nor
+        accounted at a stale memory estimate.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if the session has a pooled processor, False otherwise
+        """
+        now = self._clock()
+        self._evict_idle(now)
+
+        entry = self._entries.get(session_id)
+        if entry is None:
+            return False
+
+        entry.last_used = now
+        self._entries.move_to_end(session_id)
+
+        estimated_bytes = self._estimator(entry.processor)
+        self._memory_bytes += estimated_bytes - entry.estimated_bytes
+        entry.estimated_bytes = estimated_bytes
+
+        self._enforce_limits(session_id)
+
+        return True
+
+    def remove(self, session_id: str) -> Optional[Any]:
+        """
+        Drop the processor of a session (e.g. when its stream closes).
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Removed processor, or None if the session had none
+        """
+        entry = self._entries.pop(session_id, None)
+        if entry is None:
+            return None
+        self._memory_bytes -= entry.estimated_bytes
+        return entry.processor
+
+    def evict_idle(self) -> int:
+        """
+        Evict processors unused for idle_timeout_seconds.
+
+        Returns:
+            Number of processors evicted
+        """
+        return self._evict_idle(self._clock())
+
+    def _evict_idle(self, now: float) -> int:
+        """Evict idle processors from the least recently used end."""
+        evicted = 0
+        while self._entries:
+            session_id, entry = next(iter(self._entries.items()))
+            if now - entry.last_used < self.idle_timeout_seconds:
+                break
+            self._evict(session_id, 'idle')
+            evicted += 1
+        return evicted
+
+    def _enforce_limits(self, keep_session_id: str) -> None:
+        """Evict least recently used processors over the count or memory limit."""
+        while len(self._entries) > 1 and (
+            len(self._entries) > self.max_processors
+            or self._memory_bytes > self.max_memory_bytes
+        ):
+            session_id = next(iter(self._entries))
+            if session_id == keep_session_id:
+                break
+            reason = 'count' if len(self._entries) > self.max_processors else 'memory'
+            self._evict(session_id, reason)
+
+    def _evict(self, session_id: str, reason: str) -> None:
+        """Remove a processor and count the eviction."""
+        self.remove(session_id)
+        self.evicted_count += 1
+        logger.info(f"Evicted partial result processor of session {session_id} ({reason})")
+
+    @property
+    def memory_bytes(self) -> int:
+        """Estimated memory of all pooled processors in bytes."""
+        return self._memory_bytes
+
+    def get_statistics(self) -> Dict[str, int]:
+        """
+        Get pool statistics.
+
+        Returns:
+            Dict with processor count, estimated memory and counters
+        """
+        return {
+            'processors': len(self._entries),
+            'memory_bytes': self._memory_bytes,
+            'created': self.created_count,
+            'evicted': self.evicted_count
+        }
+
+    def size(self) -> int:
+        """
+        Get number of pooled processors.
+
+        Returns:
+            Number of processors
+        """
+        return len(self._entries)
@@ -0,0 +1,442 @@
+"""
+PCM batch assembly for Kinesis audio records.
+
+This module assembles the base64-encoded PCM records of a Kinesis batch
+into one contiguous, preallocated buffer per session. Each record is
+decoded into a temporary bytes object (binascii cannot decode into an
+existing buffer) whose audio is copied into its slot in the session
+buffer and then released, so a batch no longer holds a list of decoded
+chunks plus a joined copy of them. Consumers read the audio through
+memoryview slices (Transcribe framing) and a shared read-only int16 NumPy
+view (analysis) instead of making further copies.
+
+Records keep their Kinesis sequence numbers, so a session's batch can be
+built from only the records after its last delivered sequence number
+(see SequenceCheckpointStore), and audio held back from the session's
+previous batch can be placed in front of the records in the same buffer.
+
+Records written by a producer that numbers its chunks start with a 12-byte
+header (magic b'LTA1', stream ID and chunk index, both unsigned 32-bit
+big-endian; see session-management shared/utils/audio_record.py). The
+header is read from the first 16 base64 characters without decoding the
+record, and is left out of the assembled audio. Records without the magic
+are plain PCM.
+"""
+
+import binascii
+import logging
+import struct
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+AUDIO_RECORD_MAGIC = b'LTA1'
+AUDIO_RECORD_HEADER = struct.Struct('>4sII')
+
+# Base64 characters that encode the header (12 bytes -> 16 characters)
+_HEADER_B64_LENGTH = AUDIO_RECORD_HEADER.size * 4 // 3
+
+
+def decoded_length(data_b64: str) -> int:
+    """
+    Get the number of bytes a base64 string decodes to.
+
+    Exact for canonical base64; an upper bound if the input contains
+    whitespace.
+
+    Args:
+        data_b64: Base64-encoded data
+
+    Returns:
+        Decoded length in bytes
+    """
+    length = len(data_b64)
+    if length == 0:
+        return 0
+
+    padding = 0
+    if data_b64.endswith('=='):
+        padding = 2
+    elif data_b64.endswith('='):
+        padding = 1
+
+    return (length * 3) // 4 - padding
+
+
+def read_record_header(data_b64: str) -> Optional[Tuple[int, int]]:
+    """
+    Read the audio record header of a base64 record, if it has one.
+
+    Only the base64 characters of the header are decoded.
+
+    Args:
+        data_b64: Base64-encoded record data
+
+    Returns:
+        Tuple of (stream_id, chunk_index), or None for plain PCM records
+    """
+    if len(data_b64) < _HEADER_B64_LENGTH:
+        return None
+
+    try:
+        head = binascii.a2b_base64(data_b64[:_HEADER_B64_LENGTH])
+    except binascii.Error:
+        return None
+
+    if len(head) < AUDIO_RECORD_HEADER.size:
+        return None
+
+    magic, stream_id, chunk_index = AUDIO_RECORD_HEADER.unpack_from(head)
+    if magic != AUDIO_RECORD_MAGIC:
+        return None
+    return stream_id, chunk_index
+
+
+@dataclass
+class AudioRecord:
+    """
+    One Kinesis audio record of a session.
+
+    Attributes:
+        data_b64: Base64-encoded record data
+        sequence_number: Kinesis sequence number (if known)
+        stream_id: Producer stream ID from the record header (None if plain PCM)
+        chunk_index: Client chunk index from the record header (None if plain PCM)
+    """
+    data_b64: str
+    sequence_number: Optional[str] = None
+    stream_id: Optional[int] = None
+    chunk_index: Optional[int] = None
+
+    @property
+    def header_size(self) -> int:
+        """Bytes of record header before the audio."""
+        return AUDIO_RECORD_HEADER.size if self.chunk_index is not None else 0
+
+    @property
+    def audio_length(self) -> int:
+        """Bytes of audio in the record."""
+        return max(decoded_length(self.data_b64) - self.header_size, 0)
+
+
+class PCMBatch:
+    """
+    Contiguous PCM audio of one session assembled from Kinesis records.
+
+    Attributes:
+        session_id: Session identifier
+        sample_rate: Audio sample rate in Hz
+        record_count: Number of records assembled into the batch
+        first_sequence_number: Sequence number of the first record (if known)
+        last_sequence_number: Sequence number of the last record (if known)
+        prefix_length: Bytes at the start carried over from a previous batch
+
+    Examples:
+        >>> batch = assembler.build('golden-eagle-427')
+        >>> for frame in batch.frames(16384):
+        ...     await stream.input_stream.send_audio_event(audio_chunk=frame)
+        >>> rms = np.sqrt(np.mean(batch.samples.astype(np.float32) ** 2))
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        buffer: bytearray,
+        length: int,
+        record_count: int,
+        sample_rate: int = 16000,
+        first_sequence_number: Optional[str] = None,
+        last_sequence_number: Optional[str] = None,
+        prefix_length: int = 0
+    ):
+        """
+        Initialize PCM batch over an assembled buffer.
+
+        Args:
+            session_id: Session identifier
+            buffer: Buffer holding the audio (may be larger than length)
+            length: Number of valid bytes in the buffer
+            record_count: Number of records assembled into the buffer
+            sample_rate: Audio sample rate in Hz (default: 16000)
+            first_sequence_number: Sequence number of the first record
+            last_sequence_number: Sequence number of the last record
+            prefix_length: Bytes carried over from a previous batch
+        """
+        self.session_id = session_id
+        self.sample_rate = sample_rate
+        self.record_count = record_count
+        self.first_sequence_number = first_sequence_number
+        self.last_sequence_number = last_sequence_number
+        self.prefix_length = prefix_length
+        self._buffer = buffer
+        self._data = memoryview(buffer)[:length].toreadonly()
+        self._samples: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        """Number of bytes of audio."""
+        return len(self._data)
+
+    @property
+    def data(self) -> memoryview:
+        """Read-only memoryview of the whole batch (no copy)."""
+        return self._data
+
+    @property
+    def duration_seconds(self) -> float:
+        """Duration of the audio in seconds (16-bit mono)."""
+        return len(self._data) / (self.sample_rate * 2)
+
+    @property
+    def samples(self) -> np.ndarray:
+        """
+        Read-only int16 view of the audio, shared by all analysis stages.
+
+        A trailing odd byte is not part of the view.
+        """
+        if self._samples is None:
+            sample_count = len(self._data) // 2
+            samples = np.frombuffer(self._buffer, dtype=np.int16, count=sample_count)
+            samples.flags.writeable = False
+            self._samples = samples
+        return self._samples
+
+    def frames(self, frame_size: int) -> Iterator[memoryview]:
+        """
+        Iterate over the audio in frames without copying.
+
+        Args:
+            frame_size: Bytes per frame (the last frame may be shorter)
+
+        Yields:
+            Read-only memoryview slices of the batch
+        """
+        if frame_size <= 0:
+            raise ValueError(f"frame_size must be positive, got {frame_size}")
+
+        for offset in range(0, len(self._data), frame_size):
+            yield self._data[offset:offset + frame_size]
+
+    def head(self, length: int) -> 'PCMBatch':
+        """
+        Get the first bytes of the batch as a batch over the same buffer.
+
+        Args:
+            length: Number of bytes to keep
+
+        Returns:
+            PCMBatch sharing this batch's buffer (no copy)
+        """
+        return PCMBatch(
+            self.session_id,
+            self._buffer,
+            min(max(length, 0), len(self._data)),
+            record_count=self.record_count,
+            sample_rate=self.sample_rate,
+            first_sequence_number=self.first_sequence_number,
+            last_sequence_number=self.last_sequence_number,
+            prefix_length=min(self.prefix_length, max(length, 0))
+        )
+
+    def tobytes(self) -> bytes:
+        """
+        Copy the audio into a new bytes object.
+
+        Only needed by consumers that require bytes (e.g., S3 uploads).
+
+        Returns:
+            Audio bytes
+        """
+        return self._data.tobytes()
+
+
+class PCMBatchAssembler:
+    """
+    Assembles base64 Kinesis records into one PCMBatch per session.
+
+    Records are collected per session as their base64 payloads (only the
+    record header, if any, is decoded on arrival); build() sizes one buffer
+    from the record lengths and decodes every record into it in order.
+
+    Attributes:
+        sample_rate: Audio sample rate in Hz
+        record_count: Number of records added
+
+    Examples:
+        >>> assembler = PCMBatchAssembler()
+        >>> for record in event['Records']:
+        ...     assembler.add_record(record['kinesis']['partitionKey'],
+        ...                          record['kinesis']['data'],
+        ...                          record['kinesis']['sequenceNumber'])
+        >>> batches = assembler.build_all()
+    """
+
+    def __init__(self, sample_rate: int = 16000):
+        """
+        Initialize assembler.
+
+        Args:
+            sample_rate: Audio sample rate in Hz (default: 16000)
+        """
+        self.sample_rate = sample_rate
+        self.record_count = 0
+        self._records: Dict[str, List[AudioRecord]] = {}
+
+    def add_record(
+        self,
+        session_id: str,
+        data_b64: str,
+        sequence_number: Optional[str] = None
+    ) -> None:
+        """
+        Add a base64-encoded PCM record of a session.
+
+        Args:
+            session_id: Session identifier (Kinesis partition key)
+            data_b64: Base64-encoded PCM bytes (optionally with record header)
+            sequence_number: Kinesis sequence number of the record
+        """
+        header = read_record_header(data_b64)
+        record = AudioRecord(
+            data_b64=data_b64,
+            sequence_number=sequence_number,
+            stream_id=header[0] if header else None,
+            chunk_index=header[1] if header else None
+        )
+        self._records.setdefault(session_id, []).append(record)
+        self.record_count += 1
+
+    @property
+    def session_ids(self) -> List[str]:
+        """Session IDs in order of their first record."""
+        return list(self._records)
+
+    def first_sequence_number(self, session_id: str) -> Optional[str]:
+        """
+        Get the sequence number of a session's first record.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Sequence number, or None if the record had none
+        """
+        return self._records[session_id][0].sequence_number
+
+    def records(
+        self,
+        session_id: str,
+        after_sequence_number: Optional[str] = None
+    ) -> List[AudioRecord]:
+        """
+        Get a session's records in arrival order.
+
+        Args:
+            session_id: Session identifier
+            after_sequence_number: Only return records with a higher
+                sequence number (records without one are always kept)
+
+        Returns:
+            List of records
+
+        Raises:
+            KeyError: If no records were added for the session
+        """
+        records = self._records[session_id]
+        if after_sequence_number is None:
+            return list(records)
+
+        high_water = int(after_sequence_number)
+        return [
+            record for record in records
+            if record.sequence_number is None or int(record.sequence_number) > high_water
+        ]
+
+    def build(
+        self,
+        session_id: str,
+        after_sequence_number: Optional[str] = None,
+        prefix: Optional[bytes] = None
+    ) -> PCMBatch:
+        """
+        Decode a session's records into one preallocated buffer.
+
+        Args:
+            session_id: Session identifier
+            after_sequence_number: Only assemble records with a higher
+                sequence number (records without one are always kept)
+            prefix: Optional audio placed before the records (e.g. carried
+                over from the session's previous batch)
+
+        Returns:
+            PCMBatch over the session's audio (record_count is 0 if every
+            record was filtered out)
+
+        Raises:
+            KeyError: If no records were added for the session
+            binascii.Error: If a record is not valid base64
+        """
+        return self.assemble(
+            session_id,
+            self.records(session_id, after_sequence_number),
+            prefix=prefix
+        )
+
+    def assemble(
+        self,
+        session_id: str,
+        records: List[AudioRecord],
+        prefix: Optional[bytes] = None
+    ) -> PCMBatch:
+        """
+        Decode the given records of a session into one preallocated buffer.
+
+        Records are decoded one at a time and copied into the buffer, so at
+        most one decoded record exists besides it. Record headers are not
+        part of the audio.
+
+        Args:
+            session_id: Session identifier
+            records: Records to assemble, in playback order
+            prefix: Optional audio placed before the records
+
+        Returns:
+            PCMBatch over the records' audio
+
+        Raises:
+            binascii.Error: If a record is not valid base64
+        """
+        prefix = prefix or b''
+        buffer = bytearray(len(prefix) + sum(record.audio_length for record in records))
+        view = memoryview(buffer)
+        view[:len(prefix)] = prefix
+
+        offset = len(prefix)
+        for record in records:
+            chunk = memoryview(binascii.a2b_base64(record.data_b64))[record.header_size:]
+            view[offset:offset + len(chunk)] = chunk
+            offset += len(chunk)
+
+        view.release()
+
+        return PCMBatch(
+            session_id,
+            buffer,
+            offset,
+            record_count=len(records),
+            sample_rate=self.sample_rate,
+            first_sequence_number=records[0].sequence_number if records else None,
+            last_sequence_number=records[-1].sequence_number if records else None,
+            prefix_length=len(prefix)
+        )
+
+    def build_all(self) -> Dict[str, PCMBatch]:
+        """
+        Build the batches of every session.
+
+        Returns:
+            Mapping of session ID to PCMBatch, in order of first record
+        """
+        return {session_id: self.build(session_id) for session_id in self._records}
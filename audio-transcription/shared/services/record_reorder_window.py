@@ -0,0 +1,235 @@
+"""
+Reorder and deduplicate window for Kinesis audio records.
+
+After producer retries, Lambda retries or resharding, a session's audio
+records can arrive twice or out of order. Spliced into one buffer, such
+records make Transcribe produce garbage text that is still translated and
+synthesized. This module orders a session's records by the client chunk
+index from the record header (or by Kinesis sequence number for plain PCM
+records) and drops every chunk that is not newer than the last chunk
+already processed for the session, before any paid API call.
+
+The per-session state is the last chunk index of each recent producer
+stream (so a batch redelivered from a previous stream after the speaker
+reconnected is still deduplicated), kept across warm invocations for a
+bounded number of sessions. It is only advanced by commit() after a batch
+was processed, so records of a failed batch are accepted again when
+Kinesis retries it.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from shared.services.pcm_batch_assembler import AudioRecord
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RecordSelection:
+    """
+    Records of one session selected for processing.
+
+    Attributes:
+        records: Records in playback order
+        dropped_count: Duplicate or late records that were dropped
+        missing_count: Chunk indices skipped between accepted records
+        stream_id: Producer stream of the last accepted chunk
+        last_chunk_index: Chunk index of the last accepted chunk
+        last_chunk_indices: Last accepted chunk index per producer stream,
+            in order of processing
+    """
+    records: List[AudioRecord] = field(default_factory=list)
+    dropped_count: int = 0
+    missing_count: int = 0
+    stream_id: Optional[int] = None
+    last_chunk_index: Optional[int] = None
+    last_chunk_indices: Dict[int, int] = field(default_factory=dict)
+
+
+class RecordReorderWindow:
+    """
+    Per-session ordering and deduplication of audio records.
+
+    Numbered records (with a record header) are grouped by producer stream
+    in order of appearance and sorted by chunk index; a chunk at or below
+    the last processed chunk of the same stream is a duplicate or arrived
+    too late to be spliced in, and is dropped. A new stream ID (speaker
+    reconnected) starts its own numbering; the last chunks of the session's
+    previous streams are kept, so their redelivered records are dropped
+    too. Plain records are sorted by sequence number and records with a
+    repeated sequence number are dropped.
+
+    Attributes:
+        max_sessions: Maximum sessions tracked (least recently used first out)
+        max_streams_per_session: Producer streams tracked per session
+            (least recently used first out)
+
+    Examples:
+        >>> window = RecordReorderWindow()
+        >>> selection = window.select(session_id, assembler.records(session_id))
+        >>> batch = assembler.assemble(session_id, selection.records)
+        >>> ...  # process
+        >>> window.commit(session_id, selection)
+    """
+
+    def __init__(self, max_sessions: int = 1000, max_streams_per_session: int = 8):
+        """
+        Initialize reorder window.
+
+        Args:
+            max_sessions: Maximum sessions tracked (default: 1000)
+            max_streams_per_session: Producer streams tracked per session
+                (default: 8)
+
+        Raises:
+            ValueError: If max_sessions or max_streams_per_session is not positive
+        """
+        if max_sessions <= 0:
+            raise ValueError(f"max_sessions must be positive, got {max_sessions}")
+        if max_streams_per_session <= 0:
+            raise ValueError(
+                f"max_streams_per_session must be positive, got {max_streams_per_session}"
+            )
+
+        self.max_sessions = max_sessions
+        self.max_streams_per_session = max_streams_per_session
+        # Session -> stream ID -> last chunk index, most recent stream last
+        self._last_chunks: 'OrderedDict[str, OrderedDict[int, int]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def last_chunk(self, session_id: str) -> Optional[Tuple[int, int]]:
+        """
+        Get the last processed chunk of a session's most recent stream.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Tuple of (stream_id, chunk_index), or None
+        """
+        with self._lock:
+            streams = self._last_chunks.get(session_id)
+            return next(reversed(streams.items())) if streams else None
+
+    def last_chunk_indices(self, session_id: str) -> Dict[int, int]:
+        """
+        Get the last processed chunk index of each tracked stream of a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Mapping of stream ID to chunk index (empty if none)
+        """
+        with self._lock:
+            return dict(self._last_chunks.get(session_id, {}))
+
+    def select(self, session_id: str, records: List[AudioRecord]) -> RecordSelection:
+        """
+        Order a session's records and drop duplicates and late chunks.
+
+        Does not change the window; call commit() once the selection was
+        processed.
+
+        Args:
+            session_id: Session identifier
+            records: Records of the session in arrival order
+
+        Returns:
+            RecordSelection for the session
+        """
+        committed = self.last_chunk_indices(session_id)
+        stream_id, last_index = None, None
+
+        plain = [record for record in records if record.chunk_index is None]
+        numbered: Dict[int, List[AudioRecord]] = {}
+        for record in records:
+            if record.chunk_index is not None:
+                numbered.setdefault(record.stream_id, []).append(record)
+
+        selection = RecordSelection()
+
+        # Plain PCM (older producers): order by sequence number
+        seen_sequence_numbers = set()
+        for record in sorted(plain, key=self._sequence_key):
+            if record.sequence_number is not None:
+                if record.sequence_number in seen_sequence_numbers:
+                    selection.dropped_count += 1
+                    continue
+                seen_sequence_numbers.add(record.sequence_number)
+            selection.records.append(record)
+
+        # Numbered chunks: order by chunk index within each producer stream
+        for record_stream_id, stream_records in numbered.items():
+            stream_id, last_index = record_stream_id, committed.get(record_stream_id)
+
+            for record in sorted(stream_records, key=lambda r: (r.chunk_index, self._sequence_key(r))):
+                if last_index is not None and record.chunk_index <= last_index:
+                    selection.dropped_count += 1
+                    continue
+                if last_index is not None:
+                    selection.missing_count += record.chunk_index - last_index - 1
+                selection.records.append(record)
+                last_index = record.chunk_index
+
+            if last_index is not None:
+                selection.last_chunk_indices[stream_id] = last_index
+
+        selection.stream_id = stream_id
+        selection.last_chunk_index = last_index
+
+        if selection.dropped_count:
+            logger.info(
+                f"Dropped {selection.dropped_count} duplicate or late records "
+                f"for session {session_id}"
+            )
+        return selection
+
+    def commit(self, session_id: str, selection: RecordSelection) -> None:
+        """
+        Record the last chunk of a processed selection.
+
+        Args:
+            session_id: Session identifier
+            selection: Selection returned by select()
+        """
+        if not selection.last_chunk_indices:
+            return
+
+        with self._lock:
+            streams = self._last_chunks.setdefault(session_id, OrderedDict())
+            for stream_id, chunk_index in selection.last_chunk_indices.items():
+                streams[stream_id] = chunk_index
+                streams.move_to_end(stream_id)
+            while len(streams) > self.max_streams_per_session:
+                streams.popitem(last=False)
+
+            self._last_chunks.move_to_end(session_id)
+            while len(self._last_chunks) > self.max_sessions:
+                self._last_chunks.popitem(last=False)
+
+    def discard(self, session_id: str) -> None:
+        """
+        Forget a session.
+
+        Args:
+            session_id: Session identifier
+        """
+        with self._lock:
+            self._last_chunks.pop(session_id, None)
+
+    @property
+    def size(self) -> int:
+        """Number of sessions tracked."""
+        return len(self._last_chunks)
+
+    @staticmethod
+    def _sequence_key(record: AudioRecord) -> float:
+        """Sort key of a record's sequence number (records without one last)."""
+        if record.sequence_number is None:
+            return float('inf')
+        return int(record.sequence_number)
@@ -0,0 +1,170 @@
+"""
+Per-session delivery checkpoints for the Kinesis audio processing path.
+
+This module tracks, per session, the highest Kinesis sequence number whose
+audio has been transcribed, translated and delivered to listeners. When
+Kinesis retries part of a batch (partial batch failure reporting replays
+every record after the lowest failed sequence number), records at or below
+a session's checkpoint are skipped instead of being delivered twice.
+
+Checkpoints are kept in memory and, when a loader/writer pair is supplied,
+seeded from and persisted to durable storage so a retry handled by another
+container skips the same records.
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class SequenceCheckpointStore:
+    """
+    High-water marks of delivered Kinesis sequence numbers, per session.
+
+    Sequence numbers are compared numerically (they are decimal strings of
+    varying length). A checkpoint only moves forward. The store is safe to
+    use from executor threads; loader and writer calls happen outside the
+    lock.
+
+    Attributes:
+        loader: Optional callable returning the persisted checkpoint of a
+            session (or None), used on the first lookup of a session
+        writer: Optional callable persisting a session's new checkpoint
+        max_entries: Maximum sessions kept in memory (least recently used
+            sessions are evicted first)
+
+    Examples:
+        >>> store = SequenceCheckpointStore(loader=load, writer=save)
+        >>> batch = assembler.build(session_id, after_sequence_number=store.get(session_id))
+        >>> ...  # deliver
+        >>> store.advance(session_id, batch.last_sequence_number)
+    """
+
+    def __init__(
+        self,
+        loader: Optional[Callable[[str], Optional[str]]] = None,
+        writer: Optional[Callable[[str, str], None]] = None,
+        max_entries: int = 1000
+    ):
+        """
+        Initialize checkpoint store.
+
+        Args:
+            loader: Optional persisted checkpoint loader
+            writer: Optional checkpoint writer
+            max_entries: Maximum sessions kept in memory (default: 1000)
+
+        Raises:
+            ValueError: If max_entries is not positive
+        """
+        if max_entries <= 0:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self.loader = loader
+        self.writer = writer
+        self.max_entries = max_entries
+        self._checkpoints: 'OrderedDict[str, Optional[str]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _is_after(sequence_number: str, checkpoint: Optional[str]) -> bool:
+        """Check if a sequence number is above a checkpoint."""
+        return checkpoint is None or int(sequence_number) > int(checkpoint)
+
+    def _remember(self, session_id: str, checkpoint: Optional[str]) -> None:
+        """Store a checkpoint in memory (caller holds the lock)."""
+        self._checkpoints[session_id] = checkpoint
+        self._checkpoints.move_to_end(session_id)
+        while len(self._checkpoints) > self.max_entries:
+            self._checkpoints.popitem(last=False)
+
+    def get(self, session_id: str) -> Optional[str]:
+        """
+        Get the last delivered sequence number of a session.
+
+        The persisted checkpoint is loaded on the first lookup; a failed
+        load is logged and retried on the next lookup.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Sequence number, or None if nothing was delivered yet
+        """
+        with self._lock:
+            if session_id in self._checkpoints:
+                self._checkpoints.move_to_end(session_id)
+                return self._checkpoints[session_id]
+
+        if self.loader is None:
+            return None
+
+        try:
+            persisted = self.loader(session_id)
+        except Exception as e:
+            logger.warning(f"Failed to load sequence checkpoint for {session_id}: {e}")
+            return None
+
+        with self._lock:
+            # Keep a checkpoint advanced while the load was in flight
+            current = self._checkpoints.get(session_id)
+            if persisted is not None and self._is_after(persisted, current):
+                current = persisted
+            self._remember(session_id, current)
+            return current
+
+    def is_delivered(self, session_id: str, sequence_number: str) -> bool:
+        """
+        Check if a record of a session was already delivered.
+
+        Args:
+            session_id: Session identifier
+            sequence_number: Kinesis sequence number of the record
+
+        Returns:
+            True if the record is at or below the session's checkpoint
+        """
+        return not self._is_after(sequence_number, self.get(session_id))
+
+    def advance(self, session_id: str, sequence_number: Optional[str]) -> bool:
+        """
+        Move a session's checkpoint forward after delivery.
+
+        The new checkpoint is persisted through the writer; a failed write
+        is logged and the in-memory checkpoint is kept.
+
+        Args:
+            session_id: Session identifier
+            sequence_number: Last delivered sequence number (ignored if None)
+
+        Returns:
+            True if the checkpoint moved forward
+        """
+        if sequence_number is None:
+            return False
+
+        with self._lock:
+            if not self._is_after(sequence_number, self._checkpoints.get(session_id)):
+                return False
+            self._remember(session_id, sequence_number)
+
+        if self.writer is not None:
+            try:
+                self.writer(session_id, sequence_number)
+            except Exception as e:
+                logger.warning(f"Failed to persist sequence checkpoint for {session_id}: {e}")
+
+        return True
+
+    def clear(self) -> None:
+        """Forget all in-memory checkpoints."""
+        with self._lock:
+            self._checkpoints.clear()
+
+    @property
+    def size(self) -> int:
+        """Number of sessions with an in-memory checkpoint."""
+        return len(self._checkpoints)
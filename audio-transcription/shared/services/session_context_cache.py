@@ -0,0 +1,212 @@
+"""
+Session context cache for the Kinesis audio processing path.
+
+This module provides a short-TTL cache of per-session metadata (source
+language, target languages) and active listener connections grouped by
+target language, so one DynamoDB lookup per session feeds every downstream
+stage of a batch instead of repeated GetItem and GSI queries.
+"""
+
+import time
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionContext:
+    """
+    Cached session metadata and listener connections.
+
+    Attributes:
+        session_id: Session identifier
+        source_language: Speaker's source language code
+        target_languages: Target languages configured on the session
+        listeners_by_language: Listener connection IDs grouped by target language
+        loaded_at: Timestamp when the context was loaded
+    """
+    session_id: str
+    source_language: str
+    target_languages: List[str] = field(default_factory=list)
+    listeners_by_language: Dict[str, List[str]] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.time)
+
+    @property
+    def active_languages(self) -> List[str]:
+        """Target languages that have at least one connected listener."""
+        return [
+            language for language, connection_ids in self.listeners_by_language.items()
+            if connection_ids
+        ]
+
+    def is_expired(self, ttl_seconds: float) -> bool:
+        """
+        Check if the context is older than the TTL.
+
+        Args:
+            ttl_seconds: Time-to-live in seconds
+
+        Returns:
+            True if the context should be reloaded
+        """
+        return (time.time() - self.loaded_at) >= ttl_seconds
+
+
+class SessionContextCache:
+    """
+    TTL cache of SessionContext objects keyed by session ID.
+
+    Contexts are loaded through the supplied loader on a miss or after the
+    TTL expires. Entries can be invalidated explicitly (e.g. when a listener
+    connection is found to be gone) and individual connections can be
+    dropped without reloading. The cache is safe to use from executor
+    threads; loads happen outside the lock.
+
+    Attributes:
+        loader: Callable returning a SessionContext (or None if the session
+            does not exist) for a session ID
+        ttl_seconds: Time-to-live for cached contexts (default: 5.0)
+        max_entries: Maximum cached sessions before oldest entries are evicted
+        hits: Number of cache hits
+        misses: Number of cache misses (loads)
+
+    Examples:
+        >>> cache = SessionContextCache(loader=load_context, ttl_seconds=5.0)
+        >>> context = cache.get('golden-eagle-427')
+        >>> context.active_languages
+        ['es', 'fr']
+        >>> cache.invalidate('golden-eagle-427')
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[str], Optional[SessionContext]],
+        ttl_seconds: float = 5.0,
+        max_entries: int = 1000
+    ):
+        """
+        Initialize session context cache.
+
+        Args:
+            loader: Function loading the context for a session ID
+            ttl_seconds: Time-to-live for cached contexts in seconds (default: 5.0)
+            max_entries: Maximum number of cached sessions (default: 1000)
+        """
+        if ttl_seconds < 0:
+            raise ValueError(f"ttl_seconds must be non-negative, got {ttl_seconds}")
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be at least 1, got {max_entries}")
+
+        self.loader = loader
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._entries: Dict[str, SessionContext] = {}
+        self._lock = threading.Lock()
+
+        logger.info(
+            f"SessionContextCache initialized with TTL={ttl_seconds}s, "
+            f"max_entries={max_entries}"
+        )
+
+    def get(self, session_id: str) -> Optional[SessionContext]:
+        """
+        Get session context, loading it on a miss or after expiry.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            SessionContext, or None if the session does not exist
+        """
+        with self._lock:
+            context = self._entries.get(session_id)
+            if context is not None and not context.is_expired(self.ttl_seconds):
+                self.hits += 1
+                return context
+            self.misses += 1
+
+        context = self.loader(session_id)
+
+        with self._lock:
+            if context is None:
+                self._entries.pop(session_id, None)
+                return None
+
+            if session_id not in self._entries and len(self._entries) >= self.max_entries:
+                oldest = min(self._entries, key=lambda sid: self._entries[sid].loaded_at)
+                del self._entries[oldest]
+
+            self._entries[session_id] = context
+
+        logger.debug(
+            f"Loaded session context for {session_id}: "
+            f"active_languages={context.active_languages}"
+        )
+
+        return context
+
+    def invalidate(self, session_id: str) -> bool:
+        """
+        Drop the cached context of a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if an entry was removed
+        """
+        with self._lock:
+            removed = self._entries.pop(session_id, None) is not None
+
+        if removed:
+            logger.debug(f"Invalidated session context for {session_id}")
+
+        return removed
+
+    def remove_connections(self, session_id: str, connection_ids: List[str]) -> int:
+        """
+        Remove listener connections from a cached context without reloading.
+
+        Args:
+            session_id: Session identifier
+            connection_ids: Connection IDs to remove (e.g. gone connections)
+
+        Returns:
+            Number of connections removed
+        """
+        gone = set(connection_ids)
+        removed = 0
+
+        with self._lock:
+            context = self._entries.get(session_id)
+            if context is None:
+                return 0
+
+            for language, listeners in context.listeners_by_language.items():
+                remaining = [cid for cid in listeners if cid not in gone]
+                removed += len(listeners) - len(remaining)
+                context.listeners_by_language[language] = remaining
+
+        return removed
+
+    def clear(self) -> None:
+        """Remove all cached contexts and reset statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def size(self) -> int:
+        """
+        Get number of cached sessions.
+
+        Returns:
+            Number of cached contexts
+        """
+        return len(self._entries)
@@ -0,0 +1,247 @@
+"""
+Registry of per-session Transcribe streams for the WebSocket audio path.
+
+This module keeps the Transcribe client, stream manager, event handler and
+audio buffer of each session in a compact SessionStream object. Recording
+activity only updates a timestamp; idle streams are found through a heap
+ordered by activity, so expiring them costs O(expired log n) instead of a
+scan of every session. The number of streams per container is capped, with
+the least recently used stream evicted first.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True, eq=False)
+class SessionStream:
+    """
+    Transcribe stream state of one session.
+
+    Attributes:
+        session_id: Session identifier
+        client: Transcribe streaming client
+        manager: Stream manager (start_stream/send_audio/end_stream)
+        handler: Transcription event handler
+        buffer: Audio buffer of the session
+        last_activity: Clock time of the last activity
+        is_active: Whether the Transcribe stream has been started
+        lock: Serializes stream start, sends and shutdown of the session
+    """
+    session_id: str
+    client: Any
+    manager: Any
+    handler: Any
+    buffer: Any
+    last_activity: float
+    is_active: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class SessionStreamRegistry:
+    """
+    Per-session stream registry with idle expiry and an LRU size cap.
+
+    Each stream has exactly one entry in the idle heap, keyed by its
+    activity time when the entry was pushed. touch() only updates the
+    stream's timestamp and LRU position; when an entry reaches the top of
+    the heap with a newer timestamp it is pushed back with that timestamp,
+    so a busy stream costs one heap operation per idle timeout instead of
+    one per chunk. Entries of removed or evicted streams are skipped.
+
+    The registry is used from the event loop thread only and does no I/O:
+    expired and evicted streams are returned to the caller, which closes
+    them.
+
+    Attributes:
+        idle_timeout_seconds: Idle time after which a stream expires
+        max_streams: Maximum number of streams kept
+        evicted_count: Number of streams evicted by the size cap
+        expired_count: Number of streams expired by idle time
+
+    Examples:
+        >>> registry = SessionStreamRegistry(idle_timeout_seconds=60, max_streams=50)
+        >>> stream, evicted = registry.add('golden-eagle-427', client, manager, handler, buffer)
+        >>> registry.touch('golden-eagle-427')
+        >>> for stream in registry.pop_expired():
+        ...     await close(stream)
+    """
+
+    def __init__(
+        self,
+        idle_timeout_seconds: float = 60.0,
+        max_streams: int = 50,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize stream registry.
+
+        Args:
+            idle_timeout_seconds: Idle time after which a stream expires (default: 60.0)
+            max_streams: Maximum number of streams kept (default: 50)
+            clock: Time source in seconds (default: time.monotonic)
+        """
+        if idle_timeout_seconds <= 0:
+            raise ValueError(
+                f"idle_timeout_seconds must be positive, got {idle_timeout_seconds}"
+            )
+        if max_streams < 1:
+            raise ValueError(f"max_streams must be at least 1, got {max_streams}")
+
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.max_streams = max_streams
+        self.evicted_count = 0
+        self.expired_count = 0
+
+        self._clock = clock
+        self._streams: 'OrderedDict[str, SessionStream]' = OrderedDict()
+        self._idle_heap: List[Tuple[float, int, SessionStream]] = []
+        self._sequence = itertools.count()
+
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._streams
+
+    def __len__(self) -> int:
+        return len(self._streams)
+
+    def get(self, session_id: str) -> Optional[SessionStream]:
+        """
+        Get the stream of a session without recording activity.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            SessionStream or None if the session has no stream
+        """
+        return self._streams.get(session_id)
+
+    def add(
+        self,
+        session_id: str,
+        client: Any,
+        manager: Any,
+        handler: Any,
+        buffer: Any
+    ) -> Tuple[SessionStream, List[SessionStream]]:
+        """
+        Register a new stream for a session.
+
+        A stream already registered for the session is replaced and
+        returned with the evicted streams, so the caller closes it.
+
+        Args:
+            session_id: Session identifier
+            client: Transcribe streaming client
+            manager: Stream manager
+            handler: Transcription event handler
+            buffer: Audio buffer
+
+        Returns:
+            Tuple of (new stream, streams removed to make room)
+        """
+        removed = []
+        replaced = self._streams.pop(session_id, None)
+        if replaced is not None:
+            removed.append(replaced)
+
+        stream = SessionStream(
+            session_id=session_id,
+            client=client,
+            manager=manager,
+            handler=handler,
+            buffer=buffer,
+            last_activity=self._clock()
+        )
+        self._streams[session_id] = stream
+        self._push(stream)
+
+        while len(self._streams) > self.max_streams:
+            _, evicted = self._streams.popitem(last=False)
+            self.evicted_count += 1
+            logger.info(
+                f"Evicting least recently used stream of session {evicted.session_id} "
+                f"({self.max_streams} streams max)"
+            )
+            removed.append(evicted)
+
+        return stream, removed
+
+    def touch(self, session_id: str) -> None:
+        """
+        Record activity on a session's stream.
+
+        Args:
+            session_id: Session identifier (ignored if it has no stream)
+        """
+        stream = self._streams.get(session_id)
+        if stream is None:
+            return
+        stream.last_activity = self._clock()
+        self._streams.move_to_end(session_id)
+
+    def remove(self, session_id: str) -> Optional[SessionStream]:
+        """
+        Remove the stream of a session.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            Removed SessionStream, or None if the session had no stream
+        """
+        return self._streams.pop(session_id, None)
+
+    def pop_expired(self) -> List[SessionStream]:
+        """
+        Remove and return streams idle for at least idle_timeout_seconds.
+
+        Returns:
+            Expired streams, least recently active first
+        """
+        now = self._clock()
+        expired = []
+
+        while self._idle_heap and now - self._idle_heap[0][0] >= self.idle_timeout_seconds:
+            _, _, stream = heapq.heappop(self._idle_heap)
+            if self._streams.get(stream.session_id) is not stream:
+                continue  # Removed, evicted or replaced
+
+            if now - stream.last_activity >= self.idle_timeout_seconds:
+                del self._streams[stream.session_id]
+                self.expired_count += 1
+                expired.append(stream)
+            else:
+                self._push(stream)
+
+        return expired
+
+    def _push(self, stream: SessionStream) -> None:
+        """Add the stream's idle heap entry at its current activity time."""
+        heapq.heappush(
+            self._idle_heap, (stream.last_activity, next(self._sequence), stream)
+        )
+        # Entries of removed streams are dropped once they dominate the heap
+        if len(self._idle_heap) > 2 * len(self._streams) + 64:
+            self._idle_heap = [
+                entry for entry in self._idle_heap
+                if self._streams.get(entry[2].session_id) is entry[2]
+            ]
+            heapq.heapify(self._idle_heap)
+
+    def size(self) -> int:
+        """
+        Get number of registered streams.
+
+        Returns:
+            Number of streams
+        """
+        return len(self._streams)
@@ -0,0 +1,515 @@
+"""
+Warm Transcribe Streaming sessions for the Kinesis audio processing path.
+
+This module keeps one AWS Transcribe Streaming stream open per session for
+the lifetime of a warm Lambda container, so consecutive Kinesis batches of
+the same session are fed into the same stream instead of paying the HTTP/2
+stream setup on every batch and losing acoustic context at every batch
+boundary. Streams idle for longer than the idle timeout are closed.
+"""
+
+import asyncio
+import contextvars
+import time
+import logging
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Callback receiving each finalized segment as (text, start_time, end_time),
+# with times in seconds relative to the start of the batch's audio
+SegmentCallback = Callable[[str, float, float], Awaitable[None]]
+
+# Finals ending within this many seconds of the audio sent so far are
+# considered to cover the whole batch
+FINAL_COVERAGE_TOLERANCE_SECONDS = 0.3
+
+
+class StreamClosedError(Exception):
+    """Raised when a warm stream can no longer accept audio."""
+    pass
+
+
+async def emit_segment(
+    on_segment: Optional[SegmentCallback],
+    text: str,
+    start_time: float,
+    end_time: float
+) -> None:
+    """
+    Hand a finalized segment to a segment callback.
+
+    Callback errors are logged and do not interrupt transcription.
+
+    Args:
+        on_segment: Segment callback (None to skip)
+        text: Final transcript text of the segment
+        start_time: Segment start in seconds relative to the batch
+        end_time: Segment end in seconds relative to the batch
+    """
+    if on_segment is None:
+        return
+
+    try:
+        await on_segment(text, start_time, end_time)
+    except Exception as e:
+        logger.error(f"Segment callback failed: {e}", exc_info=True)
+
+
+class WarmTranscribeStream:
+    """
+    One open Transcribe stream fed with successive batches of a session.
+
+    A background task reads the output stream and accumulates final results.
+    transcribe() sends a batch and waits until the finals cover the audio
+    sent so far, until the stream has been quiet for settle_seconds with no
+    pending partial result, or until flush_timeout_seconds elapse. Each final
+    is handed to the optional segment callback as soon as it arrives. Speech
+    still pending as a partial result at that point is returned with a
+    later batch, once Transcribe finalizes it.
+
+    Attributes:
+        session_id: Session identifier
+        language_code: AWS language code of the stream (e.g., 'en-US')
+        sample_rate: Audio sample rate in Hz
+        sent_seconds: Seconds of audio sent on this stream
+        batch_count: Number of batches transcribed on this stream
+        last_activity: Timestamp of the last batch sent
+        loop: Event loop the stream is bound to
+    """
+
+    def __init__(
+        self,
+        session_id: str,
+        language_code: str,
+        sample_rate: int,
+        stream: Any,
+        chunk_size: int = 16384
+    ):
+        """
+        Initialize warm stream and start reading results.
+
+        Must be called from the event loop that owns the stream.
+
+        Args:
+            session_id: Session identifier
+            language_code: AWS language code of the stream
+            sample_rate: Audio sample rate in Hz
+            stream: Started Transcribe stream (input_stream / output_stream)
+            chunk_size: Bytes per audio event (default: 16384)
+        """
+        self.session_id = session_id
+        self.language_code = language_code
+        self.sample_rate = sample_rate
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.sent_seconds = 0.0
+        self.batch_count = 0
+        self.last_activity = time.time()
+        self.loop = asyncio.get_running_loop()
+
+        # (text, start_time, end_time) in seconds since the stream started
+        self._finals: List[Tuple[str, float, float]] = []
+        self._final_end_time = 0.0
+        self._pending_partial = False
+        self._last_event_at = time.monotonic()
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._changed = asyncio.Event()
+        # The reader outlives the invocation that opened the stream, so it
+        # starts from an empty context instead of holding on to that
+        # invocation's trace (and other context variables)
+        self._reader = self.loop.create_task(
+            self._read_results(), context=contextvars.Context()
+        )
+
+    @property
+    def is_closed(self) -> bool:
+        """True once the output stream has ended or failed."""
+        return self._closed
+
+    @property
+    def has_pending_speech(self) -> bool:
+        """True if speech sent earlier has not been returned as final yet."""
+        return not self._closed and (self._pending_partial or bool(self._finals))
+
+    async def _read_results(self) -> None:
+        """Consume transcript events and accumulate final results."""
+        try:
+            async for event in self.stream.output_stream:
+                transcript = getattr(event, 'transcript', None)
+                if transcript is None:
+                    continue
+
+                for result in transcript.results:
+                    if result.is_partial:
+                        self._pending_partial = True
+                        continue
+
+                    self._pending_partial = False
+                    end_time = result.end_time or 0.0
+                    self._final_end_time = max(self._final_end_time, end_time)
+                    if result.alternatives and result.alternatives[0].transcript:
+                        self._finals.append((
+                            result.alternatives[0].transcript,
+                            result.start_time or 0.0,
+                            end_time
+                        ))
+
+                self._last_event_at = time.monotonic()
+                self._changed.set()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Transcribe stream for session {self.session_id} failed: {e}")
+            self._error = e
+        finally:
+            self._closed = True
+            self._changed.set()
+
+    async def transcribe(
+        self,
+        pcm_bytes: Union[bytes, memoryview],
+        flush_timeout_seconds: float = 2.0,
+        settle_seconds: float = 0.5,
+        on_segment: Optional[SegmentCallback] = None
+    ) -> str:
+        """
+        Send a batch of PCM audio and collect the finals it produced.
+
+        Args:
+            pcm_bytes: PCM audio (16-bit mono); memoryview frames are sent without copying
+            flush_timeout_seconds: Maximum time to wait for finals (default: 2.0)
+            settle_seconds: Quiet time after which the batch is considered
+                transcribed when no partial result is pending (default: 0.5)
+            on_segment: Optional callback awaited with each final as it
+                arrives; times are relative to the start of this batch and
+                are negative for speech carried over from earlier batches
+
+        Returns:
+            Final transcript text received since the previous batch
+            (empty string if none)
+
+        Raises:
+            StreamClosedError: If the stream has ended or failed
+        """
+        if self._closed:
+            raise StreamClosedError(
+                f"Stream for session {self.session_id} is closed: {self._error}"
+            )
+
+        batch_start = self.sent_seconds
+        segments: List[str] = []
+
+        async def drain_finals() -> None:
+            while self._finals:
+                text, start_time, end_time = self._finals.pop(0)
+                segments.append(text)
+                await emit_segment(
+                    on_segment, text, start_time - batch_start, end_time - batch_start
+                )
+
+        # Speech finalized since the previous batch is emitted right away
+        await drain_finals()
+
+        try:
+            for i in range(0, len(pcm_bytes), self.chunk_size):
+                await self.stream.input_stream.send_audio_event(
+                    audio_chunk=pcm_bytes[i:i + self.chunk_size]
+                )
+        except Exception as e:
+            self._closed = True
+            raise StreamClosedError(
+                f"Failed to send audio for session {self.session_id}: {e}"
+            ) from e
+
+        self.sent_seconds += len(pcm_bytes) / (self.sample_rate * 2)
+        self.batch_count += 1
+        self.last_activity = time.time()
+
+        sent_at = time.monotonic()
+        deadline = sent_at + flush_timeout_seconds
+
+        while True:
+            await drain_finals()
+            if self._closed:
+                break
+
+            covered = self._final_end_time >= self.sent_seconds - FINAL_COVERAGE_TOLERANCE_SECONDS
+            if covered and not self._pending_partial:
+                break
+
+            now = time.monotonic()
+            quiet_for = now - max(self._last_event_at, sent_at)
+            if not self._pending_partial and quiet_for >= settle_seconds:
+                break
+            if now >= deadline:
+                break
+
+            self._changed.clear()
+            try:
+                await asyncio.wait_for(
+                    self._changed.wait(),
+                    timeout=min(deadline - now, settle_seconds)
+                )
+            except asyncio.TimeoutError:
+                pass
+
+        await drain_finals()
+        text = ' '.join(segments)
+
+        if self._error is not None and not text:
+            raise StreamClosedError(
+                f"Stream for session {self.session_id} failed: {self._error}"
+            )
+
+        return text
+
+    async def close(self, timeout_seconds: float = 2.0) -> None:
+        """
+        End the stream and stop reading results.
+
+        Finals produced after the last transcribe() call are discarded.
+
+        Args:
+            timeout_seconds: Maximum time to wait for the stream to end
+        """
+        if not self._closed:
+            try:
+                await self.stream.input_stream.end_stream()
+                await asyncio.wait_for(asyncio.shield(self._reader), timeout=timeout_seconds)
+            except Exception as e:
+                logger.debug(f"Error ending stream for session {self.session_id}: {e}")
+
+        if not self._reader.done():
+            self._reader.cancel()
+
+        self._closed = True
+
+        if self._finals:
+            logger.info(
+                f"Discarded {len(self._finals)} final results on close "
+                f"for session {self.session_id}"
+            )
+            self._finals = []
+
+
+class TranscribeStreamPool:
+    """
+    Per-session registry of warm Transcribe streams.
+
+    Streams are opened lazily on the first batch of a session and reused
+    by later batches handled by the same container. A stream is replaced
+    when the session's language changes, when it has failed, or when the
+    event loop it was opened on is no longer the running loop. Callers
+    fall back to one-shot transcription when transcribe() raises.
+
+    Attributes:
+        idle_timeout_seconds: Close streams idle for at least this long
+        flush_timeout_seconds: Maximum wait for finals after each batch
+        settle_seconds: Quiet time that ends the wait when nothing is pending
+        opened_count: Number of streams opened
+        reused_count: Number of batches sent on an already open stream
+
+    Examples:
+        >>> pool = TranscribeStreamPool(idle_timeout_seconds=10.0)
+        >>> text = await pool.transcribe('golden-eagle-427', pcm, 'en-US', 16000)
+        >>> await pool.close_idle()
+        0
+    """
+
+    def __init__(
+        self,
+        stream_factory: Optional[Callable[[str, int], Awaitable[Any]]] = None,
+        idle_timeout_seconds: float = 10.0,
+        flush_timeout_seconds: float = 2.0,
+        settle_seconds: float = 0.5,
+        region: str = 'us-east-1'
+    ):
+        """
+        Initialize stream pool.
+
+        Args:
+            stream_factory: Coroutine function (language_code, sample_rate)
+                returning a started stream (default: Transcribe Streaming)
+            idle_timeout_seconds: Idle time before a stream is closed (default: 10.0)
+            flush_timeout_seconds: Maximum wait for finals per batch (default: 2.0)
+            settle_seconds: Quiet time ending the wait (default: 0.5)
+            region: AWS region for the default stream factory (default: 'us-east-1')
+        """
+        if idle_timeout_seconds <= 0:
+            raise ValueError(
+                f"idle_timeout_seconds must be positive, got {idle_timeout_seconds}"
+            )
+
+        self.stream_factory = stream_factory or self._start_transcribe_stream
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.flush_timeout_seconds = flush_timeout_seconds
+        self.settle_seconds = settle_seconds
+        self.region = region
+        self.opened_count = 0
+        self.reused_count = 0
+
+        self._streams: Dict[str, WarmTranscribeStream] = {}
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client = None
+
+    async def _start_transcribe_stream(self, language_code: str, sample_rate: int) -> Any:
+        """Start a Transcribe Streaming stream with a shared client."""
+        from amazon_transcribe.client import TranscribeStreamingClient
+
+        if self._client is None:
+            self._client = TranscribeStreamingClient(region=self.region)
+
+        return await self._client.start_stream_transcription(
+            language_code=language_code,
+            media_sample_rate_hz=sample_rate,
+            media_encoding='pcm'
+        )
+
+    def _bind_to_running_loop(self) -> None:
+        """Drop streams and locks that belong to a previous event loop."""
+        loop = asyncio.get_running_loop()
+        if self._loop is loop:
+            return
+
+        if self._streams:
+            logger.info(
+                f"Event loop changed, dropping {len(self._streams)} warm streams"
+            )
+        self._streams = {}
+        self._locks = {}
+        self._loop = loop
+
+    async def transcribe(
+        self,
+        session_id: str,
+        pcm_bytes: Union[bytes, memoryview],
+        language_code: str,
+        sample_rate: int,
+        on_segment: Optional[SegmentCallback] = None
+    ) -> str:
+        """
+        Transcribe a batch on the session's warm stream.
+
+        Args:
+            session_id: Session identifier
+            pcm_bytes: PCM audio (16-bit mono, bytes or memoryview)
+            language_code: AWS language code (e.g., 'en-US')
+            sample_rate: Audio sample rate in Hz
+            on_segment: Optional callback awaited with each finalized segment
+
+        Returns:
+            Final transcript text produced since the previous batch
+
+        Raises:
+            Exception: If the stream cannot be opened or fails; the stream
+                is discarded and the next batch opens a new one
+        """
+        self._bind_to_running_loop()
+
+        lock = self._locks.setdefault(session_id, asyncio.Lock())
+        async with lock:
+            stream = self._streams.get(session_id)
+
+            if stream is not None and (
+                stream.is_closed
+                or stream.language_code != language_code
+                or stream.sample_rate != sample_rate
+            ):
+                await self._discard(session_id)
+                stream = None
+
+            if stream is None:
+                raw_stream = await self.stream_factory(language_code, sample_rate)
+                stream = WarmTranscribeStream(session_id, language_code, sample_rate, raw_stream)
+                self._streams[session_id] = stream
+                self.opened_count += 1
+                logger.info(f"Opened warm Transcribe stream for session {session_id}")
+            else:
+                self.reused_count += 1
+
+            try:
+                return await stream.transcribe(
+                    pcm_bytes,
+                    flush_timeout_seconds=self.flush_timeout_seconds,
+                    settle_seconds=self.settle_seconds,
+                    on_segment=on_segment
+                )
+            except Exception:
+                await self._discard(session_id)
+                raise
+
+    async def _discard(self, session_id: str) -> None:
+        """Close and forget the stream of a session."""
+        stream = self._streams.pop(session_id, None)
+        if stream is not None:
+            await stream.close()
+
+    def has_pending_speech(self, session_id: str) -> bool:
+        """
+        Check if a session's warm stream still owes final results.
+
+        Transcribe needs the following audio, silence included, to finalize
+        such speech, so callers should not drop the session's next batch.
+
+        Args:
+            session_id: Session identifier
+
+        Returns:
+            True if the session's stream has pending speech
+        """
+        stream = self._streams.get(session_id)
+        return stream is not None and stream.has_pending_speech
+
+    async def close(self, session_id: str) -> None:
+        """
+        Close the warm stream of a session.
+
+        Args:
+            session_id: Session identifier
+        """
+        self._bind_to_running_loop()
+        await self._discard(session_id)
+        self._locks.pop(session_id, None)
+
+    async def close_idle(self) -> int:
+        """
+        Close streams idle for at least idle_timeout_seconds.
+
+        Returns:
+            Number of streams closed
+        """
+        self._bind_to_running_loop()
+
+        current_time = time.time()
+        idle_sessions = [
+            session_id for session_id, stream in self._streams.items()
+            if current_time - stream.last_activity >= self.idle_timeout_seconds
+        ]
+
+        for session_id in idle_sessions:
+            idle_duration = current_time - self._streams[session_id].last_activity
+            logger.info(
+                f"Closing idle warm stream for session {session_id} "
+                f"(idle for {idle_duration:.1f} seconds)"
+            )
+            await self.close(session_id)
+
+        return len(idle_sessions)
+
+    async def close_all(self) -> None:
+        """Close every warm stream."""
+        self._bind_to_running_loop()
+        for session_id in list(self._streams):
+            await self.close(session_id)
+
+    def size(self) -> int:
+        """
+        Get number of open warm streams.
+
+        Returns:
+            Number of streams in the pool
+        """
+        return len(self._streams)
@@ -0,0 +1,280 @@
+"""
+Voice activity detection for Kinesis audio batches.
+
+This module classifies a batch of PCM audio as speech or silence before it
+is sent to AWS Transcribe, and finds the speech span so leading and
+trailing silence can be trimmed. Frames are classified by RMS energy in dB
+(same normalization, floor and -50 dB default threshold as the audio
+quality SilenceDetector) and speech endpoints are refined with the
+zero-crossing rate, so low-energy unvoiced onsets and endings (e.g. 's',
+'f') are kept.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import List, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def frame_features(samples: np.ndarray, frame_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compute per-frame RMS energy (dB) and zero-crossing rate.
+
+    A trailing partial frame is ignored.
+
+    Args:
+        samples: Audio samples (int16 or float normalized to [-1, 1])
+        frame_size: Samples per frame
+
+    Returns:
+        Tuple of (energy_db, zero_crossing_rate) arrays, one value per frame
+    """
+    frame_count = len(samples) // frame_size
+    if frame_count == 0:
+        return np.empty(0), np.empty(0)
+
+    frames = samples[:frame_count * frame_size].reshape(frame_count, frame_size)
+
+    # Normalize to [-1, 1] if int16
+    if frames.dtype == np.int16:
+        normalized = frames.astype(np.float64) / 32768.0
+    else:
+        normalized = frames.astype(np.float64)
+
+    rms = np.sqrt(np.mean(normalized ** 2, axis=1))
+
+    # Convert to dB (completely silent frames are -100 dB)
+    energy_db = np.full(frame_count, -100.0)
+    audible = rms > 1e-10
+    energy_db[audible] = 20 * np.log10(rms[audible])
+
+    signs = np.signbit(normalized)
+    zero_crossing_rate = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / (frame_size - 1)
+
+    return energy_db, zero_crossing_rate
+
+
+def find_pause_splits(
+    samples: np.ndarray,
+    frame_size: int,
+    min_samples: int,
+    max_samples: int
+) -> List[int]:
+    """
+    Split audio into segments at low-energy points.
+
+    Each segment ends at the quietest frame between min_samples and
+    max_samples after its start (the most likely pause between words or
+    sentences). The last segment holds the remainder and is at least
+    min_samples long when splitting was needed.
+
+    Args:
+        samples: Audio samples (int16 or float normalized to [-1, 1])
+        frame_size: Samples per analysis frame
+        min_samples: Minimum segment length in samples
+        max_samples: Maximum segment length in samples
+
+    Returns:
+        Split sample indices in increasing order (empty if the audio is not
+        longer than max_samples)
+
+    Raises:
+        ValueError: If min_samples exceeds max_samples
+    """
+    if not 0 < min_samples <= max_samples:
+        raise ValueError(
+            f"Expected 0 < min_samples <= max_samples, got {min_samples} and {max_samples}"
+        )
+
+    sample_count = len(samples)
+    if sample_count <= max_samples:
+        return []
+
+    energy_db, _ = frame_features(samples, frame_size)
+    splits = []
+    start = 0
+
+    while sample_count - start > max_samples:
+        first = (start + min_samples) // frame_size
+        if first >= len(energy_db):
+            break
+        last = min(start + max_samples, sample_count - min_samples) // frame_size
+        last = min(max(last, first + 1), len(energy_db))
+
+        frame = first + int(np.argmin(energy_db[first:last]))
+        split = frame * frame_size + frame_size // 2
+        splits.append(split)
+        start = split
+
+    return splits
+
+
+@dataclass
+class VoiceActivityResult:
+    """
+    Voice activity of one audio batch.
+
+    Attributes:
+        has_speech: True if the batch contains speech
+        speech_start_sample: First sample of the speech span (padded)
+        speech_end_sample: End (exclusive) of the speech span (padded)
+        total_seconds: Duration of the batch in seconds
+        speech_frame_ratio: Fraction of frames classified as speech
+        sample_rate: Audio sample rate in Hz
+    """
+    has_speech: bool
+    speech_start_sample: int
+    speech_end_sample: int
+    total_seconds: float
+    speech_frame_ratio: float
+    sample_rate: int = 16000
+
+    @property
+    def speech_seconds(self) -> float:
+        """Duration of the (padded) speech span in seconds."""
+        return (self.speech_end_sample - self.speech_start_sample) / self.sample_rate
+
+    @property
+    def leading_silence_seconds(self) -> float:
+        """Silence before the speech span in seconds."""
+        return self.speech_start_sample / self.sample_rate
+
+    @property
+    def trailing_silence_seconds(self) -> float:
+        """Silence after the speech span in seconds."""
+        return max(self.total_seconds - self.speech_end_sample / self.sample_rate, 0.0)
+
+
+class VoiceActivityDetector:
+    """
+    Energy / zero-crossing voice activity detector.
+
+    Frames at or above energy_threshold_db are speech. A batch has speech
+    if it contains at least min_speech_ms of speech frames, so isolated
+    clicks do not count. The speech span is then extended outwards over
+    adjacent frames that are within weak_energy_margin_db of the threshold
+    and have a zero-crossing rate of at least zero_crossing_threshold
+    (unvoiced consonants), and padded by padding_ms on both sides.
+
+    Attributes:
+        energy_threshold_db: Frame energy threshold in dB (default: -50.0)
+        zero_crossing_threshold: Minimum zero-crossing rate of weak unvoiced frames
+        weak_energy_margin_db: How far below the threshold unvoiced frames may be
+        frame_ms: Frame length in milliseconds
+        min_speech_ms: Minimum speech per batch in milliseconds
+        padding_ms: Padding kept around the speech span in milliseconds
+        sample_rate: Audio sample rate in Hz
+
+    Examples:
+        >>> vad = VoiceActivityDetector()
+        >>> result = vad.analyze(batch.samples)
+        >>> if not result.has_speech:
+        ...     skip_transcription()
+        >>> speech = batch.data[result.speech_start_sample * 2:result.speech_end_sample * 2]
+    """
+
+    def __init__(
+        self,
+        energy_threshold_db: float = -50.0,
+        zero_crossing_threshold: float = 0.25,
+        weak_energy_margin_db: float = 10.0,
+        frame_ms: int = 20,
+        min_speech_ms: int = 100,
+        padding_ms: int = 300,
+        sample_rate: int = 16000
+    ):
+        """
+        Initialize voice activity detector.
+
+        Args:
+            energy_threshold_db: Frame energy threshold in dB (default: -50.0)
+            zero_crossing_threshold: Minimum ZCR of weak unvoiced frames (default: 0.25)
+            weak_energy_margin_db: Energy margin for unvoiced frames in dB (default: 10.0)
+            frame_ms: Frame length in milliseconds (default: 20)
+            min_speech_ms: Minimum speech per batch in milliseconds (default: 100)
+            padding_ms: Padding around the speech span in milliseconds (default: 300)
+            sample_rate: Audio sample rate in Hz (default: 16000)
+
+        Raises:
+            ValueError: If a parameter is out of range
+        """
+        if frame_ms <= 0:
+            raise ValueError(f"frame_ms must be positive, got {frame_ms}")
+        if not 0.0 <= zero_crossing_threshold <= 1.0:
+            raise ValueError(
+                f"zero_crossing_threshold must be between 0 and 1, got {zero_crossing_threshold}"
+            )
+        if min_speech_ms < 0 or padding_ms < 0:
+            raise ValueError("min_speech_ms and padding_ms must be non-negative")
+
+        self.energy_threshold_db = energy_threshold_db
+        self.zero_crossing_threshold = zero_crossing_threshold
+        self.weak_energy_margin_db = weak_energy_margin_db
+        self.frame_ms = frame_ms
+        self.min_speech_ms = min_speech_ms
+        self.padding_ms = padding_ms
+        self.sample_rate = sample_rate
+
+        self.frame_size = max(2, int(sample_rate * frame_ms / 1000))
+        self.min_speech_frames = max(1, int(np.ceil(min_speech_ms / frame_ms)))
+        self.padding_samples = int(sample_rate * padding_ms / 1000)
+
+    def analyze(self, samples: np.ndarray) -> VoiceActivityResult:
+        """
+        Classify a batch and find its speech span.
+
+        Args:
+            samples: Audio samples (int16 or float normalized to [-1, 1])
+
+        Returns:
+            VoiceActivityResult for the batch
+        """
+        sample_count = len(samples)
+        total_seconds = sample_count / self.sample_rate
+
+        energy_db, zero_crossing_rate = frame_features(samples, self.frame_size)
+        frame_count = len(energy_db)
+
+        speech = energy_db >= self.energy_threshold_db
+        speech_frames = int(np.count_nonzero(speech))
+
+        if frame_count == 0 or speech_frames < self.min_speech_frames:
+            return VoiceActivityResult(
+                has_speech=False,
+                speech_start_sample=0,
+                speech_end_sample=0,
+                total_seconds=total_seconds,
+                speech_frame_ratio=speech_frames / frame_count if frame_count else 0.0,
+                sample_rate=self.sample_rate
+            )
+
+        speech_indices = np.flatnonzero(speech)
+        first, last = int(speech_indices[0]), int(speech_indices[-1])
+
+        # Extend endpoints over weak, noise-like frames (unvoiced consonants)
+        unvoiced = (
+            (energy_db >= self.energy_threshold_db - self.weak_energy_margin_db)
+            & (zero_crossing_rate >= self.zero_crossing_threshold)
+        )
+        while first > 0 and unvoiced[first - 1]:
+            first -= 1
+        while last < frame_count - 1 and unvoiced[last + 1]:
+            last += 1
+
+        start_sample = max(first * self.frame_size - self.padding_samples, 0)
+        end_sample = (last + 1) * self.frame_size + self.padding_samples
+        if last == frame_count - 1 or end_sample > sample_count:
+            # Speech runs into the trailing partial frame or padding
+            end_sample = sample_count
+
+        return VoiceActivityResult(
+            has_speech=True,
+            speech_start_sample=start_sample,
+            speech_end_sample=end_sample,
+            total_seconds=total_seconds,
+            speech_frame_ratio=speech_frames / frame_count,
+            sample_rate=self.sample_rate
+        )
@@ -522,3 +522,12 @@ class TestLambdaHandlerIntegration:
         assert 'correlationId' in body2
         # Correlation IDs should be different (different requests)
         assert body1['correlationId'] != body2['correlationId']
+    
+    def test_lambda_handler_flushes_metrics_sink(self):
+        """Test buffered metrics are flushed when the handler returns."""
+        with patch('handler.orchestrator', Mock()), \
+                patch('shared.utils.emf_metrics.flush_metrics') as mock_flush:
+            response = lambda_handler({}, Mock())
+        
+        assert response['statusCode'] == 400
+        mock_flush.assert_called_once()
@@ -0,0 +1,133 @@
+"""Unit tests for AnalysisScheduler."""
+
+import numpy as np
+import pytest
+from audio_quality.analyzers.analysis_scheduler import AnalysisScheduler, SchedulerStats
+from audio_quality.analyzers.frame_features import FrameFeatures
+
+
+def chunk(level: float, seconds: float = 0.25, clip_level: int = 32111) -> FrameFeatures:
+    """Features of a noise chunk at the given RMS level, as int16."""
+    rng = np.random.default_rng(5)
+    audio = (rng.normal(0, level, int(16000 * seconds)).clip(-1, 1) * 32767).astype(np.int16)
+    return FrameFeatures.from_chunk(audio, 16000, clip_level=clip_level)
+
+
+class TestAnalysisScheduler:
+    """Test suite for AnalysisScheduler."""
+
+    def test_costly_detectors_run_on_cadence(self):
+        """Test echo and SNR run once per interval of audio on steady input."""
+        scheduler = AnalysisScheduler(echo_interval_s=1.0, snr_interval_s=0.5)
+
+        plans = []
+        for _ in range(8):  # 2 s of 250 ms chunks
+            plan = scheduler.plan(chunk(0.1))
+            scheduler.record(plan)
+            plans.append(plan)
+
+        assert [p.run_echo for p in plans] == [True, False, False, False] * 2
+        assert [p.run_snr for p in plans] == [True, False] * 4
+        stats = scheduler.snapshot()
+        assert (stats.echo_runs, stats.echo_skipped) == (2, 6)
+        assert (stats.snr_runs, stats.snr_skipped) == (4, 4)
+        assert stats.audio_seconds == pytest.approx(2.0)
+
+    def test_active_problem_escalates_until_cleared(self):
+        """Test every chunk is analyzed while the last chunk showed a problem."""
+        scheduler = AnalysisScheduler(echo_interval_s=1.0)
+        scheduler.record(scheduler.plan(chunk(0.1)))
+
+        scheduler.record(scheduler.plan(chunk(0.1)), problem_active=True)
+        escalated = scheduler.plan(chunk(0.1))
+        scheduler.record(escalated, problem_active=False)
+        after = scheduler.plan(chunk(0.1))
+
+        assert escalated.escalated and escalated.run_echo and escalated.run_snr
+        assert not after.escalated and not after.run_echo
+
+    @pytest.mark.parametrize('level', [0.4, 0.0001])
+    def test_level_change_escalates(self, level):
+        """Test a jump in level or a silence transition escalates."""
+        scheduler = AnalysisScheduler()
+        scheduler.record(scheduler.plan(chunk(0.05)))
+
+        plan = scheduler.plan(chunk(level))
+
+        assert plan.escalated and plan.run_echo
+
+    def test_clipping_escalates(self):
+        """Test a clipped chunk escalates even without a level change."""
+        scheduler = AnalysisScheduler(energy_change_db=100.0)
+        scheduler.record(scheduler.plan(chunk(0.9)))
+
+        assert scheduler.plan(chunk(0.9)).escalated
+
+    def test_budget_limits_analyses(self):
+        """Test due analyses are skipped once the CPU budget is spent."""
+        scheduler = AnalysisScheduler(cpu_budget=0.01, budget_burst_s=1.0)
+
+        runs = 0
+        for _ in range(40):  # 10 s escalated throughout, 10 ms per analysis
+            plan = scheduler.plan(chunk(0.1))
+            scheduler.record(
+                plan,
+                echo_seconds=0.01 if plan.run_echo else 0.0,
+                snr_seconds=0.01 if plan.run_snr else 0.0,
+                problem_active=True
+            )
+            runs += plan.run_echo + plan.run_snr
+
+        stats = scheduler.snapshot()
+        # 100 ms of budget over 10 s of audio plus the 10 ms burst
+        assert runs <= 11
+        assert stats.budget_skipped == 80 - runs
+        assert stats.cpu_seconds == pytest.approx(runs * 0.01)
+
+    def test_unscheduled_snr_runs_every_chunk(self):
+        """Test SNR bypasses cadence and budget with schedule_snr=False."""
+        scheduler = AnalysisScheduler(cpu_budget=0.0001, schedule_snr=False)
+
+        for _ in range(4):
+            plan = scheduler.plan(chunk(0.1))
+            scheduler.record(plan, snr_seconds=0.01)
+            assert plan.run_snr
+
+    def test_unscheduled_snr_leaves_budget_to_echo(self):
+        """Test every-chunk SNR time is not charged to the echo budget."""
+        scheduler = AnalysisScheduler(cpu_budget=0.01, schedule_snr=False)
+
+        echo_runs = 0
+        for _ in range(8):
+            plan = scheduler.plan(chunk(0.1))
+            scheduler.record(
+                plan,
+                echo_seconds=0.001 if plan.run_echo else 0.0,
+                snr_seconds=0.05,
+                problem_active=True
+            )
+            echo_runs += plan.run_echo
+
+        assert echo_runs == 8
+        assert scheduler.snapshot().budget_skipped == 0
+
+    def test_snapshot_and_reset(self):
+        """Test snapshot(reset=True) starts a new window; reset() keeps stats."""
+        scheduler = AnalysisScheduler()
+        scheduler.record(scheduler.plan(chunk(0.1)))
+        scheduler.record(scheduler.plan(chunk(0.1)))
+
+        assert scheduler.snapshot(reset=False).chunks == 2
+        scheduler.reset()
+        assert scheduler.plan(chunk(0.1)).run_echo
+        assert scheduler.snapshot().chunks == 3
+        assert scheduler.snapshot() == SchedulerStats()
+
+    def test_invalid_parameters(self):
+        """Test non-positive intervals and a negative budget are rejected."""
+        with pytest.raises(ValueError):
+            AnalysisScheduler(echo_interval_s=0)
+        with pytest.raises(ValueError):
+            AnalysisScheduler(cpu_budget=-1.0)
+        with pytest.raises(ValueError):
+            AnalysisScheduler(budget_burst_s=0)
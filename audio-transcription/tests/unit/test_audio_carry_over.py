@@ -0,0 +1,128 @@
+"""
+Unit tests for cross-batch audio carry-over.
+"""
+
+import time
+import numpy as np
+import pytest
+from shared.services.audio_carry_over import (
+    AudioCarryOverBuffer,
+    find_carry_split,
+    strip_overlap
+)
+
+SAMPLE_RATE = 16000
+
+
+def tone(seconds, amplitude=8000):
+    """Generate an int16 tone."""
+    t = np.arange(int(SAMPLE_RATE * seconds)) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+
+
+def silence(seconds):
+    """Generate int16 silence."""
+    return np.zeros(int(SAMPLE_RATE * seconds), dtype=np.int16)
+
+
+class TestFindCarrySplit:
+    """Test suite for the energy-based split point."""
+
+    def test_silent_end_not_split(self):
+        """Test a batch ending in silence is transcribed whole."""
+        samples = np.concatenate([tone(2.5), silence(0.5)])
+
+        assert find_carry_split(samples) == len(samples)
+
+    def test_split_at_gap_before_cut_word(self):
+        """Test the tail after the last pause is held back."""
+        samples = np.concatenate([tone(2.2), silence(0.1), tone(0.7)])
+
+        split = find_carry_split(samples)
+
+        gap_start = int(2.2 * SAMPLE_RATE)
+        gap_end = int(2.3 * SAMPLE_RATE)
+        assert gap_start <= split <= gap_end
+
+    def test_short_batch_not_split(self):
+        """Test batches shorter than twice the carry window are not split."""
+        samples = tone(1.5)
+
+        assert find_carry_split(samples, max_carry_ms=1000) == len(samples)
+
+    def test_carry_disabled(self):
+        """Test a zero carry window never splits."""
+        samples = tone(3.0)
+
+        assert find_carry_split(samples, max_carry_ms=0) == len(samples)
+
+
+class TestStripOverlap:
+    """Test suite for transcript overlap removal."""
+
+    def test_repeated_words_removed(self):
+        """Test words repeated across the batch edge are dropped."""
+        assert strip_overlap('we will meet at the station', 'At the station, tomorrow') == 'tomorrow'
+
+    def test_single_word_overlap_kept(self):
+        """Test one common boundary word is not treated as overlap."""
+        assert strip_overlap('look at the', 'the end') == 'the end'
+
+    def test_fully_repeated_text(self):
+        """Test a transcript repeating the previous tail is empty."""
+        assert strip_overlap('see you soon', 'you soon') == ''
+
+    def test_no_previous_text(self):
+        """Test the first transcript of a session is unchanged."""
+        assert strip_overlap('', 'hello there') == 'hello there'
+
+
+class TestAudioCarryOverBuffer:
+    """Test suite for AudioCarryOverBuffer."""
+
+    def test_tail_held_and_taken_once(self):
+        """Test the held-back tail is returned for the next batch only."""
+        carry = AudioCarryOverBuffer()
+        samples = np.concatenate([tone(2.2), silence(0.1), tone(0.7)])
+        data = memoryview(samples.tobytes())
+
+        split = carry.hold_tail('session-1', data, samples)
+
+        assert 0 < split < len(data)
+        assert carry.take('session-1') == data[split:].tobytes()
+        assert carry.take('session-1') is None
+
+    def test_stale_tail_discarded(self):
+        """Test old held-back audio is not spliced onto new audio."""
+        carry = AudioCarryOverBuffer(max_age_seconds=0.01)
+        samples = np.concatenate([tone(2.2), silence(0.1), tone(0.7)])
+        carry.hold_tail('session-1', memoryview(samples.tobytes()), samples)
+
+        time.sleep(0.02)
+
+        assert carry.take('session-1') is None
+
+    def test_restore_replaces_tail_of_failed_batch(self):
+        """Test restoring puts the taken audio back instead of the new tail."""
+        carry = AudioCarryOverBuffer()
+        samples = np.concatenate([tone(2.2), silence(0.1), tone(0.7)])
+        carry.hold_tail('session-1', memoryview(samples.tobytes()), samples)
+
+        carry.restore('session-1', b'\x01\x00')
+
+        assert carry.take('session-1') == b'\x01\x00'
+
+    def test_dedupe_tracks_last_transcript(self):
+        """Test each transcript is compared with the last delivered one."""
+        carry = AudioCarryOverBuffer()
+
+        assert carry.dedupe_transcript('session-1', 'good morning every') == 'good morning every'
+        assert carry.dedupe_transcript('session-1', 'morning everyone') == 'morning everyone'
+        assert carry.dedupe_transcript('session-1', 'morning everyone') == ''
+
+    def test_invalid_parameters(self):
+        """Test parameter validation."""
+        with pytest.raises(ValueError):
+            AudioCarryOverBuffer(max_carry_ms=-1)
+        with pytest.raises(ValueError):
+            AudioCarryOverBuffer(min_overlap_words=0)
@@ -0,0 +1,1521 @@
+"""
+Unit tests for the audio processor Lambda handler (Phase 4 Kinesis path).
+
+The handler lives in lambda/audio_processor/handler.py, which is not an
+importable package, so it is loaded from its file path under a unique
+module name to avoid clashing with the emotion processor handler.
+"""
+
+import asyncio
+import base64
+import importlib.util
+import json
+import os
+import time
+import pytest
+from unittest.mock import AsyncMock, patch
+
+os.environ.setdefault('AWS_DEFAULT_REGION', 'us-east-1')
+
+_HANDLER_PATH = os.path.join(
+    os.path.dirname(__file__), '../../lambda/audio_processor/handler.py'
+)
+_spec = importlib.util.spec_from_file_location('audio_processor_handler', _HANDLER_PATH)
+handler = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(handler)
+
+
+def make_kinesis_event(chunks_by_session, first_sequence=1001):
+    """Build a Kinesis batch event from {session_id: [pcm_bytes, ...]}."""
+    records = []
+    sequence = first_sequence - 1
+    for session_id, chunks in chunks_by_session.items():
+        for chunk in chunks:
+            sequence += 1
+            records.append({
+                'kinesis': {
+                    'data': base64.b64encode(chunk).decode('ascii'),
+                    'partitionKey': session_id,
+                    'sequenceNumber': str(sequence)
+                }
+            })
+    return {'Records': records}
+
+
+def make_batch(session_id, pcm_bytes):
+    """Assemble a single-record PCMBatch."""
+    assembler = handler.PCMBatchAssembler()
+    assembler.add_record(session_id, base64.b64encode(pcm_bytes).decode('ascii'))
+    return assembler.build(session_id)
+
+
+@pytest.fixture(autouse=True)
+def one_shot_transcription(monkeypatch):
+    """Disable warm streams and the VAD gate so tests can stub transcribe_streaming."""
+    monkeypatch.setattr(handler, 'TRANSCRIBE_WARM_STREAMS_ENABLED', False)
+    monkeypatch.setattr(handler, 'VAD_ENABLED', False)
+
+
+@pytest.fixture(autouse=True)
+def in_memory_checkpoints(monkeypatch):
+    """Keep delivery checkpoints and carried-over audio in memory and per test."""
+    monkeypatch.setattr(handler, 'sequence_checkpoints', handler.SequenceCheckpointStore())
+    monkeypatch.setattr(handler, 'audio_carry_over', handler.AudioCarryOverBuffer())
+
+
+def run(coro):
+    """Run coroutine on a fresh event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestKinesisSessionConcurrency:
+    """Test suite for concurrent per-session processing."""
+
+    @pytest.fixture
+    def session_lookups(self):
+        """Patch DynamoDB lookups with static session metadata."""
+        handler.session_context_cache.clear()
+        with patch.object(
+            handler, '_load_session_context',
+            side_effect=lambda sid: handler.SessionContext(
+                session_id=sid,
+                source_language='en',
+                target_languages=['es'],
+                listeners_by_language={'es': ['conn-1']}
+            )
+        ):
+            yield
+        handler.session_context_cache.clear()
+
+    def test_sessions_processed_concurrently(self, session_lookups):
+        """Test slow sessions overlap instead of running back to back."""
+        async def slow_transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            await asyncio.sleep(0.2)
+            return 'hello'
+
+        event = make_kinesis_event({
+            'session-a': [b'\x00\x01' * 100],
+            'session-b': [b'\x00\x01' * 100],
+            'session-c': [b'\x00\x01' * 100],
+        })
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=slow_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery',
+                          new=AsyncMock(return_value=[{'targetLanguage': 'es', 'success': True}])), \
+             patch.object(handler, 'KINESIS_SESSION_CONCURRENCY', 10):
+            start = time.time()
+            response = run(handler.handle_kinesis_batch(event, None))
+            elapsed = time.time() - start
+
+        body = json.loads(response['body'])
+        assert response['statusCode'] == 200
+        assert body['sessionCount'] == 3
+        assert {r['sessionId'] for r in body['results']} == {'session-a', 'session-b', 'session-c'}
+        assert elapsed < 0.5
+
+    def test_concurrency_limit_is_respected(self, session_lookups):
+        """Test no more than KINESIS_SESSION_CONCURRENCY sessions run at once."""
+        in_flight = 0
+        max_in_flight = 0
+
+        async def tracking_transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return 'hello'
+
+        event = make_kinesis_event({f'session-{i}': [b'\x00\x01'] for i in range(6)})
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=tracking_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery',
+                          new=AsyncMock(return_value=[])), \
+             patch.object(handler, 'KINESIS_SESSION_CONCURRENCY', 2):
+            response = run(handler.handle_kinesis_batch(event, None))
+
+        assert json.loads(response['body'])['sessionCount'] == 6
+        assert max_in_flight == 2
+
+    def test_session_failure_is_isolated(self, session_lookups):
+        """Test one failing session is reported without affecting the others."""
+        async def delivery(session_id, *args, **kwargs):
+            if session_id == 'session-bad':
+                raise RuntimeError('delivery exploded')
+            return [{'targetLanguage': 'es', 'success': True}]
+
+        event = make_kinesis_event({
+            'session-good': [b'\x00\x01' * 10],
+            'session-bad': [b'\x00\x01' * 10],
+        })
+
+        with patch.object(handler, 'transcribe_streaming', new=AsyncMock(return_value='hi')), \
+             patch.object(handler, 'process_translation_and_delivery', side_effect=delivery):
+            response = run(handler.handle_kinesis_batch(event, None))
+
+        body = json.loads(response['body'])
+        assert response['statusCode'] == 200
+        assert body['failedSessionCount'] == 1
+        assert body['failures'] == [
+            {'sessionId': 'session-bad', 'sequenceNumber': '1002', 'error': 'delivery exploded'}
+        ]
+        assert [r['sessionId'] for r in body['results']] == ['session-good']
+        assert response['batchItemFailures'] == [{'itemIdentifier': '1002'}]
+
+    def test_session_without_listeners_is_skipped(self):
+        """Test sessions without active listeners skip transcription."""
+        event = make_kinesis_event({'session-a': [b'\x00\x01']})
+        transcribe = AsyncMock(return_value='hi')
+        handler.session_context_cache.clear()
+
+        with patch.object(handler, '_get_session_item',
+                          return_value={'sessionId': 'session-a', 'sourceLanguage': 'en'}), \
+             patch.object(handler, '_query_listeners_by_language', return_value={}), \
+             patch.object(handler, 'transcribe_streaming', new=transcribe):
+            response = run(handler.handle_kinesis_batch(event, None))
+
+        body = json.loads(response['body'])
+        assert body['results'][0]['skipped'] is True
+        transcribe.assert_not_called()
+        handler.session_context_cache.clear()
+
+    def test_session_audio_assembled_in_record_order(self, session_lookups):
+        """Test each session's records reach Transcribe as one contiguous view."""
+        received = []
+
+        async def capture_transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            received.append(pcm_bytes)
+            return 'hello'
+
+        event = make_kinesis_event({'session-a': [b'\x01\x00', b'\x02\x00\x03\x00']})
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=capture_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=AsyncMock(return_value=[])):
+            run(handler.handle_kinesis_batch(event, None))
+
+        assert isinstance(received[0], memoryview)
+        assert received[0].tobytes() == b'\x01\x00\x02\x00\x03\x00'
+
+    def test_session_context_loaded_once_per_ttl(self, session_lookups):
+        """Test consecutive batches reuse the cached session context."""
+        event = make_kinesis_event({'session-a': [b'\x00\x01']})
+        delivery = AsyncMock(return_value=[])
+
+        next_event = make_kinesis_event({'session-a': [b'\x00\x01']}, first_sequence=2001)
+
+        with patch.object(handler, 'transcribe_streaming', new=AsyncMock(return_value='hi')), \
+             patch.object(handler, 'process_translation_and_delivery', new=delivery):
+            run(handler.handle_kinesis_batch(event, None))
+            run(handler.handle_kinesis_batch(next_event, None))
+
+        assert delivery.call_count == 2
+        assert handler._load_session_context.call_count == 1
+        assert delivery.call_args.kwargs['listeners_by_language'] == {'es': ['conn-1']}
+
+
+class TestPartialBatchFailures:
+    """Test suite for partial batch responses and delivery checkpoints."""
+
+    @pytest.fixture
+    def session_lookups(self):
+        """Patch DynamoDB lookups with static session metadata."""
+        handler.session_context_cache.clear()
+        with patch.object(
+            handler, '_load_session_context',
+            side_effect=lambda sid: handler.SessionContext(
+                session_id=sid,
+                source_language='en',
+                target_languages=['es'],
+                listeners_by_language={'es': ['conn-1']}
+            )
+        ):
+            yield
+        handler.session_context_cache.clear()
+
+    def test_retry_only_reprocesses_failed_session(self, session_lookups):
+        """Test a replayed batch skips sessions that were already delivered."""
+        failing = {'session-bad'}
+
+        async def delivery(session_id, *args, **kwargs):
+            if session_id in failing:
+                raise RuntimeError('translate throttled')
+            return [{'targetLanguage': 'es', 'success': True}]
+
+        event = make_kinesis_event({
+            'session-bad': [b'\x00\x01' * 10],
+            'session-good': [b'\x00\x01' * 10, b'\x00\x01' * 10],
+        })
+        delivery_mock = AsyncMock(side_effect=delivery)
+
+        with patch.object(handler, 'transcribe_streaming', new=AsyncMock(return_value='hi')), \
+             patch.object(handler, 'process_translation_and_delivery', new=delivery_mock):
+            first = run(handler.handle_kinesis_batch(event, None))
+            failing.clear()
+            retry = run(handler.handle_kinesis_batch(event, None))
+
+        assert first['batchItemFailures'] == [{'itemIdentifier': '1001'}]
+        assert retry['batchItemFailures'] == []
+        assert [c.args[0] for c in delivery_mock.call_args_list] == [
+            'session-bad', 'session-good', 'session-bad'
+        ]
+        results = {r['sessionId']: r for r in json.loads(retry['body'])['results']}
+        assert results['session-good']['reason'] == 'Already delivered'
+        assert handler.sequence_checkpoints.get('session-good') == '1003'
+
+    def test_only_new_records_of_session_processed(self, session_lookups):
+        """Test records at or below the checkpoint are left out of the audio."""
+        received = []
+
+        async def capture_transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            received.append(pcm_bytes.tobytes())
+            return 'hello'
+
+        handler.sequence_checkpoints.advance('session-a', '1001')
+        event = make_kinesis_event({'session-a': [b'\x01\x00', b'\x02\x00']})
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=capture_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=AsyncMock(return_value=[])):
+            run(handler.handle_kinesis_batch(event, None))
+
+        assert received == [b'\x02\x00']
+        assert handler.sequence_checkpoints.get('session-a') == '1002'
+
+    def test_transcription_failure_fails_session(self, session_lookups):
+        """Test a failed transcription is retried instead of checkpointed."""
+        async def transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            raise RuntimeError('transcribe unavailable')
+
+        event = make_kinesis_event({'session-a': [b'\x00\x01' * 10]})
+        delivery = AsyncMock(return_value=[{'targetLanguage': 'es', 'success': True}])
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=delivery):
+            response = run(handler.handle_kinesis_batch(event, None))
+
+        body = json.loads(response['body'])
+        assert body['failures'] == [{
+            'sessionId': 'session-a',
+            'sequenceNumber': '1001',
+            'error': 'Transcription failed: transcribe unavailable'
+        }]
+        assert response['batchItemFailures'] == [{'itemIdentifier': '1001'}]
+        delivery.assert_not_called()
+        assert handler.sequence_checkpoints.get('session-a') is None
+
+    def test_every_language_failed_fails_session(self, session_lookups):
+        """Test a session with no delivered language is retried."""
+        outcomes = iter([
+            [{'targetLanguage': 'es', 'success': False, 'error': 'translate throttled'}],
+            [{'targetLanguage': 'es', 'success': True}],
+        ])
+
+        async def delivery(*args, **kwargs):
+            return next(outcomes)
+
+        event = make_kinesis_event({'session-a': [b'\x00\x01' * 10]})
+
+        with patch.object(handler, 'transcribe_streaming', new=AsyncMock(return_value='hi')), \
+             patch.object(handler, 'process_translation_and_delivery', side_effect=delivery):
+            first = run(handler.handle_kinesis_batch(event, None))
+            checkpoint_after_failure = handler.sequence_checkpoints.get('session-a')
+            retry = run(handler.handle_kinesis_batch(event, None))
+
+        assert first['batchItemFailures'] == [{'itemIdentifier': '1001'}]
+        assert checkpoint_after_failure is None
+        assert retry['batchItemFailures'] == []
+        assert json.loads(retry['body'])['results'][0]['results'] == [
+            {'targetLanguage': 'es', 'success': True}
+        ]
+        assert handler.sequence_checkpoints.get('session-a') == '1001'
+
+    def test_timed_out_language_checkpointed(self, session_lookups):
+        """Test a timed-out language, which may still reach listeners, is not retried."""
+        delivery = AsyncMock(return_value=[
+            {'targetLanguage': 'es', 'success': False, 'timedOut': True,
+             'error': 'Timed out after 10s'}
+        ])
+        event = make_kinesis_event({'session-a': [b'\x00\x01' * 10]})
+
+        with patch.object(handler, 'transcribe_streaming', new=AsyncMock(return_value='hi')), \
+             patch.object(handler, 'process_translation_and_delivery', new=delivery):
+            response = run(handler.handle_kinesis_batch(event, None))
+
+        assert response['batchItemFailures'] == []
+        assert json.loads(response['body'])['results'][0]['partialDelivery'] is True
+        assert handler.sequence_checkpoints.get('session-a') == '1001'
+
+    def test_batch_error_retries_from_first_record(self, session_lookups):
+        """Test an unexpected batch error reports the first record as failed."""
+        event = make_kinesis_event({'session-a': [b'\x00\x01']}, first_sequence=7)
+
+        with patch.object(handler, 'PCMBatchAssembler', side_effect=RuntimeError('boom')):
+            response = run(handler.handle_kinesis_batch(event, None))
+
+        assert response['statusCode'] == 500
+        assert response['batchItemFailures'] == [{'itemIdentifier': '7'}]
+
+    def test_checkpoint_persisted_on_session_item(self):
+        """Test the checkpoint is written to the existing Sessions item."""
+        with patch.object(handler.aws_clients, 'table') as table:
+            handler._save_sequence_checkpoint('session-a', '1005')
+
+        kwargs = table.return_value.update_item.call_args.kwargs
+        assert kwargs['Key'] == {'sessionId': 'session-a'}
+        assert kwargs['ExpressionAttributeValues'] == {':seq': '1005'}
+        assert kwargs['ConditionExpression'] == 'attribute_exists(sessionId)'
+
+
+class TestRecordReordering:
+    """Test suite for the record reorder/dedupe window."""
+
+    @pytest.fixture
+    def session_lookups(self, monkeypatch):
+        """Patch DynamoDB lookups with static session metadata."""
+        monkeypatch.setattr(handler, 'record_reorder_window', handler.RecordReorderWindow())
+        handler.session_context_cache.clear()
+        with patch.object(
+            handler, '_load_session_context',
+            side_effect=lambda sid: handler.SessionContext(
+                session_id=sid,
+                source_language='en',
+                target_languages=['es'],
+                listeners_by_language={'es': ['conn-1']}
+            )
+        ):
+            yield
+        handler.session_context_cache.clear()
+
+    @staticmethod
+    def chunk(chunk_index, sample):
+        """Numbered record data: header plus one 16-bit sample."""
+        from shared.services.pcm_batch_assembler import AUDIO_RECORD_HEADER, AUDIO_RECORD_MAGIC
+
+        return AUDIO_RECORD_HEADER.pack(AUDIO_RECORD_MAGIC, 7, chunk_index) + sample
+
+    def test_reordered_and_duplicate_chunks_fixed_before_transcribe(self, session_lookups):
+        """Test Transcribe gets each chunk once, in chunk order."""
+        received = []
+
+        async def capture_transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            received.append(pcm_bytes.tobytes())
+            return 'hello'
+
+        event = make_kinesis_event({'session-a': [
+            self.chunk(1, b'\x02\x00'),
+            self.chunk(0, b'\x01\x00'),
+            self.chunk(1, b'\x02\x00'),
+            self.chunk(2, b'\x03\x00'),
+        ]})
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=capture_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=AsyncMock(return_value=[])):
+            response = run(handler.handle_kinesis_batch(event, None))
+
+        assert received == [b'\x01\x00\x02\x00\x03\x00']
+        assert json.loads(response['body'])['results'][0]['droppedRecordCount'] == 1
+        assert handler.sequence_checkpoints.get('session-a') == '1004'
+
+    def test_batch_of_duplicates_skips_paid_calls(self, session_lookups):
+        """Test chunks processed by an earlier batch never reach Transcribe."""
+        transcribe = AsyncMock(return_value='hello')
+        first = make_kinesis_event({'session-a': [self.chunk(0, b'\x01\x00')]})
+        resent = make_kinesis_event({'session-a': [self.chunk(0, b'\x01\x00')]}, first_sequence=2001)
+
+        with patch.object(handler, 'transcribe_streaming', new=transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=AsyncMock(return_value=[])):
+            run(handler.handle_kinesis_batch(first, None))
+            response = run(handler.handle_kinesis_batch(resent, None))
+
+        assert transcribe.call_count == 1
+        result = json.loads(response['body'])['results'][0]
+        assert result['reason'] == 'Duplicate records'
+
+    def test_dropped_records_emitted_per_session(self):
+        """Test dropped duplicate records are reported per session."""
+        with patch.object(handler, 'metrics_sink') as metrics_sink:
+            handler._emit_kinesis_batch_metrics([
+                {'sessionId': 'session-a', 'droppedRecordCount': 3},
+                {'sessionId': 'session-b', 'droppedRecordCount': 0},
+            ])
+
+        metric_data = metrics_sink.put_metric_data.call_args.kwargs['MetricData']
+        assert metric_data == [{
+            'MetricName': 'DuplicateRecordsDropped',
+            'Value': 3,
+            'Unit': 'Count',
+            'Dimensions': [{'Name': 'SessionId', 'Value': 'session-a'}]
+        }]
+
+
+class TestAudioCarryOver:
+    """Test suite for cross-batch carry-over on the one-shot path."""
+
+    @pytest.fixture
+    def session_lookups(self):
+        """Patch DynamoDB lookups with static session metadata."""
+        handler.session_context_cache.clear()
+        with patch.object(
+            handler, '_load_session_context',
+            side_effect=lambda sid: handler.SessionContext(
+                session_id=sid,
+                source_language='en',
+                target_languages=['es'],
+                listeners_by_language={'es': ['conn-1']}
+            )
+        ):
+            yield
+        handler.session_context_cache.clear()
+
+    @staticmethod
+    def speech_with_cut_word():
+        """Three seconds of speech whose last word runs past the batch edge."""
+        import numpy as np
+
+        t = np.arange(16000 * 3) / 16000
+        samples = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+        samples[int(16000 * 2.2):int(16000 * 2.3)] = 0
+        return samples.tobytes()
+
+    def test_tail_prepended_to_next_batch(self, session_lookups):
+        """Test the cut word is transcribed with the next batch."""
+        received = []
+
+        async def capture_transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            received.append(pcm_bytes.tobytes())
+            return 'hello'
+
+        first = self.speech_with_cut_word()
+        second = b'\x10\x00' * 100
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=capture_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=AsyncMock(return_value=[])):
+            run(handler.handle_kinesis_batch(make_kinesis_event({'session-a': [first]}), None))
+            response = run(handler.handle_kinesis_batch(
+                make_kinesis_event({'session-a': [second]}, first_sequence=2001), None
+            ))
+
+        held_back = len(first) - len(received[0])
+        assert 0 < held_back <= 32000
+        assert received[1] == first[-held_back:] + second
+        result = json.loads(response['body'])['results'][0]
+        assert result['carriedOverSeconds'] == pytest.approx(held_back / 32000)
+
+    def test_repeated_transcript_not_translated_again(self, session_lookups):
+        """Test words delivered before the batch edge are not delivered twice."""
+        transcripts = iter(['see you at the', 'at the station'])
+        delivery = AsyncMock(return_value=[])
+
+        async def fake_transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            return next(transcripts)
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=fake_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=delivery):
+            run(handler.handle_kinesis_batch(make_kinesis_event({'session-a': [b'\x00\x01']}), None))
+            run(handler.handle_kinesis_batch(
+                make_kinesis_event({'session-a': [b'\x00\x01']}, first_sequence=2001), None
+            ))
+
+        assert [c.args[1] for c in delivery.call_args_list] == ['see you at the', 'station']
+
+    def test_placeholder_transcript_not_deduplicated(self, session_lookups):
+        """Test placeholder texts neither get stripped nor strip the next transcript."""
+        transcripts = iter(['see you at the', '[No transcription]', '[No transcription]', 'at the station'])
+        delivery = AsyncMock(return_value=[])
+
+        async def fake_transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            return next(transcripts)
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=fake_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=delivery):
+            for first_sequence in (1001, 2001, 3001, 4001):
+                run(handler.handle_kinesis_batch(
+                    make_kinesis_event({'session-a': [b'\x00\x01']}, first_sequence=first_sequence),
+                    None
+                ))
+
+        assert [c.args[1] for c in delivery.call_args_list] == [
+            'see you at the', '[No transcription]', '[No transcription]', 'station'
+        ]
+
+    def test_warm_streams_do_not_carry_over(self, monkeypatch):
+        """Test carry-over is off when warm streams see contiguous audio."""
+        monkeypatch.setattr(handler, 'TRANSCRIBE_WARM_STREAMS_ENABLED', True)
+
+        assert handler._carry_over_active() is False
+
+
+class TestSubBatching:
+    """Test suite for sentence-sized sub-batches of long batches."""
+
+    @pytest.fixture
+    def session_lookups(self, monkeypatch):
+        """Patch DynamoDB lookups; carry-over is tested separately."""
+        monkeypatch.setattr(handler, 'AUDIO_CARRY_OVER_ENABLED', False)
+        handler.session_context_cache.clear()
+        with patch.object(
+            handler, '_load_session_context',
+            side_effect=lambda sid: handler.SessionContext(
+                session_id=sid,
+                source_language='en',
+                target_languages=['es'],
+                listeners_by_language={'es': ['conn-1']}
+            )
+        ):
+            yield
+        handler.session_context_cache.clear()
+
+    @staticmethod
+    def three_sentences():
+        """Nine seconds of speech with pauses after 3 and 6 seconds."""
+        import numpy as np
+
+        t = np.arange(16000 * 9) / 16000
+        samples = (8000 * np.sin(2 * np.pi * 220 * t)).astype(np.int16)
+        samples[int(16000 * 2.9):int(16000 * 3.1)] = 0
+        samples[int(16000 * 5.9):int(16000 * 6.1)] = 0
+        return samples.tobytes()
+
+    def test_long_batch_pipelined_by_sub_batch(self, session_lookups):
+        """Test sub-batch N is delivered while N+1 is still transcribing."""
+        events = []
+        sentences = iter(['one', 'two', 'three'])
+
+        async def fake_transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            events.append(('transcribe', len(pcm_bytes)))
+            await asyncio.sleep(0.01)
+            return next(sentences)
+
+        async def delivery(session_id, transcript, *args, **kwargs):
+            events.append(('deliver', transcript))
+            return []
+
+        event = make_kinesis_event({'session-a': [self.three_sentences()]})
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=fake_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', side_effect=delivery):
+            response = run(handler.handle_kinesis_batch(event, None))
+
+        sizes = [size for kind, size in events if kind == 'transcribe']
+        assert len(sizes) == 3
+        assert all(2 * 32000 <= size <= 4 * 32000 for size in sizes)
+        assert sum(sizes) == 9 * 32000
+        assert events.index(('deliver', 'one')) < events.index(('transcribe', sizes[2]))
+        assert json.loads(response['body'])['results'][0]['segmentCount'] == 3
+
+    def test_later_sub_batch_failure_keeps_delivered_sub_batches(self, session_lookups):
+        """Test a sub-batch failing after earlier ones were delivered is not retried."""
+        calls = 0
+
+        async def fake_transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 2:
+                raise RuntimeError('stream reset')
+            return 'one'
+
+        delivery = AsyncMock(return_value=[{'targetLanguage': 'es', 'success': True}])
+        event = make_kinesis_event({'session-a': [self.three_sentences()]})
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=fake_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=delivery):
+            response = run(handler.handle_kinesis_batch(event, None))
+
+        result = json.loads(response['body'])['results'][0]
+        assert response['batchItemFailures'] == []
+        assert delivery.call_count == 1
+        assert result['partialDelivery'] is True
+        assert result['error'] == 'Transcription failed: stream reset'
+        assert handler.sequence_checkpoints.get('session-a') == '1001'
+
+    def test_sub_batch_segment_times_relative_to_batch(self, session_lookups):
+        """Test segment timestamps keep increasing across sub-batches."""
+        async def fake_transcribe(pcm_bytes, language_code, sample_rate, on_segment=None):
+            await on_segment('words', 0.5, 1.5)
+            return 'words'
+
+        delivery = AsyncMock(return_value=[])
+        event = make_kinesis_event({'session-a': [self.three_sentences()]})
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=fake_transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=delivery):
+            run(handler.handle_kinesis_batch(event, None))
+
+        timestamps = [c.args[4] for c in delivery.call_args_list]
+        offsets = [b - a for a, b in zip(timestamps, timestamps[1:])]
+        assert len(timestamps) == 3
+        assert all(2800 <= offset <= 3200 for offset in offsets)
+
+    def test_short_batch_not_split(self, session_lookups):
+        """Test normal batches are transcribed in one call."""
+        transcribe = AsyncMock(return_value='hi')
+        event = make_kinesis_event({'session-a': [b'\x00\x01' * 16000 * 3]})
+
+        with patch.object(handler, 'transcribe_streaming', new=transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=AsyncMock(return_value=[])):
+            run(handler.handle_kinesis_batch(event, None))
+
+        assert transcribe.call_count == 1
+
+
+class TestSegmentStreaming:
+    """Test suite for full-duplex transcription with per-segment delivery."""
+
+    def test_transcribe_streaming_emits_every_final_while_sending(self):
+        """Test finals are emitted as they arrive and none are dropped."""
+        from types import SimpleNamespace
+        from amazon_transcribe.model import TranscriptEvent
+
+        def make_event(text, start, end, is_partial=False):
+            result = SimpleNamespace(
+                is_partial=is_partial, start_time=start, end_time=end,
+                alternatives=[SimpleNamespace(transcript=text)]
+            )
+            event = TranscriptEvent.__new__(TranscriptEvent)
+            event.transcript = SimpleNamespace(results=[result])
+            return event
+
+        sent_before_first_segment = []
+
+        class FakeStream:
+            def __init__(self):
+                self.chunks = 0
+                self.events = asyncio.Queue()
+                self.input_stream = self
+
+            async def send_audio_event(self, audio_chunk):
+                self.chunks += 1
+                if self.chunks == 1:
+                    await self.events.put(make_event('Hel', 0.0, 0.5, is_partial=True))
+                    await self.events.put(make_event('Hello there.', 0.0, 1.0))
+                await asyncio.sleep(0.01)
+
+            async def end_stream(self):
+                await self.events.put(make_event('How are you?', 1.2, 2.0))
+                await self.events.put(None)
+
+            @property
+            def output_stream(self):
+                async def iterate():
+                    while True:
+                        event = await self.events.get()
+                        if event is None:
+                            return
+                        yield event
+                return iterate()
+
+        stream = FakeStream()
+
+        class FakeClient:
+            def __init__(self, region):
+                pass
+
+            async def start_stream_transcription(self, **kwargs):
+                return stream
+
+        segments = []
+
+        async def on_segment(text, start_time, end_time):
+            if not segments:
+                sent_before_first_segment.append(stream.chunks)
+            segments.append((text, start_time, end_time))
+
+        pcm = b'\x00\x01' * 16384 * 2  # 4 chunks of 16 KB
+
+        with patch('amazon_transcribe.client.TranscribeStreamingClient', FakeClient):
+            transcript = run(handler.transcribe_streaming(pcm, 'en-US', 16000, on_segment=on_segment))
+
+        assert transcript == 'Hello there. How are you?'
+        assert segments == [('Hello there.', 0.0, 1.0), ('How are you?', 1.2, 2.0)]
+        assert sent_before_first_segment[0] < 4
+
+    def test_each_segment_delivered_with_increasing_timestamps(self):
+        """Test every segment gets its own delivery, ordered by timestamp."""
+        handler.session_context_cache.clear()
+        context = handler.SessionContext(
+            session_id='session-a', source_language='en',
+            target_languages=['es'], listeners_by_language={'es': ['conn-1']}
+        )
+
+        async def transcribe(session_id, pcm_bytes, language_code, on_segment=None):
+            await on_segment('First.', 0.0, 1.0)
+            await on_segment('Second.', 0.0, 0.5)
+            return 'First. Second.'
+
+        delivery = AsyncMock(return_value=[{'targetLanguage': 'es', 'success': True}])
+
+        with patch.object(handler, '_load_session_context', return_value=context), \
+             patch.object(handler, '_transcribe_session_audio', side_effect=transcribe), \
+             patch.object(handler, 'process_translation_and_delivery', new=delivery):
+            result = run(handler._process_kinesis_session('session-a', make_batch('session-a', b'\x00\x01' * 100)))
+
+        handler.session_context_cache.clear()
+
+        assert result['segmentCount'] == 2
+        assert len(result['results']) == 2
+        texts = [call.args[1] for call in delivery.call_args_list]
+        timestamps = [call.args[4] for call in delivery.call_args_list]
+        durations = [call.args[5] for call in delivery.call_args_list]
+        assert texts == ['First.', 'Second.']
+        assert timestamps[1] > timestamps[0]
+        assert durations == [1.0, 0.5]
+
+
+class TestVoiceActivityGate:
+    """Test suite for the voice activity gate in front of Transcribe."""
+
+    @staticmethod
+    def pcm(silence_s, speech_s, trailing_s):
+        """Build PCM with a 440 Hz tone between stretches of silence."""
+        import numpy as np
+
+        t = np.arange(int(16000 * speech_s)) / 16000
+        tone = (0.3 * 32767 * np.sin(2 * np.pi * 440 * t)).astype(np.int16)
+        return np.concatenate([
+            np.zeros(int(16000 * silence_s), dtype=np.int16),
+            tone,
+            np.zeros(int(16000 * trailing_s), dtype=np.int16)
+        ]).tobytes()
+
+    @pytest.fixture
+    def vad_enabled(self, monkeypatch):
+        """Enable the gate with static session metadata."""
+        monkeypatch.setattr(handler, 'VAD_ENABLED', True)
+        handler.session_context_cache.clear()
+        context = handler.SessionContext(
+            session_id='session-a', source_language='en',
+            target_languages=['es'], listeners_by_language={'es': ['conn-1']}
+        )
+        with patch.object(handler, '_load_session_context', return_value=context) as load:
+            yield load
+        handler.session_context_cache.clear()
+
+    def test_silent_batch_skips_lookups_and_transcribe(self, vad_enabled):
+        """Test pure silence never reaches DynamoDB or Transcribe."""
+        transcribe = AsyncMock(return_value='hi')
+
+        with patch.object(handler, 'transcribe_streaming', new=transcribe):
+            result = run(handler._process_kinesis_session(
+                'session-a', make_batch('session-a', bytes(16000 * 2 * 3))
+            ))
+
+        assert result['skipped'] is True
+        assert result['reason'] == 'Silence'
+        assert result['silenceSkippedSeconds'] == pytest.approx(3.0)
+        transcribe.assert_not_called()
+        vad_enabled.assert_not_called()
+
+    def test_silence_trimmed_around_speech(self, vad_enabled):
+        """Test leading and trailing silence is not sent to Transcribe."""
+        sent = []
+
+        async def transcribe(pcm_bytes, language_code, sample_rate, **kwargs):
+            sent.append(len(pcm_bytes) / 32000)
+            return 'hello'
+
+        with patch.object(handler, 'transcribe_streaming', side_effect=transcribe), \
+             patch.object(handler, 'process_translation_and_delivery',
+                          new=AsyncMock(return_value=[])):
+            result = run(handler._process_kinesis_session(
+                'session-a', make_batch('session-a', self.pcm(1.0, 1.0, 1.0))
+            ))
+
+        # 1s of speech plus 300ms padding on each side
+        assert sent[0] == pytest.approx(1.6, abs=0.05)
+        assert result['silenceSkippedSeconds'] == pytest.approx(1.4, abs=0.05)
+
+    def test_pending_warm_speech_keeps_silent_batch(self, vad_enabled, monkeypatch):
+        """Test silence is still sent when a warm stream must finalize speech."""
+        from unittest.mock import MagicMock
+
+        pool = MagicMock()
+        pool.has_pending_speech.return_value = True
+        monkeypatch.setattr(handler, 'TRANSCRIBE_WARM_STREAMS_ENABLED', True)
+        monkeypatch.setattr(handler, 'transcribe_stream_pool', pool)
+
+        pcm_data, leading_trim = handler._gate_voice_activity(
+            'session-a', make_batch('session-a', bytes(32000))
+        )
+
+        assert len(pcm_data) == 32000
+        assert leading_trim == 0.0
+
+    def test_skipped_seconds_emitted_per_session(self):
+        """Test skipped silence is reported with a SessionId dimension."""
+        with patch.object(handler, 'metrics_sink') as metrics_sink:
+            handler._emit_kinesis_batch_metrics([
+                {'sessionId': 'session-a', 'silenceSkippedSeconds': 3.0},
+                {'sessionId': 'session-b', 'silenceSkippedSeconds': 0.0},
+            ])
+
+        metric_data = metrics_sink.put_metric_data.call_args.kwargs['MetricData']
+        assert len(metric_data) == 1
+        assert metric_data[0]['Value'] == 3.0
+        assert metric_data[0]['Dimensions'] == [{'Name': 'SessionId', 'Value': 'session-a'}]
+
+
+class TestWarmTranscribeStreams:
+    """Test suite for warm stream transcription with one-shot fallback."""
+
+    @pytest.fixture
+    def warm_streams(self, monkeypatch):
+        """Enable warm streams backed by a mocked pool."""
+        from unittest.mock import MagicMock
+
+        pool = MagicMock()
+        pool.transcribe = AsyncMock(return_value='warm text')
+        pool.close_idle = AsyncMock(return_value=0)
+        monkeypatch.setattr(handler, 'TRANSCRIBE_WARM_STREAMS_ENABLED', True)
+        monkeypatch.setattr(handler, 'transcribe_stream_pool', pool)
+        return pool
+
+    def test_warm_stream_used(self, warm_streams):
+        """Test batches are sent to the session's warm stream."""
+        one_shot = AsyncMock(return_value='one-shot text')
+
+        with patch.object(handler, 'transcribe_streaming', new=one_shot):
+            transcript = run(handler._transcribe_session_audio('session-1', b'\x00\x01', 'en-US'))
+
+        assert transcript == 'warm text'
+        warm_streams.transcribe.assert_awaited_once_with(
+            'session-1', b'\x00\x01', 'en-US', 16000, on_segment=None
+        )
+        one_shot.assert_not_called()
+
+    def test_falls_back_to_one_shot(self, warm_streams):
+        """Test a failing warm stream falls back to a one-shot stream."""
+        warm_streams.transcribe.side_effect = ConnectionError('stream reset')
+        one_shot = AsyncMock(return_value='one-shot text')
+
+        with patch.object(handler, 'transcribe_streaming', new=one_shot):
+            transcript = run(handler._transcribe_session_audio('session-1', b'\x00\x01', 'en-US'))
+
+        assert transcript == 'one-shot text'
+        one_shot.assert_awaited_once_with(b'\x00\x01', 'en-US', 16000, on_segment=None)
+
+    def test_idle_streams_closed_per_batch(self, warm_streams):
+        """Test each Kinesis batch closes idle warm streams first."""
+        event = make_kinesis_event({'session-a': [b'\x00\x01']})
+
+        with patch.object(handler, '_process_kinesis_session',
+                          new=AsyncMock(return_value={'sessionId': 'session-a'})):
+            run(handler.handle_kinesis_batch(event, None))
+
+        warm_streams.close_idle.assert_awaited_once()
+
+
+class TestStreamPartialProcessors:
+    """Test suite for partial processors held by WebSocket-path streams."""
+
+    def test_long_lived_stream_keeps_pooled_processor(self, monkeypatch):
+        """Test sending audio keeps the stream's processor pooled past the idle timeout."""
+        from unittest.mock import MagicMock
+
+        clock = [1000.0]
+        pool = handler.PartialProcessorPool(
+            factory=lambda session_id, language: MagicMock(name=session_id),
+            idle_timeout_seconds=300,
+            estimator=lambda processor: 1024,
+            clock=lambda: clock[0]
+        )
+        processor = pool.get('long-session', 'en')
+        stream = MagicMock(is_active=True, lock=asyncio.Lock())
+        stream.manager.send_audio = AsyncMock()
+        streams = MagicMock()
+        streams.get.return_value = stream
+        monkeypatch.setattr(handler, 'partial_processors', pool)
+        monkeypatch.setattr(handler, 'session_streams', streams)
+        monkeypatch.setattr(handler, '_close_expired_streams', lambda: None)
+
+        for _ in range(10):  # 10 minutes of audio
+            clock[0] += 60
+            assert run(handler._send_audio_to_stream('long-session', b'\x00\x01'))
+        pool.get('other-session', 'en')
+
+        assert 'long-session' in pool
+        assert pool.get('long-session', 'en') is processor
+
+
+class TestLanguageDeliveryPipeline:
+    """Test suite for the concurrent per-language delivery pipeline."""
+
+    @pytest.fixture
+    def aws_clients(self, monkeypatch):
+        """Patch boto3 clients with mocks keyed by service name."""
+        from unittest.mock import MagicMock
+
+        clients = {
+            'translate': MagicMock(),
+            'polly': MagicMock(),
+            's3': MagicMock(),
+            'apigatewaymanagementapi': MagicMock(),
+        }
+        clients['translate'].translate_text.side_effect = (
+            lambda Text, SourceLanguageCode, TargetLanguageCode:
+            {'TranslatedText': f'{Text}-{TargetLanguageCode}'}
+        )
+        clients['polly'].synthesize_speech.return_value = {
+            'AudioStream': MagicMock(read=MagicMock(return_value=b'mp3'))
+        }
+        clients['s3'].generate_presigned_url.return_value = 'https://example/audio.mp3'
+
+        endpoint = 'https://example.execute-api'
+        monkeypatch.setenv('API_GATEWAY_ENDPOINT', endpoint)
+        for service, client in clients.items():
+            handler.aws_clients.register_client(
+                service, client,
+                endpoint_url=endpoint if service == 'apigatewaymanagementapi' else None
+            )
+        yield clients
+        handler.aws_clients.reset()
+
+    def test_languages_run_concurrently(self, aws_clients):
+        """Test slow translations for several languages overlap."""
+        def slow_translate(Text, SourceLanguageCode, TargetLanguageCode):
+            time.sleep(0.1)
+            return {'TranslatedText': f'{Text}-{TargetLanguageCode}'}
+
+        aws_clients['translate'].translate_text.side_effect = slow_translate
+
+        with patch.object(handler, 'notify_listeners_for_language',
+                          new=AsyncMock(return_value=True)) as notify:
+            start = time.time()
+            results = run(handler.process_translation_and_delivery(
+                'session-1', 'hello', 'en', ['es', 'fr', 'de', 'it'], 1000, 1.0
+            ))
+            elapsed = time.time() - start
+
+        assert [r['targetLanguage'] for r in results] == ['es', 'fr', 'de', 'it']
+        assert all(r['success'] for r in results)
+        assert notify.await_count == 4
+        assert elapsed < 0.3
+
+    def test_stage_concurrency_limit(self, aws_clients, monkeypatch):
+        """Test the TTS stage never exceeds its concurrency limit."""
+        import threading
+
+        lock = threading.Lock()
+        in_flight = 0
+        max_in_flight = 0
+
+        def tracking_synthesize(**kwargs):
+            nonlocal in_flight, max_in_flight
+            with lock:
+                in_flight += 1
+                max_in_flight = max(max_in_flight, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return {'AudioStream': type('S', (), {'read': lambda self: b'mp3'})()}
+
+        aws_clients['polly'].synthesize_speech.side_effect = tracking_synthesize
+        monkeypatch.setitem(handler.DELIVERY_STAGE_CONCURRENCY, 'tts', 2)
+
+        with patch.object(handler, 'notify_listeners_for_language',
+                          new=AsyncMock(return_value=True)):
+            results = run(handler.process_translation_and_delivery(
+                'session-1', 'hello', 'en', ['es', 'fr', 'de', 'it', 'ja', 'ko'], 1000, 1.0
+            ))
+
+        assert all(r['success'] for r in results)
+        assert max_in_flight == 2
+
+    def test_slow_language_times_out_without_blocking_others(self, aws_clients, monkeypatch):
+        """Test a language exceeding its timeout fails alone."""
+        notified = []
+
+        async def notify(apigw_client, session_id, target_language, *args, **kwargs):
+            if target_language == 'fr':
+                await asyncio.sleep(1.0)
+            notified.append(target_language)
+            return True
+
+        monkeypatch.setattr(handler, 'LANGUAGE_DELIVERY_TIMEOUT_SECONDS', 0.2)
+
+        with patch.object(handler, 'notify_listeners_for_language', side_effect=notify):
+            results = run(handler.process_translation_and_delivery(
+                'session-1', 'hello', 'en', ['es', 'fr'], 1000, 1.0
+            ))
+
+        by_language = {r['targetLanguage']: r for r in results}
+        assert by_language['es']['success'] is True
+        assert by_language['fr']['success'] is False
+        assert 'Timed out' in by_language['fr']['error']
+        assert notified == ['es']
+
+    def test_stage_slot_wait_not_counted_against_timeout(self, aws_clients, monkeypatch):
+        """Test languages queued behind a busy stage keep their timeout budget."""
+        def slow_synthesize(**kwargs):
+            time.sleep(0.1)
+            return {'AudioStream': type('S', (), {'read': lambda self: b'mp3'})()}
+
+        aws_clients['polly'].synthesize_speech.side_effect = slow_synthesize
+        monkeypatch.setitem(handler.DELIVERY_STAGE_CONCURRENCY, 'tts', 1)
+        monkeypatch.setattr(handler, 'LANGUAGE_DELIVERY_TIMEOUT_SECONDS', 0.25)
+
+        with patch.object(handler, 'notify_listeners_for_language',
+                          new=AsyncMock(return_value=True)):
+            results = run(handler.process_translation_and_delivery(
+                'session-1', 'hello', 'en', ['es', 'fr', 'de', 'it'], 1000, 1.0
+            ))
+
+        # The last language waits ~0.3s for the TTS slot, longer than its budget
+        assert all(r['success'] for r in results)
+
+
+class TestInlineAudioDelivery:
+    """Test suite for inline WebSocket audio delivery."""
+
+    @pytest.fixture
+    def clients(self, monkeypatch):
+        """Mock clients with a Polly clip of a configurable size; inline delivery on."""
+        from unittest.mock import MagicMock
+
+        monkeypatch.setattr(handler, 'INLINE_AUDIO_ENABLED', True)
+
+        clients = {
+            'translate': MagicMock(),
+            'polly': MagicMock(),
+            's3': MagicMock(),
+            'apigw': MagicMock(),
+        }
+        clients['translate'].translate_text.return_value = {'TranslatedText': 'hola'}
+        clients['s3'].generate_presigned_url.return_value = 'https://example/audio.mp3'
+        return clients
+
+    def set_clip(self, clients, size):
+        """Make Polly return an MP3 clip of the given size."""
+        from unittest.mock import MagicMock
+
+        clients['polly'].synthesize_speech.return_value = {
+            'AudioStream': MagicMock(read=MagicMock(return_value=b'\xff' * size))
+        }
+
+    def sent_messages(self, clients):
+        """Decode messages posted to API Gateway."""
+        return [
+            json.loads(call.kwargs['Data'])
+            for call in clients['apigw'].post_to_connection.call_args_list
+        ]
+
+    def deliver(self, clients):
+        return run(handler._deliver_language(
+            clients, 'bucket', 'session-1', 'hello', 'en', 'es', 1000, 1.0,
+            connection_ids=['c1']
+        ))
+
+    def test_small_clip_sent_inline_without_s3(self, clients, monkeypatch):
+        """Test clips under the threshold skip S3 entirely."""
+        monkeypatch.setattr(handler, 'INLINE_AUDIO_CHUNK_BYTES', 1000)
+        self.set_clip(clients, 2500)
+
+        result = self.deliver(clients)
+
+        messages = self.sent_messages(clients)
+        assert result['deliveryMode'] == 'inline'
+        assert result['s3Key'] is None
+        clients['s3'].put_object.assert_not_called()
+        assert [m['chunkIndex'] for m in messages] == [0, 1, 2]
+        assert all(m['chunkCount'] == 3 and m['delivery'] == 'inline' for m in messages)
+        assert messages[0]['transcript'] == 'hola'
+        assert 'transcript' not in messages[1]
+        audio = b''.join(base64.b64decode(m['audio']) for m in messages)
+        assert audio == b'\xff' * 2500
+
+    def test_oversized_clip_uses_s3(self, clients, monkeypatch):
+        """Test clips above the threshold are delivered by presigned URL."""
+        monkeypatch.setattr(handler, 'INLINE_AUDIO_MAX_BYTES', 1000)
+        self.set_clip(clients, 2000)
+
+        result = self.deliver(clients)
+
+        messages = self.sent_messages(clients)
+        assert result['deliveryMode'] == 's3'
+        clients['s3'].put_object.assert_called_once()
+        assert len(messages) == 1
+        assert messages[0]['url'] == 'https://example/audio.mp3'
+        assert messages[0]['delivery'] == 's3'
+
+    def test_archive_stores_inline_clip_without_presigning(self, clients, monkeypatch):
+        """Test archiving writes inline clips to S3 without a presigned URL."""
+        monkeypatch.setattr(handler, 'TTS_ARCHIVE_ENABLED', True)
+        self.set_clip(clients, 100)
+
+        result = self.deliver(clients)
+
+        assert result['deliveryMode'] == 'inline'
+        assert result['s3Key'] == 'sessions/session-1/translated/es/1000.mp3'
+        clients['s3'].put_object.assert_called_once()
+        clients['s3'].generate_presigned_url.assert_not_called()
+
+    def test_inline_delivery_off_by_default(self):
+        """Test listeners keep getting presigned URLs until inline delivery is enabled."""
+        assert 'INLINE_AUDIO_ENABLED' not in os.environ
+        assert handler.INLINE_AUDIO_ENABLED is False
+
+    def test_failed_fanout_not_reported_as_delivered(self, clients):
+        """Test a clip no listener received is reported as failed."""
+        class GoneException(Exception):
+            pass
+
+        clients['apigw'].exceptions.GoneException = GoneException
+        clients['apigw'].post_to_connection.side_effect = RuntimeError('throttled')
+        self.set_clip(clients, 100)
+
+        result = self.deliver(clients)
+
+        assert result['success'] is False
+        assert result['error'] == 'No listener could be notified'
+
+    def test_delivery_latency_emitted_per_mode(self):
+        """Test delivery latencies are grouped by delivery mode."""
+        with patch.object(handler, 'metrics_sink') as metrics_sink:
+            handler._emit_kinesis_batch_metrics([
+                {'sessionId': 'session-a', 'results': [
+                    {'deliveryMode': 'inline', 'deliveryMs': 40},
+                    {'deliveryMode': 's3', 'deliveryMs': 250},
+                    {'deliveryMode': 'inline', 'deliveryMs': 60},
+                ]},
+            ])
+
+        metric_data = metrics_sink.put_metric_data.call_args.kwargs['MetricData']
+        by_mode = {m['Dimensions'][0]['Value']: m['Values'] for m in metric_data}
+        assert by_mode == {'inline': [40, 60], 's3': [250]}
+
+
+class TestSessionContextLoading:
+    """Test suite for loading session context from DynamoDB."""
+
+    def test_listeners_grouped_by_language_in_one_query(self):
+        """Test one paginated GSI query groups listeners by language."""
+        from unittest.mock import MagicMock
+
+        table = MagicMock()
+        table.query.side_effect = [
+            {
+                'Items': [
+                    {'connectionId': 'c1', 'targetLanguage': 'es'},
+                    {'connectionId': 'c2', 'targetLanguage': 'fr'},
+                ],
+                'LastEvaluatedKey': {'connectionId': 'c2'}
+            },
+            {'Items': [{'connectionId': 'c3', 'targetLanguage': 'es'}]},
+        ]
+        resource = MagicMock()
+        resource.Table.return_value = table
+        handler.aws_clients.register_resource('dynamodb', resource)
+
+        try:
+            listeners = handler._query_listeners_by_language('session-1')
+        finally:
+            handler.aws_clients.reset()
+
+        assert listeners == {'es': ['c1', 'c3'], 'fr': ['c2']}
+        assert table.query.call_count == 2
+        assert table.query.call_args.kwargs['ExclusiveStartKey'] == {'connectionId': 'c2'}
+
+    def test_notify_uses_cached_connections(self):
+        """Test notification skips the GSI query when connections are given."""
+        from unittest.mock import MagicMock
+
+        apigw = MagicMock()
+
+        with patch.object(handler.aws_clients, 'table') as table:
+            success = run(handler.notify_listeners_for_language(
+                apigw, 'session-1', 'es', 'https://url', 1000, 1.0, 'hola',
+                connection_ids=['c1', 'c2']
+            ))
+
+        assert success is True
+        table.assert_not_called()
+        assert apigw.post_to_connection.call_count == 2
+
+
+class TestListenerFanout:
+    """Test concurrent notification of a language's listeners."""
+
+    @pytest.fixture
+    def apigw(self):
+        from unittest.mock import MagicMock
+
+        class GoneException(Exception):
+            pass
+
+        client = MagicMock()
+        client.exceptions.GoneException = GoneException
+        return client
+
+    def test_sends_concurrently_within_limit(self, apigw, monkeypatch):
+        """Test listeners are notified in parallel up to the fan-out limit."""
+        import threading
+
+        monkeypatch.setattr(handler, 'LISTENER_FANOUT_CONCURRENCY', 3)
+        lock = threading.Lock()
+        in_flight = {'current': 0, 'max': 0}
+
+        def post_to_connection(ConnectionId, Data):
+            with lock:
+                in_flight['current'] += 1
+                in_flight['max'] = max(in_flight['max'], in_flight['current'])
+            time.sleep(0.05)
+            with lock:
+                in_flight['current'] -= 1
+
+        apigw.post_to_connection.side_effect = post_to_connection
+
+        started = time.time()
+        success = run(handler.notify_listeners_for_language(
+            apigw, 'session-1', 'es', 'https://url', 1000, 1.0, 'hola',
+            connection_ids=[f'c{i}' for i in range(6)]
+        ))
+
+        assert success is True
+        assert apigw.post_to_connection.call_count == 6
+        assert in_flight['max'] == 3
+        assert time.time() - started < 0.25
+
+    def test_same_payload_sent_to_every_listener(self, apigw):
+        """Test the message is encoded once and reused for all connections."""
+        with patch.object(
+            handler, '_build_translated_audio_messages',
+            wraps=handler._build_translated_audio_messages
+        ) as build:
+            run(handler.notify_listeners_for_language(
+                apigw, 'session-1', 'es', 'https://url', 1000, 1.0, 'hola',
+                connection_ids=['c1', 'c2', 'c3']
+            ))
+
+        build.assert_called_once()
+        payloads = [call.kwargs['Data'] for call in apigw.post_to_connection.call_args_list]
+        assert len(payloads) == 3
+        assert all(payload is payloads[0] for payload in payloads)
+
+    def test_gone_connections_removed_in_one_batch(self, apigw):
+        """Test gone connections are dropped from the cache and table together."""
+        from unittest.mock import MagicMock
+
+        def post_to_connection(ConnectionId, Data):
+            if ConnectionId in ('c2', 'c3'):
+                raise apigw.exceptions.GoneException()
+
+        apigw.post_to_connection.side_effect = post_to_connection
+        table = MagicMock()
+        batch = table.batch_writer.return_value.__enter__.return_value
+
+        with patch.object(handler.aws_clients, 'table', return_value=table), \
+             patch.object(handler.session_context_cache, 'remove_connections') as remove:
+            success = run(handler.notify_listeners_for_language(
+                apigw, 'session-1', 'es', 'https://url', 1000, 1.0, 'hola',
+                connection_ids=['c1', 'c2', 'c3']
+            ))
+
+        assert success is True
+        remove.assert_called_once_with('session-1', ['c2', 'c3'])
+        table.batch_writer.assert_called_once()
+        assert [c.kwargs['Key'] for c in batch.delete_item.call_args_list] == [
+            {'connectionId': 'c2'}, {'connectionId': 'c3'}
+        ]
+
+    def test_all_connections_gone_returns_none(self, apigw):
+        """Test notification reports no listeners when every connection is gone."""
+        apigw.post_to_connection.side_effect = apigw.exceptions.GoneException()
+
+        with patch.object(handler.aws_clients, 'table'), \
+             patch.object(handler.session_context_cache, 'remove_connections'):
+            success = run(handler.notify_listeners_for_language(
+                apigw, 'session-1', 'es', 'https://url', 1000, 1.0, 'hola',
+                connection_ids=['c1']
+            ))
+
+        assert success is None
+
+    def test_failed_sends_return_false(self, apigw):
+        """Test notification fails when listeners exist but none was reached."""
+        apigw.post_to_connection.side_effect = RuntimeError('throttled')
+
+        success = run(handler.notify_listeners_for_language(
+            apigw, 'session-1', 'es', 'https://url', 1000, 1.0, 'hola',
+            connection_ids=['c1', 'c2']
+        ))
+
+        assert success is False
+
+    def test_no_listeners_returns_none(self, apigw):
+        """Test notification without listeners is not a failure."""
+        success = run(handler.notify_listeners_for_language(
+            apigw, 'session-1', 'es', 'https://url', 1000, 1.0, 'hola',
+            connection_ids=[]
+        ))
+
+        assert success is None
+        apigw.post_to_connection.assert_not_called()
+
+    def test_fanout_duration_emitted(self):
+        """Test per-language fan-out durations are emitted as one metric."""
+        with patch.object(handler, 'metrics_sink') as metrics_sink:
+            handler._emit_kinesis_batch_metrics([
+                {'sessionId': 'session-a', 'results': [
+                    {'deliveryMode': 'inline', 'deliveryMs': 40, 'fanoutMs': 12},
+                    {'deliveryMode': 's3', 'deliveryMs': 250, 'fanoutMs': None},
+                    {'deliveryMode': 'inline', 'deliveryMs': 60, 'fanoutMs': 18},
+                ]},
+            ])
+
+        metric_data = metrics_sink.put_metric_data.call_args.kwargs['MetricData']
+        fanout = [m for m in metric_data if m['MetricName'] == 'ListenerFanoutDuration']
+        assert fanout[0]['Values'] == [12, 18]
+
+
+class TestLatencyTracing:
+    """Test suite for per-invocation latency trace summaries."""
+
+    @pytest.fixture
+    def session_lookups(self):
+        """Patch DynamoDB lookups with static session metadata."""
+        handler.session_context_cache.clear()
+        with patch.object(
+            handler, '_load_session_context',
+            side_effect=lambda sid: handler.SessionContext(
+                session_id=sid,
+                source_language='en',
+                target_languages=['es', 'fr'],
+                listeners_by_language={'es': ['conn-1'], 'fr': ['conn-2']}
+            )
+        ):
+            yield
+        handler.session_context_cache.clear()
+
+    @pytest.fixture
+    def clients(self):
+        """Mock Translate/Polly/S3/API Gateway clients."""
+        from unittest.mock import MagicMock
+
+        clients = {
+            'translate': MagicMock(),
+            'polly': MagicMock(),
+            's3': MagicMock(),
+            'apigw': MagicMock(),
+        }
+        clients['translate'].translate_text.return_value = {'TranslatedText': 'hola'}
+        clients['polly'].synthesize_speech.return_value = {
+            'AudioStream': MagicMock(read=MagicMock(return_value=b'\xff' * 2000))
+        }
+        clients['s3'].generate_presigned_url.return_value = 'https://example/audio.mp3'
+        return clients
+
+    def trace_summaries(self, log_info):
+        """Decode the trace summary records that were logged."""
+        messages = [call.args[0] for call in log_info.call_args_list]
+        return [
+            json.loads(message) for message in messages
+            if message.startswith('{"message": "KinesisBatchTrace"')
+        ]
+
+    def test_one_summary_per_invocation(self, session_lookups):
+        """Test the summary breaks the slowest session down by stage."""
+        async def transcribe(pcm_bytes, language_code, sample_rate, on_segment=None):
+            await asyncio.sleep(0.3 if len(pcm_bytes) > 200 else 0.01)
+            await on_segment('hello', 0.0, 1.0)
+            return 'hello'
+
+        async def deliver(*args, **kwargs):
+            await asyncio.sleep(0.01)
+            return {'targetLanguage': args[5], 'success': True}
+
+        event = make_kinesis_event({
+            'session-fast': [b'\x00\x01' * 50],
+            'session-slow': [b'\x00\x01' * 200],
+        })
+
+        with patch.object(handler.logger, 'info') as log_info, \
+             patch.object(handler, 'transcribe_streaming', side_effect=transcribe), \
+             patch.object(handler, '_deliver_language', side_effect=deliver), \
+             patch.object(handler, 'metrics_sink'):
+            run(handler.handle_kinesis_batch(event, None))
+
+        summaries = self.trace_summaries(log_info)
+        assert len(summaries) == 1
+        summary = summaries[0]
+        assert (summary['recordCount'], summary['sessionCount']) == (2, 2)
+        assert list(summary['slowestBy']['session'])[0] == 'session-slow'
+        assert set(summary['slowestBy']['language']) == {'es', 'fr'}
+        assert summary['stages']['transcribe']['count'] == 2
+        assert summary['stages']['segment']['count'] == 2
+        path = [step for step in summary['criticalPath'] if step.get('session') == 'session-slow']
+        assert [step['stage'] for step in path][-3:] == ['transcribe', 'language', 'checkpoint_save']
+        assert summary['criticalPathBreakdownMs']['transcribe'] >= 300
+
+    def test_storage_and_fanout_spans(self, clients, monkeypatch):
+        """Test S3 put, presign and fan-out are traced per language."""
+        monkeypatch.setattr(handler, 'INLINE_AUDIO_MAX_BYTES', 1000)
+
+        async def traced():
+            trace = handler.latency_tracer.start_trace('test')
+            await handler._deliver_language(
+                clients, 'bucket', 'session-1', 'hello', 'en', 'es', 1000, 1.0,
+                connection_ids=['c1']
+            )
+            trace.finish()
+            return trace.summary()
+
+        summary = run(traced())
+
+        assert set(summary['stages']) == {'translate', 'tts', 's3_put', 'presign', 'fanout'}
+        assert [step['stage'] for step in summary['criticalPath']] == [
+            'translate', 'tts', 's3_put', 'presign', 'fanout'
+        ]
+
+    def test_tracing_disabled(self, session_lookups, monkeypatch):
+        """Test no summary is logged when tracing is off."""
+        monkeypatch.setattr(handler, 'LATENCY_TRACING_ENABLED', False)
+
+        with patch.object(handler.logger, 'info') as log_info, \
+             patch.object(handler, 'transcribe_streaming', new=AsyncMock(return_value='hello')), \
+             patch.object(handler, 'process_translation_and_delivery', new=AsyncMock(return_value=[])), \
+             patch.object(handler, 'metrics_sink'):
+            run(handler.handle_kinesis_batch(make_kinesis_event({'session-a': [b'\x00\x01']}), None))
+
+        assert self.trace_summaries(log_info) == []
+
+
+class TestQualityConfigLoading:
+    """Test suite for loading the audio quality configuration."""
+
+    @pytest.fixture
+    def quality_config(self, monkeypatch):
+        """Use the real QualityConfig (the handler holds a placeholder)."""
+        from audio_quality.models.quality_config import QualityConfig
+
+        monkeypatch.setattr(handler, 'QualityConfig', QualityConfig)
+
+    def test_cadence_settings_read_from_environment(self, quality_config, monkeypatch):
+        """Test adaptive cadence and its CPU budget can be configured."""
+        monkeypatch.setenv('ADAPTIVE_CADENCE', 'true')
+        monkeypatch.setenv('ANALYSIS_CPU_BUDGET', '0.02')
+        monkeypatch.setenv('CADENCE_ENERGY_CHANGE_DB', '3.0')
+
+        config = handler._load_quality_config_from_environment()
+
+        assert config.adaptive_cadence is True
+        assert config.analysis_cpu_budget == 0.02
+        assert config.cadence_energy_change_db == 3.0
+
+    def test_stream_state_settings_read_from_environment(self, quality_config, monkeypatch):
+        """Test incremental SNR and streaming echo detection can be enabled."""
+        monkeypatch.setenv('SNR_INCREMENTAL', 'true')
+        monkeypatch.setenv('ECHO_STREAMING', 'true')
+
+        config = handler._load_quality_config_from_environment()
+
+        assert config.snr_incremental is True
+        assert config.echo_streaming is True
+
+    def test_cadence_off_by_default(self, quality_config):
+        """Test the cadence settings default to every detector on every chunk."""
+        config = handler._load_quality_config_from_environment()
+
+        assert config.adaptive_cadence is False
+        assert config.analysis_cpu_budget == 0.0
@@ -0,0 +1,130 @@
+"""
+Unit tests for AWS client registry.
+"""
+
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from shared.services import aws_client_registry
+from shared.services.aws_client_registry import AWSClientRegistry, get_client_registry
+
+
+class TestAWSClientRegistry:
+    """Test suite for AWSClientRegistry."""
+
+    def test_initialization(self):
+        """Test registry initializes with pool configuration."""
+        registry = AWSClientRegistry(max_pool_connections=25, tcp_keepalive=False)
+
+        assert registry.max_pool_connections == 25
+        assert registry.tcp_keepalive is False
+        assert registry.created_count == 0
+
+    def test_invalid_pool_size_raises(self):
+        """Test pool size below 1 is rejected."""
+        with pytest.raises(ValueError):
+            AWSClientRegistry(max_pool_connections=0)
+
+    def test_client_created_once_and_reused(self):
+        """Test client is created lazily and cached."""
+        registry = AWSClientRegistry(max_pool_connections=30)
+
+        with patch('shared.services.aws_client_registry.boto3.client') as mock_client:
+            mock_client.return_value = Mock()
+            first = registry.client('s3')
+            second = registry.client('s3')
+
+        assert first is second
+        mock_client.assert_called_once()
+        config = mock_client.call_args.kwargs['config']
+        assert config.max_pool_connections == 30
+        assert config.tcp_keepalive is True
+        assert registry.created_count == 1
+
+    def test_clients_cached_per_endpoint(self):
+        """Test clients with different endpoints are cached separately."""
+        registry = AWSClientRegistry()
+
+        with patch('shared.services.aws_client_registry.boto3.client') as mock_client:
+            mock_client.side_effect = lambda *args, **kwargs: Mock()
+            default = registry.client('apigatewaymanagementapi')
+            custom = registry.client('apigatewaymanagementapi', endpoint_url='https://a')
+
+        assert default is not custom
+        assert mock_client.call_args.kwargs['endpoint_url'] == 'https://a'
+
+    def test_registered_client_is_returned(self):
+        """Test injected stubs take precedence over real clients."""
+        registry = AWSClientRegistry()
+        stub = Mock()
+        registry.register_client('translate', stub)
+
+        with patch('shared.services.aws_client_registry.boto3.client') as mock_client:
+            assert registry.client('translate') is stub
+
+        mock_client.assert_not_called()
+
+    def test_registered_resource_shared_across_threads(self):
+        """Test injected resources are visible from every thread."""
+        registry = AWSClientRegistry()
+        stub = Mock()
+        registry.register_resource('dynamodb', stub)
+
+        seen = []
+        thread = threading.Thread(target=lambda: seen.append(registry.table('Sessions')))
+        thread.start()
+        thread.join()
+
+        stub.Table.assert_called_once_with('Sessions')
+        assert seen == [stub.Table.return_value]
+
+    def test_resources_cached_per_thread(self):
+        """Test each thread gets its own resource instance."""
+        registry = AWSClientRegistry()
+
+        with patch('shared.services.aws_client_registry.boto3.resource') as mock_resource:
+            mock_resource.side_effect = lambda *args, **kwargs: Mock()
+            main_first = registry.resource('dynamodb')
+            main_second = registry.resource('dynamodb')
+
+            other = []
+            thread = threading.Thread(target=lambda: other.append(registry.resource('dynamodb')))
+            thread.start()
+            thread.join()
+
+        assert main_first is main_second
+        assert other[0] is not main_first
+        assert mock_resource.call_count == 2
+
+    def test_reset_drops_cached_clients(self):
+        """Test reset forces clients to be recreated."""
+        registry = AWSClientRegistry()
+        registry.register_client('s3', Mock())
+
+        registry.reset()
+
+        with patch('shared.services.aws_client_registry.boto3.client') as mock_client:
+            registry.client('s3')
+
+        mock_client.assert_called_once()
+
+
+class TestGetClientRegistry:
+    """Test suite for the container-wide registry."""
+
+    def test_registry_is_singleton(self, monkeypatch):
+        """Test the same registry is returned on every call."""
+        monkeypatch.setattr(aws_client_registry, '_registry', None)
+
+        assert get_client_registry() is get_client_registry()
+
+    def test_registry_reads_environment(self, monkeypatch):
+        """Test pool size and keep-alive come from environment variables."""
+        monkeypatch.setattr(aws_client_registry, '_registry', None)
+        monkeypatch.setenv('AWS_MAX_POOL_CONNECTIONS', '64')
+        monkeypatch.setenv('AWS_TCP_KEEPALIVE', 'false')
+
+        registry = get_client_registry()
+
+        assert registry.max_pool_connections == 64
+        assert registry.tcp_keepalive is False
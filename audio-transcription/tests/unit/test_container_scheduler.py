@@ -0,0 +1,128 @@
+"""
+Unit tests for container scheduler.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from shared.services.container_scheduler import ContainerScheduler, InstrumentedExecutor
+
+
+class TestInstrumentedExecutor:
+    """Test suite for InstrumentedExecutor."""
+
+    def test_queueing_and_utilization(self):
+        """Test a saturated pool reports queue depth, wait and utilization."""
+        executor = InstrumentedExecutor(max_workers=2)
+        release = threading.Event()
+        try:
+            futures = [executor.submit(release.wait) for _ in range(4)]
+            time.sleep(0.05)
+            release.set()
+            for future in futures:
+                future.result()
+
+            stats = executor.snapshot()
+        finally:
+            executor.shutdown()
+
+        assert stats.submitted == 4
+        assert stats.completed == 4
+        assert stats.peak_active == 2
+        assert stats.peak_queued >= 2
+        assert stats.avg_queue_wait_ms > 0
+        assert 0.0 < stats.utilization <= 1.0
+
+    def test_snapshot_resets_window(self):
+        """Test counters start over after a snapshot."""
+        executor = InstrumentedExecutor(max_workers=1)
+        try:
+            executor.submit(time.sleep, 0).result()
+            executor.snapshot()
+
+            stats = executor.snapshot()
+        finally:
+            executor.shutdown()
+
+        assert stats.submitted == 0
+        assert stats.busy_seconds == 0.0
+
+    def test_invalid_max_workers(self):
+        """Test an empty pool is rejected."""
+        with pytest.raises(ValueError):
+            InstrumentedExecutor(max_workers=0)
+
+
+class TestContainerScheduler:
+    """Test suite for ContainerScheduler."""
+
+    @pytest.fixture
+    def scheduler(self):
+        """Scheduler with 4 executor threads."""
+        scheduler = ContainerScheduler(max_workers=4)
+        yield scheduler
+        scheduler.shutdown()
+        asyncio.set_event_loop(None)
+
+    def test_loop_reused_across_runs(self, scheduler):
+        """Test every run uses the same loop."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = scheduler.run(current_loop())
+        second = scheduler.run(current_loop())
+
+        assert first is second
+        assert scheduler.loops_created == 1
+
+    def test_closed_loop_replaced(self, scheduler):
+        """Test a loop closed by other code is recreated with a new executor."""
+        scheduler.run(asyncio.sleep(0))
+        scheduler.loop.close()
+
+        assert scheduler.run(scheduler.run_blocking(sum, [1, 2])) == 3
+        assert scheduler.loops_created == 2
+
+    def test_blocking_calls_overlap(self, scheduler):
+        """Test blocking calls run concurrently on the executor."""
+        async def fan_out():
+            started = time.perf_counter()
+            await asyncio.gather(*[scheduler.run_blocking(time.sleep, 0.05) for _ in range(4)])
+            return time.perf_counter() - started
+
+        assert scheduler.run(fan_out()) < 0.15
+
+    def test_default_executor_is_instrumented(self, scheduler):
+        """Test run_in_executor(None, ...) uses the scheduler's pool."""
+        async def default_executor_thread():
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, lambda: threading.current_thread().name)
+
+        assert scheduler.run(default_executor_thread()).startswith('blocking-io')
+        assert scheduler.executor.snapshot().submitted == 1
+
+    def test_run_inside_loop_rejected(self, scheduler):
+        """Test nested run() calls fail instead of deadlocking."""
+        async def nested():
+            scheduler.run(asyncio.sleep(0))
+
+        with pytest.raises(RuntimeError):
+            scheduler.run(nested())
+
+    def test_emit_metrics(self, scheduler):
+        """Test executor metrics are emitted once per window."""
+        sink = MagicMock()
+        scheduler.run(scheduler.run_blocking(time.sleep, 0))
+
+        scheduler.emit_metrics(sink, dimensions={'Function': 'audio-processor'})
+        names = {call.args[0] for call in sink.put_metric.call_args_list}
+        scheduler.emit_metrics(sink)
+
+        assert names == {
+            'ExecutorUtilization', 'ExecutorPeakActiveThreads', 'ExecutorPeakQueueDepth',
+            'ExecutorQueueWait', 'ExecutorTasks'
+        }
+        assert sink.put_metric.call_count == 5
@@ -112,3 +112,84 @@ class TestEchoDetector:
         
         assert result.has_echo, "Should detect strong feedback echo"
         assert result.echo_level_db > -10.0, f"Strong echo should have high level, got {result.echo_level_db:.2f} dB"
+    
+    def test_echo_detection_long_delay(self, detector):
+        """Test a long echo is reported at its delay, not at a pitch period multiple."""
+        np.random.seed(3)
+        sample_rate = 16000
+        signal = generate_speech_like_signal(1.0, sample_rate)
+        
+        delay_samples = int(0.25 * sample_rate)
+        echo = np.zeros_like(signal)
+        echo[delay_samples:] = signal[:-delay_samples] * 0.3
+        
+        result = detector.detect_echo(signal + echo, sample_rate)
+        
+        assert result.has_echo
+        assert 240 < result.delay_ms < 260, f"Should detect ~250ms delay, got {result.delay_ms:.2f}ms"
+    
+    def test_high_frequency_content_does_not_alias(self, detector):
+        """Test content above the decimated Nyquist frequency does not create echo peaks."""
+        sample_rate = 16000
+        t = np.arange(sample_rate) / sample_rate
+        envelope = 0.5 + 0.5 * np.sin(2 * np.pi * 2 * t)
+        signal = 0.5 * np.sin(2 * np.pi * 7010 * t) * envelope
+        signal += np.random.default_rng(0).normal(0, 0.01, len(t))
+        
+        result = detector.detect_echo(signal, sample_rate)
+        
+        assert not result.has_echo
+    
+    def test_bounded_autocorrelation_matches_full(self, detector):
+        """Test the bounded-lag FFT autocorrelation equals the full correlation."""
+        audio = np.random.default_rng(1).normal(0, 0.2, 3000)
+        detector.WHITENING_ORDER = 0
+        
+        bounded = detector._autocorrelation(audio, 500)
+        full = np.correlate(audio, audio, mode='full')[len(audio) - 1:]
+        
+        np.testing.assert_allclose(bounded, full[:501], atol=1e-9)
+    
+    def test_streaming_decimation_is_continuous(self):
+        """Test chunked streaming decimation equals filtering the whole signal."""
+        detector = EchoDetector(streaming=True)
+        audio = np.random.default_rng(2).normal(0, 0.2, 16000)
+        
+        chunks = []
+        start = 0
+        for size in (1001, 3999, 777, 5000, 5223):
+            chunks.append(detector._decimate_streaming(audio[start:start + size], 16000, 2))
+            start += size
+        streamed = np.concatenate(chunks)
+        
+        detector.reset()
+        whole = detector._decimate_streaming(audio, 16000, 2)
+        
+        assert len(streamed) == 8000
+        np.testing.assert_allclose(streamed, whole, atol=1e-12)
+    
+    def test_streaming_detects_echo_across_chunks(self):
+        """Test streaming mode finds an echo longer than the chunk."""
+        np.random.seed(4)
+        sample_rate = 16000
+        signal = generate_speech_like_signal(1.0, sample_rate)
+        delay_samples = int(0.3 * sample_rate)
+        echo = np.zeros_like(signal)
+        echo[delay_samples:] = signal[:-delay_samples] * 0.5
+        signal = signal + echo
+        chunk = int(0.25 * sample_rate)
+        
+        stateless = EchoDetector(min_delay_ms=40, max_delay_ms=500)
+        streaming = EchoDetector(min_delay_ms=40, max_delay_ms=500, streaming=True)
+        results = [
+            streaming.detect_echo(signal[i:i + chunk], sample_rate)
+            for i in range(0, len(signal), chunk)
+        ]
+        
+        assert not stateless.detect_echo(signal[-chunk:], sample_rate).has_echo
+        assert not results[0].has_echo
+        assert results[-1].has_echo
+        assert 290 < results[-1].delay_ms < 310
+        
+        streaming.reset()
+        assert not streaming.detect_echo(signal[-chunk:], sample_rate).has_echo
@@ -0,0 +1,200 @@
+"""
+Unit tests for the buffered EMF metrics sink.
+"""
+
+import io
+import json
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+from shared.utils import emf_metrics
+from shared.utils.emf_metrics import MetricsSink, flush_metrics_after
+
+
+def emf_documents(stream):
+    """Decode the EMF documents written to a stream."""
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+class TestMetricsSink:
+    """Test suite for MetricsSink."""
+
+    @pytest.fixture
+    def stream(self):
+        """Stream capturing EMF output."""
+        return io.StringIO()
+
+    def test_nothing_written_until_flush(self, stream):
+        """Test metrics are buffered in memory."""
+        sink = MetricsSink(stream=stream)
+
+        sink.put_metric('BufferOverflow', 1, namespace='AudioTranscription/Buffer')
+
+        assert stream.getvalue() == ''
+        assert sink.pending_count == 1
+        assert sink.flush() == 1
+        assert sink.pending_count == 0
+
+    def test_emf_document_per_dimension_set(self, stream):
+        """Test metrics sharing namespace and dimensions share one document."""
+        sink = MetricsSink(stream=stream)
+        sink.put_metric_data(
+            Namespace='AudioTranscription/Buffer',
+            MetricData=[
+                {'MetricName': 'BufferOverflow', 'Value': 1, 'Unit': 'Count',
+                 'Dimensions': [{'Name': 'SessionId', 'Value': 's1'}]},
+                {'MetricName': 'BufferSize', 'Value': 50, 'Unit': 'Count',
+                 'Dimensions': [{'Name': 'SessionId', 'Value': 's1'}]}
+            ]
+        )
+        sink.put_metric_data(
+            Namespace='AudioTranscription/Buffer',
+            MetricData=[{'MetricName': 'BufferOverflow', 'Value': 1, 'Unit': 'Count',
+                         'Dimensions': [{'Name': 'SessionId', 'Value': 's1'}]}]
+        )
+        sink.put_metric('BufferOverflow', 1, dimensions={'SessionId': 's2'},
+                        namespace='AudioTranscription/Buffer')
+
+        sink.flush()
+        documents = emf_documents(stream)
+
+        assert len(documents) == 2
+        first = documents[0]
+        directive = first['_aws']['CloudWatchMetrics'][0]
+        assert directive['Namespace'] == 'AudioTranscription/Buffer'
+        assert directive['Dimensions'] == [['SessionId']]
+        assert directive['Metrics'] == [
+            {'Name': 'BufferOverflow', 'Unit': 'Count'},
+            {'Name': 'BufferSize', 'Unit': 'Count'}
+        ]
+        assert first['SessionId'] == 's1'
+        assert first['BufferOverflow'] == [1.0, 1.0]
+        assert first['BufferSize'] == 50.0
+        assert documents[1]['SessionId'] == 's2'
+
+    def test_values_split_at_emf_limit(self, stream):
+        """Test more than 100 values of a metric span several documents."""
+        sink = MetricsSink(stream=stream)
+        sink.put_metric_data(
+            Namespace='AudioTranscription/Kinesis',
+            MetricData=[{'MetricName': 'DeliveryLatency', 'Values': list(range(250)),
+                         'Unit': 'Milliseconds'}]
+        )
+
+        sink.flush()
+        documents = emf_documents(stream)
+
+        assert [len(d['DeliveryLatency']) for d in documents] == [100, 100, 50]
+
+    def test_counts_expand_values(self, stream):
+        """Test Values/Counts datums keep every sample."""
+        sink = MetricsSink(stream=stream)
+
+        sink.put_metric_data(
+            Namespace='Test',
+            MetricData=[{'MetricName': 'Latency', 'Values': [10, 20], 'Counts': [2, 1]}]
+        )
+
+        assert sink.pending_count == 3
+
+    def test_flush_when_pending_limit_reached(self, stream):
+        """Test a full buffer is written without waiting for the invocation end."""
+        sink = MetricsSink(stream=stream, max_pending_values=3)
+
+        for _ in range(3):
+            sink.put_metric('Violations', 1, namespace='Test')
+
+        assert sink.pending_count == 0
+        assert emf_documents(stream)[0]['Violations'] == [1.0, 1.0, 1.0]
+
+    def test_cloudwatch_backend_batches_requests(self):
+        """Test the CloudWatch backend sends one aggregated request at flush."""
+        cloudwatch = MagicMock()
+        sink = MetricsSink(backend='cloudwatch', cloudwatch_client=cloudwatch)
+        timestamp = datetime(2024, 1, 1, 12, 0, 30)
+        for value in (5, 5, 7):
+            sink.put_metric_data(
+                Namespace='AudioQuality',
+                MetricData=[{'MetricName': 'SNR', 'Value': value, 'Unit': 'None',
+                             'Timestamp': timestamp,
+                             'Dimensions': [{'Name': 'StreamId', 'Value': 's1'}]}]
+            )
+
+        cloudwatch.put_metric_data.assert_not_called()
+        sink.flush()
+
+        cloudwatch.put_metric_data.assert_called_once()
+        datum = cloudwatch.put_metric_data.call_args.kwargs['MetricData'][0]
+        assert datum['Values'] == [5.0, 7.0]
+        assert datum['Counts'] == [2.0, 1.0]
+        assert datum['Dimensions'] == [{'Name': 'StreamId', 'Value': 's1'}]
+        assert datum['Timestamp'] == timestamp
+
+    def test_flush_errors_are_swallowed(self):
+        """Test output failures never reach the caller."""
+        cloudwatch = MagicMock()
+        cloudwatch.put_metric_data.side_effect = Exception('Throttling')
+        sink = MetricsSink(backend='cloudwatch', cloudwatch_client=cloudwatch)
+        sink.put_metric('Errors', 1, namespace='Test')
+
+        assert sink.flush() == 1
+        assert sink.pending_count == 0
+
+    def test_none_backend_discards(self):
+        """Test the 'none' backend keeps nothing."""
+        sink = MetricsSink(backend='none')
+
+        sink.put_metric('Errors', 1)
+
+        assert sink.pending_count == 0
+
+    @pytest.mark.parametrize('kwargs', [
+        {'backend': 'statsd'},
+        {'max_pending_values': 0},
+        {'flush_interval_seconds': 0}
+    ])
+    def test_invalid_configuration(self, kwargs):
+        """Test invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            MetricsSink(**kwargs)
+
+    def test_invalid_datum(self):
+        """Test datums without a value are rejected."""
+        with pytest.raises(ValueError):
+            MetricsSink().put_metric_data(Namespace='Test', MetricData=[{'MetricName': 'X'}])
+
+
+class TestFlushMetricsAfter:
+    """Test suite for the handler decorator."""
+
+    @pytest.fixture
+    def sink(self):
+        """Process-wide sink writing to a buffer."""
+        sink = MetricsSink(stream=io.StringIO())
+        emf_metrics.set_metrics_sink(sink)
+        yield sink
+        emf_metrics.set_metrics_sink(None)
+
+    def test_flushes_on_return(self, sink):
+        """Test metrics of an invocation are written when it returns."""
+        @flush_metrics_after
+        def handler(event, context):
+            emf_metrics.get_metrics_sink().put_metric('Invocations', 1, namespace='Test')
+            return {'statusCode': 200}
+
+        assert handler({}, None) == {'statusCode': 200}
+        assert sink.pending_count == 0
+        assert emf_documents(sink._stream)[0]['Invocations'] == 1.0
+
+    def test_flushes_on_error(self, sink):
+        """Test metrics of a failed invocation are written too."""
+        @flush_metrics_after
+        def handler(event, context):
+            emf_metrics.get_metrics_sink().put_metric('Errors', 1, namespace='Test')
+            raise RuntimeError('boom')
+
+        with pytest.raises(RuntimeError):
+            handler({}, None)
+
+        assert sink.pending_count == 0
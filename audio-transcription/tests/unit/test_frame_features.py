@@ -0,0 +1,122 @@
+"""Unit tests for FrameFeatures."""
+
+import numpy as np
+import pytest
+from audio_quality.analyzers.clipping_detector import ClippingDetector
+from audio_quality.analyzers.echo_detector import EchoDetector
+from audio_quality.analyzers.frame_features import FrameFeatures
+from audio_quality.analyzers.silence_detector import SilenceDetector
+from audio_quality.analyzers.snr_calculator import SNRCalculator
+
+
+@pytest.fixture
+def speech_like():
+    """One second of amplitude-modulated tone with noise, as int16."""
+    rng = np.random.default_rng(7)
+    t = np.arange(16000) / 16000
+    signal = np.sin(2 * np.pi * 220 * t) * (1 + np.sin(2 * np.pi * 3 * t)) * 0.3
+    signal += rng.normal(0, 0.05, len(t))
+    return (np.clip(signal, -1, 1) * 32767).astype(np.int16)
+
+
+class TestFrameFeatures:
+    """Test suite for FrameFeatures."""
+
+    def test_statistics_match_direct_computation(self, speech_like):
+        """Test energy, RMS and peak equal the straightforward numpy results."""
+        features = FrameFeatures.from_chunk(speech_like, 16000)
+        normalized = speech_like.astype(np.float64) / 32768.0
+
+        assert features.is_int16
+        assert features.mean_square == pytest.approx(np.mean(normalized ** 2))
+        assert features.rms == pytest.approx(np.sqrt(np.mean(normalized ** 2)))
+        assert features.peak == pytest.approx(np.max(np.abs(normalized)))
+
+    def test_frame_energy_matches_loop(self, speech_like):
+        """Test the strided frame energy equals a per-frame loop."""
+        features = FrameFeatures.from_chunk(speech_like, 16000)
+        normalized = speech_like.astype(np.float64) / 32768.0
+
+        expected = [np.mean(normalized[i:i + 1600] ** 2) for i in range(0, 16000, 1600)]
+
+        np.testing.assert_allclose(features.frame_energy(1600), expected)
+        assert features.frame_energy(1600) is features.frame_energy(1600)
+        assert len(features.frame_energy(3000)) == 5
+
+    def test_clipped_count_includes_both_polarities(self):
+        """Test samples at the clip level count, including int16 minimum."""
+        audio = np.array([32111, -32111, -32768, 32110, 0], dtype=np.int16)
+
+        features = FrameFeatures.from_chunk(audio, 16000, clip_level=32111)
+
+        assert features.clipped_count == 3
+
+    def test_float_input_not_rescaled(self):
+        """Test normalized float input is used as is."""
+        audio = np.array([0.5, -0.5, 0.5, -0.5])
+
+        features = FrameFeatures.from_chunk(audio, 16000, clip_level=32111)
+
+        assert not features.is_int16
+        assert features.rms == pytest.approx(0.5)
+        assert features.clipped_count == 0
+
+    def test_detectors_agree_with_and_without_features(self, speech_like):
+        """Test each detector gives the same result from shared features."""
+        features = FrameFeatures.from_chunk(speech_like, 16000, clip_level=32111)
+
+        assert SNRCalculator().calculate_snr(speech_like, features=features) == pytest.approx(
+            SNRCalculator().calculate_snr(speech_like)
+        )
+        assert SilenceDetector().detect_silence(speech_like, 1.0, features=features) == \
+            SilenceDetector().detect_silence(speech_like, 1.0)
+        assert ClippingDetector().detect_clipping(speech_like, features=features) == \
+            ClippingDetector().detect_clipping(speech_like)
+        with_features = EchoDetector().detect_echo(speech_like, 16000, features=features)
+        without = EchoDetector().detect_echo(speech_like, 16000)
+        assert with_features.echo_level_db == pytest.approx(without.echo_level_db)
+        assert with_features.delay_ms == without.delay_ms
+
+    @pytest.mark.parametrize('audio, sample_rate', [
+        (np.array([], dtype=np.int16), 16000),
+        (np.zeros((2, 2), dtype=np.int16), 16000),
+        (np.zeros(10, dtype=np.int16), 0)
+    ])
+    def test_invalid_input(self, audio, sample_rate):
+        """Test empty, multi-channel and rate-less input is rejected."""
+        with pytest.raises(ValueError):
+            FrameFeatures.from_chunk(audio, sample_rate)
+
+    @pytest.mark.parametrize('lengths', [[4096] * 5, [4096, 1000, 16000, 3]])
+    def test_batch_matches_single_chunks(self, lengths):
+        """Test batch features equal per-chunk features for equal and ragged lengths."""
+        rng = np.random.default_rng(3)
+        chunks = [(rng.normal(0, 0.4, n).clip(-1, 1) * 32767).astype(np.int16) for n in lengths]
+        chunks[0][10] = -32768
+
+        batch = FrameFeatures.from_batch(chunks, [16000] * len(chunks), clip_level=32111)
+
+        for chunk, features in zip(chunks, batch):
+            single = FrameFeatures.from_chunk(chunk, 16000, clip_level=32111)
+            np.testing.assert_array_equal(features.samples, single.samples)
+            assert features.mean_square == pytest.approx(single.mean_square)
+            assert features.peak == single.peak
+            assert features.clipped_count == single.clipped_count
+
+    def test_batch_mixed_dtypes(self):
+        """Test int16 and float chunks in one batch are normalized separately."""
+        chunks = [np.array([16384, -16384], dtype=np.int16), np.array([0.25, -0.5])]
+
+        pcm, normalized = FrameFeatures.from_batch(chunks, [16000, 8000])
+
+        assert pcm.is_int16 and pcm.peak == pytest.approx(0.5)
+        assert not normalized.is_int16 and normalized.peak == pytest.approx(0.5)
+        assert normalized.sample_rate == 8000
+
+    def test_batch_invalid_input(self):
+        """Test empty chunks and mismatched rates are rejected."""
+        assert FrameFeatures.from_batch([], []) == []
+        with pytest.raises(ValueError):
+            FrameFeatures.from_batch([np.zeros(4, dtype=np.int16)], [16000, 16000])
+        with pytest.raises(ValueError):
+            FrameFeatures.from_batch([np.zeros(0, dtype=np.int16)], [16000])
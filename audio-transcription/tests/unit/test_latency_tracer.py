@@ -0,0 +1,129 @@
+"""
+Unit tests for latency tracer.
+"""
+
+import asyncio
+import time
+import pytest
+from shared.services import latency_tracer
+
+
+def run(coro):
+    """Run coroutine on a fresh event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+class TestSpans:
+    """Test suite for span recording."""
+
+    def test_span_without_trace_is_noop(self):
+        """Test instrumented code runs untraced outside an invocation."""
+        async def untraced():
+            with latency_tracer.span('translate') as opened:
+                return opened
+
+        assert run(untraced()) is None
+
+    def test_spans_nest_and_inherit_attributes(self):
+        """Test child spans get the parent's session attribute."""
+        async def traced():
+            trace = latency_tracer.start_trace('batch')
+            with latency_tracer.span('session', session='s1'):
+                with latency_tracer.span('language', language='es') as language_span:
+                    pass
+            return trace, language_span
+
+        trace, language_span = run(traced())
+
+        assert language_span.parent.name == 'session'
+        assert language_span.attributes == {'session': 's1', 'language': 'es'}
+        assert language_span.end is not None
+
+    def test_concurrent_tasks_nest_under_their_own_span(self):
+        """Test spans opened in gathered tasks do not cross sessions."""
+        async def session(session_id):
+            with latency_tracer.span('session', session=session_id):
+                await asyncio.sleep(0.01)
+                with latency_tracer.span('transcribe') as opened:
+                    await asyncio.sleep(0.01)
+                return opened
+
+        async def traced():
+            latency_tracer.start_trace('batch')
+            return await asyncio.gather(session('s1'), session('s2'))
+
+        first, second = run(traced())
+
+        assert first.attributes['session'] == 's1'
+        assert second.attributes['session'] == 's2'
+        assert first.parent is not second.parent
+
+    def test_explicit_parent(self):
+        """Test work started from a callback can attach to another span."""
+        async def traced():
+            latency_tracer.start_trace('batch')
+            with latency_tracer.span('session', session='s1'):
+                session_span = latency_tracer.current_span()
+                with latency_tracer.span('transcribe'):
+                    with latency_tracer.span('segment', parent=session_span) as segment:
+                        pass
+            return segment
+
+        assert run(traced()).parent.name == 'session'
+
+
+class TestSummary:
+    """Test suite for trace summaries."""
+
+    def test_critical_path_follows_last_finishing_chain(self):
+        """Test the slow session's stages make up the critical path."""
+        async def session(session_id, transcribe_seconds):
+            with latency_tracer.span('session', session=session_id):
+                with latency_tracer.span('transcribe'):
+                    await asyncio.sleep(transcribe_seconds)
+                with latency_tracer.span('tts'):
+                    await asyncio.sleep(0.01)
+
+        async def traced():
+            trace = latency_tracer.start_trace('batch')
+            await asyncio.gather(session('fast', 0.01), session('slow', 0.05))
+            trace.finish(sessionCount=2)
+            return trace
+
+        summary = run(traced()).summary()
+
+        assert [step['stage'] for step in summary['criticalPath']] == ['transcribe', 'tts']
+        assert {step['session'] for step in summary['criticalPath']} == {'slow'}
+        breakdown = summary['criticalPathBreakdownMs']
+        assert breakdown['transcribe'] >= 50
+        assert sum(breakdown.values()) == pytest.approx(summary['durationMs'], abs=1.0)
+        assert summary['sessionCount'] == 2
+
+    def test_stage_and_attribute_totals(self):
+        """Test stages are aggregated and sessions ranked by duration."""
+        trace = latency_tracer.InvocationTrace('batch', max_values_per_attribute=1)
+        for session_id, seconds in (('s1', 0.001), ('s2', 0.02)):
+            with latency_tracer.span('session', parent=trace.root, session=session_id):
+                time.sleep(seconds)
+        trace.finish()
+
+        summary = trace.summary()
+
+        assert summary['stages']['session']['count'] == 2
+        assert list(summary['slowestBy']['session']) == ['s2']
+        assert summary['spanCount'] == 2
+
+    def test_empty_trace(self):
+        """Test a trace without spans summarizes to its own duration."""
+        trace = latency_tracer.InvocationTrace('batch')
+        trace.finish()
+
+        summary = trace.summary()
+
+        assert summary['criticalPath'] == []
+        assert summary['criticalPathBreakdownMs']['other'] == summary['durationMs']
+
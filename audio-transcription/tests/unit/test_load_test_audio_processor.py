@@ -0,0 +1,102 @@
+"""
+Unit tests for the offline audio processor load test harness.
+
+The harness is a script (scripts/load_test_audio_processor.py), so it is
+loaded from its file path.
+"""
+
+import base64
+import importlib.util
+import os
+import pytest
+
+from shared.services.aws_client_registry import get_client_registry
+from shared.services.pcm_batch_assembler import read_record_header
+from shared.utils.emf_metrics import set_metrics_sink
+
+_SCRIPT_PATH = os.path.join(
+    os.path.dirname(__file__), '../../scripts/load_test_audio_processor.py'
+)
+_spec = importlib.util.spec_from_file_location('load_test_audio_processor', _SCRIPT_PATH)
+load_test = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(load_test)
+
+
+class TestLatencyModel:
+    """Test suite for latency specs."""
+
+    def test_fixed_and_none(self):
+        """Test constant latencies are returned in seconds."""
+        assert load_test.LatencyModel('fixed:250').sample() == pytest.approx(0.25)
+        assert load_test.LatencyModel('none').sample() == 0.0
+
+    def test_distributions_within_bounds(self):
+        """Test sampled latencies follow the spec."""
+        uniform = load_test.LatencyModel('uniform:10:20', seed=1)
+        lognormal = load_test.LatencyModel('lognormal:100:0.5', seed=1)
+
+        assert all(0.01 <= uniform.sample() <= 0.02 for _ in range(100))
+        assert all(lognormal.sample() > 0 for _ in range(100))
+
+    @pytest.mark.parametrize('spec', ['bogus', 'uniform:10', 'fixed:1:2', 'lognormal:-1:2'])
+    def test_invalid_spec(self, spec):
+        """Test malformed specs are rejected."""
+        with pytest.raises(ValueError):
+            load_test.LatencyModel(spec)
+
+
+class TestKinesisEventGenerator:
+    """Test suite for synthetic Kinesis events."""
+
+    def test_records_numbered_across_batches(self):
+        """Test chunk indices and sequence numbers continue between batches."""
+        generator = load_test.KinesisEventGenerator(['s1', 's2'], batch_seconds=1.0, record_ms=250)
+
+        first = generator.next_event()['Records']
+        second = generator.next_event()['Records']
+
+        assert len(first) == 8
+        s1_chunks = [
+            read_record_header(r['kinesis']['data'])[1]
+            for r in first + second if r['kinesis']['partitionKey'] == 's1'
+        ]
+        assert s1_chunks == list(range(8))
+        sequence_numbers = [int(r['kinesis']['sequenceNumber']) for r in first + second]
+        assert sequence_numbers == sorted(set(sequence_numbers))
+        # 250 ms of 16 kHz 16-bit audio plus the 12-byte header
+        assert len(base64.b64decode(first[0]['kinesis']['data'])) == 8012
+
+
+class TestRunLoadTest:
+    """Smoke tests running the harness against the handler."""
+
+    @pytest.fixture
+    def args(self, monkeypatch):
+        """Small load with no fake latency; restores the environment, clients and metrics sink."""
+        for name in ('SESSIONS_TABLE_NAME', 'CONNECTIONS_TABLE', 'API_GATEWAY_ENDPOINT'):
+            monkeypatch.delenv(name, raising=False)
+        args = load_test.build_parser().parse_args([
+            '--sessions', '2', '--languages', '2', '--listeners', '2',
+            '--batch-seconds', '2', '--batches', '2', '--warmup-batches', '1',
+            '--transcribe-connect-latency', 'none', '--transcribe-latency', 'none',
+            '--translate-latency', 'none', '--polly-latency', 'none',
+            '--s3-latency', 'none', '--dynamodb-latency', 'none', '--apigw-latency', 'none'
+        ])
+        yield args
+        get_client_registry().reset()
+        set_metrics_sink(None)
+
+    @pytest.mark.parametrize('mode', ['warm', 'one-shot'])
+    def test_report(self, args, mode):
+        """Test every stage is timed and every listener is notified."""
+        args.transcribe_mode = mode
+
+        report = load_test.run_load_test(args)
+
+        assert report['endToEnd']['count'] == 2
+        assert report['throughput']['failedRecords'] == 0
+        assert {'transcribe', 'translate', 'tts', 'notify', 'session'} <= set(report['stages'])
+        assert report['calls']['translate'] > 0
+        # Every translated segment reaches both listeners of its language
+        assert report['calls']['apigw'] >= 2 * report['calls']['translate']
+        assert report['allocations']['peakPerInvocationMiB']['max'] > 0
@@ -0,0 +1,58 @@
+"""Unit tests for NoiseFloorTracker."""
+
+import pytest
+from audio_quality.analyzers.noise_floor_tracker import (
+    QUANTIZATION_NOISE_POWER,
+    NoiseFloorTracker
+)
+
+
+class TestNoiseFloorTracker:
+    """Test suite for NoiseFloorTracker."""
+    
+    def test_floor_ignores_speech_bursts(self):
+        """Test loud frames between pauses do not raise the floor."""
+        tracker = NoiseFloorTracker(window_frames=16, subwindows=4, smoothing=0.0, bias=1.0)
+        
+        for power in [1e-4, 1e-4, 0.1, 0.1, 0.1, 0.1] * 4:
+            noise_power = tracker.update(power)
+        
+        assert noise_power == pytest.approx(1e-4)
+    
+    def test_floor_rises_after_window(self):
+        """Test a higher noise level replaces the old minimum after one window."""
+        tracker = NoiseFloorTracker(window_frames=8, subwindows=4, smoothing=0.0, bias=1.0)
+        for _ in range(8):
+            tracker.update(1e-4)
+        
+        powers = [tracker.update(1e-2) for _ in range(10)]
+        
+        assert powers[0] == pytest.approx(1e-4)
+        assert powers[-1] == pytest.approx(1e-2)
+    
+    def test_floor_falls_immediately(self):
+        """Test a quieter frame lowers the floor at once."""
+        tracker = NoiseFloorTracker(smoothing=0.0, bias=1.0)
+        tracker.update(1e-2)
+        
+        assert tracker.update(1e-4) == pytest.approx(1e-4)
+    
+    def test_bias_and_minimum(self):
+        """Test the bias is applied and the floor never drops below quantization noise."""
+        tracker = NoiseFloorTracker(smoothing=0.0, bias=1.5)
+        
+        assert tracker.noise_power is None
+        assert tracker.update(1e-4) == pytest.approx(1.5e-4)
+        assert tracker.update(0.0) == QUANTIZATION_NOISE_POWER
+        assert tracker.frames_seen == 2
+    
+    @pytest.mark.parametrize('kwargs', [
+        {'window_frames': 4, 'subwindows': 8},
+        {'subwindows': 0},
+        {'smoothing': 1.0},
+        {'bias': 0.5}
+    ])
+    def test_invalid_parameters(self, kwargs):
+        """Test invalid configuration is rejected."""
+        with pytest.raises(ValueError):
+            NoiseFloorTracker(**kwargs)
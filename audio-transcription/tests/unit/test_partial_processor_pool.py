@@ -0,0 +1,177 @@
+"""
+Unit tests for partial processor pool.
+"""
+
+import time
+import pytest
+from shared.models.configuration import PartialResultConfig
+from shared.models.transcription_results import PartialResult
+from shared.services.partial_processor_pool import (
+    PROCESSOR_BASE_BYTES,
+    PartialProcessorPool,
+    estimate_processor_bytes
+)
+from shared.services.partial_result_processor import PartialResultProcessor
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def create_processor(session_id, source_language):
+    """Create a real processor with default configuration."""
+    return PartialResultProcessor(
+        config=PartialResultConfig(),
+        session_id=session_id,
+        source_language=source_language
+    )
+
+
+class TestPartialProcessorPool:
+    """Test suite for PartialProcessorPool."""
+
+    @pytest.fixture
+    def clock(self):
+        """Fake time source."""
+        return FakeClock()
+
+    @pytest.fixture
+    def pool(self, clock):
+        """Pool of up to 3 processors idling out after 300 seconds."""
+        return PartialProcessorPool(
+            factory=create_processor, max_processors=3, idle_timeout_seconds=300, clock=clock
+        )
+
+    def test_one_processor_per_session(self, pool):
+        """Test sessions get separate, reused processors."""
+        first = pool.get('s1', 'en')
+        second = pool.get('s2', 'en')
+
+        assert first is not second
+        assert pool.get('s1', 'en') is first
+        assert first.rate_limiter is not second.rate_limiter
+        assert first.result_buffer is not second.result_buffer
+        assert pool.created_count == 2
+
+    def test_results_do_not_leak_across_sessions(self, pool):
+        """Test a partial buffered for one session is not in another's buffer."""
+        first = pool.get('s1', 'en')
+        second = pool.get('s2', 'en')
+
+        first.result_buffer.add(PartialResult(
+            result_id='r1', text='hello everyone', stability_score=0.9,
+            timestamp=time.time(), session_id='s1', source_language='en'
+        ))
+
+        assert first.result_buffer.size() == 1
+        assert second.result_buffer.size() == 0
+
+    def test_language_change_replaces_processor(self, pool):
+        """Test a processor is recreated for a new source language."""
+        first = pool.get('s1', 'en')
+
+        assert pool.get('s1', 'es') is not first
+        assert pool.size() == 1
+
+    def test_idle_processors_evicted(self, pool, clock):
+        """Test processors unused for the idle timeout are dropped."""
+        pool.get('s1', 'en')
+        clock.now += 200
+        pool.get('s2', 'en')
+        clock.now += 150
+
+        assert pool.evict_idle() == 1
+        assert 's1' not in pool
+        assert 's2' in pool
+
+    def test_touched_processor_survives_idle_timeout(self, pool, clock):
+        """Test a processor held by a long-lived stream stays pooled while touched."""
+        processor = pool.get('stream', 'en')
+        for _ in range(10):  # 10 minutes of audio, one chunk per minute
+            clock.now += 60
+            assert pool.touch('stream')
+
+        pool.get('other', 'en')
+
+        assert 'stream' in pool
+        assert pool.get('stream', 'en') is processor
+        assert pool.evicted_count == 0
+        assert not pool.touch('unknown')
+
+    def test_touch_refreshes_memory_estimate(self, pool):
+        """Test touch() accounts for results buffered since the processor was fetched."""
+        processor = pool.get('s1', 'en')
+        processor.result_buffer.add(PartialResult(
+            result_id='r1', text='x' * 1000, stability_score=0.9,
+            timestamp=time.time(), session_id='s1', source_language='en'
+        ))
+
+        pool.touch('s1')
+
+        assert pool.memory_bytes == estimate_processor_bytes(processor) > PROCESSOR_BASE_BYTES
+
+    def test_lru_eviction_at_cap(self, pool, clock):
+        """Test the least recently used processor is evicted when full."""
+        for session_id in ('s1', 's2', 's3'):
+            pool.get(session_id, 'en')
+            clock.now += 1
+        pool.get('s1', 'en')
+
+        pool.get('s4', 'en')
+
+        assert 's2' not in pool
+        assert pool.size() == 3
+        assert pool.evicted_count == 1
+
+    def test_memory_budget(self, clock):
+        """Test processors are evicted when the memory estimate exceeds the budget."""
+        pool = PartialProcessorPool(
+            factory=create_processor,
+            max_memory_bytes=2 * PROCESSOR_BASE_BYTES,
+            clock=clock
+        )
+
+        for session_id in ('s1', 's2', 's3'):
+            pool.get(session_id, 'en')
+
+        assert pool.size() == 2
+        assert 's1' not in pool
+        assert pool.memory_bytes == 2 * PROCESSOR_BASE_BYTES
+
+    def test_remove_releases_memory(self, pool):
+        """Test removing a session's processor updates the accounting."""
+        processor = pool.get('s1', 'en')
+
+        assert pool.remove('s1') is processor
+        assert pool.remove('s1') is None
+        assert pool.get_statistics() == {
+            'processors': 0, 'memory_bytes': 0, 'created': 1, 'evicted': 0
+        }
+
+    def test_estimate_grows_with_buffered_results(self):
+        """Test buffered text is part of the memory estimate."""
+        processor = create_processor('s1', 'en')
+        empty = estimate_processor_bytes(processor)
+
+        processor.result_buffer.add(PartialResult(
+            result_id='r1', text='x' * 1000, stability_score=0.9,
+            timestamp=time.time(), session_id='s1', source_language='en'
+        ))
+
+        assert estimate_processor_bytes(processor) > empty + 1000
+
+    @pytest.mark.parametrize('kwargs', [
+        {'max_processors': 0},
+        {'idle_timeout_seconds': 0},
+        {'max_memory_bytes': 0}
+    ])
+    def test_invalid_configuration(self, kwargs):
+        """Test invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            PartialProcessorPool(factory=create_processor, **kwargs)
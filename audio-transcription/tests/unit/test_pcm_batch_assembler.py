@@ -0,0 +1,206 @@
+"""
+Unit tests for PCM batch assembler.
+"""
+
+import base64
+import binascii
+import numpy as np
+import pytest
+from shared.services.pcm_batch_assembler import (
+    AUDIO_RECORD_HEADER,
+    AUDIO_RECORD_MAGIC,
+    PCMBatchAssembler,
+    decoded_length,
+    read_record_header
+)
+
+
+def encode(data):
+    """Base64-encode bytes as a Kinesis record payload."""
+    return base64.b64encode(data).decode('ascii')
+
+
+def encode_numbered(data, chunk_index, stream_id=7):
+    """Base64-encode bytes with an audio record header."""
+    return encode(AUDIO_RECORD_HEADER.pack(AUDIO_RECORD_MAGIC, stream_id, chunk_index) + data)
+
+
+class TestDecodedLength:
+    """Test suite for decoded_length."""
+
+    @pytest.mark.parametrize('size', [0, 1, 2, 3, 4, 5, 1023, 3200])
+    def test_matches_decoded_size(self, size):
+        """Test length is exact for canonical base64 of any padding."""
+        data = bytes(range(256)) * (size // 256 + 1)
+        assert decoded_length(encode(data[:size])) == size
+
+
+class TestReadRecordHeader:
+    """Test suite for read_record_header."""
+
+    def test_numbered_record(self):
+        """Test the stream ID and chunk index are read from the header."""
+        assert read_record_header(encode_numbered(b'\x01\x00' * 100, 41)) == (7, 41)
+
+    def test_plain_pcm_record(self):
+        """Test records without the magic are plain PCM."""
+        assert read_record_header(encode(b'\x01\x00' * 100)) is None
+        assert read_record_header(encode(b'\x01\x00')) is None
+
+
+class TestPCMBatchAssembler:
+    """Test suite for PCMBatchAssembler."""
+
+    def test_records_grouped_by_session_in_order(self):
+        """Test records are concatenated per session in arrival order."""
+        assembler = PCMBatchAssembler()
+        assembler.add_record('session-a', encode(b'\x01\x00'))
+        assembler.add_record('session-b', encode(b'\x09\x00'))
+        assembler.add_record('session-a', encode(b'\x02\x00\x03\x00'))
+
+        batches = assembler.build_all()
+
+        assert list(batches) == ['session-a', 'session-b']
+        assert bytes(batches['session-a'].data) == b'\x01\x00\x02\x00\x03\x00'
+        assert batches['session-a'].record_count == 2
+        assert assembler.record_count == 3
+
+    def test_buffer_sized_exactly(self):
+        """Test the buffer is allocated once at the decoded size."""
+        assembler = PCMBatchAssembler()
+        chunks = [b'\x00\x01' * 1600, b'\x02\x03' * 801, b'\x04']
+        for chunk in chunks:
+            assembler.add_record('session-a', encode(chunk))
+
+        batch = assembler.build('session-a')
+
+        assert len(batch) == sum(len(c) for c in chunks)
+        assert len(batch._buffer) == len(batch)
+        assert batch.data.tobytes() == b''.join(chunks)
+
+    def test_invalid_base64_raises(self):
+        """Test a corrupt record is reported."""
+        assembler = PCMBatchAssembler()
+        assembler.add_record('session-a', 'abc')
+
+        with pytest.raises(binascii.Error):
+            assembler.build('session-a')
+
+    def test_records_after_sequence_number(self):
+        """Test delivered records are left out of the batch."""
+        assembler = PCMBatchAssembler()
+        assembler.add_record('session-a', encode(b'\x01\x00'), '98')
+        assembler.add_record('session-a', encode(b'\x02\x00'), '99')
+        assembler.add_record('session-a', encode(b'\x03\x00'), '100')
+
+        batch = assembler.build('session-a', after_sequence_number='99')
+
+        assert bytes(batch.data) == b'\x03\x00'
+        assert batch.record_count == 1
+        assert (batch.first_sequence_number, batch.last_sequence_number) == ('100', '100')
+        assert assembler.first_sequence_number('session-a') == '98'
+
+    def test_all_records_delivered(self):
+        """Test a fully delivered session builds an empty batch."""
+        assembler = PCMBatchAssembler()
+        assembler.add_record('session-a', encode(b'\x01\x00'), '5')
+
+        batch = assembler.build('session-a', after_sequence_number='5')
+
+        assert batch.record_count == 0
+        assert len(batch) == 0
+        assert batch.last_sequence_number is None
+
+    def test_prefix_placed_before_records(self):
+        """Test carried-over audio shares the preallocated buffer."""
+        assembler = PCMBatchAssembler()
+        assembler.add_record('session-a', encode(b'\x02\x00'), '1')
+
+        batch = assembler.build('session-a', prefix=b'\x01\x00')
+
+        assert bytes(batch.data) == b'\x01\x00\x02\x00'
+        assert len(batch._buffer) == 4
+        assert batch.prefix_length == 2
+        assert batch.record_count == 1
+
+    def test_record_header_not_in_audio(self):
+        """Test numbered records contribute only their audio."""
+        assembler = PCMBatchAssembler()
+        assembler.add_record('session-a', encode_numbered(b'\x01\x00', 0), '1')
+        assembler.add_record('session-a', encode(b'\x02\x00'), '2')
+
+        batch = assembler.build('session-a')
+
+        assert bytes(batch.data) == b'\x01\x00\x02\x00'
+        assert len(batch._buffer) == 4
+        assert [r.chunk_index for r in assembler.records('session-a')] == [0, None]
+
+    def test_unknown_session_raises(self):
+        """Test building a session without records fails."""
+        with pytest.raises(KeyError):
+            PCMBatchAssembler().build('missing')
+
+
+class TestPCMBatch:
+    """Test suite for PCMBatch views."""
+
+    @pytest.fixture
+    def batch(self):
+        """Batch of one second of 16 kHz audio with a ramp signal."""
+        samples = np.arange(16000, dtype=np.int16)
+        assembler = PCMBatchAssembler(sample_rate=16000)
+        assembler.add_record('session-a', encode(samples[:8000].tobytes()))
+        assembler.add_record('session-a', encode(samples[8000:].tobytes()))
+        return assembler.build('session-a')
+
+    def test_duration(self, batch):
+        """Test duration is derived from 16-bit mono audio."""
+        assert batch.duration_seconds == pytest.approx(1.0)
+
+    def test_frames_are_views(self, batch):
+        """Test frames slice the batch without copying."""
+        frames = list(batch.frames(16384))
+
+        assert [len(f) for f in frames] == [16384, 15616]
+        assert all(isinstance(f, memoryview) for f in frames)
+        assert all(f.obj is batch._buffer for f in frames)
+        assert b''.join(frames) == batch.tobytes()
+
+    def test_frames_reject_invalid_size(self, batch):
+        """Test frame size must be positive."""
+        with pytest.raises(ValueError):
+            list(batch.frames(0))
+
+    def test_samples_are_shared_read_only_view(self, batch):
+        """Test analysis gets one read-only int16 view over the buffer."""
+        samples = batch.samples
+
+        assert samples is batch.samples
+        assert samples.dtype == np.int16
+        assert np.array_equal(samples, np.arange(16000, dtype=np.int16))
+        assert np.shares_memory(samples, np.frombuffer(batch._buffer, dtype=np.uint8))
+        with pytest.raises(ValueError):
+            samples[0] = 1
+
+    def test_head_shares_buffer(self, batch):
+        """Test head() truncates without copying."""
+        head = batch.head(4)
+
+        assert len(head) == 4
+        assert head._buffer is batch._buffer
+        assert head.samples.tolist() == batch.samples[:2].tolist()
+
+    def test_data_is_read_only(self, batch):
+        """Test consumers cannot modify the shared audio."""
+        with pytest.raises(TypeError):
+            batch.data[0] = 1
+
+    def test_odd_trailing_byte_excluded_from_samples(self):
+        """Test an odd byte count does not break the int16 view."""
+        assembler = PCMBatchAssembler()
+        assembler.add_record('session-a', encode(b'\x01\x00\x02'))
+
+        batch = assembler.build('session-a')
+
+        assert len(batch) == 3
+        assert batch.samples.tolist() == [1]
@@ -346,3 +346,131 @@ class TestAudioQualityAnalyzer:
         # Metrics should be different (different audio)
         assert metrics1.snr_db != metrics2.snr_db
         assert metrics1.stream_id != metrics2.stream_id
+    
+    def test_analyze_batch_matches_per_stream_analyze(self, clean_audio, noisy_audio, clipped_audio):
+        """Test batch results equal analyzing each stream with its own analyzer."""
+        chunks = {'clean': clean_audio, 'noisy': noisy_audio, 'clipped': clipped_audio}
+        batch_analyzer = AudioQualityAnalyzer()
+        
+        batch = batch_analyzer.analyze_batch(chunks, sample_rate=16000, timestamp=10.0)
+        
+        assert list(batch) == ['clean', 'noisy', 'clipped']
+        for stream_id, chunk in chunks.items():
+            single = AudioQualityAnalyzer().analyze(chunk, 16000, stream_id, timestamp=10.0)
+            assert batch[stream_id].stream_id == stream_id
+            assert batch[stream_id].snr_db == pytest.approx(single.snr_db)
+            assert batch[stream_id].clipped_sample_count == single.clipped_sample_count
+            assert batch[stream_id].echo_level_db == pytest.approx(single.echo_level_db)
+            assert batch[stream_id].energy_db == pytest.approx(single.energy_db)
+    
+    def test_analyze_batch_keeps_state_per_stream(self):
+        """Test silence duration accumulates per stream across batches."""
+        analyzer = AudioQualityAnalyzer()
+        silence = np.zeros(16000, dtype=np.int16)
+        speech = (np.sin(2 * np.pi * 220 * np.arange(16000) / 16000) * 0.3 * 32767).astype(np.int16)
+        
+        for second in range(6):
+            metrics = analyzer.analyze_batch(
+                {'quiet': silence, 'talking': speech}, sample_rate=16000, timestamp=float(second)
+            )
+        
+        assert metrics['quiet'].is_silent
+        assert metrics['quiet'].silence_duration_s >= 5.0
+        assert not metrics['talking'].is_silent
+        assert analyzer.release_stream('quiet')
+        assert not analyzer.release_stream('quiet')
+    
+    def test_analyze_batch_per_stream_sample_rates(self):
+        """Test chunks of different lengths and sample rates in one batch."""
+        analyzer = AudioQualityAnalyzer()
+        chunks = {
+            'narrowband': (np.random.randn(4000) * 0.1 * 32767).astype(np.int16),
+            'wideband': (np.random.randn(24000) * 0.1 * 32767).astype(np.int16)
+        }
+        
+        batch = analyzer.analyze_batch(chunks, sample_rate={'narrowband': 8000, 'wideband': 48000})
+        
+        assert set(batch) == {'narrowband', 'wideband'}
+        with pytest.raises(ValueError):
+            analyzer.analyze_batch(chunks, sample_rate={'wideband': 48000})
+    
+    def test_analyze_batch_evicts_least_recent_stream(self, clean_audio):
+        """Test per-stream state is capped at max_streams."""
+        analyzer = AudioQualityAnalyzer(max_streams=2)
+        
+        analyzer.analyze_batch({'a': clean_audio, 'b': clean_audio}, sample_rate=16000)
+        analyzer.analyze_batch({'a': clean_audio, 'c': clean_audio}, sample_rate=16000)
+        
+        assert not analyzer.release_stream('b')
+        assert analyzer.release_stream('a')
+        assert analyzer.release_stream('c')
+    
+    def test_adaptive_cadence_reuses_costly_results(self, clean_audio):
+        """Test echo and SNR results are reused between scheduled runs."""
+        config = QualityConfig(adaptive_cadence=True, echo_update_interval_s=1.0)
+        analyzer = AudioQualityAnalyzer(config)
+        chunks = np.split(clean_audio, 4)
+        
+        metrics = [analyzer.analyze(c, 16000, 's', timestamp=i) for i, c in enumerate(chunks)]
+        
+        stats = analyzer.scheduler_stats('s')
+        assert (stats.echo_runs, stats.echo_skipped) == (1, 3)
+        assert stats.snr_skipped > 0
+        assert len({m.echo_level_db for m in metrics}) == 1
+        assert [m.timestamp for m in metrics] == [0, 1, 2, 3]
+    
+    def test_analyze_keeps_cadence_per_stream(self, clean_audio):
+        """Test streams sharing one analyzer do not share their cadence."""
+        analyzer = AudioQualityAnalyzer(QualityConfig(adaptive_cadence=True))
+        chunk = clean_audio[:4000]
+        
+        analyzer.analyze(chunk, 16000, 'a', timestamp=0)
+        analyzer.analyze(chunk, 16000, 'a', timestamp=1)
+        analyzer.analyze(chunk, 16000, 'b', timestamp=1)
+        
+        assert analyzer.scheduler_stats('a').chunks == 2
+        assert analyzer.scheduler_stats('b').echo_runs == 1
+        assert analyzer.scheduler_stats('a').chunks == 0
+        assert analyzer.scheduler_stats('unknown') is None
+    
+    def test_analyze_keeps_incremental_snr_per_stream(self):
+        """Test a shared analyzer tracks one noise floor per stream."""
+        rng = np.random.default_rng(0)
+        t = np.arange(16000) / 16000
+        bursts = np.sin(2 * np.pi * 440 * t) * 0.3 * (np.sin(2 * np.pi * 2 * t) > 0)
+        
+        def speech(noise_level):
+            audio = bursts + rng.normal(0, noise_level, len(t))
+            return (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
+        
+        quiet, noisy = speech(0.001), speech(0.05)
+        config = QualityConfig(snr_incremental=True)
+        shared = AudioQualityAnalyzer(config)
+        
+        for i in range(3):
+            shared.analyze(quiet, 16000, 'quiet', timestamp=i)
+        mixed = shared.analyze(noisy, 16000, 'noisy', timestamp=3)
+        alone = AudioQualityAnalyzer(config).analyze(noisy, 16000, 'noisy', timestamp=3)
+        
+        assert mixed.snr_db == pytest.approx(alone.snr_db)
+    
+    def test_adaptive_cadence_off_by_default(self, default_analyzer):
+        """Test the scheduler is only created with adaptive_cadence."""
+        assert default_analyzer.scheduler is None
+        assert default_analyzer.stream_scheduler_stats() == {}
+    
+    def test_analyze_batch_scheduler_stats_per_stream(self, clean_audio):
+        """Test each batch stream has its own cadence and stats."""
+        analyzer = AudioQualityAnalyzer(QualityConfig(adaptive_cadence=True))
+        
+        analyzer.analyze_batch({'a': clean_audio[:4000], 'b': clean_audio[:4000]}, sample_rate=16000)
+        analyzer.analyze_batch({'a': clean_audio[:4000]}, sample_rate=16000)
+        
+        stats = analyzer.stream_scheduler_stats()
+        assert stats['a'].chunks == 2 and stats['b'].chunks == 1
+        assert analyzer.stream_scheduler_stats()['a'].chunks == 0
+    
+    def test_invalid_cadence_config_fails(self):
+        """Test a negative CPU budget is rejected."""
+        with pytest.raises(ValueError):
+            AudioQualityAnalyzer(QualityConfig(analysis_cpu_budget=-0.1))
@@ -0,0 +1,129 @@
+"""
+Unit tests for record reorder window.
+"""
+
+import pytest
+from shared.services.pcm_batch_assembler import AudioRecord
+from shared.services.record_reorder_window import RecordReorderWindow
+
+
+def numbered(chunk_index, sequence_number, stream_id=7):
+    """Create a record with a chunk header."""
+    return AudioRecord(
+        data_b64='',
+        sequence_number=str(sequence_number),
+        stream_id=stream_id,
+        chunk_index=chunk_index
+    )
+
+
+def plain(sequence_number):
+    """Create a plain PCM record."""
+    return AudioRecord(data_b64='', sequence_number=str(sequence_number))
+
+
+class TestRecordReorderWindow:
+    """Test suite for RecordReorderWindow."""
+
+    def test_chunks_ordered_by_index(self):
+        """Test out-of-order chunks are put back in order."""
+        window = RecordReorderWindow()
+
+        selection = window.select('session-1', [numbered(2, 101), numbered(0, 102), numbered(1, 103)])
+
+        assert [r.chunk_index for r in selection.records] == [0, 1, 2]
+        assert selection.dropped_count == 0
+
+    def test_duplicate_chunks_dropped(self):
+        """Test a chunk written twice by the producer is used once."""
+        window = RecordReorderWindow()
+
+        selection = window.select('session-1', [numbered(0, 101), numbered(1, 102), numbered(1, 103)])
+
+        assert [r.sequence_number for r in selection.records] == ['101', '102']
+        assert selection.dropped_count == 1
+
+    def test_processed_chunks_dropped_in_later_batch(self):
+        """Test chunks at or below the committed chunk are dropped."""
+        window = RecordReorderWindow()
+        window.commit('session-1', window.select('session-1', [numbered(0, 101), numbered(1, 102)]))
+
+        selection = window.select('session-1', [numbered(1, 103), numbered(2, 104)])
+
+        assert [r.chunk_index for r in selection.records] == [2]
+        assert selection.dropped_count == 1
+
+    def test_select_does_not_commit(self):
+        """Test a failed batch is accepted again on retry."""
+        window = RecordReorderWindow()
+        records = [numbered(0, 101), numbered(1, 102)]
+
+        window.select('session-1', records)
+
+        assert len(window.select('session-1', records).records) == 2
+        assert window.last_chunk('session-1') is None
+
+    def test_new_stream_restarts_numbering(self):
+        """Test a reconnected speaker starting again at chunk 0 is accepted."""
+        window = RecordReorderWindow()
+        window.commit('session-1', window.select('session-1', [numbered(50, 101)]))
+
+        selection = window.select('session-1', [numbered(0, 102, stream_id=8)])
+
+        assert len(selection.records) == 1
+        assert window.last_chunk('session-1') == (7, 50)
+
+    def test_previous_stream_redelivery_dropped(self):
+        """Test a batch of the previous stream redelivered after a reconnect is deduplicated."""
+        window = RecordReorderWindow()
+        old_batch = [numbered(0, 101), numbered(1, 102)]
+        window.commit('session-1', window.select('session-1', old_batch))
+        window.commit('session-1', window.select('session-1', [numbered(0, 103, stream_id=8)]))
+
+        selection = window.select('session-1', old_batch + [numbered(1, 104, stream_id=8)])
+
+        assert [(r.stream_id, r.chunk_index) for r in selection.records] == [(8, 1)]
+        assert selection.dropped_count == 2
+        assert window.last_chunk('session-1') == (8, 0)
+        assert window.last_chunk_indices('session-1') == {7: 1, 8: 0}
+
+    def test_streams_per_session_bounded(self):
+        """Test the least recently seen streams of a session are forgotten."""
+        window = RecordReorderWindow(max_streams_per_session=2)
+        for stream_id in (1, 2, 3):
+            window.commit('session-1', window.select('session-1', [numbered(5, 1, stream_id)]))
+
+        assert window.last_chunk_indices('session-1') == {2: 5, 3: 5}
+
+    def test_missing_chunks_counted(self):
+        """Test gaps in the chunk sequence are reported."""
+        window = RecordReorderWindow()
+
+        selection = window.select('session-1', [numbered(0, 101), numbered(3, 102)])
+
+        assert selection.missing_count == 2
+
+    def test_plain_records_ordered_by_sequence_number(self):
+        """Test records without a header fall back to sequence numbers."""
+        window = RecordReorderWindow()
+
+        selection = window.select('session-1', [plain(103), plain(101), plain(103)])
+
+        assert [r.sequence_number for r in selection.records] == ['101', '103']
+        assert selection.dropped_count == 1
+
+    def test_sessions_bounded(self):
+        """Test least recently committed sessions are evicted."""
+        window = RecordReorderWindow(max_sessions=2)
+        for session_id in ('a', 'b', 'c'):
+            window.commit(session_id, window.select(session_id, [numbered(0, 1)]))
+
+        assert window.size == 2
+        assert window.last_chunk('a') is None
+
+    def test_invalid_max_sessions(self):
+        """Test max_sessions and max_streams_per_session must be positive."""
+        with pytest.raises(ValueError):
+            RecordReorderWindow(max_sessions=0)
+        with pytest.raises(ValueError):
+            RecordReorderWindow(max_streams_per_session=0)
@@ -0,0 +1,86 @@
+"""
+Unit tests for sequence checkpoint store.
+"""
+
+import pytest
+from unittest.mock import Mock
+from shared.services.sequence_checkpoint_store import SequenceCheckpointStore
+
+
+class TestSequenceCheckpointStore:
+    """Test suite for SequenceCheckpointStore."""
+
+    def test_unknown_session_has_no_checkpoint(self):
+        """Test nothing is delivered for a new session."""
+        store = SequenceCheckpointStore()
+
+        assert store.get('session-1') is None
+        assert store.is_delivered('session-1', '1') is False
+
+    def test_advance_only_moves_forward(self):
+        """Test checkpoints never go back."""
+        store = SequenceCheckpointStore()
+
+        assert store.advance('session-1', '200') is True
+        assert store.advance('session-1', '150') is False
+        assert store.advance('session-1', None) is False
+        assert store.get('session-1') == '200'
+
+    def test_sequence_numbers_compared_numerically(self):
+        """Test longer sequence numbers are later, not lexically smaller."""
+        store = SequenceCheckpointStore()
+        store.advance('session-1', '9')
+
+        assert store.is_delivered('session-1', '9') is True
+        assert store.is_delivered('session-1', '10') is False
+
+    def test_persisted_checkpoint_loaded_once(self):
+        """Test the loader seeds the checkpoint on first lookup only."""
+        loader = Mock(return_value='500')
+        store = SequenceCheckpointStore(loader=loader)
+
+        assert store.get('session-1') == '500'
+        assert store.get('session-1') == '500'
+        loader.assert_called_once_with('session-1')
+
+    def test_failed_load_retried(self):
+        """Test a failing loader does not cache an empty checkpoint."""
+        loader = Mock(side_effect=[RuntimeError('throttled'), '42'])
+        store = SequenceCheckpointStore(loader=loader)
+
+        assert store.get('session-1') is None
+        assert store.get('session-1') == '42'
+
+    def test_advance_persists(self):
+        """Test a new checkpoint is written; a stale one is not."""
+        writer = Mock()
+        store = SequenceCheckpointStore(writer=writer)
+
+        store.advance('session-1', '10')
+        store.advance('session-1', '5')
+
+        writer.assert_called_once_with('session-1', '10')
+
+    def test_failed_write_keeps_checkpoint(self):
+        """Test a failing writer does not undo the in-memory checkpoint."""
+        store = SequenceCheckpointStore(writer=Mock(side_effect=RuntimeError('down')))
+
+        assert store.advance('session-1', '10') is True
+        assert store.get('session-1') == '10'
+
+    def test_least_recently_used_evicted(self):
+        """Test memory is bounded by max_entries."""
+        store = SequenceCheckpointStore(max_entries=2)
+        store.advance('session-1', '1')
+        store.advance('session-2', '2')
+        store.get('session-1')
+        store.advance('session-3', '3')
+
+        assert store.size == 2
+        assert store.get('session-2') is None
+        assert store.get('session-1') == '1'
+
+    def test_invalid_max_entries(self):
+        """Test max_entries must be positive."""
+        with pytest.raises(ValueError):
+            SequenceCheckpointStore(max_entries=0)
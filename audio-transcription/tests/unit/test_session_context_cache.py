@@ -0,0 +1,137 @@
+"""
+Unit tests for session context cache.
+"""
+
+import time
+import pytest
+from unittest.mock import Mock
+from shared.services.session_context_cache import SessionContext, SessionContextCache
+
+
+def make_context(session_id='session-1', listeners=None):
+    """Create a SessionContext with listeners grouped by language."""
+    return SessionContext(
+        session_id=session_id,
+        source_language='en',
+        target_languages=['es', 'fr', 'de'],
+        listeners_by_language=listeners if listeners is not None else {
+            'es': ['c1', 'c2'],
+            'fr': ['c3']
+        }
+    )
+
+
+class TestSessionContext:
+    """Test suite for SessionContext."""
+
+    def test_active_languages_exclude_empty(self):
+        """Test languages without listeners are not active."""
+        context = make_context(listeners={'es': ['c1'], 'fr': []})
+
+        assert context.active_languages == ['es']
+
+    def test_is_expired(self):
+        """Test expiry is based on load time."""
+        context = make_context()
+        context.loaded_at = time.time() - 10
+
+        assert context.is_expired(5.0) is True
+        assert context.is_expired(20.0) is False
+
+
+class TestSessionContextCache:
+    """Test suite for SessionContextCache."""
+
+    def test_initialization_validates_parameters(self):
+        """Test invalid TTL and size are rejected."""
+        with pytest.raises(ValueError):
+            SessionContextCache(loader=Mock(), ttl_seconds=-1)
+        with pytest.raises(ValueError):
+            SessionContextCache(loader=Mock(), max_entries=0)
+
+    def test_get_loads_on_miss_and_caches(self):
+        """Test context is loaded once and then served from cache."""
+        loader = Mock(side_effect=lambda sid: make_context(sid))
+        cache = SessionContextCache(loader=loader, ttl_seconds=5.0)
+
+        first = cache.get('session-1')
+        second = cache.get('session-1')
+
+        assert first is second
+        loader.assert_called_once_with('session-1')
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_get_reloads_after_ttl(self):
+        """Test expired contexts are reloaded."""
+        loader = Mock(side_effect=lambda sid: make_context(sid))
+        cache = SessionContextCache(loader=loader, ttl_seconds=5.0)
+
+        cache.get('session-1').loaded_at -= 10
+        cache.get('session-1')
+
+        assert loader.call_count == 2
+
+    def test_missing_session_not_cached(self):
+        """Test None results are returned but not cached."""
+        loader = Mock(return_value=None)
+        cache = SessionContextCache(loader=loader)
+
+        assert cache.get('missing') is None
+        assert cache.get('missing') is None
+        assert loader.call_count == 2
+        assert cache.size() == 0
+
+    def test_invalidate(self):
+        """Test invalidation forces a reload."""
+        loader = Mock(side_effect=lambda sid: make_context(sid))
+        cache = SessionContextCache(loader=loader)
+
+        cache.get('session-1')
+        assert cache.invalidate('session-1') is True
+        assert cache.invalidate('session-1') is False
+        cache.get('session-1')
+
+        assert loader.call_count == 2
+
+    def test_remove_connections(self):
+        """Test gone connections are dropped without reloading."""
+        cache = SessionContextCache(loader=lambda sid: make_context(sid))
+        cache.get('session-1')
+
+        removed = cache.remove_connections('session-1', ['c2', 'c3', 'unknown'])
+        context = cache.get('session-1')
+
+        assert removed == 2
+        assert context.listeners_by_language == {'es': ['c1'], 'fr': []}
+        assert context.active_languages == ['es']
+
+    def test_remove_connections_for_uncached_session(self):
+        """Test removing connections of an uncached session is a no-op."""
+        cache = SessionContextCache(loader=Mock())
+
+        assert cache.remove_connections('session-1', ['c1']) == 0
+
+    def test_oldest_entry_evicted_at_capacity(self):
+        """Test cache size stays bounded by max_entries."""
+        cache = SessionContextCache(
+            loader=lambda sid: make_context(sid), max_entries=2
+        )
+
+        cache.get('session-1').loaded_at -= 2
+        cache.get('session-2').loaded_at -= 1
+        cache.get('session-3')
+
+        assert cache.size() == 2
+        assert cache.invalidate('session-1') is False
+
+    def test_clear(self):
+        """Test clear drops entries and statistics."""
+        cache = SessionContextCache(loader=lambda sid: make_context(sid))
+        cache.get('session-1')
+
+        cache.clear()
+
+        assert cache.size() == 0
+        assert cache.hits == 0
+        assert cache.misses == 0
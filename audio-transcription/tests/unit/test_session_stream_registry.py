@@ -0,0 +1,137 @@
+"""
+Unit tests for session stream registry.
+"""
+
+import pytest
+from shared.services.session_stream_registry import SessionStreamRegistry
+
+
+class FakeClock:
+    """Manually advanced clock."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestSessionStreamRegistry:
+    """Test suite for SessionStreamRegistry."""
+
+    @pytest.fixture
+    def clock(self):
+        """Fake time source."""
+        return FakeClock()
+
+    @pytest.fixture
+    def registry(self, clock):
+        """Registry with a 60 second idle timeout and 3 streams max."""
+        return SessionStreamRegistry(idle_timeout_seconds=60, max_streams=3, clock=clock)
+
+    def add(self, registry, session_id):
+        """Register a stream with placeholder components."""
+        return registry.add(session_id, f'client-{session_id}', 'manager', 'handler', 'buffer')
+
+    def test_add_and_get(self, registry):
+        """Test a registered stream is found by session."""
+        stream, removed = self.add(registry, 's1')
+
+        assert removed == []
+        assert registry.get('s1') is stream
+        assert stream.client == 'client-s1'
+        assert not stream.is_active
+        assert 's1' in registry
+        assert registry.size() == 1
+
+    def test_idle_streams_expire_in_activity_order(self, registry, clock):
+        """Test streams idle for the timeout are returned oldest first."""
+        self.add(registry, 's1')
+        clock.now += 10
+        self.add(registry, 's2')
+        clock.now += 10
+        self.add(registry, 's3')
+
+        clock.now += 50
+        expired = registry.pop_expired()
+
+        assert [stream.session_id for stream in expired] == ['s1', 's2']
+        assert registry.size() == 1
+        assert registry.expired_count == 2
+
+    def test_touch_defers_expiry(self, registry, clock):
+        """Test activity keeps a stream registered past its first deadline."""
+        self.add(registry, 's1')
+        clock.now += 50
+        registry.touch('s1')
+
+        clock.now += 20
+        assert registry.pop_expired() == []
+        assert 's1' in registry
+
+        clock.now += 40
+        assert [stream.session_id for stream in registry.pop_expired()] == ['s1']
+
+    def test_lru_eviction_at_cap(self, registry, clock):
+        """Test the least recently used stream is evicted when full."""
+        for session_id in ('s1', 's2', 's3'):
+            self.add(registry, session_id)
+            clock.now += 1
+        registry.touch('s1')
+
+        _, removed = self.add(registry, 's4')
+
+        assert [stream.session_id for stream in removed] == ['s2']
+        assert 's2' not in registry
+        assert registry.size() == 3
+        assert registry.evicted_count == 1
+
+    def test_replacing_returns_previous_stream(self, registry, clock):
+        """Test re-registering a session hands back the old stream to close."""
+        old, _ = self.add(registry, 's1')
+
+        new, removed = self.add(registry, 's1')
+
+        assert removed == [old]
+        assert registry.get('s1') is new
+
+        # The old stream's heap entry does not expire the new stream
+        clock.now += 30
+        registry.touch('s1')
+        clock.now += 40
+        assert registry.pop_expired() == []
+
+    def test_removed_stream_not_expired(self, registry, clock):
+        """Test heap entries of removed streams are skipped."""
+        stream, _ = self.add(registry, 's1')
+
+        assert registry.remove('s1') is stream
+        assert registry.remove('s1') is None
+
+        clock.now += 120
+        assert registry.pop_expired() == []
+
+    def test_heap_compacted_after_churn(self, clock):
+        """Test entries of removed streams do not accumulate."""
+        registry = SessionStreamRegistry(idle_timeout_seconds=60, max_streams=5, clock=clock)
+
+        for index in range(1000):
+            self.add(registry, f's{index}')
+            registry.remove(f's{index}')
+
+        assert len(registry._idle_heap) <= 2 * registry.size() + 65
+
+    def test_touch_unknown_session_ignored(self, registry):
+        """Test recording activity for an unknown session is a no-op."""
+        registry.touch('missing')
+
+        assert registry.size() == 0
+
+    @pytest.mark.parametrize('kwargs', [
+        {'idle_timeout_seconds': 0},
+        {'max_streams': 0}
+    ])
+    def test_invalid_configuration(self, kwargs):
+        """Test invalid settings are rejected."""
+        with pytest.raises(ValueError):
+            SessionStreamRegistry(**kwargs)
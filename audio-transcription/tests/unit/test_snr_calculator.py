@@ -104,3 +104,65 @@ class TestSNRCalculator:
         # Higher amplitude should generally result in higher SNR
         assert all(isinstance(snr, float) for snr in snr_values), "All SNR values should be floats"
         assert all(snr > 0 for snr in snr_values), "All SNR values should be positive"
+
+
+def generate_bursty_speech(duration: float, noise_std: float, seed: int = 0) -> np.ndarray:
+    """Generate 4 Hz syllable bursts with a 0.5 s pause every 2 s plus white noise."""
+    rng = np.random.default_rng(seed)
+    sample_rate = 16000
+    t = np.arange(int(sample_rate * duration)) / sample_rate
+    gate = (np.sin(2 * np.pi * 4 * t) > 0) & ((t % 2) < 1.5)
+    speech = np.sin(2 * np.pi * 180 * t) + 0.5 * np.sin(2 * np.pi * 360 * t)
+    speech = (speech + rng.normal(0, 0.3, len(t))) * gate * 0.3
+    return speech + rng.normal(0, noise_std, len(t))
+
+
+class TestIncrementalSNR:
+    """Test suite for SNRCalculator in incremental mode."""
+    
+    def _chunk_snrs(self, calculator, signal, chunk_size=4096):
+        """Feed 256 ms chunks and return the SNR of each."""
+        return np.array([
+            calculator.calculate_snr(signal[i:i + chunk_size])
+            for i in range(0, len(signal) - chunk_size + 1, chunk_size)
+        ])
+    
+    def test_short_chunks_are_stable_and_accurate(self):
+        """Test 256 ms chunks give steady values near the true SNR."""
+        signal = generate_bursty_speech(20.0, noise_std=0.01)
+        calculator = SNRCalculator(incremental=True)
+        
+        # Skip the first 2 s while the noise floor window fills
+        snrs = self._chunk_snrs(calculator, signal)[8:]
+        
+        # True SNR of active speech against the noise is ~28 dB
+        assert 24.0 < np.median(snrs) < 31.0
+        assert np.std(snrs) < 1.0
+        assert calculator.get_rolling_average() == pytest.approx(np.mean(snrs[-10:]))
+    
+    def test_snr_follows_noise_level(self):
+        """Test a louder noise floor lowers the SNR within a few seconds."""
+        calculator = SNRCalculator(incremental=True)
+        quiet = self._chunk_snrs(calculator, generate_bursty_speech(6.0, noise_std=0.003))
+        loud = self._chunk_snrs(calculator, generate_bursty_speech(6.0, noise_std=0.03, seed=1))
+        
+        assert quiet[-1] - loud[-1] > 10.0
+    
+    def test_clean_and_silent_signals(self):
+        """Test pure tones and silence keep the non-incremental results."""
+        t = np.arange(4096) / 16000
+        calculator = SNRCalculator(incremental=True)
+        
+        assert calculator.calculate_snr(np.sin(2 * np.pi * 440 * t) * 0.5) > 40.0
+        calculator.reset()
+        assert calculator.calculate_snr(np.zeros(4096)) == 0.0
+    
+    def test_reset_clears_noise_floor(self):
+        """Test reset forgets the tracked noise floor and history."""
+        calculator = SNRCalculator(incremental=True)
+        self._chunk_snrs(calculator, generate_bursty_speech(2.0, noise_std=0.01))
+        
+        calculator.reset()
+        
+        assert calculator.noise_floor.noise_power is None
+        assert calculator.get_rolling_average() is None
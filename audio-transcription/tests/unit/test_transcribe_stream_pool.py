@@ -0,0 +1,332 @@
+"""
+Unit tests for warm Transcribe stream pool.
+"""
+
+import asyncio
+import time
+import pytest
+from types import SimpleNamespace
+from shared.services.latency_tracer import current_span, start_trace
+from shared.services.transcribe_stream_pool import (
+    StreamClosedError,
+    TranscribeStreamPool,
+    WarmTranscribeStream
+)
+
+
+def make_event(text, end_time, is_partial=False, start_time=None):
+    """Create a transcript event with a single result."""
+    result = SimpleNamespace(
+        is_partial=is_partial,
+        start_time=max(end_time - 0.5, 0.0) if start_time is None else start_time,
+        end_time=end_time,
+        alternatives=[SimpleNamespace(transcript=text)]
+    )
+    return SimpleNamespace(transcript=SimpleNamespace(results=[result]))
+
+
+class FakeInputStream:
+    """Input stream that forwards sent audio to the fake service."""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.chunks = []
+
+    async def send_audio_event(self, audio_chunk):
+        if self.stream.fail_on_send:
+            raise ConnectionError('stream reset')
+        self.chunks.append(audio_chunk)
+        self.stream.on_audio(len(audio_chunk))
+
+    async def end_stream(self):
+        self.stream.ended = True
+        await self.stream.events.put(None)
+
+
+class FakeStream:
+    """
+    Fake Transcribe stream emitting one final per batch of audio.
+
+    Each batch of audio produces a final result ending at the audio sent so
+    far, after a short delay, with text 'segment-N'.
+    """
+
+    def __init__(self, result_delay=0.01, emit_results=True):
+        self.result_delay = result_delay
+        self.emit_results = emit_results
+        self.fail_on_send = False
+        self.ended = False
+        self.bytes_received = 0
+        self.segments = 0
+        self.events = asyncio.Queue()
+        self.input_stream = FakeInputStream(self)
+
+    def on_audio(self, byte_count):
+        self.bytes_received += byte_count
+
+    def finish_batch(self):
+        """Schedule the final result for the audio received so far."""
+        if not self.emit_results:
+            return
+        self.segments += 1
+        event = make_event(f'segment-{self.segments}', self.bytes_received / 32000)
+        asyncio.get_running_loop().call_later(
+            self.result_delay, self.events.put_nowait, event
+        )
+
+    @property
+    def output_stream(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        while True:
+            event = await self.events.get()
+            if event is None:
+                return
+            yield event
+
+
+def make_pool(streams, **kwargs):
+    """Create a pool whose factory hands out FakeStreams and records them."""
+    async def factory(language_code, sample_rate):
+        stream = FakeStream()
+        original = stream.input_stream.send_audio_event
+
+        async def send_and_finish(audio_chunk):
+            await original(audio_chunk)
+            if stream.bytes_received % 32000 == 0:
+                stream.finish_batch()
+
+        stream.input_stream.send_audio_event = send_and_finish
+        streams.append(stream)
+        return stream
+
+    kwargs.setdefault('flush_timeout_seconds', 1.0)
+    kwargs.setdefault('settle_seconds', 0.2)
+    return TranscribeStreamPool(stream_factory=factory, **kwargs)
+
+
+ONE_SECOND = b'\x00\x01' * 16000
+
+
+class TestWarmTranscribeStream:
+    """Test suite for WarmTranscribeStream."""
+
+    @pytest.mark.asyncio
+    async def test_returns_finals_covering_batch(self):
+        """Test finals covering the sent audio end the wait early."""
+        fake = FakeStream()
+        stream = WarmTranscribeStream('session-1', 'en-US', 16000, fake)
+
+        async def send_and_finish(audio_chunk):
+            fake.on_audio(len(audio_chunk))
+            if fake.bytes_received == len(ONE_SECOND):
+                fake.finish_batch()
+
+        fake.input_stream.send_audio_event = send_and_finish
+
+        start = time.monotonic()
+        text = await stream.transcribe(ONE_SECOND, flush_timeout_seconds=2.0, settle_seconds=1.0)
+
+        assert text == 'segment-1'
+        assert time.monotonic() - start < 0.5
+        assert stream.sent_seconds == pytest.approx(1.0)
+        await stream.close()
+
+    @pytest.mark.asyncio
+    async def test_reader_does_not_inherit_invocation_trace(self, monkeypatch):
+        """Test the reader task does not keep the opening invocation's trace alive."""
+        seen = []
+        read_results = WarmTranscribeStream._read_results
+
+        async def record_context(stream):
+            seen.append(current_span())
+            await read_results(stream)
+
+        monkeypatch.setattr(WarmTranscribeStream, '_read_results', record_context)
+        start_trace('invocation')
+        stream = WarmTranscribeStream('session-1', 'en-US', 16000, FakeStream())
+        await asyncio.sleep(0)
+
+        assert current_span() is not None
+        assert seen == [None]
+        await stream.close()
+
+    @pytest.mark.asyncio
+    async def test_pending_partial_carried_to_next_batch(self):
+        """Test speech still partial at flush timeout is returned later."""
+        fake = FakeStream(emit_results=False)
+        stream = WarmTranscribeStream('session-1', 'en-US', 16000, fake)
+
+        await fake.events.put(make_event('hel', 0.5, is_partial=True))
+        first = await stream.transcribe(ONE_SECOND, flush_timeout_seconds=0.2, settle_seconds=0.1)
+
+        await fake.events.put(make_event('hello', 0.9))
+        second = await stream.transcribe(ONE_SECOND, flush_timeout_seconds=0.2, settle_seconds=0.1)
+
+        assert first == ''
+        assert second == 'hello'
+        await stream.close()
+
+    @pytest.mark.asyncio
+    async def test_segments_emitted_relative_to_batch(self):
+        """Test each final reaches the callback with batch-relative times."""
+        fake = FakeStream(emit_results=False)
+        stream = WarmTranscribeStream('session-1', 'en-US', 16000, fake)
+        segments = []
+
+        async def on_segment(text, start_time, end_time):
+            segments.append((text, start_time, end_time))
+
+        await stream.transcribe(ONE_SECOND, flush_timeout_seconds=0.1, settle_seconds=0.05)
+        await fake.events.put(make_event('one', 1.4, start_time=1.0))
+        await fake.events.put(make_event('two', 2.0, start_time=1.5))
+        text = await stream.transcribe(
+            ONE_SECOND, flush_timeout_seconds=0.5, settle_seconds=0.1, on_segment=on_segment
+        )
+
+        assert text == 'one two'
+        assert segments == [
+            ('one', pytest.approx(0.0), pytest.approx(0.4)),
+            ('two', pytest.approx(0.5), pytest.approx(1.0))
+        ]
+        await stream.close()
+
+    @pytest.mark.asyncio
+    async def test_silence_returns_after_settle(self):
+        """Test a batch producing no results returns after the settle time."""
+        fake = FakeStream(emit_results=False)
+        stream = WarmTranscribeStream('session-1', 'en-US', 16000, fake)
+
+        start = time.monotonic()
+        text = await stream.transcribe(ONE_SECOND, flush_timeout_seconds=2.0, settle_seconds=0.1)
+
+        assert text == ''
+        assert time.monotonic() - start < 0.5
+        await stream.close()
+
+    @pytest.mark.asyncio
+    async def test_send_failure_raises_stream_closed(self):
+        """Test a failed send marks the stream closed."""
+        fake = FakeStream()
+        fake.fail_on_send = True
+        stream = WarmTranscribeStream('session-1', 'en-US', 16000, fake)
+
+        with pytest.raises(StreamClosedError):
+            await stream.transcribe(ONE_SECOND)
+
+        assert stream.is_closed is True
+        await stream.close()
+
+
+class TestTranscribeStreamPool:
+    """Test suite for TranscribeStreamPool."""
+
+    def test_invalid_idle_timeout_raises(self):
+        """Test non-positive idle timeout is rejected."""
+        with pytest.raises(ValueError):
+            TranscribeStreamPool(idle_timeout_seconds=0)
+
+    @pytest.mark.asyncio
+    async def test_stream_reused_across_batches(self):
+        """Test consecutive batches of a session share one stream."""
+        streams = []
+        pool = make_pool(streams)
+
+        first = await pool.transcribe('session-1', ONE_SECOND, 'en-US', 16000)
+        second = await pool.transcribe('session-1', ONE_SECOND, 'en-US', 16000)
+
+        assert (first, second) == ('segment-1', 'segment-2')
+        assert len(streams) == 1
+        assert pool.opened_count == 1
+        assert pool.reused_count == 1
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_language_change_opens_new_stream(self):
+        """Test a language change replaces the session's stream."""
+        streams = []
+        pool = make_pool(streams)
+
+        await pool.transcribe('session-1', ONE_SECOND, 'en-US', 16000)
+        await pool.transcribe('session-1', ONE_SECOND, 'es-US', 16000)
+
+        assert len(streams) == 2
+        assert streams[0].ended is True
+        assert pool.size() == 1
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_failed_stream_discarded(self):
+        """Test a failing stream raises and is replaced on the next batch."""
+        streams = []
+        pool = make_pool(streams)
+
+        await pool.transcribe('session-1', ONE_SECOND, 'en-US', 16000)
+        streams[0].fail_on_send = True
+
+        with pytest.raises(StreamClosedError):
+            await pool.transcribe('session-1', ONE_SECOND, 'en-US', 16000)
+        assert pool.size() == 0
+
+        text = await pool.transcribe('session-1', ONE_SECOND, 'en-US', 16000)
+
+        assert text == 'segment-1'
+        assert len(streams) == 2
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_has_pending_speech(self):
+        """Test unfinished partial results are reported as pending speech."""
+        pool = make_pool([], flush_timeout_seconds=0.1, settle_seconds=0.05)
+
+        assert pool.has_pending_speech('session-1') is False
+        await pool.transcribe('session-1', ONE_SECOND, 'en-US', 16000)
+        stream = pool._streams['session-1']
+        assert pool.has_pending_speech('session-1') is False
+
+        await stream.stream.events.put(make_event('hel', 1.5, is_partial=True))
+        await asyncio.sleep(0.01)
+
+        assert pool.has_pending_speech('session-1') is True
+        await pool.close_all()
+
+    @pytest.mark.asyncio
+    async def test_close_idle(self):
+        """Test only streams idle past the timeout are closed."""
+        streams = []
+        pool = make_pool(streams, idle_timeout_seconds=5.0)
+
+        await pool.transcribe('session-1', ONE_SECOND, 'en-US', 16000)
+        await pool.transcribe('session-2', ONE_SECOND, 'en-US', 16000)
+        pool._streams['session-1'].last_activity -= 10
+
+        closed = await pool.close_idle()
+
+        assert closed == 1
+        assert streams[0].ended is True
+        assert pool.size() == 1
+        await pool.close_all()
+
+    def test_streams_dropped_when_event_loop_changes(self):
+        """Test streams from a previous event loop are not reused."""
+        streams = []
+        pool = make_pool(streams)
+        loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+
+        try:
+            for loop in loops:
+                loop.run_until_complete(
+                    pool.transcribe('session-1', ONE_SECOND, 'en-US', 16000)
+                )
+
+            assert len(streams) == 2
+            assert pool.opened_count == 2
+            assert pool.size() == 1
+        finally:
+            loops[1].run_until_complete(pool.close_all())
+            # Let the abandoned stream's reader finish on its own loop
+            loops[0].run_until_complete(streams[0].input_stream.end_stream())
+            loops[0].run_until_complete(asyncio.sleep(0))
+            for loop in loops:
+                loop.close()
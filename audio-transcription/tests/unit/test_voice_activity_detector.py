@@ -0,0 +1,163 @@
+"""
+Unit tests for voice activity detector.
+"""
+
+import numpy as np
+import pytest
+from shared.services.voice_activity_detector import (
+    VoiceActivityDetector,
+    find_pause_splits,
+    frame_features
+)
+
+SAMPLE_RATE = 16000
+
+
+def tone(duration_s, amplitude=0.3, frequency=440):
+    """Generate an int16 sine tone."""
+    t = np.arange(int(SAMPLE_RATE * duration_s)) / SAMPLE_RATE
+    return (amplitude * 32767 * np.sin(2 * np.pi * frequency * t)).astype(np.int16)
+
+
+def silence(duration_s):
+    """Generate int16 digital silence."""
+    return np.zeros(int(SAMPLE_RATE * duration_s), dtype=np.int16)
+
+
+def noise(duration_s, amplitude):
+    """Generate int16 white noise."""
+    rng = np.random.default_rng(42)
+    samples = rng.uniform(-amplitude, amplitude, int(SAMPLE_RATE * duration_s))
+    return (samples * 32767).astype(np.int16)
+
+
+class TestFrameFeatures:
+    """Test suite for frame_features."""
+
+    def test_energy_matches_silence_detector_scale(self):
+        """Test energy uses int16 normalization and a -100 dB floor."""
+        samples = np.concatenate([silence(0.02), tone(0.02, amplitude=1.0)])
+
+        energy_db, _ = frame_features(samples, 320)
+
+        assert energy_db[0] == -100.0
+        assert energy_db[1] == pytest.approx(-3.0, abs=0.1)
+
+    def test_zero_crossing_rate(self):
+        """Test noise crosses zero far more often than a low tone."""
+        _, zcr_tone = frame_features(tone(0.1, frequency=200), 320)
+        _, zcr_noise = frame_features(noise(0.1, 0.1), 320)
+
+        assert zcr_tone.max() < 0.05
+        assert zcr_noise.min() > 0.3
+
+    def test_partial_frame_ignored(self):
+        """Test input shorter than a frame yields no frames."""
+        energy_db, zcr = frame_features(tone(0.01), 320)
+
+        assert len(energy_db) == 0
+        assert len(zcr) == 0
+
+
+class TestFindPauseSplits:
+    """Test suite for find_pause_splits."""
+
+    def test_short_audio_not_split(self):
+        """Test audio up to the maximum length stays in one segment."""
+        assert find_pause_splits(tone(4.0), 320, 32000, 64000) == []
+
+    def test_splits_at_pauses(self):
+        """Test long audio is cut in the pauses between sentences."""
+        samples = np.concatenate([
+            tone(2.5), silence(0.2), tone(3.0), silence(0.2), tone(2.5)
+        ])
+
+        splits = find_pause_splits(samples, 320, 32000, 64000)
+
+        assert len(splits) == 2
+        assert int(2.5 * SAMPLE_RATE) <= splits[0] <= int(2.7 * SAMPLE_RATE)
+        assert int(5.7 * SAMPLE_RATE) <= splits[1] <= int(5.9 * SAMPLE_RATE)
+
+    def test_segment_lengths_bounded_without_pauses(self):
+        """Test continuous audio is still cut into bounded segments."""
+        samples = tone(10.0)
+
+        boundaries = [0] + find_pause_splits(samples, 320, 32000, 64000) + [len(samples)]
+        lengths = np.diff(boundaries)
+
+        assert all(32000 <= length <= 64000 for length in lengths)
+
+    def test_invalid_lengths_raise(self):
+        """Test the minimum segment length cannot exceed the maximum."""
+        with pytest.raises(ValueError):
+            find_pause_splits(tone(1.0), 320, 64000, 32000)
+
+
+class TestVoiceActivityDetector:
+    """Test suite for VoiceActivityDetector."""
+
+    def test_invalid_parameters_raise(self):
+        """Test out-of-range parameters are rejected."""
+        with pytest.raises(ValueError):
+            VoiceActivityDetector(frame_ms=0)
+        with pytest.raises(ValueError):
+            VoiceActivityDetector(zero_crossing_threshold=1.5)
+        with pytest.raises(ValueError):
+            VoiceActivityDetector(padding_ms=-1)
+
+    def test_silence_has_no_speech(self):
+        """Test digital silence is classified as silent."""
+        result = VoiceActivityDetector().analyze(silence(3.0))
+
+        assert result.has_speech is False
+        assert result.total_seconds == pytest.approx(3.0)
+        assert result.speech_seconds == 0.0
+
+    def test_low_noise_floor_has_no_speech(self):
+        """Test background noise below the threshold is silent."""
+        result = VoiceActivityDetector().analyze(noise(3.0, 0.001))
+
+        assert result.has_speech is False
+
+    def test_click_shorter_than_min_speech_ignored(self):
+        """Test isolated clicks do not count as speech."""
+        samples = np.concatenate([silence(1.0), tone(0.04), silence(1.0)])
+
+        result = VoiceActivityDetector(min_speech_ms=100).analyze(samples)
+
+        assert result.has_speech is False
+
+    def test_speech_span_padded(self):
+        """Test the speech span covers speech plus padding."""
+        samples = np.concatenate([silence(1.0), tone(1.0), silence(1.0)])
+
+        result = VoiceActivityDetector(padding_ms=300).analyze(samples)
+
+        assert result.has_speech is True
+        assert result.leading_silence_seconds == pytest.approx(0.7, abs=0.02)
+        assert result.trailing_silence_seconds == pytest.approx(0.7, abs=0.02)
+        assert result.speech_seconds == pytest.approx(1.6, abs=0.04)
+
+    def test_unvoiced_endpoints_extended(self):
+        """Test weak noise-like frames next to speech are kept."""
+        fricative = noise(0.2, 0.005)  # about -53 dB, high zero-crossing rate
+        samples = np.concatenate([silence(1.0), fricative, tone(0.5), silence(1.0)])
+
+        result = VoiceActivityDetector(padding_ms=0).analyze(samples)
+
+        assert result.leading_silence_seconds == pytest.approx(1.0, abs=0.02)
+
+    def test_speech_to_end_keeps_trailing_partial_frame(self):
+        """Test speech running to the end of the batch is not cut."""
+        samples = np.concatenate([silence(0.5), tone(0.51)])
+
+        result = VoiceActivityDetector(padding_ms=0).analyze(samples)
+
+        assert result.speech_end_sample == len(samples)
+        assert result.trailing_silence_seconds == 0.0
+
+    def test_float_input(self):
+        """Test normalized float input is supported."""
+        samples = tone(1.0).astype(np.float32) / 32768.0
+
+        assert VoiceActivityDetector().analyze(samples).has_speech is True
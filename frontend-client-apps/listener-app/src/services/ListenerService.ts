@@ -15,16 +15,33 @@ export interface ListenerServiceConfig {
 }
 
 /**
- * Listener service orchestrates S3 audio playback and WebSocket control
+ * Inline audio chunks received so far for one translated clip
+ */
+interface InlineAudioAssembly {
+  parts: string[];
+  received: number;
+  metadata: AudioChunkMetadata;
+  startedAt: number;
+}
+
+// Incomplete inline clips are dropped after this long (a chunk was lost)
+const INLINE_AUDIO_TTL_MS = 30000; // 30 seconds
+// Most inline clips assembled at once; the oldest are dropped beyond it
+const MAX_INLINE_AUDIO_ASSEMBLIES = 16;
+
+/**
+ * Listener service orchestrates translated audio playback and WebSocket control
  * 
  * Architecture:
- * - S3: Translated audio delivery via presigned URLs
+ * - WebSocket: Small translated clips delivered inline (base64 chunks)
+ * - S3: Larger translated clips delivered via presigned URLs
  * - WebSocket: Control messages and session metadata
  */
 export class ListenerService {
   private wsClient: WebSocketClient;
   private audioPlayer: S3AudioPlayer | null = null;
   private config: ListenerServiceConfig;
+  private inlineAudio: Map<number, InlineAudioAssembly> = new Map();
 
   constructor(config: ListenerServiceConfig) {
     this.config = config;
@@ -362,6 +379,7 @@ export class ListenerService {
       this.audioPlayer = null;
     }
     
+    this.inlineAudio.clear();
     this.wsClient.disconnect();
   }
 
@@ -389,6 +407,95 @@ export class ListenerService {
     }
   }
 
+  /**
+   * Reassemble inline translated audio and queue it for playback
+   *
+   * Clips are split into chunkCount messages sharing a sequenceNumber;
+   * the clip is queued once every chunk has arrived. Clips missing a chunk
+   * are dropped after INLINE_AUDIO_TTL_MS, or earlier when more than
+   * MAX_INLINE_AUDIO_ASSEMBLIES are incomplete.
+   */
+  private handleInlineAudio(message: any): void {
+    const sequenceNumber = message.sequenceNumber || message.timestamp;
+    const chunkCount = message.chunkCount || 1;
+    const now = Date.now();
+
+    let assembly = this.inlineAudio.get(sequenceNumber);
+    if (!assembly) {
+      this.dropStaleInlineAudio(now);
+      assembly = {
+        parts: new Array(chunkCount),
+        received: 0,
+        metadata: {
+          url: '',
+          timestamp: message.timestamp,
+          duration: message.duration || 2.0,
+          sequenceNumber,
+        },
+        startedAt: now,
+      };
+      this.inlineAudio.set(sequenceNumber, assembly);
+    }
+
+    const chunkIndex = message.chunkIndex || 0;
+    if (assembly.parts[chunkIndex] === undefined) {
+      assembly.parts[chunkIndex] = message.audio;
+      assembly.received += 1;
+    }
+    if (message.transcript !== undefined) {
+      assembly.metadata.transcript = message.transcript;
+    }
+
+    if (assembly.received < chunkCount) {
+      return;
+    }
+
+    this.inlineAudio.delete(sequenceNumber);
+
+    const buffers = assembly.parts.map((part) => {
+      const binary = atob(part);
+      const bytes = new Uint8Array(binary.length);
+      for (let i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+      }
+      return bytes;
+    });
+
+    const metadata: AudioChunkMetadata = {
+      ...assembly.metadata,
+      audio: new Blob(buffers, { type: message.contentType || 'audio/mpeg' }),
+    };
+
+    if (this.audioPlayer) {
+      this.audioPlayer.addChunk(metadata);
+    }
+
+    console.log(
+      `[ListenerService] Received inline translated audio: ${sequenceNumber} ` +
+      `(${chunkCount} chunks)`
+    );
+  }
+
+  /**
+   * Drop incomplete inline clips that are expired or over the assembly cap
+   *
+   * Map iteration follows insertion order, so the oldest clips come first.
+   */
+  private dropStaleInlineAudio(now: number): void {
+    for (const [sequenceNumber, assembly] of this.inlineAudio) {
+      const expired = now - assembly.startedAt >= INLINE_AUDIO_TTL_MS;
+      if (!expired && this.inlineAudio.size < MAX_INLINE_AUDIO_ASSEMBLIES) {
+        break;
+      }
+      this.inlineAudio.delete(sequenceNumber);
+      console.warn(
+        `[ListenerService] Dropped incomplete inline audio: ${sequenceNumber} ` +
+        `(${assembly.received}/${assembly.parts.length} chunks, ` +
+        `${expired ? 'expired' : 'too many pending clips'})`
+      );
+    }
+  }
+
   /**
    * Setup WebSocket event handlers (for control messages only)
    */
@@ -439,6 +546,12 @@ export class ListenerService {
     // Handle translated audio notifications (Phase 3)
     this.wsClient.on('translatedAudio', (message: any) => {
       if (message.targetLanguage === this.config.targetLanguage) {
+        // Inline audio arrives in one or more chunks in the message itself
+        if (message.delivery === 'inline') {
+          this.handleInlineAudio(message);
+          return;
+        }
+
         const metadata: AudioChunkMetadata = {
           url: message.url,
           timestamp: message.timestamp,
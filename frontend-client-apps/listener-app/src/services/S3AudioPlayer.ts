@@ -15,6 +15,7 @@ export interface AudioChunkMetadata {
   duration: number;
   sequenceNumber: number;
   transcript?: string;
+  audio?: Blob; // Inline audio from the WebSocket message (no download)
 }
 
 export interface S3AudioPlayerConfig {
@@ -84,15 +85,15 @@ export class S3AudioPlayer {
 
       console.log(`[S3AudioPlayer] Playing chunk ${chunk.sequenceNumber}`);
 
-      // Check if already in cache
-      let audioBlob = this.prefetchCache.get(chunk.sequenceNumber);
+      // Use inline audio, or check if already in cache
+      let audioBlob = chunk.audio ?? this.prefetchCache.get(chunk.sequenceNumber);
 
       if (!audioBlob) {
         // Not cached, download now
         this.config.onBuffering?.(true);
         audioBlob = await this.downloadAudio(chunk.url);
         this.config.onBuffering?.(false);
-      } else {
+      } else if (!chunk.audio) {
         // Remove from cache after use
         this.prefetchCache.delete(chunk.sequenceNumber);
       }
@@ -203,6 +204,11 @@ export class S3AudioPlayer {
     const chunksToPrefetch = this.playQueue.slice(0, this.maxCacheSize);
 
     for (const chunk of chunksToPrefetch) {
+      // Skip inline chunks (nothing to download)
+      if (chunk.audio) {
+        continue;
+      }
+
       // Skip if already in cache
       if (this.prefetchCache.has(chunk.sequenceNumber)) {
         continue;
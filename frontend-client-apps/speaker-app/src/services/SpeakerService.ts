@@ -27,6 +27,9 @@ export class SpeakerService {
   private audioWorkletService: AudioWorkletService | null = null;
   private statusPollInterval: NodeJS.Timeout | null = null;
   private retryHandler: RetryHandler;
+  // Chunk counter for the lifetime of the connection (the audio processor
+  // drops chunks that are not newer than the last one it received)
+  private chunkIndex = 0;
 
   constructor(_config: SpeakerServiceConfig, wsClient: WebSocketClient) {
     this.wsClient = wsClient;
@@ -175,6 +178,7 @@ export class SpeakerService {
         action: 'audioChunk',
         sessionId,
         audioData: base64,
+        chunkIndex: this.chunkIndex++,
         timestamp,
         format: 'pcm',  // Changed from 'webm-opus'
         sampleRate: 16000,
@@ -73,6 +73,10 @@ class SessionManagementStack(Stack):
             "AUDIO_STREAM_NAME",
             self.audio_stream.stream_name
         )
+        self.connection_handler.add_environment(
+            "AUDIO_RECORD_HEADER_ENABLED",
+            "true"
+        )
 
         # Create WebSocket API
         self.websocket_api = self._create_websocket_api()
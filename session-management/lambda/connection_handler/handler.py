@@ -43,7 +43,9 @@ from shared.utils.response_builder import (
     rate_limit_error_response,
 )
 from shared.utils.structured_logger import get_structured_logger
+from shared.utils.audio_record import build_audio_record, stream_id_for_connection
 from shared.utils.metrics import get_metrics_publisher
+from shared.utils.emf_metrics import flush_metrics_after
 from shared.config.table_names import get_table_name, SESSIONS_TABLE_NAME, CONNECTIONS_TABLE_NAME
 
 # Initialize structured logger
@@ -73,8 +75,11 @@ else:
 MAX_LISTENERS_PER_SESSION = int(os.environ.get('MAX_LISTENERS_PER_SESSION', '500'))
 SESSION_MAX_DURATION_HOURS = int(os.environ.get('SESSION_MAX_DURATION_HOURS', '2'))
 SUPPORTED_LANGUAGES = os.environ.get('SUPPORTED_LANGUAGES', 'en,es,fr,de,pt,it,ja,ko,zh').split(',')
+# Prefix Kinesis audio records with a chunk header when the client numbers its chunks
+AUDIO_RECORD_HEADER_ENABLED = os.environ.get('AUDIO_RECORD_HEADER_ENABLED', 'true').lower() == 'true'
 
 
+@flush_metrics_after
 def lambda_handler(event, context):
     """
     Handle WebSocket events: $connect and MESSAGE events.
@@ -865,6 +870,7 @@ def handle_audio_chunk(event, connection_id, body, ip_address):
     try:
         session_id = body.get('sessionId', '')
         audio_data_base64 = body.get('audioData', '')
+        has_chunk_index = 'chunkIndex' in body
         chunk_index = body.get('chunkIndex', 0)
         
         if not session_id or not audio_data_base64:
@@ -890,13 +896,30 @@ def handle_audio_chunk(event, connection_id, body, ip_address):
         import base64
         pcm_bytes = base64.b64decode(audio_data_base64)
         
+        # Numbered chunks carry a header so the audio processor can reorder
+        # and deduplicate them; unnumbered chunks stay plain PCM
+        record_data = pcm_bytes
+        if AUDIO_RECORD_HEADER_ENABLED and has_chunk_index:
+            try:
+                record_data = build_audio_record(
+                    pcm_bytes,
+                    stream_id=stream_id_for_connection(connection_id),
+                    chunk_index=int(chunk_index)
+                )
+            except (TypeError, ValueError):
+                logger.warning(
+                    message=f"Invalid chunkIndex {chunk_index!r}, sending chunk without header",
+                    correlation_id=connection_id,
+                    operation='handle_audio_chunk'
+                )
+        
         # Write directly to Kinesis Data Stream
         stream_name = os.environ.get('AUDIO_STREAM_NAME', f'audio-ingestion-{os.environ.get("ENV", "dev")}')
         
         kinesis_client = boto3.client('kinesis')
         kinesis_client.put_record(
             StreamName=stream_name,
-            Data=pcm_bytes,  # Raw bytes (not base64)
+            Data=record_data,  # Raw bytes (not base64), optionally with chunk header
             PartitionKey=session_id  # Groups records by session
         )
         
@@ -17,6 +17,8 @@ from datetime import datetime, timedelta
 import boto3
 from botocore.exceptions import ClientError
 
+from shared.utils.emf_metrics import flush_metrics_after, get_metrics_sink
+
 # Configure logging
 logger = logging.getLogger()
 logger.setLevel(logging.INFO)
@@ -48,6 +50,7 @@ SUPPORTED_LANGUAGES = [
 QUALITY_TIERS = ['standard', 'premium']
 
 
+@flush_metrics_after
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     HTTP API Lambda handler for session CRUD operations.
@@ -693,25 +696,14 @@ def generate_session_id() -> str:
 
 
 def emit_metric(metric_name: str, value: float, dimensions: Optional[Dict[str, str]] = None):
-    """Emit CloudWatch metric."""
+    """Buffer CloudWatch metric (written when the invocation ends)."""
     try:
-        cloudwatch = boto3.client('cloudwatch')
-        
-        metric_data = {
-            'MetricName': metric_name,
-            'Value': value,
-            'Unit': 'Count',
-            'Timestamp': datetime.utcnow(),
-        }
-        
-        if dimensions:
-            metric_data['Dimensions'] = [
-                {'Name': k, 'Value': v} for k, v in dimensions.items()
-            ]
-        
-        cloudwatch.put_metric_data(
-            Namespace='SessionManagement',
-            MetricData=[metric_data]
+        get_metrics_sink().put_metric(
+            metric_name,
+            value,
+            unit='Count',
+            dimensions=dimensions,
+            namespace='SessionManagement'
         )
     except Exception as e:
         logger.warning(f'Failed to emit metric: {str(e)}')
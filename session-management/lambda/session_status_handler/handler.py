@@ -20,6 +20,7 @@ from shared.utils.response_builder import (
 )
 from shared.utils.structured_logger import get_structured_logger
 from shared.utils.metrics import get_metrics_publisher
+from shared.utils.emf_metrics import flush_metrics_after
 from shared.config.table_names import get_table_name, SESSIONS_TABLE_NAME, CONNECTIONS_TABLE_NAME
 
 # Initialize structured logger
@@ -36,6 +37,7 @@ metrics_publisher = get_metrics_publisher()
 STATUS_QUERY_TIMEOUT_MS = int(os.environ.get('STATUS_QUERY_TIMEOUT_MS', '500'))
 
 
+@flush_metrics_after
 def lambda_handler(event, context):
     """
     Handle WebSocket session status events.
@@ -23,6 +23,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
 from shared.data_access.connections_repository import ConnectionsRepository
 from shared.utils.structured_logger import get_structured_logger
 from shared.utils.metrics import MetricsPublisher
+from shared.utils.emf_metrics import flush_metrics_after
 from shared.config.table_names import get_table_name, CONNECTIONS_TABLE_NAME
 
 # Initialize logger
@@ -275,6 +276,7 @@ def check_and_close_idle_connections(endpoint_url: str) -> Dict[str, int]:
         raise
 
 
+@flush_metrics_after
 def lambda_handler(event, context):
     """
     Handle periodic timeout check triggered by EventBridge.
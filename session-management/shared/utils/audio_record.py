@@ -0,0 +1,56 @@
+"""
+Kinesis audio record format.
+
+Audio chunks are written to the audio ingestion stream as raw PCM bytes.
+When the speaker client numbers its chunks, the record starts with a
+12-byte header so the audio processor can put chunks back in order and drop
+duplicates:
+
+    magic       4 bytes  b'LTA1'
+    stream_id   4 bytes  unsigned, big-endian; CRC32 of the connection ID,
+                         so chunk numbering restarts with a new connection
+    chunk_index 4 bytes  unsigned, big-endian; client chunk counter
+
+Records without the magic are plain PCM (older producers), and the audio
+processor keeps accepting them.
+"""
+
+import struct
+import zlib
+
+AUDIO_RECORD_MAGIC = b'LTA1'
+AUDIO_RECORD_HEADER = struct.Struct('>4sII')
+
+
+def stream_id_for_connection(connection_id: str) -> int:
+    """
+    Derive the record stream ID of a speaker connection.
+
+    Args:
+        connection_id: WebSocket connection ID of the speaker
+
+    Returns:
+        Unsigned 32-bit stream ID
+    """
+    return zlib.crc32(connection_id.encode('utf-8')) & 0xFFFFFFFF
+
+
+def build_audio_record(pcm_bytes: bytes, stream_id: int, chunk_index: int) -> bytes:
+    """
+    Prefix a PCM chunk with the audio record header.
+
+    Args:
+        pcm_bytes: Raw PCM audio of the chunk
+        stream_id: Stream ID of the speaker connection
+        chunk_index: Client chunk counter
+
+    Returns:
+        Record data for Kinesis
+
+    Raises:
+        ValueError: If chunk_index is out of range
+    """
+    if not 0 <= chunk_index <= 0xFFFFFFFF:
+        raise ValueError(f"chunk_index out of range: {chunk_index}")
+
+    return AUDIO_RECORD_HEADER.pack(AUDIO_RECORD_MAGIC, stream_id, chunk_index) + pcm_bytes
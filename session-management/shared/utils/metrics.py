@@ -5,27 +5,31 @@ Provides methods for emitting:
 - Latency metrics (p50, p95, p99)
 - Gauge metrics (active sessions, total listeners)
 - Count metrics (errors, rate limits)
+
+Metrics are buffered in the process-wide metrics sink and written as EMF
+when the handler calls flush_metrics() at the end of the invocation.
 """
-import boto3
-import os
 from typing import List, Dict, Optional
 from datetime import datetime, timezone
 
+from shared.utils.emf_metrics import MetricsSink, get_metrics_sink
+
 
 class MetricsPublisher:
     """
     CloudWatch metrics publisher for session management metrics.
     """
     
-    def __init__(self, namespace: str = 'SessionManagement'):
+    def __init__(self, namespace: str = 'SessionManagement', sink: Optional[MetricsSink] = None):
         """
         Initialize metrics publisher.
         
         Args:
             namespace: CloudWatch metrics namespace
+            sink: Metrics sink (default: the process-wide sink)
         """
         self.namespace = namespace
-        self.cloudwatch = boto3.client('cloudwatch', region_name=os.environ.get('AWS_REGION', 'us-east-1'))
+        self.sink = sink or get_metrics_sink()
     
     def put_latency_metric(
         self,
@@ -100,7 +104,7 @@ class MetricsPublisher:
         dimensions: List[Dict[str, str]]
     ):
         """
-        Put metric to CloudWatch.
+        Buffer metric in the metrics sink.
         
         Args:
             metric_name: Metric name
@@ -119,7 +123,7 @@ class MetricsPublisher:
             if dimensions:
                 metric_data['Dimensions'] = dimensions
             
-            self.cloudwatch.put_metric_data(
+            self.sink.put_metric_data(
                 Namespace=self.namespace,
                 MetricData=[metric_data]
             )
@@ -10,10 +10,11 @@ Validates:
 import json
 import logging
 import pytest
-from unittest.mock import Mock, patch, MagicMock, call
+from unittest.mock import MagicMock
 from datetime import datetime
 
 from shared.utils.structured_logger import StructuredLogger, get_structured_logger
+from shared.utils.emf_metrics import MetricsSink
 from shared.utils.metrics import MetricsPublisher, get_metrics_publisher
 
 
@@ -190,18 +191,33 @@ class TestStructuredLogging:
 class TestCloudWatchMetrics:
     """Test CloudWatch metrics emission."""
     
-    @patch('boto3.client')
-    def test_session_creation_latency_metric_emitted(self, mock_boto_client):
-        """Verify SessionCreationLatency metric is emitted correctly."""
+    def test_metrics_buffered_until_flush(self):
+        """Verify metrics reach CloudWatch in one request at flush time."""
         mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
+        sink = MetricsSink(backend='cloudwatch', cloudwatch_client=mock_cloudwatch)
+        publisher = MetricsPublisher(sink=sink)
+        
+        publisher.emit_active_sessions(10)
+        publisher.emit_connection_error('SESSION_NOT_FOUND')
+        
+        assert not mock_cloudwatch.put_metric_data.called
+        
+        sink.flush()
         
-        publisher = MetricsPublisher()
+        mock_cloudwatch.put_metric_data.assert_called_once()
+        call_args = mock_cloudwatch.put_metric_data.call_args
+        assert call_args[1]['Namespace'] == 'SessionManagement'
+        assert len(call_args[1]['MetricData']) == 2
+    
+    def test_session_creation_latency_metric_emitted(self):
+        """Verify SessionCreationLatency metric is emitted correctly."""
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(sink=mock_sink)
         publisher.emit_session_creation_latency(1500.0, 'user-123')
         
         # Verify put_metric_data was called
-        assert mock_cloudwatch.put_metric_data.called
-        call_args = mock_cloudwatch.put_metric_data.call_args
+        assert mock_sink.put_metric_data.called
+        call_args = mock_sink.put_metric_data.call_args
         
         # Verify namespace
         assert call_args[1]['Namespace'] == 'SessionManagement'
@@ -218,16 +234,13 @@ class TestCloudWatchMetrics:
         assert dimensions[0]['Name'] == 'UserId'
         assert dimensions[0]['Value'] == 'user-123'
     
-    @patch('boto3.client')
-    def test_listener_join_latency_metric_emitted(self, mock_boto_client):
+    def test_listener_join_latency_metric_emitted(self):
         """Verify ListenerJoinLatency metric is emitted correctly."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher()
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(sink=mock_sink)
         publisher.emit_listener_join_latency(800.0, 'session-123')
         
-        call_args = mock_cloudwatch.put_metric_data.call_args
+        call_args = mock_sink.put_metric_data.call_args
         metric_data = call_args[1]['MetricData'][0]
         
         assert metric_data['MetricName'] == 'ListenerJoinLatency'
@@ -238,48 +251,39 @@ class TestCloudWatchMetrics:
         assert dimensions[0]['Name'] == 'SessionId'
         assert dimensions[0]['Value'] == 'session-123'
     
-    @patch('boto3.client')
-    def test_active_sessions_gauge_metric_emitted(self, mock_boto_client):
+    def test_active_sessions_gauge_metric_emitted(self):
         """Verify ActiveSessions gauge metric is emitted correctly."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher()
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(sink=mock_sink)
         publisher.emit_active_sessions(42)
         
-        call_args = mock_cloudwatch.put_metric_data.call_args
+        call_args = mock_sink.put_metric_data.call_args
         metric_data = call_args[1]['MetricData'][0]
         
         assert metric_data['MetricName'] == 'ActiveSessions'
         assert metric_data['Value'] == 42
         assert metric_data['Unit'] == 'Count'
     
-    @patch('boto3.client')
-    def test_total_listeners_gauge_metric_emitted(self, mock_boto_client):
+    def test_total_listeners_gauge_metric_emitted(self):
         """Verify TotalListeners gauge metric is emitted correctly."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher()
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(sink=mock_sink)
         publisher.emit_total_listeners(250)
         
-        call_args = mock_cloudwatch.put_metric_data.call_args
+        call_args = mock_sink.put_metric_data.call_args
         metric_data = call_args[1]['MetricData'][0]
         
         assert metric_data['MetricName'] == 'TotalListeners'
         assert metric_data['Value'] == 250
         assert metric_data['Unit'] == 'Count'
     
-    @patch('boto3.client')
-    def test_connection_error_metric_with_error_code(self, mock_boto_client):
+    def test_connection_error_metric_with_error_code(self):
         """Verify ConnectionErrors metric includes error code dimension."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher()
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(sink=mock_sink)
         publisher.emit_connection_error('SESSION_NOT_FOUND')
         
-        call_args = mock_cloudwatch.put_metric_data.call_args
+        call_args = mock_sink.put_metric_data.call_args
         metric_data = call_args[1]['MetricData'][0]
         
         assert metric_data['MetricName'] == 'ConnectionErrors'
@@ -290,16 +294,13 @@ class TestCloudWatchMetrics:
         assert dimensions[0]['Name'] == 'ErrorCode'
         assert dimensions[0]['Value'] == 'SESSION_NOT_FOUND'
     
-    @patch('boto3.client')
-    def test_rate_limit_exceeded_metric_with_operation(self, mock_boto_client):
+    def test_rate_limit_exceeded_metric_with_operation(self):
         """Verify RateLimitExceeded metric includes operation dimension."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher()
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(sink=mock_sink)
         publisher.emit_rate_limit_exceeded('createSession')
         
-        call_args = mock_cloudwatch.put_metric_data.call_args
+        call_args = mock_sink.put_metric_data.call_args
         metric_data = call_args[1]['MetricData'][0]
         
         assert metric_data['MetricName'] == 'RateLimitExceeded'
@@ -309,68 +310,52 @@ class TestCloudWatchMetrics:
         assert dimensions[0]['Name'] == 'Operation'
         assert dimensions[0]['Value'] == 'createSession'
     
-    @patch('boto3.client')
-    def test_metric_emission_failure_does_not_raise(self, mock_boto_client):
+    def test_metric_emission_failure_does_not_raise(self):
         """Verify metric emission failures don't raise exceptions."""
-        mock_cloudwatch = MagicMock()
-        mock_cloudwatch.put_metric_data.side_effect = Exception('CloudWatch error')
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher()
+        mock_sink = MagicMock()
+        mock_sink.put_metric_data.side_effect = Exception('CloudWatch error')
+        publisher = MetricsPublisher(sink=mock_sink)
         
         # Should not raise exception
         publisher.emit_active_sessions(10)
     
-    @patch('boto3.client')
-    def test_metric_timestamp_included(self, mock_boto_client):
+    def test_metric_timestamp_included(self):
         """Verify metrics include timestamp."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher()
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(sink=mock_sink)
         publisher.emit_active_sessions(5)
         
-        call_args = mock_cloudwatch.put_metric_data.call_args
+        call_args = mock_sink.put_metric_data.call_args
         metric_data = call_args[1]['MetricData'][0]
         
         assert 'Timestamp' in metric_data
         assert isinstance(metric_data['Timestamp'], datetime)
     
-    @patch('boto3.client')
-    def test_get_metrics_publisher_singleton(self, mock_boto_client):
+    def test_get_metrics_publisher_singleton(self):
         """Verify get_metrics_publisher returns singleton instance."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
         publisher1 = get_metrics_publisher()
         publisher2 = get_metrics_publisher()
         
         # Should return same instance
         assert publisher1 is publisher2
     
-    @patch('boto3.client')
-    def test_custom_namespace_support(self, mock_boto_client):
+    def test_custom_namespace_support(self):
         """Verify custom namespace can be specified."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher(namespace='CustomNamespace')
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(namespace='CustomNamespace', sink=mock_sink)
         publisher.emit_active_sessions(10)
         
-        call_args = mock_cloudwatch.put_metric_data.call_args
+        call_args = mock_sink.put_metric_data.call_args
         assert call_args[1]['Namespace'] == 'CustomNamespace'
 
 
 class TestMetricAggregation:
     """Test metric aggregation accuracy."""
     
-    @patch('boto3.client')
-    def test_multiple_latency_metrics_emitted_separately(self, mock_boto_client):
+    def test_multiple_latency_metrics_emitted_separately(self):
         """Verify multiple latency metrics are emitted as separate data points."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher()
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(sink=mock_sink)
         
         # Emit multiple latency metrics
         publisher.emit_session_creation_latency(1000.0)
@@ -378,15 +363,12 @@ class TestMetricAggregation:
         publisher.emit_session_creation_latency(2000.0)
         
         # Should have 3 separate calls
-        assert mock_cloudwatch.put_metric_data.call_count == 3
+        assert mock_sink.put_metric_data.call_count == 3
     
-    @patch('boto3.client')
-    def test_count_metrics_increment_correctly(self, mock_boto_client):
+    def test_count_metrics_increment_correctly(self):
         """Verify count metrics increment with each emission."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher()
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(sink=mock_sink)
         
         # Emit multiple error metrics
         publisher.emit_connection_error('ERROR_1')
@@ -394,20 +376,17 @@ class TestMetricAggregation:
         publisher.emit_connection_error('ERROR_2')
         
         # Should have 3 separate emissions
-        assert mock_cloudwatch.put_metric_data.call_count == 3
+        assert mock_sink.put_metric_data.call_count == 3
         
         # Verify each emission has value of 1
-        for call in mock_cloudwatch.put_metric_data.call_args_list:
+        for call in mock_sink.put_metric_data.call_args_list:
             metric_data = call[1]['MetricData'][0]
             assert metric_data['Value'] == 1
     
-    @patch('boto3.client')
-    def test_gauge_metrics_reflect_current_value(self, mock_boto_client):
+    def test_gauge_metrics_reflect_current_value(self):
         """Verify gauge metrics reflect current value, not cumulative."""
-        mock_cloudwatch = MagicMock()
-        mock_boto_client.return_value = mock_cloudwatch
-        
-        publisher = MetricsPublisher()
+        mock_sink = MagicMock()
+        publisher = MetricsPublisher(sink=mock_sink)
         
         # Emit gauge metrics with different values
         publisher.emit_active_sessions(10)
@@ -415,7 +394,7 @@ class TestMetricAggregation:
         publisher.emit_active_sessions(12)
         
         # Get all emitted values
-        calls = mock_cloudwatch.put_metric_data.call_args_list
+        calls = mock_sink.put_metric_data.call_args_list
         values = [call[1]['MetricData'][0]['Value'] for call in calls]
         
         # Should be exact values, not cumulative
@@ -0,0 +1,37 @@
+"""
+Unit tests for the Kinesis audio record format.
+"""
+import pytest
+from shared.utils.audio_record import (
+    AUDIO_RECORD_HEADER,
+    AUDIO_RECORD_MAGIC,
+    build_audio_record,
+    stream_id_for_connection
+)
+
+
+class TestAudioRecord:
+    """Test suite for audio record headers."""
+
+    def test_header_prefixes_pcm(self):
+        """Test the header is followed by the unchanged PCM bytes."""
+        record = build_audio_record(b'\x01\x00\x02\x00', stream_id=7, chunk_index=41)
+
+        assert len(record) == AUDIO_RECORD_HEADER.size + 4
+        assert AUDIO_RECORD_HEADER.unpack_from(record) == (AUDIO_RECORD_MAGIC, 7, 41)
+        assert record[AUDIO_RECORD_HEADER.size:] == b'\x01\x00\x02\x00'
+
+    def test_header_keeps_sample_alignment(self):
+        """Test the header length is a whole number of 16-bit samples."""
+        assert AUDIO_RECORD_HEADER.size % 2 == 0
+
+    def test_stream_id_per_connection(self):
+        """Test stream IDs are stable per connection and differ between connections."""
+        assert stream_id_for_connection('abc=') == stream_id_for_connection('abc=')
+        assert stream_id_for_connection('abc=') != stream_id_for_connection('abd=')
+        assert 0 <= stream_id_for_connection('abc=') <= 0xFFFFFFFF
+
+    def test_invalid_chunk_index(self):
+        """Test negative chunk indices are rejected."""
+        with pytest.raises(ValueError):
+            build_audio_record(b'', stream_id=1, chunk_index=-1)
@@ -8,6 +8,7 @@ Tests all CRUD operations for session management via HTTP API:
 - DELETE /sessions/{sessionId} - Delete session
 - GET /health - Health check
 """
+import importlib.util
 import json
 import os
 import sys
@@ -25,9 +26,15 @@ os.environ['REGION'] = 'us-east-1'
 os.environ['WEBSOCKET_API_ENDPOINT'] = 'https://test.execute-api.us-east-1.amazonaws.com/test'
 
 # Add lambda directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', 'lambda', 'http_session_handler'))
+handler_dir = os.path.join(os.path.dirname(__file__), '..', '..', 'lambda', 'http_session_handler')
+sys.path.insert(0, handler_dir)
 
-import handler
+# Import handler module directly from file to avoid conflicts with other handlers
+spec = importlib.util.spec_from_file_location(
+    'http_session_handler', os.path.join(handler_dir, 'handler.py')
+)
+handler = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(handler)
 
 
 @pytest.fixture
@@ -780,3 +787,30 @@ class TestErrorHandling:
         body = json.loads(response['body'])
         assert 'error' in body
         assert 'Internal server error' in body['error']
+
+
+class TestMetrics:
+    """Test suite for buffered metrics."""
+    
+    def test_metric_buffered_and_flushed_after_invocation(self, mock_env):
+        """Test metrics go to the shared sink and are flushed once per invocation."""
+        # Arrange
+        sink = MagicMock()
+        event = create_http_event('GET', '/health')
+        
+        # Act
+        with patch.object(handler, 'get_metrics_sink', return_value=sink), \
+             patch.object(handler, 'health_check',
+                          side_effect=lambda: handler.emit_metric('HealthCheckCount', 1) or {}), \
+             patch('shared.utils.emf_metrics.flush_metrics') as flush:
+            handler.lambda_handler(event, None)
+        
+        # Assert
+        sink.put_metric.assert_called_once_with(
+            'HealthCheckCount',
+            1,
+            unit='Count',
+            dimensions=None,
+            namespace='SessionManagement'
+        )
+        flush.assert_called_once()
@@ -23,6 +23,7 @@ mkdir -p build/python/shared_utils
 echo "Copying shared utilities..."
 cp ../session-management/shared/utils/structured_logger.py build/python/shared_utils/
 cp ../session-management/shared/utils/error_codes.py build/python/shared_utils/
+cp ../session-management/shared/utils/emf_metrics.py build/python/shared_utils/
 cp ../session-management/shared/config/table_names.py build/python/shared_utils/
 cp ../session-management/shared/models/websocket_messages.py build/python/shared_utils/
 
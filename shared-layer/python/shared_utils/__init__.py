@@ -13,6 +13,12 @@ from .error_codes import (
     get_http_status,
     get_error_message
 )
+from .emf_metrics import (
+    MetricsSink,
+    get_metrics_sink,
+    flush_metrics,
+    flush_metrics_after
+)
 from .table_names import (
     SESSIONS_TABLE_NAME,
     CONNECTIONS_TABLE_NAME,
@@ -32,6 +38,12 @@ __all__ = [
     'get_http_status',
     'get_error_message',
     
+    # Metrics
+    'MetricsSink',
+    'get_metrics_sink',
+    'flush_metrics',
+    'flush_metrics_after',
+    
     # Table names
     'SESSIONS_TABLE_NAME',
     'CONNECTIONS_TABLE_NAME',
@@ -17,6 +17,7 @@ Environment Variables:
     CACHE_TTL_SECONDS: Translation cache TTL in seconds (default: 3600)
     MAX_CACHE_ENTRIES: Maximum cache entries before LRU eviction (default: 10000)
     API_GATEWAY_ENDPOINT: API Gateway WebSocket endpoint for broadcasting
+    METRICS_BACKEND: Metrics output, 'emf', 'cloudwatch' or 'none' (default: emf)
 """
 
 import json
@@ -42,6 +43,7 @@ from shared.services.translation_pipeline_orchestrator import (
     TranslationPipelineOrchestrator,
     EmotionDynamics
 )
+from shared.utils.emf_metrics import flush_metrics_after, get_metrics_sink
 
 # Configure logging
 logger = logging.getLogger()
@@ -64,7 +66,9 @@ apigateway_client = boto3.client(
     'apigatewaymanagementapi',
     endpoint_url=API_GATEWAY_ENDPOINT
 )
-cloudwatch_client = boto3.client('cloudwatch')
+
+# Metrics are buffered and written as EMF when the invocation ends
+metrics_sink = get_metrics_sink()
 
 # Initialize services (reused across invocations)
 atomic_counter = AtomicCounter(
@@ -82,7 +86,7 @@ translation_cache_manager = TranslationCacheManager(
     dynamodb_client=dynamodb_client,
     ttl_seconds=CACHE_TTL_SECONDS,
     max_entries=MAX_CACHE_ENTRIES,
-    cloudwatch_client=cloudwatch_client
+    cloudwatch_client=metrics_sink
 )
 
 translation_service = ParallelTranslationService(
@@ -113,6 +117,7 @@ orchestrator = TranslationPipelineOrchestrator(
 )
 
 
+@flush_metrics_after
 def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
     """
     Lambda entry point for translation broadcasting pipeline.
@@ -269,9 +274,9 @@ def _emit_metrics(result):
             'Unit': 'Count'
         })
         
-        # Put metrics to CloudWatch
+        # Buffer metrics (flushed at the end of the invocation)
         if metrics:
-            cloudwatch_client.put_metric_data(
+            metrics_sink.put_metric_data(
                 Namespace='TranslationPipeline',
                 MetricData=metrics
             )
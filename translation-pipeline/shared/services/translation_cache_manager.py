@@ -35,7 +35,8 @@ class TranslationCacheManager:
             table_name: DynamoDB table name for cached translations
             cache_ttl_seconds: TTL for cache entries in seconds (default: 3600)
             max_cache_entries: Maximum number of cache entries (default: 10000)
-            cloudwatch_client: Optional CloudWatch client for testing
+            cloudwatch_client: Optional metrics sink or CloudWatch client
+                (the Lambda handler passes its buffered EMF metrics sink)
             dynamodb_client: Optional DynamoDB client for testing
         """
         self.table_name = table_name
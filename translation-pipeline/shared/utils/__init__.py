@@ -0,0 +1,5 @@
+"""
+Utilities for translation pipeline.
+
+This module contains helpers shared by the translation pipeline services.
+"""
@@ -0,0 +1,433 @@
+"""
+Buffered, non-blocking CloudWatch metrics in Embedded Metric Format (EMF).
+
+Calling put_metric_data() on a boto3 CloudWatch client is a blocking HTTPS
+request. A MetricsSink aggregates metrics in memory and writes them out when
+flush() is called, normally once at the end of each Lambda invocation:
+
+- 'emf' backend (default): one EMF JSON document per namespace and dimension
+  set is written to stdout. CloudWatch Logs extracts the metrics
+  asynchronously, so nothing on the request path waits for CloudWatch.
+- 'cloudwatch' backend: batched put_metric_data calls at flush time, for
+  processes whose stdout is not shipped to CloudWatch Logs.
+- 'none' backend: metrics are discarded.
+
+The sink accepts the same put_metric_data(Namespace=..., MetricData=[...])
+call as a boto3 client, so it can be passed wherever a CloudWatch client is
+expected. This module is kept identical in audio-transcription,
+session-management and translation-pipeline and is shipped in the shared
+Lambda layer (shared_utils.emf_metrics).
+"""
+
+import functools
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+logger = logging.getLogger(__name__)
+
+BACKEND_EMF = 'emf'
+BACKEND_CLOUDWATCH = 'cloudwatch'
+BACKEND_NONE = 'none'
+BACKENDS = (BACKEND_EMF, BACKEND_CLOUDWATCH, BACKEND_NONE)
+
+# EMF limits per document
+EMF_MAX_METRICS_PER_DOCUMENT = 100
+EMF_MAX_VALUES_PER_METRIC = 100
+EMF_MAX_DIMENSIONS = 30
+
+# PutMetricData limits per request and per datum
+PUT_METRIC_DATA_MAX_DATUMS = 20
+PUT_METRIC_DATA_MAX_VALUES = 150
+
+# (namespace, dimensions, minute) -> one EMF document / dimension set
+_GroupKey = Tuple[str, Tuple[Tuple[str, str], ...], int]
+
+
+class MetricsSink:
+    """
+    In-memory metrics aggregator with EMF and batched CloudWatch output.
+
+    Values are grouped by namespace, dimension set and minute, and by metric
+    name and unit within a group. Nothing is written until flush(), or until
+    max_pending_values values are pending or flush_interval_seconds have
+    passed since the last flush (for long-lived processes that never reach
+    an invocation boundary). Thread-safe: metrics may be put from executor
+    threads.
+
+    Attributes:
+        backend: Output backend ('emf', 'cloudwatch' or 'none')
+        default_namespace: Namespace used by put_metric() when none is given
+        max_pending_values: Pending values that trigger a flush
+        flush_interval_seconds: Seconds after which a put triggers a flush
+        pending_count: Number of values not yet flushed
+
+    Examples:
+        >>> sink = MetricsSink(default_namespace='AudioTranscription/Kinesis')
+        >>> sink.put_metric('RecordsProcessed', 25, dimensions={'Stage': 'dev'})
+        >>> sink.put_metric_data(
+        ...     Namespace='AudioTranscription/Buffer',
+        ...     MetricData=[{'MetricName': 'BufferOverflow', 'Value': 1, 'Unit': 'Count'}]
+        ... )
+        >>> sink.flush()  # end of invocation
+    """
+
+    def __init__(
+        self,
+        backend: str = BACKEND_EMF,
+        default_namespace: str = 'Default',
+        cloudwatch_client=None,
+        max_pending_values: int = 1000,
+        flush_interval_seconds: float = 60.0,
+        stream: Optional[TextIO] = None
+    ):
+        """
+        Initialize metrics sink.
+
+        Args:
+            backend: Output backend ('emf', 'cloudwatch' or 'none')
+            default_namespace: Namespace used by put_metric() when none is given
+            cloudwatch_client: CloudWatch client for the 'cloudwatch' backend
+                (default: boto3 client created on first flush)
+            max_pending_values: Pending values that trigger a flush (default: 1000)
+            flush_interval_seconds: Seconds after which a put triggers a flush
+                (default: 60)
+            stream: Stream EMF documents are written to (default: sys.stdout)
+
+        Raises:
+            ValueError: If backend is unknown or limits are not positive
+        """
+        if backend not in BACKENDS:
+            raise ValueError(f"backend must be one of {BACKENDS}, got {backend!r}")
+        if max_pending_values <= 0:
+            raise ValueError("max_pending_values must be positive")
+        if flush_interval_seconds <= 0:
+            raise ValueError("flush_interval_seconds must be positive")
+
+        self.backend = backend
+        self.default_namespace = default_namespace
+        self.max_pending_values = max_pending_values
+        self.flush_interval_seconds = flush_interval_seconds
+        self._cloudwatch = cloudwatch_client
+        self._stream = stream
+
+        # group -> (timestamp ms, {(metric name, unit): [values]})
+        self._groups: Dict[_GroupKey, Tuple[int, Dict[Tuple[str, str], List[float]]]] = {}
+        self._pending_count = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of values not yet flushed."""
+        with self._lock:
+            return self._pending_count
+
+    def put_metric_data(self, Namespace: str, MetricData: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Buffer metrics given in PutMetricData format.
+
+        Same arguments as boto3 CloudWatch put_metric_data(). Each datum has
+        MetricName, Value or Values (with optional Counts), and optionally
+        Unit, Dimensions and Timestamp; other keys are ignored.
+
+        Args:
+            Namespace: CloudWatch namespace
+            MetricData: Metric datums
+
+        Returns:
+            Empty dict (like the boto3 response without metadata)
+
+        Raises:
+            ValueError: If a datum has no MetricName or no value
+        """
+        entries = []
+        for datum in MetricData:
+            name = datum.get('MetricName')
+            if not name:
+                raise ValueError("MetricData entry requires MetricName")
+
+            if 'Values' in datum:
+                counts = datum.get('Counts') or [1] * len(datum['Values'])
+                values = [
+                    float(value)
+                    for value, count in zip(datum['Values'], counts)
+                    for _ in range(int(count))
+                ]
+            elif 'Value' in datum:
+                values = [float(datum['Value'])]
+            else:
+                raise ValueError(f"MetricData entry {name!r} requires Value or Values")
+
+            dimensions = tuple(
+                (str(dimension['Name']), str(dimension['Value']))
+                for dimension in datum.get('Dimensions') or []
+            )
+            entries.append((
+                (Namespace, dimensions, name, datum.get('Unit', 'None')),
+                values,
+                _timestamp_ms(datum.get('Timestamp'))
+            ))
+
+        self._add(entries)
+        return {}
+
+    def put_metric(
+        self,
+        name: str,
+        value: float,
+        unit: str = 'Count',
+        dimensions: Optional[Dict[str, str]] = None,
+        namespace: Optional[str] = None
+    ) -> None:
+        """
+        Buffer one metric value.
+
+        Args:
+            name: Metric name
+            value: Metric value
+            unit: CloudWatch unit (default: Count)
+            dimensions: Dimension name to value (default: none)
+            namespace: CloudWatch namespace (default: default_namespace)
+        """
+        dimension_pairs = tuple(
+            (str(key), str(dimension_value))
+            for key, dimension_value in (dimensions or {}).items()
+        )
+        self._add([(
+            (namespace or self.default_namespace, dimension_pairs, name, unit),
+            [float(value)],
+            _timestamp_ms(None)
+        )])
+
+    def _add(self, entries: List[Tuple[Tuple[str, tuple, str, str], List[float], int]]) -> None:
+        """Add values to their groups and flush if a threshold is reached."""
+        if self.backend == BACKEND_NONE:
+            return
+
+        with self._lock:
+            for (namespace, dimensions, name, unit), values, timestamp_ms in entries:
+                key = (namespace, dimensions, timestamp_ms // 60000)
+                _, metrics = self._groups.setdefault(key, (timestamp_ms, {}))
+                metrics.setdefault((name, unit), []).extend(values)
+                self._pending_count += len(values)
+
+            flush_due = (
+                self._pending_count >= self.max_pending_values
+                or time.monotonic() - self._last_flush >= self.flush_interval_seconds
+            )
+
+        if flush_due:
+            self.flush()
+
+    def flush(self) -> int:
+        """
+        Write out all pending metrics.
+
+        Output errors are logged and the metrics dropped: metrics never
+        fail the caller.
+
+        Returns:
+            Number of values flushed
+        """
+        with self._lock:
+            groups = self._groups
+            flushed = self._pending_count
+            self._groups = {}
+            self._pending_count = 0
+            self._last_flush = time.monotonic()
+
+        if not groups:
+            return 0
+
+        try:
+            if self.backend == BACKEND_EMF:
+                self._write_emf(groups)
+            elif self.backend == BACKEND_CLOUDWATCH:
+                self._put_to_cloudwatch(groups)
+        except Exception as e:
+            logger.warning(f"Failed to flush {flushed} metric values: {e}")
+
+        return flushed
+
+    def _write_emf(self, groups: Dict[_GroupKey, Tuple[int, Dict[Tuple[str, str], List[float]]]]) -> None:
+        """Write one EMF document per group (split at the EMF limits)."""
+        lines = []
+        for (namespace, dimensions, _), (timestamp_ms, metrics) in groups.items():
+            dimensions = dimensions[:EMF_MAX_DIMENSIONS]
+            chunks = [
+                (name, unit, values[start:start + EMF_MAX_VALUES_PER_METRIC])
+                for (name, unit), values in metrics.items()
+                for start in range(0, len(values), EMF_MAX_VALUES_PER_METRIC)
+            ]
+
+            # Every (name, unit) chunk needs its own document slot, and one
+            # document can hold each metric name only once
+            documents: List[Dict[str, Any]] = []
+            for name, unit, values in chunks:
+                document = next(
+                    (d for d in documents
+                     if name not in d and len(d['_aws']['CloudWatchMetrics'][0]['Metrics'])
+                     < EMF_MAX_METRICS_PER_DOCUMENT),
+                    None
+                )
+                if document is None:
+                    document = {
+                        '_aws': {
+                            'Timestamp': timestamp_ms,
+                            'CloudWatchMetrics': [{
+                                'Namespace': namespace,
+                                'Dimensions': [[key for key, _ in dimensions]],
+                                'Metrics': []
+                            }]
+                        },
+                        **dict(dimensions)
+                    }
+                    documents.append(document)
+                document['_aws']['CloudWatchMetrics'][0]['Metrics'].append(
+                    {'Name': name, 'Unit': unit}
+                )
+                document[name] = values[0] if len(values) == 1 else values
+
+            lines.extend(json.dumps(document) for document in documents)
+
+        stream = self._stream or sys.stdout
+        stream.write('\n'.join(lines) + '\n')
+        stream.flush()
+
+    def _put_to_cloudwatch(self, groups: Dict[_GroupKey, Tuple[int, Dict[Tuple[str, str], List[float]]]]) -> None:
+        """Send the groups with batched put_metric_data calls per namespace."""
+        if self._cloudwatch is None:
+            import boto3
+            self._cloudwatch = boto3.client('cloudwatch')
+
+        by_namespace: Dict[str, List[Dict[str, Any]]] = {}
+        for (namespace, dimensions, _), (timestamp_ms, metrics) in groups.items():
+            timestamp = datetime.utcfromtimestamp(timestamp_ms / 1000)
+            for (name, unit), values in metrics.items():
+                counts = list(Counter(values).items())
+                for start in range(0, len(counts), PUT_METRIC_DATA_MAX_VALUES):
+                    chunk = counts[start:start + PUT_METRIC_DATA_MAX_VALUES]
+                    datum = {
+                        'MetricName': name,
+                        'Values': [value for value, _ in chunk],
+                        'Counts': [float(count) for _, count in chunk],
+                        'Unit': unit,
+                        'Timestamp': timestamp
+                    }
+                    if dimensions:
+                        datum['Dimensions'] = [
+                            {'Name': key, 'Value': value} for key, value in dimensions
+                        ]
+                    by_namespace.setdefault(namespace, []).append(datum)
+
+        for namespace, metric_data in by_namespace.items():
+            for start in range(0, len(metric_data), PUT_METRIC_DATA_MAX_DATUMS):
+                self._cloudwatch.put_metric_data(
+                    Namespace=namespace,
+                    MetricData=metric_data[start:start + PUT_METRIC_DATA_MAX_DATUMS]
+                )
+
+
+def _timestamp_ms(timestamp: Any) -> int:
+    """Convert a PutMetricData timestamp (datetime, epoch seconds or None) to epoch ms."""
+    if timestamp is None:
+        return int(time.time() * 1000)
+    if isinstance(timestamp, datetime):
+        if timestamp.tzinfo is None:
+            # boto3 treats naive datetimes as UTC
+            return int((timestamp - datetime(1970, 1, 1)).total_seconds() * 1000)
+        return int(timestamp.timestamp() * 1000)
+    return int(float(timestamp) * 1000)
+
+
+# Process-wide sink (created on first use)
+_sink: Optional[MetricsSink] = None
+_sink_lock = threading.Lock()
+
+
+def get_metrics_sink() -> MetricsSink:
+    """
+    Get the process-wide metrics sink.
+
+    The sink is created on first use from environment variables:
+    - METRICS_BACKEND: 'emf', 'cloudwatch' or 'none' (default: emf)
+    - METRICS_MAX_PENDING_VALUES: Pending values that trigger a flush (default: 1000)
+    - METRICS_FLUSH_INTERVAL_SECONDS: Seconds after which a put triggers a
+      flush (default: 60)
+
+    Returns:
+        Shared MetricsSink instance
+    """
+    global _sink
+
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                _sink = MetricsSink(
+                    backend=os.getenv('METRICS_BACKEND', BACKEND_EMF).lower(),
+                    max_pending_values=int(os.getenv('METRICS_MAX_PENDING_VALUES', '1000')),
+                    flush_interval_seconds=float(os.getenv('METRICS_FLUSH_INTERVAL_SECONDS', '60'))
+                )
+
+    return _sink
+
+
+def set_metrics_sink(sink: Optional[MetricsSink]) -> None:
+    """
+    Replace the process-wide metrics sink.
+
+    For tests and local tools; pending metrics of the replaced sink are
+    not flushed.
+
+    Args:
+        sink: New sink, or None to create one from the environment on next use
+    """
+    global _sink
+
+    with _sink_lock:
+        _sink = sink
+
+
+def flush_metrics() -> int:
+    """
+    Flush the process-wide sink (call at the end of each invocation).
+
+    Returns:
+        Number of values flushed
+    """
+    return get_metrics_sink().flush() if _sink is not None else 0
+
+
+def flush_metrics_after(handler: Callable) -> Callable:
+    """
+    Decorate a Lambda handler to flush the process-wide sink when it returns.
+
+    The flush also runs when the handler raises, so metrics of failed
+    invocations are not lost or attributed to the next invocation.
+
+    Args:
+        handler: Lambda handler function (event, context)
+
+    Returns:
+        Wrapped handler
+
+    Examples:
+        >>> @flush_metrics_after
+        ... def lambda_handler(event, context):
+        ...     get_metrics_sink().put_metric('Invocations', 1, namespace='MyService')
+    """
+    @functools.wraps(handler)
+    def wrapper(event, context):
+        try:
+            return handler(event, context)
+        finally:
+            flush_metrics()
+
+    return wrapper